@@ -1,7 +1,9 @@
 import json
+import multiprocessing as mp
 import os
 from collections import defaultdict
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
 
 import h5py
@@ -10,11 +12,16 @@ import torch as th
 import omnigibson as og
 import omnigibson.lazy as lazy
 from omnigibson.envs.env_wrapper import EnvironmentWrapper
-from omnigibson.macros import gm
+from omnigibson.macros import gm, macros
 from omnigibson.objects.object_base import BaseObject
 from omnigibson.sensors.vision_sensor import VisionSensor
 from omnigibson.utils.config_utils import TorchEncoder
-from omnigibson.utils.python_utils import create_object_from_init_info, h5py_group_to_torch
+from omnigibson.utils.data_utils import AsyncWriter, HDF5TrajectoryWriter, run_sharded_playback
+from omnigibson.utils.python_utils import (
+    create_object_from_init_info,
+    extract_class_init_kwargs_from_dict,
+    h5py_group_to_torch,
+)
 from omnigibson.utils.ui_utils import create_module_logger
 
 # Create module logger
@@ -28,12 +35,34 @@ class DataWrapper(EnvironmentWrapper):
     An OmniGibson environment wrapper for writing data to an HDF5 file.
     """
 
-    def __init__(self, env, output_path, only_successes=True):
+    def __init__(
+        self,
+        env,
+        output_path,
+        only_successes=True,
+        streaming=False,
+        compression=None,
+        write_buffer_size=1,
+        async_write=False,
+        write_queue_size=macros.utils.data_utils.DEFAULT_WRITE_QUEUE_SIZE,
+    ):
         """
         Args:
             env (Environment): The environment to wrap
             output_path (str): path to store hdf5 data file
             only_successes (bool): Whether to only save successful episodes
+            streaming (bool): Whether to stream each trajectory directly to resizable, chunked datasets in the hdf5
+                file as it is being collected, instead of aggregating the whole trajectory in memory and writing it
+                once the episode ends
+            compression (None or str or dict): Only used if @streaming is True. Compression filter(s) to use for
+                the written datasets, either a single filter for all datasets or a dictionary mapping dataset /
+                modality names to filters. See HDF5TrajectoryWriter for more info
+            write_buffer_size (int): Only used if @streaming is True. Number of steps to buffer in memory before
+                appending them to the hdf5 file
+            async_write (bool): Whether to execute all hdf5 writes on a background thread, so that the simulation
+                loop does not block on disk I/O and compression
+            write_queue_size (int): Only used if @async_write is True. Maximum number of pending write jobs (a single
+                step if @streaming, else a whole trajectory) before the simulation loop blocks on the writer thread
         """
         # Make sure the wrapped environment inherits correct omnigibson format
         assert isinstance(
@@ -47,8 +76,14 @@ class DataWrapper(EnvironmentWrapper):
         self.step_count = 0
         self.only_successes = only_successes
         self.current_obs = None
+        self.streaming = streaming
+        self.compression = compression
+        self.write_buffer_size = write_buffer_size
 
         self.current_traj_history = []
+        self.current_traj_writer = None
+        self.current_traj_length = 0
+        self.async_writer = AsyncWriter(max_queue_size=write_queue_size) if async_write else None
 
         Path(os.path.dirname(output_path)).mkdir(parents=True, exist_ok=True)
         log.info(f"\nWriting OmniGibson dataset hdf5 to: {output_path}\n")
@@ -90,7 +125,7 @@ class DataWrapper(EnvironmentWrapper):
         step_data = self._parse_step_data(action, next_obs, reward, terminated, truncated, info)
 
         # Update obs and traj history
-        self.current_traj_history.append(step_data)
+        self.add_step_data(step_data)
         self.current_obs = next_obs
 
         return next_obs, reward, terminated, truncated, info
@@ -112,6 +147,92 @@ class DataWrapper(EnvironmentWrapper):
         """
         raise NotImplementedError()
 
+    def add_step_data(self, step_data):
+        """
+        Records a single step of data @step_data to the current trajectory. If streaming, this is directly written
+        to the hdf5 file (on the background writer thread if writing asynchronously), otherwise it is stored in memory
+        until the trajectory is flushed
+
+        Args:
+            step_data (dict): Keyword-mapped data that should be recorded in the HDF5
+        """
+        self.current_traj_length += 1
+        if self.streaming:
+            if self.current_traj_writer is None:
+                self.current_traj_writer = self.create_traj_writer(traj_grp_name=f"demo_{self.traj_count}")
+            self.run_write_job(partial(self.current_traj_writer.append, step_data), n_steps=1)
+        else:
+            self.current_traj_history.append(step_data)
+
+    def create_traj_writer(self, traj_grp_name, nested_keys=("obs",), **kwargs):
+        """
+        Creates a streaming writer for a new trajectory group @traj_grp_name. Note that the group itself is only
+        created in the hdf5 file once data is first written
+
+        Args:
+            traj_grp_name (str): Name of the trajectory group to store
+            nested_keys (list of str): Name of key(s) corresponding to nested data in each step
+            kwargs (dict): Any additional keyword arguments to pass to the HDF5TrajectoryWriter constructor
+
+        Returns:
+            HDF5TrajectoryWriter: Writer streaming to the newly created trajectory group
+        """
+        return HDF5TrajectoryWriter(
+            parent_group=self.hdf5_file["data"],
+            name=traj_grp_name,
+            nested_keys=nested_keys,
+            compression=self.compression,
+            buffer_size=self.write_buffer_size,
+            **kwargs,
+        )
+
+    def get_traj_metadata(self):
+        """
+        Grabs any additional metadata to store as attributes of the current trajectory's group. By default, this is
+        empty. Note that this is called when the trajectory is flushed, but may be written at a later time if writing
+        asynchronously, so the returned data should not be modified afterwards
+
+        Returns:
+            dict: Keyword-mapped metadata to add to the trajectory group. See add_metadata() for supported values
+        """
+        return dict()
+
+    def run_write_job(self, job, n_steps=0):
+        """
+        Runs @job, which writes to the hdf5 file. If writing asynchronously, it is queued to be executed on the
+        background writer thread (blocking while the queue is full), otherwise it is executed immediately
+
+        Args:
+            job (function): Function taking no arguments to execute
+            n_steps (int): Number of sim steps written by @job, used for write throughput bookkeeping
+        """
+        if self.async_writer is None:
+            job()
+        else:
+            self.async_writer.submit(job, n_items=n_steps)
+
+    def write_traj(self, traj_grp_name, traj_data=None, traj_writer=None, metadata=None):
+        """
+        Writes a finalized trajectory to the hdf5 file, either from in-memory trajectory data @traj_data or by
+        closing streaming writer @traj_writer
+
+        Args:
+            traj_grp_name (str): Name of the trajectory group to store
+            traj_data (None or list of dict): If specified, trajectory data to write. See process_traj_to_hdf5()
+            traj_writer (None or HDF5TrajectoryWriter): If specified, streaming writer to close
+            metadata (None or dict): If specified, keyword-mapped metadata to add to the trajectory group
+
+        Returns:
+            hdf5.Group: Generated hdf5 group storing the recorded trajectory data
+        """
+        if traj_writer is not None:
+            traj_grp = traj_writer.close()
+        else:
+            traj_grp = self.process_traj_to_hdf5(traj_data, traj_grp_name, nested_keys=["obs"])
+        for name, data in ({} if metadata is None else metadata).items():
+            self.add_metadata(group=traj_grp, name=name, data=data)
+        return traj_grp
+
     def reset(self):
         """
         Run the environment reset() function and flush data
@@ -121,7 +242,7 @@ class DataWrapper(EnvironmentWrapper):
                 - dict: Environment observation space after reset occurs
                 - dict: Information related to observation metadata
         """
-        if len(self.current_traj_history) > 0:
+        if self.current_traj_length > 0:
             self.flush_current_traj()
 
         self.current_obs, info = self.env.reset()
@@ -195,22 +316,35 @@ class DataWrapper(EnvironmentWrapper):
         # Only save successful demos and if actually recording
         success = self.env.task.success or not self.only_successes
         if success and self.hdf5_file is not None:
-            traj_grp_name = f"demo_{self.traj_count}"
-            traj_grp = self.process_traj_to_hdf5(self.current_traj_history, traj_grp_name, nested_keys=["obs"])
+            job = partial(
+                self.write_traj,
+                traj_grp_name=f"demo_{self.traj_count}",
+                traj_data=None if self.streaming else self.current_traj_history,
+                traj_writer=self.current_traj_writer,
+                metadata=self.get_traj_metadata(),
+            )
+            self.run_write_job(job, n_steps=0 if self.streaming else self.current_traj_length)
             self.traj_count += 1
         else:
             # Remove this demo
-            self.step_count -= len(self.current_traj_history)
+            self.step_count -= self.current_traj_length
+            if self.current_traj_writer is not None:
+                self.run_write_job(self.current_traj_writer.discard)
 
         # Clear trajectory and transition buffers
         self.current_traj_history = []
+        self.current_traj_writer = None
+        self.current_traj_length = 0
 
     def flush_current_file(self):
+        self.run_write_job(self._flush_file)
+        log.info("Flushing hdf5")
+
+    def _flush_file(self):
         self.hdf5_file.flush()  # Flush data to disk to avoid large memory footprint
         # Retrieve the file descriptor and use os.fsync() to flush to disk
         fd = self.hdf5_file.id.get_vfd_handle()
         os.fsync(fd)
-        log.info("Flushing hdf5")
 
     def add_metadata(self, group, name, data):
         """
@@ -228,9 +362,18 @@ class DataWrapper(EnvironmentWrapper):
         """
         Save collected trajectories as a hdf5 file in the robomimic format
         """
-        if len(self.current_traj_history) > 0:
+        if self.current_traj_length > 0:
             self.flush_current_traj()
 
+        # Wait for all pending writes to finish
+        if self.async_writer is not None:
+            self.async_writer.close()
+            log.info(
+                f"Async writer: {self.async_writer.n_items_written} steps written at "
+                f"{self.async_writer.throughput:.1f} steps/s, simulation blocked on writes for "
+                f"{self.async_writer.blocked_time:.2f} s"
+            )
+
         if self.hdf5_file is not None:
 
             log.info(
@@ -252,7 +395,18 @@ class DataCollectionWrapper(DataWrapper):
     dataset!
     """
 
-    def __init__(self, env, output_path, viewport_camera_path="/World/viewer_camera", only_successes=True):
+    def __init__(
+        self,
+        env,
+        output_path,
+        viewport_camera_path="/World/viewer_camera",
+        only_successes=True,
+        streaming=False,
+        compression=None,
+        write_buffer_size=1,
+        async_write=False,
+        write_queue_size=macros.utils.data_utils.DEFAULT_WRITE_QUEUE_SIZE,
+    ):
         """
         Args:
             env (Environment): The environment to wrap
@@ -260,6 +414,16 @@ class DataCollectionWrapper(DataWrapper):
             viewport_camera_path (str): prim path to the camera to use when rendering the main viewport during
                 data collection
             only_successes (bool): Whether to only save successful episodes
+            streaming (bool): Whether to stream each trajectory directly to the hdf5 file as it is being collected
+                instead of aggregating it in memory
+            compression (None or str or dict): Only used if @streaming is True. Compression filter(s) to use for
+                the written datasets. See HDF5TrajectoryWriter for more info
+            write_buffer_size (int): Only used if @streaming is True. Number of steps to buffer in memory before
+                appending them to the hdf5 file
+            async_write (bool): Whether to execute all hdf5 writes on a background thread, so that the simulation
+                loop does not block on disk I/O and compression
+            write_queue_size (int): Only used if @async_write is True. Maximum number of pending write jobs before
+                the simulation loop blocks on the writer thread
         """
         # Store additional variables needed for optimized data collection
 
@@ -285,7 +449,16 @@ class DataCollectionWrapper(DataWrapper):
         )
 
         # Run super
-        super().__init__(env=env, output_path=output_path, only_successes=only_successes)
+        super().__init__(
+            env=env,
+            output_path=output_path,
+            only_successes=only_successes,
+            streaming=streaming,
+            compression=compression,
+            write_buffer_size=write_buffer_size,
+            async_write=async_write,
+            write_queue_size=write_queue_size,
+        )
 
         # Configure the simulator to optimize for data collection
         self._optimize_sim_for_data_collection(viewport_camera_path=viewport_camera_path)
@@ -329,7 +502,7 @@ class DataCollectionWrapper(DataWrapper):
             "state": state,
             "state_size": len(state),
         }
-        self.current_traj_history.append(step_data)
+        self.add_step_data(step_data)
 
         # Update max state size
         self.max_state_size = max(self.max_state_size, len(state))
@@ -354,19 +527,24 @@ class DataCollectionWrapper(DataWrapper):
 
     def process_traj_to_hdf5(self, traj_data, traj_grp_name, nested_keys=("obs",)):
         # First pad all state values to be the same max (uniform) size
+        # Note that self.max_state_size is not used since this may run asynchronously after it has been reset
+        max_state_size = max(len(step_data["state"]) for step_data in traj_data)
         for step_data in traj_data:
             state = step_data["state"]
-            padded_state = th.zeros(self.max_state_size, dtype=th.float32)
+            padded_state = th.zeros(max_state_size, dtype=th.float32)
             padded_state[: len(state)] = state
             step_data["state"] = padded_state
 
         # Call super
-        traj_grp = super().process_traj_to_hdf5(traj_data, traj_grp_name, nested_keys)
+        return super().process_traj_to_hdf5(traj_data, traj_grp_name, nested_keys)
 
-        # Add in transition info
-        self.add_metadata(group=traj_grp, name="transitions", data=self.current_transitions)
+    def create_traj_writer(self, traj_grp_name, nested_keys=("obs",), **kwargs):
+        # Serialized states vary in size over the episode, so pad them on the fly
+        return super().create_traj_writer(traj_grp_name, nested_keys=nested_keys, pad_keys=("state",), **kwargs)
 
-        return traj_grp
+    def get_traj_metadata(self):
+        # Add in transition info
+        return {"transitions": self.current_transitions}
 
     def flush_current_traj(self):
         # Call super first
@@ -414,6 +592,11 @@ class DataPlaybackWrapper(DataWrapper):
         external_sensors_config=None,
         n_render_iterations=5,
         only_successes=False,
+        streaming=False,
+        compression=None,
+        write_buffer_size=1,
+        async_write=False,
+        write_queue_size=macros.utils.data_utils.DEFAULT_WRITE_QUEUE_SIZE,
     ):
         """
         Create a DataPlaybackWrapper environment instance form the recorded demonstration info
@@ -439,6 +622,16 @@ class DataPlaybackWrapper(DataWrapper):
                 the physical state changes. Increasing this number will improve the rendered quality at the expense of
                 speed.
             only_successes (bool): Whether to only save successful episodes
+            streaming (bool): Whether to stream each recorded trajectory directly to the output hdf5 file as it is
+                being played back instead of aggregating it in memory
+            compression (None or str or dict): Only used if @streaming is True. Compression filter(s) to use for
+                the written datasets, e.g. {"obs": "gzip"}. See HDF5TrajectoryWriter for more info
+            write_buffer_size (int): Only used if @streaming is True. Number of steps to buffer in memory before
+                appending them to the output hdf5 file
+            async_write (bool): Whether to execute all hdf5 writes on a background thread, so that playback does not
+                block on disk I/O and compression
+            write_queue_size (int): Only used if @async_write is True. Maximum number of pending write jobs before
+                playback blocks on the writer thread
 
         Returns:
             DataPlaybackWrapper: Generated playback environment
@@ -480,9 +673,26 @@ class DataPlaybackWrapper(DataWrapper):
             output_path=output_path,
             n_render_iterations=n_render_iterations,
             only_successes=only_successes,
+            streaming=streaming,
+            compression=compression,
+            write_buffer_size=write_buffer_size,
+            async_write=async_write,
+            write_queue_size=write_queue_size,
         )
 
-    def __init__(self, env, input_path, output_path, n_render_iterations=5, only_successes=False):
+    def __init__(
+        self,
+        env,
+        input_path,
+        output_path,
+        n_render_iterations=5,
+        only_successes=False,
+        streaming=False,
+        compression=None,
+        write_buffer_size=1,
+        async_write=False,
+        write_queue_size=macros.utils.data_utils.DEFAULT_WRITE_QUEUE_SIZE,
+    ):
         """
         Args:
             env (Environment): The environment to wrap
@@ -491,6 +701,16 @@ class DataPlaybackWrapper(DataWrapper):
             n_render_iterations (int): Number of rendering iterations to use when loading each stored frame from the
                 recorded data
             only_successes (bool): Whether to only save successful episodes
+            streaming (bool): Whether to stream each recorded trajectory directly to the output hdf5 file as it is
+                being played back instead of aggregating it in memory
+            compression (None or str or dict): Only used if @streaming is True. Compression filter(s) to use for
+                the written datasets. See HDF5TrajectoryWriter for more info
+            write_buffer_size (int): Only used if @streaming is True. Number of steps to buffer in memory before
+                appending them to the output hdf5 file
+            async_write (bool): Whether to execute all hdf5 writes on a background thread, so that the simulation
+                loop does not block on disk I/O and compression
+            write_queue_size (int): Only used if @async_write is True. Maximum number of pending write jobs before
+                the simulation loop blocks on the writer thread
         """
         # Make sure transition rules are DISABLED for playback since we manually propagate transitions
         assert not gm.ENABLE_TRANSITION_RULES, "Transition rules must be disabled for DataPlaybackWrapper env!"
@@ -503,7 +723,16 @@ class DataPlaybackWrapper(DataWrapper):
         self.n_render_iterations = n_render_iterations
 
         # Run super
-        super().__init__(env=env, output_path=output_path, only_successes=only_successes)
+        super().__init__(
+            env=env,
+            output_path=output_path,
+            only_successes=only_successes,
+            streaming=streaming,
+            compression=compression,
+            write_buffer_size=write_buffer_size,
+            async_write=async_write,
+            write_queue_size=write_queue_size,
+        )
 
     def _parse_step_data(self, action, obs, reward, terminated, truncated, info):
         # Store action, obs, reward, terminated, truncated, info
@@ -549,7 +778,7 @@ class DataPlaybackWrapper(DataWrapper):
         if record:
             init_obs, _, _, _, _ = self.env.step(action=action[0], n_render_iterations=self.n_render_iterations)
             step_data = {"obs": init_obs}
-            self.current_traj_history.append(step_data)
+            self.add_step_data(step_data)
 
         for i, (a, s, ss, r, te, tr) in enumerate(
             zip(action, state[1:], state_size[1:], reward, terminated, truncated)
@@ -587,19 +816,92 @@ class DataPlaybackWrapper(DataWrapper):
                     truncated=tr,
                     info=info,
                 )
-                self.current_traj_history.append(step_data)
+                self.add_step_data(step_data)
 
             self.step_count += 1
 
         if record:
             self.flush_current_traj()
 
-    def playback_dataset(self, record=True):
+    def playback_dataset(self, record=True, episode_ids=None):
         """
         Playback all episodes from the input HDF5 file, and optionally record observation data if @record is True
 
         Args:
             record (bool): Whether to record data during playback or not
+            episode_ids (None or list of int): If specified, only these episodes are played back, in order
         """
-        for episode_id in range(self.input_hdf5["data"].attrs["n_episodes"]):
+        if episode_ids is None:
+            episode_ids = range(self.input_hdf5["data"].attrs["n_episodes"])
+        for episode_id in episode_ids:
             self.playback_episode(episode_id=episode_id, record=record)
+
+    @staticmethod
+    def playback_dataset_sharded(input_path, output_path, n_workers, episodes_per_shard=10, **kwargs):
+        """
+        Playback all episodes from the input HDF5 file @input_path in parallel across @n_workers processes, each with
+        its own environment created from the file's stored config, and record observation data to @output_path.
+        Each shard of @episodes_per_shard episodes is recorded to its own output file before all shards are merged.
+        If interrupted, calling this again with the same arguments resumes from the last incomplete shards. See
+        run_sharded_playback() for more info
+
+        Args:
+            input_path (str): Absolute path to the input hdf5 file containing the relevant collected data to playback
+            output_path (str): Absolute path to the output hdf5 file that will contain the merged recorded
+                observations from the replayed data
+            n_workers (int): Number of worker processes to use. If 1, playback occurs in the current process
+            episodes_per_shard (int): Maximum number of episodes per shard
+            kwargs (dict): Any additional keyword arguments to pass to DataPlaybackWrapper.create_from_hdf5(), e.g.:
+                robot_obs_modalities
+
+        Returns:
+            list of str: Paths to the output HDF5 files of all shards
+        """
+        return run_sharded_playback(
+            input_path=input_path,
+            output_path=output_path,
+            worker_fn=_playback_shards,
+            n_workers=n_workers,
+            episodes_per_shard=episodes_per_shard,
+            worker_kwargs=kwargs,
+        )
+
+
+def _playback_shards(input_path, shards, **kwargs):
+    """
+    Worker function for DataPlaybackWrapper.playback_dataset_sharded(). Plays back and records each shard to its own
+    output file, reusing a single environment across all shards
+
+    Args:
+        input_path (str): Absolute path to the input hdf5 file containing the relevant collected data to playback
+        shards (list of 2-tuple): (episode_ids, shard_path) for each shard to play back
+        kwargs (dict): Keyword arguments to pass to DataPlaybackWrapper.create_from_hdf5()
+    """
+    env = None
+    try:
+        for episode_ids, shard_path in shards:
+            if env is None:
+                env = DataPlaybackWrapper.create_from_hdf5(input_path=input_path, output_path=shard_path, **kwargs)
+            else:
+                env = DataPlaybackWrapper(
+                    env=env.env,
+                    input_path=input_path,
+                    output_path=shard_path,
+                    **extract_class_init_kwargs_from_dict(cls=DataPlaybackWrapper, dic=kwargs),
+                )
+            try:
+                env.hdf5_file["data"].attrs["episode_ids"] = episode_ids
+                env.playback_dataset(record=True, episode_ids=episode_ids)
+                env.save_data()
+            finally:
+                env.input_hdf5.close()
+                # If playback failed, the shard is left incomplete and will be played back again when resuming
+                if env.hdf5_file:
+                    env.hdf5_file.close()
+    finally:
+        if env is not None:
+            env.close()
+        # Worker processes own their simulator, which must be shut down for the process to exit cleanly. When running
+        # in the calling process, the simulator is left running for the caller
+        if mp.parent_process() is not None:
+            og.shutdown()
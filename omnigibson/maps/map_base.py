@@ -52,10 +52,13 @@ class BaseMap:
         """
         Transforms a 2D point in world (simulator) reference frame into map reference frame
 
-            xy: 2D location in world reference frame (metric)
-        :return: 2D location in map reference frame (image)
+        Args:
+            xy (2-array or (N, 2)-array): 2D location(s) in world reference frame (in metric space)
+
+        Returns:
+            2-array or (N, 2)-array: 2D location(s) in map reference frame (in image pixel space)
         """
 
         xy = th.as_tensor(xy)
         point_wrt_map = xy / self.map_resolution + self.map_size / 2.0
-        return th.flip(point_wrt_map, dims=tuple(range(point_wrt_map.dim()))).int()
+        return th.flip(point_wrt_map, dims=(-1,)).int()
@@ -1,16 +1,33 @@
 import math
 import os
+from collections import OrderedDict
+from hashlib import md5
 
 import cv2
 import torch as th
 
+from omnigibson.macros import create_module_macros
 from omnigibson.maps.map_base import BaseMap
-from omnigibson.utils.motion_planning_utils import astar
+from omnigibson.utils.grid_planning_utils import (
+    GridLandmarkIndex,
+    GridPlanner,
+    HierarchicalGridPlanner,
+    plan_paths,
+)
 from omnigibson.utils.ui_utils import create_module_logger
 
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Maximum number of single-goal distance fields to keep cached per eroded map
+m.MAX_CACHED_DISTANCE_FIELDS = 8
+
+# Number of landmarks used by the landmark-based geodesic distance index
+m.N_DISTANCE_INDEX_LANDMARKS = 16
+
 
 class TraversableMap(BaseMap):
     """
@@ -25,6 +42,7 @@ class TraversableMap(BaseMap):
         trav_map_with_objects=True,
         num_waypoints=10,
         waypoint_resolution=0.2,
+        hierarchical_planning=False,
     ):
         """
         Args:
@@ -34,6 +52,9 @@ class TraversableMap(BaseMap):
             trav_map_with_objects (bool): whether to use objects or not when constructing graph
             num_waypoints (int): number of way points returned
             waypoint_resolution (float): resolution of adjacent way points
+            hierarchical_planning (bool): whether to compute shortest paths with a multi-resolution planner, which
+                first plans on a coarsened map and then refines the path around it. This explores far fewer pixels
+                on large maps, at the cost of paths that are not guaranteed to be optimal
         """
         # Set internal values
         self.map_default_resolution = 0.01  # each pixel == 0.01m in the dataset representation
@@ -41,6 +62,7 @@ class TraversableMap(BaseMap):
         self.trav_map_with_objects = trav_map_with_objects
         self.num_waypoints = num_waypoints
         self.waypoint_interval = int(waypoint_resolution / map_resolution)
+        self.hierarchical_planning = hierarchical_planning
 
         # Values loaded at runtime
         self.trav_map_original_size = None
@@ -48,6 +70,10 @@ class TraversableMap(BaseMap):
         self.mesh_body_id = None
         self.floor_heights = None
         self.floor_map = None
+        self.maps_path = None
+
+        # Cache of eroded maps and their connectivity, keyed by (floor, erosion radius in pixels)
+        self._floor_map_cache = dict()
 
         # Run super method
         super().__init__(map_resolution=map_resolution)
@@ -67,8 +93,10 @@ class TraversableMap(BaseMap):
             log.warning("trav map does not exist: {}".format(maps_path))
             return
 
+        self.maps_path = maps_path
         self.floor_heights = floor_heights
         self.floor_map = []
+        self.clear_cache()
         map_size = None
         for floor in range(len(self.floor_heights)):
             if self.trav_map_with_objects:
@@ -108,17 +136,90 @@ class TraversableMap(BaseMap):
         """
         return len(self.floor_heights)
 
-    def _erode_trav_map(self, trav_map, robot=None):
-        # Erode the traversability map to account for the robot's size
+    def _get_erosion_radius_pixels(self, robot=None):
+        """
+        Args:
+            robot (None or BaseRobot): if given, the erosion radius accounts for the robot's size
+
+        Returns:
+            int: Erosion radius in map pixels
+        """
         if robot:
             robot_chassis_extent = robot.reset_joint_pos_aabb_extent[:2]
             radius = th.norm(robot_chassis_extent) / 2.0
         else:
             radius = self.default_erosion_radius
-        radius_pixel = int(math.ceil(radius / self.map_resolution))
+        return int(math.ceil(radius / self.map_resolution))
+
+    def _erode_trav_map(self, trav_map, robot=None):
+        # Erode the traversability map to account for the robot's size
+        radius_pixel = self._get_erosion_radius_pixels(robot=robot)
         trav_map = th.tensor(cv2.erode(trav_map.cpu().numpy(), th.ones((radius_pixel, radius_pixel)).cpu().numpy()))
         return trav_map
 
+    def get_eroded_map_info(self, floor, robot=None):
+        """
+        Grabs the eroded traversability map for floor @floor and its connectivity information, computing and caching
+        it if it has not been generated yet. Entries are keyed by (floor, erosion radius in pixels), so robots of
+        similar size share the same entry.
+
+        Args:
+            floor (int): floor number
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+
+        Returns:
+            dict: Keyword-mapped cached information for the eroded map, with the following keys:
+                - "trav_map": (H, W)-array eroded traversability map
+                - "component_labels": (H, W)-array 4-connected component label per pixel, where 0 is untraversable
+                - "component_cells": (H * W,)-array flat pixel indices, sorted by their component label
+                - "component_offsets": (N + 1,)-array, where the pixels belonging to component label i are
+                    component_cells[component_offsets[i]:component_offsets[i + 1]]
+                - "planner": GridPlanner for computing shortest paths on the eroded map
+                - "hierarchical_planner": None or HierarchicalGridPlanner for computing shortest paths on the eroded
+                    map, only generated if hierarchical planning is enabled
+                - "distance_fields": OrderedDict mapping (row, col) goal pixels to their cached GridDistanceField,
+                    in least-recently-used order
+                - "landmark_index": None or GridLandmarkIndex, populated by get_landmark_index()
+        """
+        key = (floor, self._get_erosion_radius_pixels(robot=robot))
+        if key not in self._floor_map_cache:
+            # create a deep copy so that we don't erode the original map
+            trav_map = self._erode_trav_map(th.clone(self.floor_map[floor]), robot=robot)
+
+            # Find connected components and bucket the flat pixel indices by component label
+            _, component_labels = cv2.connectedComponents(trav_map.cpu().numpy(), connectivity=4)
+            component_labels = th.from_numpy(component_labels)
+            flat_labels = component_labels.flatten()
+            counts = th.bincount(flat_labels)
+            component_offsets = th.zeros(len(counts) + 1, dtype=th.int64)
+            component_offsets[1:] = th.cumsum(counts, dim=0)
+
+            self._floor_map_cache[key] = {
+                "trav_map": trav_map,
+                "component_labels": component_labels,
+                "component_cells": th.argsort(flat_labels, stable=True),
+                "component_offsets": component_offsets,
+                "planner": GridPlanner(trav_map),
+                "hierarchical_planner": HierarchicalGridPlanner(trav_map) if self.hierarchical_planning else None,
+                "distance_fields": OrderedDict(),
+                "landmark_index": None,
+            }
+
+        return self._floor_map_cache[key]
+
+    def clear_cache(self, floor=None):
+        """
+        Clears the cached eroded maps. This should be called whenever the underlying traversability maps are
+        modified or regenerated
+
+        Args:
+            floor (None or int): If specified, only clears the entries for this floor. Otherwise, clears all entries
+        """
+        if floor is None:
+            self._floor_map_cache = dict()
+        else:
+            self._floor_map_cache = {key: val for key, val in self._floor_map_cache.items() if key[0] != floor}
+
     def get_random_point(self, floor=None, reference_point=None, robot=None):
         """
         Sample a random point on the given floor number. If not given, sample a random floor number.
@@ -129,6 +230,7 @@ class TraversableMap(BaseMap):
                                  Warning: if @reference_point is given, @floor must be given;
                                           otherwise, this would lead to undefined behavior
             reference_point (3-array): (x,y,z) if given, sample a point in the same connected component as this point
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
 
         Returns:
             2-tuple:
@@ -140,30 +242,157 @@ class TraversableMap(BaseMap):
 
         # If nothing is given, sample a random floor and a random point on that floor
         if floor is None and reference_point is None:
-            floor = th.randint(0, self.n_floors)
+            floor = th.randint(0, self.n_floors, (1,)).item()
 
-        # create a deep copy so that we don't erode the original map
-        trav_map = th.clone(self.floor_map[floor])
-        trav_map = self._erode_trav_map(trav_map, robot=robot)
+        map_info = self.get_eroded_map_info(floor=floor, robot=robot)
+        offsets = map_info["component_offsets"]
 
         if reference_point is not None:
-            # Find connected component
-            _, component_labels = cv2.connectedComponents(trav_map.cpu().numpy(), connectivity=4)
-            component_labels = th.tensor(component_labels)
-
             # If previous point is given, sample a point in the same connected component
             prev_xy_map = self.world_to_map(reference_point[:2])
-            prev_label = component_labels[prev_xy_map[0]][prev_xy_map[1]]
-            trav_space = th.where(component_labels == prev_label)
+            label = map_info["component_labels"][prev_xy_map[0], prev_xy_map[1]].item()
+            start, end = offsets[label].item(), offsets[label + 1].item()
         else:
-            trav_space = th.where(trav_map == 255)
-        idx = th.randint(0, high=trav_space[0].shape[0], size=(1,)).item()
-        xy_map = th.tensor([trav_space[0][idx], trav_space[1][idx]])
+            # Label 0 corresponds to the untraversable pixels, all other labels are traversable
+            start, end = offsets[1].item(), offsets[-1].item()
+        idx = th.randint(start, high=end, size=(1,)).item()
+        xy_map = th.tensor(divmod(map_info["component_cells"][idx].item(), map_info["trav_map"].shape[1]))
         x, y = self.map_to_world(xy_map)
         z = self.floor_heights[floor]
         return floor, th.tensor([x, y, z])
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, robot=None):
+    def get_distance_field(self, floor, target_world, robot=None):
+        """
+        Grabs the geodesic distance field from every pixel on floor @floor to @target_world, computing it with a
+        single Dijkstra pass over the eroded map if it is not already cached
+
+        Args:
+            floor (int): floor number
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+
+        Returns:
+            GridDistanceField: Distance field to @target_world, in map pixels
+        """
+        target_map = tuple(self.world_to_map(target_world).tolist())
+        return self._get_distance_field(
+            map_info=self.get_eroded_map_info(floor=floor, robot=robot), target_map=target_map
+        )
+
+    def _get_distance_field(self, map_info, target_map):
+        """
+        Grabs the (cached) distance field to pixel @target_map on the eroded map described by @map_info
+
+        Args:
+            map_info (dict): Cached eroded map information, as returned by get_eroded_map_info()
+            target_map (2-tuple): (row, col) target pixel
+
+        Returns:
+            GridDistanceField: Distance field to @target_map, in map pixels
+        """
+        distance_fields = map_info["distance_fields"]
+        if target_map in distance_fields:
+            distance_fields.move_to_end(target_map)
+        else:
+            distance_fields[target_map] = map_info["planner"].compute_distance_field(target_map)
+            if len(distance_fields) > m.MAX_CACHED_DISTANCE_FIELDS:
+                distance_fields.popitem(last=False)
+        return distance_fields[target_map]
+
+    def get_geodesic_distance(self, floor, source_world, target_world, robot=None):
+        """
+        Get the geodesic distance from one point to another point. This is a single lookup into the (cached)
+        distance field to @target_world, so repeated queries towards the same target are cheap
+
+        Args:
+            floor (int): floor number
+            source_world (2-array): (x,y) 2D source location in world reference frame (metric)
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+
+        Returns:
+            None or float: geodesic distance between the two points, or None if no traversable path exists
+        """
+        distance_field = self.get_distance_field(floor=floor, target_world=target_world, robot=robot)
+        distance = distance_field.get_distance(tuple(self.world_to_map(source_world).tolist()))
+        return None if distance is None else distance * self.map_resolution
+
+    def get_landmark_index(self, floor, robot=None):
+        """
+        Grabs the landmark-based geodesic distance index for floor @floor. The index is built at most once: it is
+        cached in memory, and serialized next to the scene's traversability maps so that subsequent loads of the same
+        (eroded) map can read it from disk instead
+
+        Args:
+            floor (int): floor number
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+
+        Returns:
+            GridLandmarkIndex: Landmark index for the eroded map
+        """
+        map_info = self.get_eroded_map_info(floor=floor, robot=robot)
+        if map_info["landmark_index"] is None:
+            planner = map_info["planner"]
+            # The file is keyed by the content of the eroded map, so stale indices are never loaded
+            digest = md5(map_info["trav_map"].cpu().numpy().tobytes())
+            digest.update(f"{planner.eight_connected}_{m.N_DISTANCE_INDEX_LANDMARKS}".encode())
+            fpath = (
+                None
+                if self.maps_path is None
+                else os.path.join(self.maps_path, f"floor_trav_{floor}_landmarks_{digest.hexdigest()[:16]}.npz")
+            )
+            if fpath is not None and os.path.exists(fpath):
+                landmark_index = GridLandmarkIndex.load(fpath)
+            else:
+                landmark_index = GridLandmarkIndex.build(planner, n_landmarks=m.N_DISTANCE_INDEX_LANDMARKS)
+                if fpath is not None:
+                    try:
+                        landmark_index.save(fpath)
+                    except OSError as e:
+                        log.warning(f"Could not save landmark index to {fpath}: {e}")
+            map_info["landmark_index"] = landmark_index
+
+        return map_info["landmark_index"]
+
+    def get_geodesic_distances(self, floor, sources, targets, robot=None, max_error=None):
+        """
+        Get the geodesic distances between many pairs of points at once, using the landmark index for this floor.
+        Each returned distance is the midpoint of the index's lower and upper bounds on the true distance. Pairs
+        the index cannot bound, or whose bounds are looser than @max_error, are resolved exactly from the (cached)
+        distance fields to their targets
+
+        Args:
+            floor (int): floor number
+            sources ((N, 2)-array): (x,y) 2D source locations in world reference frame (metric)
+            targets ((N, 2)-array): (x,y) 2D target locations in world reference frame (metric)
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            max_error (None or float): if specified, maximum allowed error (in meters) of each returned distance
+
+        Returns:
+            (N,)-array: geodesic distance between each source / target pair, or inf if no traversable path exists
+        """
+        sources_map = self.world_to_map(th.as_tensor(sources).reshape(-1, 2))
+        targets_map = self.world_to_map(th.as_tensor(targets).reshape(-1, 2))
+        lower, upper = self.get_landmark_index(floor=floor, robot=robot).get_distance_bounds(sources_map, targets_map)
+        distances = th.where(th.isinf(lower), math.inf, (lower + upper) / 2.0) * self.map_resolution
+
+        # Resolve the remaining pairs exactly, grouping them by target so that each distance field is computed once
+        needs_refinement = th.isnan(lower)
+        if max_error is not None:
+            needs_refinement |= (upper - lower) * self.map_resolution / 2.0 > max_error
+        needs_refinement &= ~th.isinf(lower)
+        map_info = self.get_eroded_map_info(floor=floor, robot=robot)
+        for target_map in th.unique(targets_map[needs_refinement], dim=0):
+            distance_field = self._get_distance_field(map_info=map_info, target_map=tuple(target_map.tolist()))
+            for idx in th.nonzero(needs_refinement & th.all(targets_map == target_map, dim=1)).flatten():
+                distance = distance_field.get_distance(tuple(sources_map[idx].tolist()))
+                distances[idx] = math.inf if distance is None else distance * self.map_resolution
+
+        return distances
+
+    def get_shortest_path(
+        self, floor, source_world, target_world, entire_path=False, robot=None, use_distance_field=False
+    ):
         """
         Get the shortest path from one point to another point.
         If any of the given point is not in the graph, add it to the graph and
@@ -175,6 +404,9 @@ class TraversableMap(BaseMap):
             target_world (2-array): (x,y) 2D target location in world reference frame (metric)
             entire_path (bool): whether to return the entire path
             robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            use_distance_field (bool): whether to recover the path by descending the (cached) distance field to
+                @target_world instead of running a fresh A* search. This is preferable when many queries share the
+                same target
 
         Returns:
             2-tuple:
@@ -182,14 +414,110 @@ class TraversableMap(BaseMap):
                 - float: geodesic distance of the path
         """
         source_map = tuple(self.world_to_map(source_world).tolist())
-        target_map = tuple(self.world_to_map(target_world).tolist())
 
-        # create a deep copy so that we don't erode the original map
-        trav_map = th.clone(self.floor_map[floor])
+        if use_distance_field:
+            distance_field = self.get_distance_field(floor=floor, target_world=target_world, robot=robot)
+            path_map = distance_field.get_path(source_map)
+        else:
+            target_map = tuple(self.world_to_map(target_world).tolist())
+            map_info = self.get_eroded_map_info(floor=floor, robot=robot)
+            planner = map_info["hierarchical_planner"] if self.hierarchical_planning else map_info["planner"]
+            path_map = planner.plan(source_map, target_map)
+        return self._postprocess_path(path_map=path_map, target_world=target_world, entire_path=entire_path)
+
+    def get_shortest_paths(self, floor, sources, targets, entire_path=False, robot=None, executor=None, chunk_size=16):
+        """
+        Get the shortest paths between many pairs of points at once. All queries share the same eroded map; queries
+        sharing the same target are answered by descending a single (cached) distance field to that target, and the
+        remaining independent searches can optionally be distributed across @executor
+
+        Args:
+            floor (int): floor number
+            sources ((N, 2)-array): (x,y) 2D source locations in world reference frame (metric)
+            targets ((N, 2)-array): (x,y) 2D target locations in world reference frame (metric)
+            entire_path (bool): whether to return the entire paths
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            executor (None or concurrent.futures.Executor): if specified, executor (e.g.: a thread or process pool)
+                across which the independent searches are distributed
+            chunk_size (int): number of independent searches submitted to @executor per task
+
+        Returns:
+            3-tuple:
+                - (N, M, 2) array: array of path waypoints for each query, padded with zeros up to the maximum number
+                    of waypoints M across all queries
+                - (N,) array: number of valid waypoints for each query, which is 0 if no traversable path was found
+                - (N,) array: geodesic distance of each path, which is inf if no traversable path was found
+        """
+        sources = th.as_tensor(sources, dtype=th.float32).reshape(-1, 2)
+        targets = th.as_tensor(targets, dtype=th.float32).reshape(-1, 2)
+        sources_map, targets_map = self.world_to_map(sources).tolist(), self.world_to_map(targets).tolist()
+        map_info = self.get_eroded_map_info(floor=floor, robot=robot)
+
+        # Group the queries by their target pixel
+        query_groups = dict()
+        for idx, target_map in enumerate(targets_map):
+            query_groups.setdefault(tuple(target_map), []).append(idx)
+
+        path_maps = [None] * len(sources_map)
+        independent_idxs = []
+        for target_map, idxs in query_groups.items():
+            if len(idxs) == 1:
+                independent_idxs.append(idxs[0])
+                continue
+            distance_field = self._get_distance_field(map_info=map_info, target_map=target_map)
+            for idx in idxs:
+                path_maps[idx] = distance_field.get_path(sources_map[idx])
+
+        if executor is None:
+            planner = map_info["hierarchical_planner"] if self.hierarchical_planning else map_info["planner"]
+            for idx in independent_idxs:
+                path_maps[idx] = planner.plan(sources_map[idx], targets_map[idx])
+        else:
+            trav_map = map_info["trav_map"].cpu().numpy()
+            chunks = [independent_idxs[i : i + chunk_size] for i in range(0, len(independent_idxs), chunk_size)]
+            futures = [
+                executor.submit(
+                    plan_paths,
+                    trav_map,
+                    [sources_map[idx] for idx in chunk],
+                    [targets_map[idx] for idx in chunk],
+                    hierarchical=self.hierarchical_planning,
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                for idx, path_map in zip(chunk, future.result()):
+                    path_maps[idx] = path_map
+
+        # Convert to world frame and pad all paths to the same length
+        results = [
+            self._postprocess_path(path_map=path_map, target_world=target_world, entire_path=entire_path)
+            for path_map, target_world in zip(path_maps, targets)
+        ]
+        lengths = th.tensor([0 if path is None else len(path) for path, _ in results], dtype=th.int64)
+        paths = th.zeros((len(results), int(lengths.max()) if len(results) > 0 else 0, 2))
+        geodesic_distances = th.full((len(results),), math.inf)
+        for idx, (path, geodesic_distance) in enumerate(results):
+            if path is not None:
+                paths[idx, : lengths[idx]] = path
+                geodesic_distances[idx] = geodesic_distance
+
+        return paths, lengths, geodesic_distances
+
+    def _postprocess_path(self, path_map, target_world, entire_path=False):
+        """
+        Converts a path in map frame into subsampled waypoints in world frame
 
-        trav_map = self._erode_trav_map(trav_map, robot=robot)
+        Args:
+            path_map (None or (N, 2)-array): (row, col) pixels along the path, or None if no path was found
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+            entire_path (bool): whether to return the entire path
 
-        path_map = astar(trav_map, source_map, target_map)
+        Returns:
+            2-tuple:
+                - (N, 2) array: array of path waypoints, where N is the number of generated waypoints
+                - float: geodesic distance of the path
+        """
         if path_map is None:
             # No traversable path found
             return None, None
@@ -3,12 +3,11 @@ from collections import namedtuple
 
 import torch as th
 
-import omnigibson as og
 from omnigibson.macros import create_module_macros
 from omnigibson.object_states.aabb import AABB
 from omnigibson.object_states.object_state_base import AbsoluteObjectState
 from omnigibson.utils.constants import PrimType
-from omnigibson.utils.sampling_utils import raytest, raytest_batch
+from omnigibson.utils.sampling_utils import raytest_batch
 
 # Create settings for this module
 m = create_module_macros(module_path=__file__)
@@ -20,6 +19,10 @@ m.MAX_DISTANCE_HORIZONTAL = 5.0
 # this number, the lower the possibility of false negatives in Inside and NextTo.
 m.HORIZONTAL_AXIS_COUNT = 5
 
+# Offset (in meters) past an object's extent from which rays are shot back at it to find its surface, when adjacency
+# rays should start from the object's surface instead of its AABB center
+m.SHOOTING_OFFSET = 0.01
+
 AxisAdjacencyList = namedtuple("AxisAdjacencyList", ("positive_neighbors", "negative_neighbors"))
 
 
@@ -62,7 +65,46 @@ def get_equidistant_coordinate_planes(n_planes):
     return th.stack([first_axes[:, None, :], second_axes[:, None, :]], dim=1)
 
 
-def compute_adjacencies(obj, axes, max_distance, use_aabb_center=True):
+class RayBackend:
+    """
+    Interface for casting batches of rays. Adjacency computation only interacts with the physics engine through this
+    interface, so that it can be swapped out, e.g. for testing
+    """
+
+    def raycast_all(self, start_points, end_points):
+        """
+        Casts rays from @start_points to @end_points, reporting all hits of each ray
+
+        Args:
+            start_points (th.Tensor): (N, 3) global start locations of the rays
+            end_points (th.Tensor): (N, 3) global end locations of the rays
+
+        Returns:
+            list of list of dict: (Unordered) hits of each ray, in the same format as
+                raytest_batch(..., only_closest=False). Each hit must contain at least "rigidBody", "position", and
+                "distance"
+        """
+        raise NotImplementedError
+
+
+class PhysXRayBackend(RayBackend):
+    """
+    Ray backend casting rays in the simulator's physics scene
+    """
+
+    def raycast_all(self, start_points, end_points):
+        return raytest_batch(start_points, end_points, only_closest=False)
+
+
+def _get_hit_object(scene, rigid_body_path):
+    # Links are tracked by the scene's object registry. Fall back to the hit body's parent prim otherwise
+    hit_obj = scene.object_registry("link_prim_paths", rigid_body_path, None)
+    if hit_obj is None:
+        hit_obj = scene.object_registry("prim_path", "/".join(rigid_body_path.split("/")[:-1]), None)
+    return hit_obj
+
+
+def compute_adjacencies(obj, axes, max_distance, use_aabb_center=True, ray_backend=None):
     """
     Given an object and a list of axes, find the adjacent objects in the axes'
     positive and negative directions.
@@ -74,88 +116,116 @@ def compute_adjacencies(obj, axes, max_distance, use_aabb_center=True):
         obj (StatefulObject): The object to check adjacencies of.
         axes (2D-array): (n_axes, 3) array defining the axes to check in.
             Note that each axis will be checked in both its positive and negative direction.
+        max_distance (float): Maximum distance to check for adjacent objects in each direction
         use_aabb_center (bool): If True and @obj is not of PrimType.CLOTH, will shoot rays from @obj's aabb center.
             Otherwise, will dynamically compute starting points based on the requested @axes
+        ray_backend (None or RayBackend): Backend used to cast rays. If None, rays are cast in the simulator
 
     Returns:
         list of AxisAdjacencyList: List of length len(axes) containing the adjacencies.
     """
-    # Get vectors for each of the axes' directions.
-    # The ordering is axes1+, axis1-, axis2+, axis2- etc.
-    directions = th.empty((len(axes) * 2, 3))
-    directions[0::2] = axes
-    directions[1::2] = -axes
-
-    # Prepare this object's info for ray casting.
-    if obj.prim_type == PrimType.CLOTH:
-        ray_starts = th.tile(obj.root_link.centroid_particle_position, (len(directions), 1))
-
-    else:
-        aabb_lower, aabb_higher = obj.states[AABB].get_value()
-        object_position = (aabb_lower + aabb_higher) / 2.0
-        ray_starts = th.tile(object_position, (len(directions), 1))
-
-        if not use_aabb_center:
-            # Dynamically compute start points by iterating over the directions and pre-shooting rays from
-            # which to shoot back from
-            # For a given direction, we go in the negative (opposite) direction to the edge of the object extent,
-            # and then proceed with an additional offset before shooting rays
-            shooting_offset = 0.01
-
-            direction_half_extent = directions * (aabb_higher - aabb_lower).reshape(1, 3) / 2.0
-            pre_start = object_position.reshape(1, 3) + (direction_half_extent + directions * shooting_offset)
-            pre_end = object_position.reshape(1, 3) - direction_half_extent
-
-            idx = 0
-            obj_link_paths = {link.prim_path for link in obj.links.values()}
-
-            def _ray_callback(hit):
-                # Check for self-hit -- if so, record the position and terminate early
-                should_continue = True
-                if hit.rigid_body in obj_link_paths:
-                    ray_starts[idx] = th.tensor(hit.position)
-                    should_continue = False
-                return should_continue
-
-            for ray_start, ray_end in zip(pre_start, pre_end):
-                raytest(
-                    start_point=ray_start,
-                    end_point=ray_end,
-                    only_closest=False,
-                    callback=_ray_callback,
-                )
-                idx += 1
+    return compute_adjacencies_batch(requests=[(obj, axes, max_distance, use_aabb_center)], ray_backend=ray_backend)[0]
+
+
+def compute_adjacencies_batch(requests, ray_backend=None):
+    """
+    Batched version of compute_adjacencies(), which casts the rays of all of @requests together: once to find their
+    start points if needed, and once to find their adjacent objects
 
-    # Prepare the rays to cast.
-    ray_endpoints = ray_starts + (directions * max_distance)
+    Args:
+        requests (list of 4-tuple): (obj, axes, max_distance, use_aabb_center) arguments of each adjacency computation.
+            See compute_adjacencies() for details
+        ray_backend (None or RayBackend): Backend used to cast rays. If None, rays are cast in the simulator
+
+    Returns:
+        list of list of AxisAdjacencyList: Adjacencies of each request, in the same format as compute_adjacencies()
+    """
+    ray_backend = PhysXRayBackend() if ray_backend is None else ray_backend
+    if len(requests) == 0:
+        return []
+
+    # Gather the rays of all requests. For each request, ray directions are ordered as axis1+, axis1-, axis2+, etc.
+    all_directions, all_ray_starts, all_max_distances, ray_request_idxs = [], [], [], []
+    pre_starts, pre_ends, pre_ray_idxs = [], [], []
+    request_link_paths = []
+    n_rays = 0
+    for request_idx, (obj, axes, max_distance, use_aabb_center) in enumerate(requests):
+        axes = th.as_tensor(axes, dtype=th.float32).reshape(-1, 3)
+        directions = th.empty((len(axes) * 2, 3))
+        directions[0::2] = axes
+        directions[1::2] = -axes
+        request_link_paths.append(set(obj.link_prim_paths))
+
+        # Prepare this object's info for ray casting.
+        if obj.prim_type == PrimType.CLOTH:
+            ray_starts = th.tile(obj.root_link.centroid_particle_position, (len(directions), 1))
+
+        else:
+            aabb_lower, aabb_higher = obj.states[AABB].get_value()
+            object_position = (aabb_lower + aabb_higher) / 2.0
+            ray_starts = th.tile(object_position, (len(directions), 1))
+
+            if not use_aabb_center:
+                # Dynamically compute start points by pre-shooting rays from which to shoot back from.
+                # For a given direction, we go in the negative (opposite) direction to the edge of the object extent,
+                # and then proceed with an additional offset before shooting rays
+                direction_half_extent = directions * (aabb_higher - aabb_lower).reshape(1, 3) / 2.0
+                pre_starts.append(
+                    object_position.reshape(1, 3) + (direction_half_extent + directions * m.SHOOTING_OFFSET)
+                )
+                pre_ends.append(object_position.reshape(1, 3) - direction_half_extent)
+                pre_ray_idxs.extend(range(n_rays, n_rays + len(directions)))
+
+        all_directions.append(directions)
+        all_ray_starts.append(ray_starts.float())
+        all_max_distances.append(th.full((len(directions), 1), float(max_distance)))
+        ray_request_idxs.extend([request_idx] * len(directions))
+        n_rays += len(directions)
+
+    directions = th.cat(all_directions)
+    ray_starts = th.cat(all_ray_starts)
+
+    # Start rays from where the pre-shot rays hit their own object first, if they did
+    if len(pre_ray_idxs) > 0:
+        pre_results = ray_backend.raycast_all(th.cat(pre_starts), th.cat(pre_ends))
+        for ray_idx, results in zip(pre_ray_idxs, pre_results):
+            link_paths = request_link_paths[ray_request_idxs[ray_idx]]
+            self_hits = [result for result in results if result["rigidBody"] in link_paths]
+            if len(self_hits) > 0:
+                ray_starts[ray_idx] = th.as_tensor(min(self_hits, key=lambda hit: hit["distance"])["position"])
 
     # Cast time.
-    prim_paths = obj.link_prim_paths
-    ray_results = raytest_batch(
-        ray_starts, ray_endpoints, only_closest=False, ignore_bodies=prim_paths, ignore_collisions=prim_paths
-    )
+    ray_endpoints = ray_starts + directions * th.cat(all_max_distances)
+    ray_results = ray_backend.raycast_all(ray_starts, ray_endpoints)
 
-    # Add the results to the appropriate lists
+    # Convert the hit links into unique objects encountered, ignoring the casting object's own links.
     # For now, we keep our result in the dimensionality of (direction, hit_object_order).
-    # We convert the hit link into unique objects encountered
-    objs_by_direction = []
-    for results in ray_results:
+    hit_objs = dict()
+    objs_by_direction = [[] for _ in requests]
+    for request_idx, results in zip(ray_request_idxs, ray_results):
+        obj, link_paths = requests[request_idx][0], request_link_paths[request_idx]
         unique_objs = set()
         for result in results:
+            rigid_body_path = result["rigidBody"]
+            if rigid_body_path in link_paths:
+                continue
+            key = (obj.scene, rigid_body_path)
+            if key not in hit_objs:
+                hit_objs[key] = _get_hit_object(scene=obj.scene, rigid_body_path=rigid_body_path)
             # Check if the inferred hit object is not None, we add it to our set
-            obj_prim_path = "/".join(result["rigidBody"].split("/")[:-1])
-            hit_obj = obj.scene.object_registry("prim_path", obj_prim_path, None)
-            if hit_obj is not None:
-                unique_objs.add(hit_obj)
-        objs_by_direction.append(unique_objs)
+            if hit_objs[key] is not None:
+                unique_objs.add(hit_objs[key])
+        objs_by_direction[request_idx].append(unique_objs)
 
     # Reshape so that these have the following indices:
     # (axis_idx, direction-one-or-zero, hit_idx)
-    objs_by_axis = [
-        AxisAdjacencyList(positive_neighbors, negative_neighbors)
-        for positive_neighbors, negative_neighbors in zip(objs_by_direction[::2], objs_by_direction[1::2])
+    return [
+        [
+            AxisAdjacencyList(positive_neighbors, negative_neighbors)
+            for positive_neighbors, negative_neighbors in zip(request_objs[::2], request_objs[1::2])
+        ]
+        for request_objs in objs_by_direction
     ]
-    return objs_by_axis
 
 
 class VerticalAdjacency(AbsoluteObjectState):
@@ -164,15 +234,18 @@ class VerticalAdjacency(AbsoluteObjectState):
     Value is a AxisAdjacencyList object.
     """
 
-    def _get_value(self):
-        # Call the adjacency computation with th Z axis.
-        bodies_by_axis = compute_adjacencies(
-            self.obj, th.tensor([[0, 0, 1]]), m.MAX_DISTANCE_VERTICAL, use_aabb_center=False
-        )
+    def _get_adjacency_request(self):
+        # Check adjacencies along the Z axis
+        return self.obj, th.tensor([[0, 0, 1]]), m.MAX_DISTANCE_VERTICAL, False
 
+    def _get_value_from_adjacencies(self, bodies_by_axis):
         # Return the adjacencies from the only axis we passed in.
         return bodies_by_axis[0]
 
+    def _get_value(self):
+        bodies_by_axis = compute_adjacencies_batch(requests=[self._get_adjacency_request()])[0]
+        return self._get_value_from_adjacencies(bodies_by_axis)
+
     @classmethod
     def get_dependencies(cls):
         deps = super().get_dependencies()
@@ -202,19 +275,19 @@ class HorizontalAdjacency(AbsoluteObjectState):
     2 * m.HORIZONTAL_AXIS_COUNT directions.
     """
 
-    def _get_value(self):
+    def _get_adjacency_request(self):
         coordinate_planes = get_equidistant_coordinate_planes(m.HORIZONTAL_AXIS_COUNT)
 
-        # Flatten the axis dimension and input into compute_adjacencies.
-        bodies_by_axis = compute_adjacencies(
-            self.obj, coordinate_planes.reshape(-1, 3), m.MAX_DISTANCE_HORIZONTAL, use_aabb_center=True
-        )
+        # Flatten the axis dimension and check adjacencies along all of them.
+        return self.obj, coordinate_planes.reshape(-1, 3), m.MAX_DISTANCE_HORIZONTAL, True
 
-        # Now reshape the bodies_by_axis to group by coordinate planes.
-        bodies_by_plane = list(zip(bodies_by_axis[::2], bodies_by_axis[1::2]))
+    def _get_value_from_adjacencies(self, bodies_by_axis):
+        # Reshape the bodies_by_axis to group by coordinate planes.
+        return list(zip(bodies_by_axis[::2], bodies_by_axis[1::2]))
 
-        # Return the adjacencies.
-        return bodies_by_plane
+    def _get_value(self):
+        bodies_by_axis = compute_adjacencies_batch(requests=[self._get_adjacency_request()])[0]
+        return self._get_value_from_adjacencies(bodies_by_axis)
 
     @classmethod
     def get_dependencies(cls):
@@ -223,3 +296,27 @@ class HorizontalAdjacency(AbsoluteObjectState):
         return deps
 
     # Nothing needs to be done to save/load adjacency since it will happen due to pose caching.
+
+
+def update_adjacencies(objs, state_types=(VerticalAdjacency, HorizontalAdjacency), ray_backend=None):
+    """
+    Computes the out-of-date adjacency states of all @objs with a single batch of raycasts, and caches their values
+    for the current simulator step. This avoids casting rays object by object when many binary kinematic states
+    (e.g. NextTo, OnTop, Inside, or Under) are subsequently evaluated, e.g. when building a scene graph
+
+    Args:
+        objs (list of StatefulObject): Objects whose adjacencies should be updated
+        state_types (tuple of class): Adjacency states to update, among VerticalAdjacency and HorizontalAdjacency
+        ray_backend (None or RayBackend): Backend used to cast rays. If None, rays are cast in the simulator
+    """
+    states = [
+        obj.states[state_type]
+        for obj in objs
+        for state_type in state_types
+        if state_type in obj.states and obj.states[state_type].cache_needs_update(get_value_args=())
+    ]
+    all_bodies_by_axis = compute_adjacencies_batch(
+        requests=[state._get_adjacency_request() for state in states], ray_backend=ray_backend
+    )
+    for state, bodies_by_axis in zip(states, all_bodies_by_axis):
+        state.set_cached_value(get_value_args=(), value=state._get_value_from_adjacencies(bodies_by_axis))
@@ -59,10 +59,10 @@ class ContactParticles(RelativeObjectState, KinematicsMixin):
         # Iterate over all particles and aggregate contacts
         positions = system.get_particles_position_orientation()[0]
         # Only check positions that are within the relaxed AABB of this object
-        inbound_idxs = ((lower < positions) & (positions < upper)).all(dim=-1).nonzero()
+        inbound_idxs = system.spatial_hash.query_box(lower=lower, upper=upper)
         dist = system.particle_contact_radius + m.CONTACT_TOLERANCE
-        for idx in inbound_idxs:
-            og.sim.psqi.overlap_sphere(dist, positions[idx.item()].cpu().numpy(), report_hit, False)
+        for idx in inbound_idxs.tolist():
+            og.sim.psqi.overlap_sphere(dist, positions[idx].cpu().numpy(), report_hit, False)
 
         # Return contacts
         return contacts
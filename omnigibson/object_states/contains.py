@@ -82,7 +82,11 @@ class ContainedParticles(RelativeObjectState, LinkBasedStateMixin):
 
         # Only calculate if we have valid positions
         if len(checked_positions) > 0:
-            particles_in_volume = self.check_in_volume(checked_positions)
+            # Only the particles near this container need to be checked. The spatial hash indexes the raw positions,
+            # which are at most m.VISUAL_PARTICLE_OFFSET away from the checked ones
+            particles_in_volume = self.check_in_volume(
+                checked_positions, spatial_hash=system.spatial_hash, margin=m.VISUAL_PARTICLE_OFFSET
+            )
             n_particles_in_volume = particles_in_volume.sum()
 
         return ContainedParticlesData(n_particles_in_volume, raw_positions, particles_in_volume)
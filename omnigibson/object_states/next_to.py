@@ -4,6 +4,7 @@ from omnigibson.object_states.aabb import AABB
 from omnigibson.object_states.adjacency import HorizontalAdjacency, flatten_planes
 from omnigibson.object_states.kinematics_mixin import KinematicsMixin
 from omnigibson.object_states.object_state_base import BooleanStateMixin, RelativeObjectState
+from omnigibson.utils.broadphase_utils import aabb_distance
 
 
 class NextTo(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
@@ -26,12 +27,7 @@ class NextTo(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
 
         objA_lower, objA_upper = objA_aabb
         objB_lower, objB_upper = objB_aabb
-        distance_vec = []
-        for dim in range(3):
-            glb = max(objA_lower[dim], objB_lower[dim])
-            lub = min(objA_upper[dim], objB_upper[dim])
-            distance_vec.append(max(0, glb - lub))
-        distance = th.norm(th.tensor(distance_vec, dtype=th.float32))
+        distance = aabb_distance(objA_lower, objA_upper, objB_lower, objB_upper)
         objA_dims = objA_upper - objA_lower
         objB_dims = objB_upper - objB_lower
         avg_aabb_length = th.mean(objA_dims + objB_dims)
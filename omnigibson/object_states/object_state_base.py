@@ -190,10 +190,32 @@ class BaseObjectState(BaseObjectRequirement, Serializable, Registerable, Recreat
             get_value_args (tuple): Specific argument combinations (usually tuple of objects) passed into
                 @self.get_value / @self._get_value
         """
-        t = og.sim.current_time_step_index
         # Compute value and update cache
-        val = self._get_value(*get_value_args)
-        self._cache[get_value_args] = dict(value=val, info=self.cache_info(get_value_args=get_value_args), t=t)
+        self.set_cached_value(get_value_args=get_value_args, value=self._get_value(*get_value_args))
+
+    def set_cached_value(self, get_value_args, value):
+        """
+        Stores @value as the internal cached value at the current timestep. This is useful when the values of many
+        object states are computed jointly, e.g. with a single batch of raycasts
+
+        Args:
+            get_value_args (tuple): Specific argument combinations (usually tuple of objects) passed into
+                @self.get_value / @self._get_value
+            value (any): Value of @self._get_value(*get_value_args) at the current timestep
+        """
+        t = og.sim.current_time_step_index
+        self._cache[get_value_args] = dict(value=value, info=self.cache_info(get_value_args=get_value_args), t=t)
+
+    def cache_needs_update(self, get_value_args):
+        """
+        Args:
+            get_value_args (tuple): Specific argument combinations (usually tuple of objects) passed into
+                @self.get_value
+
+        Returns:
+            bool: Whether @self.get_value(*get_value_args) would need to recompute its value
+        """
+        return get_value_args not in self._cache or not self.cache_is_valid(get_value_args=get_value_args)
 
     def cache_info(self, get_value_args):
         """
@@ -320,7 +342,7 @@ class BaseObjectState(BaseObjectRequirement, Serializable, Registerable, Recreat
         # We need to see if we need to update our cache -- we do so if and only if one of the following conditions are met:
         # (a) key is NOT in the cache
         # (b) Our cache is not valid
-        if key not in self._cache or not self.cache_is_valid(get_value_args=key):
+        if self.cache_needs_update(get_value_args=key):
             # Update the cache
             self.update_cache(get_value_args=key)
 
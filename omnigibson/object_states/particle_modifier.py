@@ -440,13 +440,21 @@ class ParticleModifier(IntrinsicObjectState, LinkBasedStateMixin, UpdateStateMix
 
         elif self.method == ParticleModifyMethod.ADJACENCY:
             # Define the function for checking whether points are within the adjacency mesh
-            def check_in_adjacency_mesh(particle_positions):
+            def check_in_adjacency_mesh(particle_positions, spatial_hash=None, margin=0.0):
                 # Define the AABB bounds
                 lower, upper = self.link.visual_aabb
                 # Add the margin
                 lower -= m.PARTICLE_MODIFIER_ADJACENCY_AREA_MARGIN
                 upper += m.PARTICLE_MODIFIER_ADJACENCY_AREA_MARGIN
-                return ((lower < particle_positions) & (particle_positions < upper)).all(dim=-1)
+                if spatial_hash is None:
+                    return ((lower < particle_positions) & (particle_positions < upper)).all(dim=-1)
+
+                # Only check the particles that the spatial hash finds near the AABB
+                idxs = spatial_hash.query_box(lower=lower - margin, upper=upper + margin)
+                in_mesh = th.zeros(len(particle_positions), dtype=th.bool)
+                positions = particle_positions[idxs]
+                in_mesh[idxs] = ((lower < positions) & (positions < upper)).all(dim=-1)
+                return in_mesh
 
             self._check_in_mesh = check_in_adjacency_mesh
 
@@ -884,7 +892,7 @@ class ParticleRemover(ParticleModifier):
         if self.obj.scene.is_visual_particle_system(system_name=system.name):
             # Iterate over all particles and remove any that are within the relaxed AABB of the remover volume
             particle_positions = system.get_particles_position_orientation()[0]
-            inbound_idxs = self._check_in_mesh(particle_positions).nonzero()
+            inbound_idxs = self._check_in_mesh(particle_positions, spatial_hash=system.spatial_hash).nonzero()
             modification_limit = self.visual_particle_modification_limit
 
         # Physical system
@@ -893,7 +901,9 @@ class ParticleRemover(ParticleModifier):
             # collisions via scene query interface. Alternatively, if we're using the projection method,
             # we also need to use check_in_mesh to check for overlap with the projection mesh.
             inbound_idxs = (
-                self._check_in_mesh(system.get_particles_position_orientation()[0]).nonzero()
+                self._check_in_mesh(
+                    system.get_particles_position_orientation()[0], spatial_hash=system.spatial_hash
+                ).nonzero()
                 if self.obj.prim_type == PrimType.CLOTH or self.method == ParticleModifyMethod.PROJECTION
                 else th.tensor(list(self.obj.states[ContactParticles].get_value(system, self.link)))
             )
@@ -1,9 +1,17 @@
+from omnigibson.macros import create_module_macros
 from omnigibson.object_states.contact_bodies import ContactBodies
 from omnigibson.object_states.kinematics_mixin import KinematicsMixin
 from omnigibson.object_states.object_state_base import BooleanStateMixin, RelativeObjectState
 from omnigibson.utils.constants import PrimType
 from omnigibson.utils.usd_utils import RigidContactAPI
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Objects whose AABBs are further apart than this distance (in meters) are assumed not to be touching. This should be
+# larger than the physics contact offsets, so that it never rejects a reported contact
+m.BROADPHASE_MARGIN = 0.05
+
 
 class Touching(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
 
@@ -14,6 +22,9 @@ class Touching(KinematicsMixin, RelativeObjectState, BooleanStateMixin):
     def _get_value(self, other):
         if self.obj.prim_type == PrimType.CLOTH and other.prim_type == PrimType.CLOTH:
             raise ValueError("Cannot detect contact between two cloth objects.")
+        # Objects far away from each other cannot be touching
+        elif not self.obj.scene.objects_may_be_near(self.obj, other, margin=m.BROADPHASE_MARGIN):
+            return False
         # If one of the objects is the cloth object, the contact will be asymmetrical.
         # The rigid object will appear in the ContactBodies of the cloth object, but not the other way around.
         elif self.obj.prim_type == PrimType.CLOTH:
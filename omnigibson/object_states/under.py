@@ -1,5 +1,6 @@
 import omnigibson as og
 from omnigibson.object_states.adjacency import VerticalAdjacency
+from omnigibson.object_states.adjacency import m as adjacency_m
 from omnigibson.object_states.kinematics_mixin import KinematicsMixin
 from omnigibson.object_states.object_state_base import BooleanStateMixin, RelativeObjectState
 from omnigibson.utils.constants import PrimType
@@ -39,6 +40,12 @@ class Under(RelativeObjectState, KinematicsMixin, BooleanStateMixin):
         if other.prim_type == PrimType.CLOTH:
             raise ValueError("Cannot detect if an object is under a cloth object.")
 
+        # Objects further apart than the vertical adjacency rays can reach cannot be under one another
+        if not self.obj.scene.objects_may_be_near(
+            self.obj, other, margin=adjacency_m.MAX_DISTANCE_VERTICAL + adjacency_m.SHOOTING_OFFSET
+        ):
+            return False
+
         adjacency = self.obj.states[VerticalAdjacency].get_value()
         other_adjacency = other.states[VerticalAdjacency].get_value()
         return (
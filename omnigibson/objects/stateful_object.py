@@ -213,6 +213,10 @@ class StatefulObject(BaseObject):
         has had its state updated within the last simulation step
         """
         self.scene.updated_state_objects.add(self)
+        # Also record this with the transition rules, which may be evaluated much later than this update, e.g. after the
+        # scene's updated objects are cleared at the start of the next simulator step
+        if gm.ENABLE_TRANSITION_RULES and self.scene.transition_rule_api is not None:
+            self.scene.transition_rule_api.updated_objects.add(self)
 
     def prepare_object_states(self):
         """
@@ -596,13 +600,16 @@ class StatefulObject(BaseObject):
 
     def clear_states_cache(self):
         """
-        Clears the internal cache from all owned states
+        Clears the internal cache from all owned states, and invalidates the scene's broadphase index, which is built
+        from the owned AABB state
         """
         # Check self._states just in case states have not been initialized yet.
         if not self._states:
             return
         for _, obj_state in self._states.items():
             obj_state.clear_cache()
+        if self._scene_assigned and self.scene is not None:
+            self.scene.invalidate_broadphase()
 
     def set_position_orientation(
         self, position=None, orientation=None, frame: Literal["world", "parent", "scene"] = "world"
@@ -5,13 +5,25 @@ import torch as th
 from PIL import Image
 
 from omnigibson import object_states
+from omnigibson.macros import create_module_macros
+from omnigibson.object_states.adjacency import update_adjacencies
 from omnigibson.object_states.factory import get_state_name
 from omnigibson.object_states.object_state_base import AbsoluteObjectState, BooleanStateMixin, RelativeObjectState
 from omnigibson.robots import BaseRobot
 from omnigibson.sensors import VisionSensor
 from omnigibson.utils import transform_utils as T
+from omnigibson.utils.constants import PrimType
 from omnigibson.utils.numpy_utils import pil_to_tensor
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Position (m) / orientation (quaternion component) / joint position tolerances under which an object is considered to
+# not have moved since the last scene graph step in incremental mode
+m.INCREMENTAL_POS_TOLERANCE = 1e-4
+m.INCREMENTAL_ORI_TOLERANCE = 1e-4
+m.INCREMENTAL_JOINT_TOLERANCE = 1e-4
+
 
 def _formatted_aabb(obj):
     return T.pose2mat((obj.aabb_center, th.tensor([0, 0, 0, 1], dtype=th.float32))), obj.aabb_extent
@@ -29,6 +41,7 @@ class SceneGraphBuilder(object):
             object_states.Touching,
             object_states.NextTo,
         ),
+        incremental=False,
     ):
         """
         A utility that builds a scene graph with objects as nodes and relative states as edges,
@@ -44,6 +57,12 @@ class SceneGraphBuilder(object):
             merge_parallel_edges (bool): Whether parallel edges (e.g. different states of the same pair of objects) should
                 exist (making the graph a MultiDiGraph) or should be merged into a single edge instead.
             exclude_states (Iterable): Object state classes that should be ignored when building the graph.
+            incremental (bool): Whether to only recompute the nodes and edges of objects that changed since the last
+                step, i.e.: objects that moved (root pose or joint positions), had an object state updated during the
+                last simulation step (see scene.updated_state_objects), are deformable, or just came into view. All
+                other nodes keep their attributes, and edges between two unchanged objects are kept as-is. Note that
+                this assumes step() is called after every simulation step, since scene.updated_state_objects only
+                tracks the most recent one.
         """
         self._G = None
         self._robots = None
@@ -56,6 +75,15 @@ class SceneGraphBuilder(object):
         self._merge_parallel_edges = merge_parallel_edges
         self._last_desired_frame_to_world = None
         self._exclude_states = set(exclude_states)
+        self._incremental = incremental
+
+        # Maps each object in view during the last step to its (position, orientation, joint positions) at that step.
+        # Only used in incremental mode
+        self._last_obj_signatures = dict()
+
+        # Number of nodes and (ordered) object pairs whose states were recomputed during the last step
+        self.n_recomputed_nodes = 0
+        self.n_recomputed_edges = 0
 
     def get_scene_graph(self):
         return self._G.copy()
@@ -95,13 +123,21 @@ class SceneGraphBuilder(object):
 
         return states
 
-    def _get_boolean_binary_states(self, objs):
+    def _get_boolean_binary_states(self, objs, dirty_objs=None):
+        # Cast the adjacency rays of all objects in a single batch, instead of object by object as states are evaluated
+        if dirty_objs is None or len(dirty_objs) > 0:
+            update_adjacencies(objs)
+
         states = []
         for obj1 in objs:
             for obj2 in objs:
                 if obj1 == obj2:
                     continue
 
+                # Pairs of unchanged objects keep their edges
+                if dirty_objs is not None and obj1 not in dirty_objs and obj2 not in dirty_objs:
+                    continue
+
                 for state_type, state_inst in obj1.states.items():
                     if not issubclass(state_type, BooleanStateMixin) or not issubclass(state_type, RelativeObjectState):
                         continue
@@ -120,6 +156,28 @@ class SceneGraphBuilder(object):
 
         return states
 
+    def _get_obj_signature(self, obj):
+        pos, ori = obj.get_position_orientation()
+        joint_pos = obj.get_joint_positions() if obj.n_joints > 0 else None
+        return pos, ori, joint_pos
+
+    def _has_obj_changed(self, obj, signature):
+        # Deformable objects can change shape without their root pose changing
+        if obj.prim_type == PrimType.CLOTH or obj not in self._last_obj_signatures:
+            return True
+        pos, ori, joint_pos = signature
+        last_pos, last_ori, last_joint_pos = self._last_obj_signatures[obj]
+        if not th.allclose(pos, last_pos, rtol=0.0, atol=m.INCREMENTAL_POS_TOLERANCE):
+            return True
+        # q and -q represent the same orientation
+        if not th.allclose(ori, last_ori, rtol=0.0, atol=m.INCREMENTAL_ORI_TOLERANCE) and not th.allclose(
+            ori, -last_ori, rtol=0.0, atol=m.INCREMENTAL_ORI_TOLERANCE
+        ):
+            return True
+        return joint_pos is not None and not th.allclose(
+            joint_pos, last_joint_pos, rtol=0.0, atol=m.INCREMENTAL_JOINT_TOLERANCE
+        )
+
     def start(self, scene):
         assert self._G is None, "Cannot start graph builder multiple times."
 
@@ -185,13 +243,31 @@ class SceneGraphBuilder(object):
         base_robots = [obj for obj in objs_to_add if isinstance(obj, BaseRobot)]
         objs_to_add -= set(base_robots)
 
+        # Determine which objects need to be recomputed
+        if self._incremental:
+            signatures = {obj: self._get_obj_signature(obj) for obj in objs_to_add}
+            updated_state_objects = scene.updated_state_objects
+            dirty_objs = {
+                obj
+                for obj, signature in signatures.items()
+                if obj in updated_state_objects or obj not in self._G.nodes or self._has_obj_changed(obj, signature)
+            }
+            self._last_obj_signatures = signatures
+        else:
+            dirty_objs = objs_to_add
+
         for obj in objs_to_add:
             # Add the object if not already in the graph
             if obj not in self._G.nodes:
                 self._G.add_node(obj)
 
             # Get the relative position of the object & update it (reducing accumulated errors)
-            self._G.nodes[obj]["pose"] = world_to_desired_frame @ T.pose2mat(obj.get_position_orientation())
+            pos, ori = signatures[obj][:2] if self._incremental else obj.get_position_orientation()
+            self._G.nodes[obj]["pose"] = world_to_desired_frame @ T.pose2mat((pos, ori))
+
+            # Unchanged objects keep their bounding box and states
+            if obj not in dirty_objs:
+                continue
 
             # Get the bounding box.
             if hasattr(obj, "get_base_aligned_bbox"):
@@ -206,8 +282,25 @@ class SceneGraphBuilder(object):
             self._G.nodes[obj]["states"] = self._get_boolean_unary_states(obj)
 
         # Update the binary states for seen objects.
-        self._G.remove_edges_from(list(itertools.product(objs_to_add, objs_to_add)))
-        edges = self._get_boolean_binary_states(objs_to_add)
+        if self._incremental:
+            # Remove every (possibly parallel) edge between seen objects that involves at least one changed object
+            all_edges = self._G.edges if self._merge_parallel_edges else self._G.edges(keys=True)
+            self._G.remove_edges_from(
+                [
+                    edge
+                    for edge in all_edges
+                    if edge[0] in objs_to_add
+                    and edge[1] in objs_to_add
+                    and (edge[0] in dirty_objs or edge[1] in dirty_objs)
+                ]
+            )
+            edges = self._get_boolean_binary_states(objs_to_add, dirty_objs=dirty_objs)
+        else:
+            self._G.remove_edges_from(list(itertools.product(objs_to_add, objs_to_add)))
+            edges = self._get_boolean_binary_states(objs_to_add)
+        n_clean = len(objs_to_add) - len(dirty_objs)
+        self.n_recomputed_nodes = len(dirty_objs)
+        self.n_recomputed_edges = len(objs_to_add) * (len(objs_to_add) - 1) - n_clean * (n_clean - 1)
         if self._merge_parallel_edges:
             new_edges = {}
             for edge in edges:
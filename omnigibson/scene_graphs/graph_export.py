@@ -0,0 +1,274 @@
+"""
+Utilities for exporting scene graphs built by SceneGraphBuilder into compact, tensor-backed structures, and for
+streaming per-step differences between them
+"""
+
+import torch as th
+
+# Unary states are packed into an int64 bitmask per node
+MAX_UNARY_STATES = 63
+
+
+def _empty_export():
+    return {
+        "node_ids": th.zeros(0, dtype=th.int64),
+        "poses": th.zeros((0, 4, 4), dtype=th.float32),
+        "bbox_poses": th.zeros((0, 4, 4), dtype=th.float32),
+        "bbox_extents": th.zeros((0, 3), dtype=th.float32),
+        "unary_states": th.zeros(0, dtype=th.int64),
+        "edge_index": th.zeros((2, 0), dtype=th.int64),
+        "edge_predicates": th.zeros(0, dtype=th.int64),
+        "edge_values": th.zeros(0, dtype=th.bool),
+    }
+
+
+def _edge_keys(src_ids, dst_ids, predicates, n_ids, n_predicates):
+    # Encodes (src, dst, predicate) triplets into unique int64 keys
+    return (src_ids * n_ids + dst_ids) * n_predicates + predicates
+
+
+class SceneGraphExporter:
+    """
+    Exports scene graphs built by SceneGraphBuilder into compact tensor-backed dictionaries, with:
+
+        - node_ids (th.Tensor): (N,) sorted int64 node IDs
+        - poses (th.Tensor): (N, 4, 4) node poses
+        - bbox_poses (th.Tensor): (N, 4, 4) node bounding box poses
+        - bbox_extents (th.Tensor): (N, 3) node bounding box extents
+        - unary_states (th.Tensor): (N,) int64 bitmask of each node's True unary states
+        - edge_index (th.Tensor): (2, E) COO (source row, target row) indices into the node tables
+        - edge_predicates (th.Tensor): (E,) int64 predicate (binary state) codes
+        - edge_values (th.Tensor): (E,) bool predicate values
+
+    Node IDs, unary state bits, and predicate codes are assigned the first time the corresponding object or state is
+    seen, and are stable for the lifetime of the exporter, so exports from different steps can be compared and diffed.
+    """
+
+    def __init__(self):
+        self.node_ids = dict()
+        self.unary_state_ids = dict()
+        self.predicate_ids = dict()
+
+    def _get_id(self, vocab, key):
+        if key not in vocab:
+            vocab[key] = len(vocab)
+        return vocab[key]
+
+    def _get_unary_state_bitmask(self, states):
+        bitmask = 0
+        for state_name, value in states.items():
+            bit = self._get_id(self.unary_state_ids, state_name)
+            assert bit < MAX_UNARY_STATES, f"Cannot export more than {MAX_UNARY_STATES} distinct unary states!"
+            if value:
+                bitmask |= 1 << bit
+        return bitmask
+
+    @property
+    def node_names(self):
+        """
+        Returns:
+            list of str: Names of the exported objects, indexed by node ID
+        """
+        return list(self.node_ids.keys())
+
+    @property
+    def unary_state_names(self):
+        """
+        Returns:
+            list of str: Names of the exported unary states, indexed by bit in the unary state bitmask
+        """
+        return list(self.unary_state_ids.keys())
+
+    @property
+    def predicate_names(self):
+        """
+        Returns:
+            list of str: Names of the exported predicates (binary states), indexed by predicate code
+        """
+        return list(self.predicate_ids.keys())
+
+    def export(self, G):
+        """
+        Exports scene graph @G into a compact tensor-backed dictionary. See the class docstring for its contents
+
+        Args:
+            G (nx.DiGraph or nx.MultiDiGraph): Scene graph, e.g. from SceneGraphBuilder.get_scene_graph()
+
+        Returns:
+            dict: Tensor-backed scene graph
+        """
+        if G.number_of_nodes() == 0:
+            return _empty_export()
+
+        nodes = list(G.nodes)
+        node_ids = th.tensor([self._get_id(self.node_ids, obj.name) for obj in nodes], dtype=th.int64)
+        node_ids, order = th.sort(node_ids)
+        nodes = [nodes[i] for i in order.tolist()]
+        obj_to_row = {obj: row for row, obj in enumerate(nodes)}
+
+        node_data = [G.nodes[obj] for obj in nodes]
+        export = {
+            "node_ids": node_ids,
+            "poses": th.stack([data["pose"] for data in node_data]).float(),
+            "bbox_poses": th.stack([data["bbox_pose"] for data in node_data]).float(),
+            "bbox_extents": th.stack([th.as_tensor(data["bbox_extent"]) for data in node_data]).float(),
+            "unary_states": th.tensor(
+                [self._get_unary_state_bitmask(data["states"]) for data in node_data], dtype=th.int64
+            ),
+        }
+
+        # Flatten (possibly merged) edges into one COO entry per predicate
+        src_rows, dst_rows, predicates, values = [], [], [], []
+        if G.is_multigraph():
+            edge_states = (
+                (obj1, obj2, ((state_name, data["value"]),))
+                for obj1, obj2, state_name, data in G.edges(keys=True, data=True)
+            )
+        else:
+            edge_states = G.edges(data="states")
+        for obj1, obj2, states in edge_states:
+            for state_name, value in states:
+                src_rows.append(obj_to_row[obj1])
+                dst_rows.append(obj_to_row[obj2])
+                predicates.append(self._get_id(self.predicate_ids, state_name))
+                values.append(bool(value))
+        export["edge_index"] = th.tensor([src_rows, dst_rows], dtype=th.int64).reshape(2, -1)
+        export["edge_predicates"] = th.tensor(predicates, dtype=th.int64)
+        export["edge_values"] = th.tensor(values, dtype=th.bool)
+
+        return export
+
+    def diff(self, prev_export, export, atol=1e-5):
+        """
+        Computes the difference between two exported scene graphs. Nodes and edges are identified by their node IDs
+        (and predicate codes), so both exports must come from this exporter
+
+        Args:
+            prev_export (dict): Previously exported scene graph
+            export (dict): Newly exported scene graph
+            atol (float): Absolute tolerance under which node poses and bounding boxes are considered unchanged
+
+        Returns:
+            dict: Scene graph diff, with:
+                - node_ids (th.Tensor): (N,) IDs of nodes that were added or whose attributes changed
+                - poses, bbox_poses, bbox_extents, unary_states (th.Tensor): The new attributes of those nodes
+                - removed_node_ids (th.Tensor): (M,) IDs of removed nodes
+                - added_edges (th.Tensor): (3, E) (source ID, target ID, predicate code) of added or changed edges
+                - added_edge_values (th.Tensor): (E,) values of those edges
+                - removed_edges (th.Tensor): (3, F) (source ID, target ID, predicate code) of removed edges
+        """
+        prev_ids, ids = prev_export["node_ids"], export["node_ids"]
+
+        # Nodes: IDs are sorted in both exports, so common nodes can be aligned with searchsorted
+        is_common = th.isin(ids, prev_ids)
+        prev_rows = th.searchsorted(prev_ids, ids[is_common])
+        is_changed = th.ones(len(ids), dtype=th.bool)
+        is_unchanged = export["unary_states"][is_common] == prev_export["unary_states"][prev_rows]
+        for key in ("poses", "bbox_poses", "bbox_extents"):
+            is_close = th.isclose(export[key][is_common], prev_export[key][prev_rows], rtol=0.0, atol=atol)
+            is_unchanged &= is_close.flatten(1).all(dim=1)
+        is_changed[is_common] = ~is_unchanged
+        diff = {
+            key: export[key][is_changed] for key in ("node_ids", "poses", "bbox_poses", "bbox_extents", "unary_states")
+        }
+        diff["removed_node_ids"] = prev_ids[~th.isin(prev_ids, ids)]
+
+        # Edges: compare (source ID, target ID, predicate code) keys
+        prev_edges = th.cat([prev_ids[prev_export["edge_index"]], prev_export["edge_predicates"].unsqueeze(0)], dim=0)
+        edges = th.cat([ids[export["edge_index"]], export["edge_predicates"].unsqueeze(0)], dim=0)
+        n_ids = max(len(self.node_ids), 1)
+        n_predicates = max(len(self.predicate_ids), 1)
+        prev_keys = _edge_keys(*prev_edges, n_ids=n_ids, n_predicates=n_predicates)
+        keys = _edge_keys(*edges, n_ids=n_ids, n_predicates=n_predicates)
+        # Keys with the same value in both exports are unchanged
+        value_keys = keys * 2 + export["edge_values"]
+        prev_value_keys = prev_keys * 2 + prev_export["edge_values"]
+        is_added = ~th.isin(value_keys, prev_value_keys)
+        diff["added_edges"] = edges[:, is_added]
+        diff["added_edge_values"] = export["edge_values"][is_added]
+        diff["removed_edges"] = prev_edges[:, ~th.isin(prev_keys, keys)]
+
+        return diff
+
+    def apply_diff(self, export, diff):
+        """
+        Applies scene graph diff @diff to exported scene graph @export, such that
+        apply_diff(prev_export, diff(prev_export, export)) reconstructs export (up to the diff's tolerance)
+
+        Args:
+            export (dict): Exported scene graph to apply the diff to
+            diff (dict): Scene graph diff, e.g. from diff()
+
+        Returns:
+            dict: Updated exported scene graph
+        """
+        # Nodes: drop removed and updated nodes, then add the updated ones back
+        ids = export["node_ids"]
+        keep = ~th.isin(ids, diff["removed_node_ids"]) & ~th.isin(ids, diff["node_ids"])
+        node_ids, order = th.sort(th.cat([ids[keep], diff["node_ids"]]))
+        new_export = {"node_ids": node_ids}
+        for key in ("poses", "bbox_poses", "bbox_extents", "unary_states"):
+            new_export[key] = th.cat([export[key][keep], diff[key]])[order]
+
+        # Edges: drop removed and updated edges and edges of removed nodes, then add the updated ones back
+        edges = th.cat([ids[export["edge_index"]], export["edge_predicates"].unsqueeze(0)], dim=0)
+        n_ids = max(len(self.node_ids), 1)
+        n_predicates = max(len(self.predicate_ids), 1)
+        keys = _edge_keys(*edges, n_ids=n_ids, n_predicates=n_predicates)
+        removed_keys = th.cat(
+            [
+                _edge_keys(*diff["removed_edges"], n_ids=n_ids, n_predicates=n_predicates),
+                _edge_keys(*diff["added_edges"], n_ids=n_ids, n_predicates=n_predicates),
+            ]
+        )
+        keep = ~th.isin(keys, removed_keys) & th.isin(edges[0], node_ids) & th.isin(edges[1], node_ids)
+        edges = th.cat([edges[:, keep], diff["added_edges"]], dim=1)
+        new_export["edge_index"] = th.searchsorted(node_ids, edges[:2])
+        new_export["edge_predicates"] = edges[2]
+        new_export["edge_values"] = th.cat([export["edge_values"][keep], diff["added_edge_values"]])
+
+        return new_export
+
+
+class SceneGraphDiffStream:
+    """
+    Streams per-step diffs of a scene graph, e.g. one built by SceneGraphBuilder, optionally forwarding each diff to a
+    sink such as a queue's put() method or a function writing it to disk (e.g. with th.save). The first diff contains
+    the whole graph.
+
+    Args:
+        exporter (None or SceneGraphExporter): Exporter to use. If None, a new one will be created
+        sink (None or function): If specified, function called with each diff dictionary
+        atol (float): Absolute tolerance under which node poses and bounding boxes are considered unchanged
+    """
+
+    def __init__(self, exporter=None, sink=None, atol=1e-5):
+        self.exporter = SceneGraphExporter() if exporter is None else exporter
+        self.sink = sink
+        self.atol = atol
+        self._last_export = _empty_export()
+
+    @property
+    def last_export(self):
+        """
+        Returns:
+            dict: Most recently exported scene graph
+        """
+        return self._last_export
+
+    def step(self, G):
+        """
+        Exports scene graph @G and computes its diff with respect to the previous step
+
+        Args:
+            G (nx.DiGraph or nx.MultiDiGraph): Scene graph, e.g. from SceneGraphBuilder.get_scene_graph()
+
+        Returns:
+            dict: Scene graph diff. See SceneGraphExporter.diff() for its contents
+        """
+        export = self.exporter.export(G)
+        diff = self.exporter.diff(self._last_export, export, atol=self.atol)
+        self._last_export = export
+        if self.sink is not None:
+            self.sink(diff)
+        return diff
@@ -30,6 +30,7 @@ class InteractiveTraversableScene(TraversableScene):
         trav_map_with_objects=True,
         num_waypoints=10,
         waypoint_resolution=0.2,
+        hierarchical_planning=False,
         load_object_categories=None,
         not_load_object_categories=None,
         load_room_types=None,
@@ -50,6 +51,7 @@ class InteractiveTraversableScene(TraversableScene):
             trav_map_with_objects (bool): whether to use objects or not when constructing graph
             num_waypoints (int): number of way points returned
             waypoint_resolution (float): resolution of adjacent way points
+            hierarchical_planning (bool): whether to use multi-resolution planning for shortest path queries
             load_object_categories (None or list): if specified, only load these object categories into the scene
             not_load_object_categories (None or list): if specified, do not load these object categories into the scene
             load_room_types (None or list): only load objects in these room types into the scene
@@ -98,6 +100,7 @@ class InteractiveTraversableScene(TraversableScene):
             trav_map_with_objects=trav_map_with_objects,
             num_waypoints=num_waypoints,
             waypoint_resolution=waypoint_resolution,
+            hierarchical_planning=hierarchical_planning,
             use_floor_plane=False,
         )
 
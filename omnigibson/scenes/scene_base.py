@@ -12,6 +12,7 @@ import omnigibson as og
 import omnigibson.lazy as lazy
 import omnigibson.utils.transform_utils as T
 from omnigibson.macros import create_module_macros, gm
+from omnigibson.object_states.aabb import AABB
 from omnigibson.objects.dataset_object import DatasetObject
 from omnigibson.objects.light_object import LightObject
 from omnigibson.objects.object_base import BaseObject
@@ -28,6 +29,7 @@ from omnigibson.systems.system_base import (
     get_all_system_names,
 )
 from omnigibson.transition_rules import TransitionRuleAPI
+from omnigibson.utils.broadphase_utils import AABBBroadphase, aabb_distance
 from omnigibson.utils.config_utils import TorchEncoder
 from omnigibson.utils.constants import STRUCTURE_CATEGORIES
 from omnigibson.utils.python_utils import (
@@ -46,6 +48,14 @@ from omnigibson.utils.usd_utils import CollisionAPI, add_asset_to_stage
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Cell size (in meters) of the scene's broadphase grid, and how many cells an object's AABB can span before it is
+# compared against all other objects instead of being hashed into the grid
+m.BROADPHASE_CELL_SIZE = 1.0
+m.BROADPHASE_MAX_CELLS_PER_BOX = 64
+
 # Global dicts that will contain mappings
 REGISTERED_SCENES = dict()
 
@@ -96,6 +106,10 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         self._pose = None
         self._pose_inv = None
         self._updated_state_objects = None
+        self._broadphase = AABBBroadphase(
+            cell_size=m.BROADPHASE_CELL_SIZE, max_cells_per_box=m.BROADPHASE_MAX_CELLS_PER_BOX
+        )
+        self._broadphase_t = None
 
         # Call super init
         super().__init__()
@@ -209,7 +223,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
             list of str: Keys with which to index into the object registry. These should be valid public attributes of
                 prims that we can use as unique IDs to reference prims, e.g., prim.prim_path, prim.name, etc.
         """
-        return ["name", "prim_path", "uuid"]
+        return ["name", "prim_path", "uuid", "link_prim_paths"]
 
     @property
     def object_registry_group_keys(self):
@@ -245,6 +259,84 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
     def clear_updated_objects(self):
         self._updated_state_objects = set()
 
+    @property
+    def broadphase(self):
+        """
+        Returns:
+            AABBBroadphase: Broadphase index over the AABBs of all objects in the scene with an AABB state, keyed by
+                object. It is lazily refreshed at most once per simulator step, or after it has been invalidated by
+                objects being added, removed, moved, or having their state loaded in between steps
+        """
+        if self._broadphase_t != og.sim.current_time_step_index:
+            self.update_broadphase()
+        return self._broadphase
+
+    def update_broadphase(self):
+        """
+        Refreshes the scene's broadphase index from the AABB states of all objects in the scene
+        """
+        objs = list(self.get_objects_with_state(AABB))
+        aabbs = [obj.states[AABB].get_value() for obj in objs]
+        lowers = th.stack([lower for lower, _ in aabbs]) if len(objs) > 0 else th.zeros((0, 3))
+        uppers = th.stack([upper for _, upper in aabbs]) if len(objs) > 0 else th.zeros((0, 3))
+        self._broadphase.update(keys=objs, lowers=lowers, uppers=uppers)
+        self._broadphase_t = og.sim.current_time_step_index
+
+    def invalidate_broadphase(self):
+        """
+        Marks the scene's broadphase index as out of date, so that it is refreshed the next time it is queried. This
+        should be called whenever objects' AABBs change in between simulator steps, e.g. when they are teleported
+        """
+        self._broadphase_t = None
+
+    def get_non_object_collision_aabbs(self):
+        """
+        Returns:
+            None or 2-tuple: If this scene has collision geometry that does not belong to any object, and is therefore
+                not tracked by the broadphase index, the (n, 3) lower and upper corners of its AABBs. Otherwise, None
+        """
+        return None
+
+    def get_candidate_object_pairs(self, margin=0.0):
+        """
+        Lists all pairs of objects in the scene whose AABBs are within @margin of each other. Any pair of objects not
+        in this list is guaranteed not to be in contact, nor within @margin of each other
+
+        Args:
+            margin (float): Maximum distance between the AABBs of a pair of objects, in meters
+
+        Returns:
+            list of 2-tuple: Pairs of objects whose AABBs are within @margin of each other
+        """
+        return self.broadphase.query_pairs(margin=margin)
+
+    def objects_may_be_near(self, obj_a, obj_b, margin=0.0):
+        """
+        Conservatively checks whether the AABBs of two objects are within @margin of each other, e.g. to reject distant
+        pairs of objects before evaluating expensive kinematic predicates between them. This does not force the
+        broadphase index to be refreshed: if it is out of date or does not contain both objects, their AABB states are
+        compared directly instead
+
+        Args:
+            obj_a (StatefulObject): First object
+            obj_b (StatefulObject): Second object
+            margin (float): Maximum distance between the AABBs of the objects, in meters
+
+        Returns:
+            bool: False if the objects' AABBs are guaranteed to be further than @margin from each other, else True
+        """
+        if (
+            self._broadphase_t == og.sim.current_time_step_index
+            and obj_a in self._broadphase
+            and obj_b in self._broadphase
+        ):
+            return self._broadphase.are_near(obj_a, obj_b, margin=margin)
+        if AABB not in obj_a.states or AABB not in obj_b.states:
+            return True
+        lower_a, upper_a = obj_a.states[AABB].get_value()
+        lower_b, upper_b = obj_b.states[AABB].get_value()
+        return aabb_distance(lower_a, upper_a, lower_b, upper_b).item() <= margin
+
     def prebuild(self):
         """
         Prebuild the scene USD before loading it into the simulator. This is useful for caching the scene USD for faster
@@ -652,6 +744,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
                 # Run any additional scene-specific logic with the created object
                 self._add_object(obj)
 
+                # The broadphase index needs to be refreshed to include this object
+                self.invalidate_broadphase()
+
     def remove_object(self, obj, _batched_call=False):
         """
         Method to remove an object from the simulator
@@ -667,6 +762,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
             # Sometimes we don't register objects to the object registry during add_object (e.g. particle templates)
             if self.object_registry.object_is_registered(obj):
                 self.object_registry.remove(obj)
+                self.invalidate_broadphase()
 
             # Remove from omni stage
             obj.remove()
@@ -872,7 +968,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         raise NotImplementedError()
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, robot=None):
+    def get_shortest_path(
+        self, floor, source_world, target_world, entire_path=False, robot=None, use_distance_field=False
+    ):
         """
         Get the shortest path from one point to another point.
 
@@ -882,6 +980,8 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
             target_world (2-array): (x,y) 2D target location in world reference frame (metric)
             entire_path (bool): whether to return the entire path
             robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            use_distance_field (bool): whether to recover the path from a cached distance field to @target_world
+                instead of running a fresh search
 
         Returns:
             2-tuple:
@@ -890,6 +990,60 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         raise NotImplementedError()
 
+    def get_shortest_paths(self, floor, sources, targets, entire_path=False, robot=None, executor=None, chunk_size=16):
+        """
+        Get the shortest paths between many pairs of points at once.
+
+        Args:
+            floor (int): floor number
+            sources ((N, 2)-array): (x,y) 2D source locations in world reference frame (metric)
+            targets ((N, 2)-array): (x,y) 2D target locations in world reference frame (metric)
+            entire_path (bool): whether to return the entire paths
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            executor (None or concurrent.futures.Executor): if specified, executor (e.g.: a thread or process pool)
+                across which the independent searches are distributed
+            chunk_size (int): number of independent searches submitted to @executor per task
+
+        Returns:
+            3-tuple:
+                - (N, M, 2) array: array of path waypoints for each query, padded with zeros up to the maximum number
+                    of waypoints M across all queries
+                - (N,) array: number of valid waypoints for each query, which is 0 if no traversable path was found
+                - (N,) array: geodesic distance of each path, which is inf if no traversable path was found
+        """
+        raise NotImplementedError()
+
+    def get_geodesic_distance(self, floor, source_world, target_world, robot=None):
+        """
+        Get the geodesic distance from one point to another point.
+
+        Args:
+            floor (int): floor number
+            source_world (2-array): (x,y) 2D source location in world reference frame (metric)
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+
+        Returns:
+            None or float: geodesic distance between the two points, or None if no traversable path exists
+        """
+        raise NotImplementedError()
+
+    def get_geodesic_distances(self, floor, sources, targets, robot=None, max_error=None):
+        """
+        Get the geodesic distances between many pairs of points at once.
+
+        Args:
+            floor (int): floor number
+            sources ((N, 2)-array): (x,y) 2D source locations in world reference frame (metric)
+            targets ((N, 2)-array): (x,y) 2D target locations in world reference frame (metric)
+            robot (None or BaseRobot): if given, erode the traversability map to account for the robot's size
+            max_error (None or float): if specified, maximum allowed error (in meters) of each returned distance
+
+        Returns:
+            (N,)-array: geodesic distance between each source / target pair, or inf if no traversable path exists
+        """
+        raise NotImplementedError()
+
     def get_floor_height(self, floor=0):
         """
         Get the height of the given floor. Default is 0.0, since we only have a single floor
@@ -948,6 +1102,13 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         # Default state for the scene is from the registry alone
         self._registry.load_state(state=state, serialized=False)
 
+        # Objects may have been moved, so the broadphase index is out of date
+        self.invalidate_broadphase()
+
+        # Any transition rule inputs may have changed
+        if gm.ENABLE_TRANSITION_RULES and self._transition_rule_api is not None:
+            self._transition_rule_api.invalidate()
+
     def serialize(self, state):
         # Default state for the scene is from the registry alone
         return self._registry.serialize(state=state)
@@ -34,6 +34,7 @@ class StaticTraversableScene(TraversableScene):
         trav_map_with_objects=True,
         num_waypoints=10,
         waypoint_resolution=0.2,
+        hierarchical_planning=False,
     ):
         """
         Args:
@@ -45,10 +46,12 @@ class StaticTraversableScene(TraversableScene):
             trav_map_with_objects (bool): whether to use objects or not when constructing graph
             num_waypoints (int): number of way points returned
             waypoint_resolution (float): resolution of adjacent way points
+            hierarchical_planning (bool): whether to use multi-resolution planning for shortest path queries
         """
         # Store and initialize additional variables
         self._floor_heights = None
         self._scene_mesh = None
+        self._scene_mesh_aabb = None
 
         # Run super init
         assert og.sim.floor_plane, "Floor plane must be enabled for StaticTraversableScene"
@@ -60,6 +63,7 @@ class StaticTraversableScene(TraversableScene):
             trav_map_with_objects=trav_map_with_objects,
             num_waypoints=num_waypoints,
             waypoint_resolution=waypoint_resolution,
+            hierarchical_planning=hierarchical_planning,
             use_floor_plane=True,
         )
 
@@ -123,6 +127,16 @@ class StaticTraversableScene(TraversableScene):
                 self.floor_heights[floor] - self._scene_prim.get_position_orientation()[0][2] + additional_elevation
             )
         self._scene_prim.set_position_orientation(position=th.tensor([0, 0, height_adjustment]))
+        self._scene_mesh_aabb = None
+
+    def get_non_object_collision_aabbs(self):
+        # The scene mesh only moves with the floor plane, so its AABB is cached until then
+        if self._scene_mesh is None:
+            return None
+        if self._scene_mesh_aabb is None:
+            lower, upper = self._scene_mesh.aabb
+            self._scene_mesh_aabb = (lower.reshape(1, 3), upper.reshape(1, 3))
+        return self._scene_mesh_aabb
 
     def get_floor_height(self, floor=0):
         """
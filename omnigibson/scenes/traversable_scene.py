@@ -21,6 +21,7 @@ class TraversableScene(Scene):
         trav_map_with_objects=True,
         num_waypoints=10,
         waypoint_resolution=0.2,
+        hierarchical_planning=False,
         use_floor_plane=True,
     ):
         """
@@ -33,6 +34,7 @@ class TraversableScene(Scene):
             trav_map_with_objects (bool): whether to use objects or not when constructing graph
             num_waypoints (int): number of way points returned
             waypoint_resolution (float): resolution of adjacent way points
+            hierarchical_planning (bool): whether to use multi-resolution planning for shortest path queries
             use_floor_plane (bool): whether to load a flat floor plane into the simulator
         """
         log.info("TraversableScene model: {}".format(scene_model))
@@ -45,6 +47,7 @@ class TraversableScene(Scene):
             trav_map_with_objects=trav_map_with_objects,
             num_waypoints=num_waypoints,
             waypoint_resolution=waypoint_resolution,
+            hierarchical_planning=hierarchical_planning,
         )
         # Run super init
         super().__init__(
@@ -63,11 +66,42 @@ class TraversableScene(Scene):
     def get_random_point(self, floor=None, reference_point=None, robot=None):
         return self._trav_map.get_random_point(floor=floor, reference_point=reference_point, robot=robot)
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, robot=None):
+    def get_shortest_path(
+        self, floor, source_world, target_world, entire_path=False, robot=None, use_distance_field=False
+    ):
         return self._trav_map.get_shortest_path(
             floor=floor,
             source_world=source_world,
             target_world=target_world,
             entire_path=entire_path,
             robot=robot,
+            use_distance_field=use_distance_field,
+        )
+
+    def get_shortest_paths(self, floor, sources, targets, entire_path=False, robot=None, executor=None, chunk_size=16):
+        return self._trav_map.get_shortest_paths(
+            floor=floor,
+            sources=sources,
+            targets=targets,
+            entire_path=entire_path,
+            robot=robot,
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+
+    def get_geodesic_distance(self, floor, source_world, target_world, robot=None):
+        return self._trav_map.get_geodesic_distance(
+            floor=floor,
+            source_world=source_world,
+            target_world=target_world,
+            robot=robot,
+        )
+
+    def get_geodesic_distances(self, floor, sources, targets, robot=None, max_error=None):
+        return self._trav_map.get_geodesic_distances(
+            floor=floor,
+            sources=sources,
+            targets=targets,
+            robot=robot,
+            max_error=max_error,
         )
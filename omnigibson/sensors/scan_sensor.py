@@ -1,14 +1,12 @@
-import math
 from collections.abc import Iterable
 
-import cv2
 import torch as th
 
 import omnigibson.lazy as lazy
 import omnigibson.utils.transform_utils as T
 from omnigibson.sensors.sensor_base import BaseSensor
-from omnigibson.utils.constants import OccupancyGridState
 from omnigibson.utils.numpy_utils import NumpyTypes
+from omnigibson.utils.occupancy_grid_utils import OccupancyGridRasterizer, get_scan_ray_directions
 from omnigibson.utils.python_utils import classproperty
 
 
@@ -84,6 +82,8 @@ class ScanSensor(BaseSensor):
 
         # Create variables that will be filled in at runtime
         self._rs = None  # Range sensor interface, analagous to others, e.g.: dynamic control interface
+        self._occupancy_grid_rasterizer = None
+        self._ray_directions = None  # ((horizontal_fov, horizontal_resolution), ray directions) cache
 
         # Create load config from inputs
         load_config = dict() if load_config is None else load_config
@@ -157,36 +157,45 @@ class ScanSensor(BaseSensor):
 
         return obs_space_mapping
 
-    def get_local_occupancy_grid(self, scan):
+    @property
+    def occupancy_grid_rasterizer(self):
         """
-        Get local occupancy grid based on current 1D scan
-
-        Args:
-            n-array: 1D LiDAR scan
-
         Returns:
-            2D-array: (occupancy_grid_resolution, occupancy_grid_resolution)-sized numpy array of the local occupancy grid
+            OccupancyGridRasterizer: Rasterizer used to generate this sensor's local occupancy grids
         """
-        # Run sanity checks first
-        assert "occupancy_grid" in self._modalities, "Occupancy grid is not enabled for this range sensor!"
-        assert self.n_vertical_rays == 1, "Occupancy grid is only valid for a 1D range sensor (n_vertical_rays = 1)!"
+        if self._occupancy_grid_rasterizer is None:
+            self._occupancy_grid_rasterizer = OccupancyGridRasterizer(
+                resolution=self.occupancy_grid_resolution,
+                grid_range=self.occupancy_grid_range,
+                inner_radius=self.occupancy_grid_inner_radius,
+            )
+        return self._occupancy_grid_rasterizer
 
-        # Calculate the number of points
-        num_points = math.ceil(self.horizontal_fov / self.horizontal_resolution)
+    @property
+    def ray_directions(self):
+        """
+        Returns:
+            th.Tensor: (N, 3) unit vectors for each horizontal ray in this sensor's frame. These are only recomputed
+                when the horizontal FOV or resolution changes
+        """
+        key = (self.horizontal_fov, self.horizontal_resolution)
+        if self._ray_directions is None or self._ray_directions[0] != key:
+            self._ray_directions = (key, get_scan_ray_directions(*key))
+        return self._ray_directions[1]
 
-        # Generate angles using linspace
-        angles = th.linspace(
-            -th.deg2rad(th.tensor([self.horizontal_fov / 2])).item(),
-            th.deg2rad(th.tensor([self.horizontal_fov / 2])).item(),
-            num_points,
-        )
+    def get_local_scan_points(self, scan):
+        """
+        Get the 2D positions of the hits of the current 1D scan, expressed in the occupancy grid's local link frame
 
-        # Convert into 3D unit vectors for each angle
-        unit_vector_laser = th.stack([th.cos(angles), th.sin(angles), th.zeros_like(angles)], dim=1)
+        Args:
+            scan (n-array): 1D LiDAR scan
 
+        Returns:
+            th.Tensor: (N, 2) local (x, y) positions of each scan hit
+        """
         # Scale unit vectors by corresponding laser scan distnaces
         assert ((scan >= 0.0) & (scan <= 1.0)).all(), "scan out of valid range [0, 1]"
-        scan_laser = unit_vector_laser * (scan * (self.max_range - self.min_range) + self.min_range)
+        scan_laser = self.ray_directions * (scan * (self.max_range - self.min_range) + self.min_range)
 
         # Convert scans from laser frame to world frame
         pos, ori = self.get_position_orientation()
@@ -195,50 +204,51 @@ class ScanSensor(BaseSensor):
         # Convert scans from world frame to local base frame
         base_pos, base_ori = self.occupancy_grid_local_link.get_position_orientation()
         scan_local = (T.quat2mat(base_ori).T @ (scan_world - base_pos).T).T
-        scan_local = scan_local[:, :2]
-        scan_local = th.cat([th.tensor([[0, 0]]), scan_local, th.tensor([[0, 0]])], dim=0)
+        return scan_local[:, :2]
 
-        # flip y axis
-        scan_local[:, 1] *= -1
+    def get_local_occupancy_grid(self, scan):
+        """
+        Get local occupancy grid based on current 1D scan
 
-        # Initialize occupancy grid -- default is unknown values
-        occupancy_grid = th.full(
-            (self.occupancy_grid_resolution, self.occupancy_grid_resolution),
-            fill_value=int(OccupancyGridState.UNKNOWN * 2.0),
-            dtype=th.uint8,
-        )
+        Args:
+            n-array: 1D LiDAR scan
 
-        # Convert local scans into the corresponding OG square it should belong to (note now all values are > 0, since
-        # OG ranges from [0, resolution] x [0, resolution])
-        scan_local_in_map = scan_local / self.occupancy_grid_range * self.occupancy_grid_resolution + (
-            self.occupancy_grid_resolution / 2
-        )
-        scan_local_in_map = scan_local_in_map.reshape((1, -1, 1, 2)).int()
-
-        occupancy_grid = occupancy_grid.cpu().numpy()
-        scan_local_in_map = scan_local_in_map.cpu().numpy()
-
-        # For each scan hit,
-        for i in range(scan_local_in_map.shape[1]):
-            cv2.circle(
-                img=occupancy_grid,
-                center=(scan_local_in_map[0, i, 0, 0], scan_local_in_map[0, i, 0, 1]),
-                radius=2,
-                color=int(OccupancyGridState.OBSTACLES * 2.0),
-                thickness=-1,
-            )
-        cv2.fillPoly(
-            img=occupancy_grid, pts=scan_local_in_map, color=int(OccupancyGridState.FREESPACE * 2.0), lineType=1
-        )
-        cv2.circle(
-            img=occupancy_grid,
-            center=(self.occupancy_grid_resolution // 2, self.occupancy_grid_resolution // 2),
-            radius=self.occupancy_grid_inner_radius,
-            color=int(OccupancyGridState.FREESPACE * 2.0),
-            thickness=-1,
-        )
+        Returns:
+            2D-array: (occupancy_grid_resolution, occupancy_grid_resolution)-sized numpy array of the local occupancy grid
+        """
+        # Run sanity checks first
+        assert "occupancy_grid" in self._modalities, "Occupancy grid is not enabled for this range sensor!"
+        assert self.n_vertical_rays == 1, "Occupancy grid is only valid for a 1D range sensor (n_vertical_rays = 1)!"
+
+        return self.occupancy_grid_rasterizer.rasterize(self.get_local_scan_points(scan))
 
-        return th.tensor(occupancy_grid[:, :, None]) / 2.0
+    @staticmethod
+    def get_local_occupancy_grids(sensors, scans):
+        """
+        Get local occupancy grids for multiple scan sensors at once, e.g. one per robot. All sensors must share the same
+        occupancy grid settings and number of rays
+
+        Args:
+            sensors (list of ScanSensor): Scan sensors to generate occupancy grids for
+            scans (list of n-array): 1D LiDAR scan for each sensor in @sensors
+
+        Returns:
+            th.Tensor: (B, occupancy_grid_resolution, occupancy_grid_resolution, 1) local occupancy grids
+        """
+        rasterizer = sensors[0].occupancy_grid_rasterizer
+        for sensor in sensors:
+            assert "occupancy_grid" in sensor._modalities, "Occupancy grid is not enabled for this range sensor!"
+            assert (
+                sensor.occupancy_grid_resolution,
+                sensor.occupancy_grid_range,
+                sensor.occupancy_grid_inner_radius,
+            ) == (
+                rasterizer.resolution,
+                rasterizer.grid_range,
+                rasterizer.inner_radius,
+            ), "All scan sensors must share the same occupancy grid settings!"
+        points = th.stack([sensor.get_local_scan_points(scan) for sensor, scan in zip(sensors, scans)], dim=0)
+        return rasterizer.rasterize_batch(points)
 
     def _get_obs(self):
         # Run super first to grab any upstream obs
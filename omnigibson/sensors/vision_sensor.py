@@ -113,6 +113,14 @@ class VisionSensor(BaseSensor):
     INSTANCE_ID_REMAPPER = Remapper()
     INSTANCE_REGISTRY = {0: "background", 1: "unlabelled"}
     INSTANCE_ID_REGISTRY = {0: "background"}
+    # Reverse (instance label -> instance ID) lookups of the registries above
+    INSTANCE_REGISTRY_INDEX = {"background": 0, "unlabelled": 1}
+    INSTANCE_ID_REGISTRY_INDEX = {"background": 0}
+    # Persistent caches of resolved instance labels, mapped from raw replicator label (e.g. prim path) to instance
+    # label. Instance segmentation labels depend on the scene the camera belongs to, so they are cached per scene index
+    # (None for the viewer camera)
+    INSTANCE_LABEL_CACHE = dict()
+    INSTANCE_ID_LABEL_CACHE = dict()
 
     def __init__(
         self,
@@ -196,6 +204,12 @@ class VisionSensor(BaseSensor):
         # Add this sensor to the list of global sensors
         self.SENSORS[self.prim_path] = self
 
+        # Cached instance labels of objects' prim paths are invalidated whenever objects are added or removed
+        og.sim.add_callback_on_add_obj(name="vision_sensor_instance_labels", callback=self._invalidate_instance_labels)
+        og.sim.add_callback_on_remove_obj(
+            name="vision_sensor_instance_labels", callback=self._invalidate_instance_labels
+        )
+
         resolution = (self._load_config["image_width"], self._load_config["image_height"])
         self._render_product = lazy.omni.replicator.core.create.render_product(self.prim_path, resolution)
 
@@ -379,8 +393,9 @@ class VisionSensor(BaseSensor):
         """
         replicator_mapping = self._preprocess_semantic_labels(id_to_labels)
 
+        # The unique keys are computed once and reused by the remapper
         image_keys = th.unique(img)
-        if not set(image_keys.tolist()).issubset(set(replicator_mapping.keys())):
+        if not replicator_mapping.keys() >= set(image_keys.tolist()):
             log.debug(
                 "Some semantic IDs in the image are not in the id_to_labels mapping. This is a known issue with the replicator and should only affect a few pixels. These pixels will be marked as unlabelled."
             )
@@ -407,117 +422,156 @@ class VisionSensor(BaseSensor):
         if not id:
             id_to_labels.update({"1": "UNLABELLED"})
 
-        # Preprocess id_to_labels and update instance registry
+        # Preprocess id_to_labels and update instance registry. Resolved labels are cached across frames, so only
+        # values that have not been seen before need to be resolved and registered
+        if id:
+            label_cache = VisionSensor.INSTANCE_ID_LABEL_CACHE
+        else:
+            label_cache = VisionSensor.INSTANCE_LABEL_CACHE.setdefault(
+                None if self.scene is None else self.scene.idx, dict()
+            )
         replicator_mapping = {}
         for key, value in id_to_labels.items():
-            key = int(key)
-            if value in ["BACKGROUND", "UNLABELLED"]:
-                value = value.lower()
-            elif "/" in value:
-                # Instance Segmentation
-                if not id:
-                    # Case 1: This is the ground plane
-                    if og.sim.floor_plane is not None and value == og.sim.floor_plane.prim_path:
-                        value = "groundPlane"
-                    else:
-                        # Case 2: Check if this is an object, e.g. '/World/scene_0/breakfast_table', '/World/scene_0/dishtowel'
-                        obj = None
-                        if self.scene is not None:
-                            # If this is a camera within a scene, we check the object registry of the scene
-                            obj = self.scene.object_registry("prim_path", value)
-                        else:
-                            # If this is the viewer camera, we check each object registry
-                            for scene in og.sim.scenes:
-                                obj = scene.object_registry("prim_path", value)
-                                if obj:
-                                    break
-                        if obj is not None:
-                            # This is an object, so we remap the instance segmentation label to the object name
-                            value = obj.name
-                        # Case 3: Check if this is a particle system
-                        else:
-                            # This is a particle system
-                            path_split = value.split("/")
-                            prim_name = path_split[-1]
-                            system_matched = False
-                            # Case 3.1: Filter out macro particle systems
-                            # e.g. '/World/scene_0/diced__apple/particles/diced__appleParticle0', '/World/scene_0/breakfast_table/base_link/stainParticle0'
-                            if "Particle" in prim_name:
-                                macro_system_name = prim_name.split("Particle")[0]
-                                if macro_system_name in get_all_system_names():
-                                    system_matched = True
-                                    value = macro_system_name
-                            # Case 3.2: Filter out micro particle systems
-                            # e.g. '/World/scene_0/water/waterInstancer0/prototype0_1', '/World/scene_0/white_rice/white_riceInstancer0/prototype0'
-                            else:
-                                # If anything in path_split has "Instancer" in it, we know it's a micro particle system
-                                for path in path_split:
-                                    if "Instancer" in path:
-                                        # This is a micro particle system
-                                        system_matched = True
-                                        value = path.split("Instancer")[0]
-                                        break
-                            # Case 4: If nothing matched, we label it as unlabelled
-                            if not system_matched:
-                                value = "unlabelled"
-                # Instance ID Segmentation
-                else:
-                    # The only thing we do here is for micro particle system, we clean its name
-                    # e.g. a raw path looks like '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0'
-                    # we clean it to '/World/scene_0/water/waterInstancer0/prototype0'
-                    # Case 1: This is a micro particle system
-                    # e.g. '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0'
-                    if "Instancer" in value and "." in value:
-                        # This is a micro particle system
-                        value = value[: value.rfind(".")]
-                    # Case 2: For everything else, we keep the name as is
-                    """
-                    e.g. 
-                    {
-                        '54': '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', 
-                        '60': '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', 
-                        '30': '/World/scene_0/breakfast_table/base_link/stainParticle1', 
-                        '27': '/World/scene_0/diced__apple/particles/diced__appleParticle0', 
-                        '58': '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0', 
-                        '64': '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0', 
-                        '40': '/World/scene_0/diced__apple/particles/diced__appleParticle1', 
-                        '48': '/World/scene_0/breakfast_table/base_link/stainParticle0', 
-                        '1': '/World/ground_plane/geom', 
-                        '19': '/World/scene_0/dishtowel/base_link_cloth', 
-                        '6': '/World/scene_0/breakfast_table/base_link/visuals'
-                    }
-                    """
-            else:
-                # TODO: This is a temporary fix unexpected labels e.g. INVALID introduced in new Isaac Sim versions
-                value = "unlabelled"
-
-            self._register_instance(value, id=id)
-            replicator_mapping[key] = value
+            label = label_cache.get(value, None)
+            if label is None:
+                label = self._resolve_instance_label(value, id=id)
+                self._register_instance(label, id=id)
+                label_cache[value] = label
+            replicator_mapping[int(key)] = label
 
         # This is a temporary fix for the problem where some small number of pixels show up in the image, but not in the info (id_to_labels).
         # We identify these values and mark them as unlabelled.
+        # The unique keys are computed once and reused by the remapper
         image_keys = th.unique(img)
-        for key in image_keys:
-            if str(key.item()) not in id_to_labels:
+        image_key_list = image_keys.tolist()
+        for key in image_key_list:
+            if str(key) not in id_to_labels:
                 value = "unlabelled"
                 self._register_instance(value, id=id)
-                replicator_mapping[key.item()] = value
+                replicator_mapping[key] = value
 
         registry = VisionSensor.INSTANCE_ID_REGISTRY if id else VisionSensor.INSTANCE_REGISTRY
         remapper = VisionSensor.INSTANCE_ID_REMAPPER if id else VisionSensor.INSTANCE_REMAPPER
 
-        if not set(image_keys.tolist()).issubset(set(replicator_mapping.keys())):
+        if not replicator_mapping.keys() >= set(image_key_list):
             log.warning(
                 "Some instance IDs in the image are not in the id_to_labels mapping. This is a known issue with the replicator and should only affect a few pixels. These pixels will be marked as unlabelled."
             )
 
         return remapper.remap(replicator_mapping, registry, img, image_keys)
 
+    def _resolve_instance_label(self, value, id=False):
+        """
+        Resolve a raw replicator instance (ID) segmentation label into our own instance label
+
+        Args:
+            value (str): Raw replicator label, e.g. a prim path or 'BACKGROUND'
+            id (bool): Whether to resolve for instance ID segmentation
+
+        Returns:
+            str: Resolved instance label
+        """
+        if value in ["BACKGROUND", "UNLABELLED"]:
+            value = value.lower()
+        elif "/" in value:
+            # Instance Segmentation
+            if not id:
+                # Case 1: This is the ground plane
+                if og.sim.floor_plane is not None and value == og.sim.floor_plane.prim_path:
+                    value = "groundPlane"
+                else:
+                    # Case 2: Check if this is an object, e.g. '/World/scene_0/breakfast_table', '/World/scene_0/dishtowel'
+                    obj = None
+                    if self.scene is not None:
+                        # If this is a camera within a scene, we check the object registry of the scene
+                        obj = self.scene.object_registry("prim_path", value)
+                    else:
+                        # If this is the viewer camera, we check each object registry
+                        for scene in og.sim.scenes:
+                            obj = scene.object_registry("prim_path", value)
+                            if obj:
+                                break
+                    if obj is not None:
+                        # This is an object, so we remap the instance segmentation label to the object name
+                        value = obj.name
+                    # Case 3: Check if this is a particle system
+                    else:
+                        # This is a particle system
+                        path_split = value.split("/")
+                        prim_name = path_split[-1]
+                        system_matched = False
+                        # Case 3.1: Filter out macro particle systems
+                        # e.g. '/World/scene_0/diced__apple/particles/diced__appleParticle0', '/World/scene_0/breakfast_table/base_link/stainParticle0'
+                        if "Particle" in prim_name:
+                            macro_system_name = prim_name.split("Particle")[0]
+                            if macro_system_name in get_all_system_names():
+                                system_matched = True
+                                value = macro_system_name
+                        # Case 3.2: Filter out micro particle systems
+                        # e.g. '/World/scene_0/water/waterInstancer0/prototype0_1', '/World/scene_0/white_rice/white_riceInstancer0/prototype0'
+                        else:
+                            # If anything in path_split has "Instancer" in it, we know it's a micro particle system
+                            for path in path_split:
+                                if "Instancer" in path:
+                                    # This is a micro particle system
+                                    system_matched = True
+                                    value = path.split("Instancer")[0]
+                                    break
+                        # Case 4: If nothing matched, we label it as unlabelled
+                        if not system_matched:
+                            value = "unlabelled"
+            # Instance ID Segmentation
+            else:
+                # The only thing we do here is for micro particle system, we clean its name
+                # e.g. a raw path looks like '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0'
+                # we clean it to '/World/scene_0/water/waterInstancer0/prototype0'
+                # Case 1: This is a micro particle system
+                # e.g. '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0'
+                if "Instancer" in value and "." in value:
+                    # This is a micro particle system
+                    value = value[: value.rfind(".")]
+                # Case 2: For everything else, we keep the name as is
+                """
+                e.g. 
+                {
+                    '54': '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', 
+                    '60': '/World/scene_0/water/waterInstancer0/prototype0.proto0_prototype0_id0', 
+                    '30': '/World/scene_0/breakfast_table/base_link/stainParticle1', 
+                    '27': '/World/scene_0/diced__apple/particles/diced__appleParticle0', 
+                    '58': '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0', 
+                    '64': '/World/scene_0/white_rice/white_riceInstancer0/prototype0.proto0_prototype0_id0', 
+                    '40': '/World/scene_0/diced__apple/particles/diced__appleParticle1', 
+                    '48': '/World/scene_0/breakfast_table/base_link/stainParticle0', 
+                    '1': '/World/ground_plane/geom', 
+                    '19': '/World/scene_0/dishtowel/base_link_cloth', 
+                    '6': '/World/scene_0/breakfast_table/base_link/visuals'
+                }
+                """
+        else:
+            # TODO: This is a temporary fix unexpected labels e.g. INVALID introduced in new Isaac Sim versions
+            value = "unlabelled"
+
+        return value
+
     def _register_instance(self, instance_name, id=False):
         registry = VisionSensor.INSTANCE_ID_REGISTRY if id else VisionSensor.INSTANCE_REGISTRY
-        if instance_name not in registry.values():
+        registry_index = VisionSensor.INSTANCE_ID_REGISTRY_INDEX if id else VisionSensor.INSTANCE_REGISTRY_INDEX
+        if instance_name not in registry_index:
+            registry_index[instance_name] = len(registry)
             registry[len(registry)] = instance_name
 
+    @classmethod
+    def _invalidate_instance_labels(cls, obj):
+        """
+        Invalidate any cached instance segmentation label for object @obj's prim path. This is called whenever an object
+        is added to or removed from the simulator, since the label of its prim path changes accordingly
+
+        Args:
+            obj (BaseObject): Object that was added or removed
+        """
+        for label_cache in cls.INSTANCE_LABEL_CACHE.values():
+            label_cache.pop(obj.prim_path, None)
+
     def _remap_bounding_box_semantic_ids(self, bboxes, id_to_labels):
         """
         Remap the semantic IDs of the bounding boxes to our own semantic IDs.
@@ -902,6 +956,10 @@ class VisionSensor(BaseSensor):
         cls.KEY_ARRAY = None
         cls.INSTANCE_REGISTRY = {0: "background", 1: "unlabelled"}
         cls.INSTANCE_ID_REGISTRY = {0: "background"}
+        cls.INSTANCE_REGISTRY_INDEX = {"background": 0, "unlabelled": 1}
+        cls.INSTANCE_ID_REGISTRY_INDEX = {"background": 0}
+        cls.INSTANCE_LABEL_CACHE = dict()
+        cls.INSTANCE_ID_LABEL_CACHE = dict()
 
     @classproperty
     def all_modalities(cls):
@@ -30,7 +30,7 @@ from omnigibson.prims import XFormPrim
 from omnigibson.prims.material_prim import MaterialPrim
 from omnigibson.scenes import Scene
 from omnigibson.sensors.vision_sensor import VisionSensor
-from omnigibson.systems.macro_particle_system import MacroPhysicalParticleSystem
+from omnigibson.systems.macro_particle_system import MacroPhysicalParticleSystem, MacroVisualParticleSystem
 from omnigibson.utils.config_utils import TorchEncoder
 from omnigibson.utils.constants import LightingMode
 from omnigibson.utils.python_utils import Serializable
@@ -793,10 +793,10 @@ def _launch_simulator(*args, **kwargs):
                 # One physics timestep will elapse
                 self.step_physics()
 
-            # Run all pre-processing for all objects and record which scenes have been modified
-            scenes_modified = set()
+            # Run all pre-processing for all objects and record which objects have been removed from each scene
+            scenes_modified = defaultdict(list)
             for obj in objs:
-                scenes_modified.add(obj.scene)
+                scenes_modified[obj.scene].append(obj)
                 self._pre_remove_object(obj)
                 # Prune from the state if recorded
                 if playing:
@@ -816,8 +816,8 @@ def _launch_simulator(*args, **kwargs):
 
                 if gm.ENABLE_TRANSITION_RULES:
                     # Prune the transition rules that are currently active
-                    for scene in scenes_modified:
-                        scene.transition_rule_api.prune_active_rules()
+                    for scene, scene_objs in scenes_modified.items():
+                        scene.transition_rule_api.remove_objects(scene_objs)
 
                 # Load the state back
                 self.load_state(state)
@@ -876,10 +876,22 @@ def _launch_simulator(*args, **kwargs):
             """
 
         def render(self):
+            # Make sure pending visual particle poses are rendered
+            self._sync_visual_particle_poses_in_usd()
             super().render()
             # During rendering, the Fabric API is updated, so we can mark it as clean
             PoseAPI.mark_valid()
 
+        def _sync_visual_particle_poses_in_usd(self):
+            """
+            Writes the poses of all macro visual particles modified since the last sync to USD
+            """
+            for scene in self.scenes:
+                if scene is not None and scene.initialized:
+                    for system in scene.active_systems.values():
+                        if isinstance(system, MacroVisualParticleSystem):
+                            system.sync_particle_poses_in_usd()
+
         def update_handles(self):
             # Handles are only relevant when physx is running
             if not self.is_playing():
@@ -927,11 +939,11 @@ def _launch_simulator(*args, **kwargs):
                     # For this same reason, after we finish the loop, we keep any objects that are yet to be initialized
                     # First call zero-physics step update, so that handles are properly propagated
                     og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
-                    scenes_modified = set()
+                    scenes_modified = defaultdict(list)
                     for i in range(n_objects_to_initialize):
                         obj = self._objects_to_initialize[i]
                         obj.initialize()
-                        scenes_modified.add(obj.scene)
+                        scenes_modified[obj.scene].append(obj)
                         if len(obj.states.keys() & self.object_state_types_on_contact) > 0:
                             self._objects_require_contact_callback = True
                         if len(obj.states.keys() & self.object_state_types_on_joint_break) > 0:
@@ -943,9 +955,9 @@ def _launch_simulator(*args, **kwargs):
                     self.update_handles()
 
                     if gm.ENABLE_TRANSITION_RULES:
-                        # Refresh the transition rules
-                        for scene in scenes_modified:
-                            scene.transition_rule_api.refresh_all_rules()
+                        # Incrementally refresh the transition rules with the new objects
+                        for scene, scene_objs in scenes_modified.items():
+                            scene.transition_rule_api.add_objects(scene_objs)
 
                 # Update any system-related state
                 for scene in self.scenes:
@@ -1083,6 +1095,9 @@ def _launch_simulator(*args, **kwargs):
             for scene in self.scenes:
                 scene.clear_updated_objects()
 
+            # Write any visual particle poses modified since the last step to USD in bulk
+            self._sync_visual_particle_poses_in_usd()
+
             for _ in range(self._n_steps_per_loop):
                 if render:
                     super().step(render=True)
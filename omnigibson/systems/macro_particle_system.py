@@ -15,6 +15,7 @@ from omnigibson.utils.sampling_utils import sample_cuboid_on_object_symmetric_bi
 from omnigibson.utils.ui_utils import create_module_logger, suppress_omni_log
 from omnigibson.utils.usd_utils import (
     FlatcacheAPI,
+    PoseAPI,
     absolute_prim_path_to_scene_relative,
     scene_relative_prim_path_to_absolute,
 )
@@ -249,6 +250,9 @@ class MacroParticleSystem(BaseSystem):
         # Increment counter
         self._particle_counter += 1
 
+        # Particle indices have changed
+        self.invalidate_spatial_hash()
+
         return new_particle
 
     def remove_particle_by_name(self, name):
@@ -256,6 +260,9 @@ class MacroParticleSystem(BaseSystem):
         particle = self.particles.pop(name)
         og.sim.remove_prim(particle)
 
+        # Particle indices have changed
+        self.invalidate_spatial_hash()
+
     def remove_particles(
         self,
         idxs,
@@ -385,9 +392,29 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         # NOTE: face_id will only exist for particles on cloths
         self._particles_info = None
 
-        # Pre-cached information about visual particles so that we have efficient runtime computations
-        # Maps particle name to local pose matrix for computing global poses for the particle
-        self._particles_local_mat = None
+        # Structure-of-arrays store of all visual particles so that pose computations can be batched over every particle
+        # at once. Rows follow the order of self.particles (once removed rows are compacted), and hold each particle's
+        # group index, parent frame index, pose relative to its parent frame (expressed in world units, i.e.: already
+        # accounting for the parent link's scale), scale, and whether its pose still needs to be written to USD
+        self._particle_group_idxs = None
+        self._particle_parent_idxs = None
+        self._particle_local_positions = None
+        self._particle_local_orientations = None
+        self._particle_scales = None
+        self._particle_dirty = None
+
+        # Maps particle name to its row in the store, and list of rows removed since the store was last compacted
+        self._particle_rows = None
+        self._removed_particle_rows = None
+
+        # Maps group name to its index in the store, and the next group index to assign
+        self._group_idxs = None
+        self._next_group_idx = None
+
+        # List of (frame, is_cloth) parent frames that particles are attached to, and mapping from frame to its index.
+        # Frames are links for particles on rigid bodies, and the object itself for particles on cloths
+        self._parent_frames = None
+        self._parent_frame_idxs = None
 
         # Maps group name to array of face_ids where particles are located if the group object is a cloth type
         # Maps group name to th.tensor of face IDs (int) that particles are attached to
@@ -413,8 +440,25 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         # Initialize mutable class variables so they don't automatically get overridden by children classes
         self._particles_info = dict()
-        self._particles_local_mat = dict()
         self._cloth_face_ids = dict()
+        self._reset_particle_store()
+
+    def _reset_particle_store(self):
+        """
+        Resets the structure-of-arrays particle store so that it is empty
+        """
+        self._particle_group_idxs = th.empty(0, dtype=th.int64)
+        self._particle_parent_idxs = th.empty(0, dtype=th.int64)
+        self._particle_local_positions = th.empty((0, 3))
+        self._particle_local_orientations = th.empty((0, 4))
+        self._particle_scales = th.empty((0, 3))
+        self._particle_dirty = th.empty(0, dtype=th.bool)
+        self._particle_rows = dict()
+        self._removed_particle_rows = []
+        self._group_idxs = dict()
+        self._next_group_idx = 0
+        self._parent_frames = []
+        self._parent_frame_idxs = dict()
 
     def update(self):
         # Run super first
@@ -438,17 +482,15 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
                 z_up = th.zeros_like(normals)
                 z_up[:, 2] = 1.0
                 orientations = T.axisangle2quat(T.vecs2axisangle(z_up, normals))
+                rows = self._get_group_rows(group=group)
                 if not self._CLIP_INTO_OBJECTS and z_extent > 0:
-                    z_offsets = (
-                        th.tensor([z_extent * particle.scale[2] for particle in self._group_particles[group].values()])
-                        / 2.0
-                    )
+                    z_offsets = z_extent * self._particle_scales[rows, 2] / 2.0
                     # Shift the particles halfway up
                     positions += normals * z_offsets.reshape(-1, 1)
 
                 # Set the group particle poses
-                self.set_group_particles_position_orientation(
-                    group=group, positions=positions, orientations=orientations
+                self._modify_batch_particles_position_orientation(
+                    rows=rows, positions=positions, orientations=orientations, local=False
                 )
 
     def _load_new_particle(self, relative_prim_path, name):
@@ -477,8 +519,18 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         # Clear all groups as well
         self._particles_info = dict()
-        self._particles_local_mat = dict()
         self._cloth_face_ids = dict()
+        self._reset_particle_store()
+
+    def create_attachment_group(self, obj):
+        # Call super first
+        group = super().create_attachment_group(obj=obj)
+
+        # Assign a fresh index to this group, so that stale particle rows can never be mistaken for this group's
+        self._group_idxs[group] = self._next_group_idx
+        self._next_group_idx += 1
+
+        return group
 
     def remove_attachment_group(self, group):
         # Call super first
@@ -487,6 +539,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         # If the group is a cloth, also remove the cloth face ids
         if group in self._cloth_face_ids:
             self._cloth_face_ids.pop(group)
+        self._group_idxs.pop(group)
 
         return group
 
@@ -498,7 +551,8 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         parent_obj = self._particles_info[name]["obj"]
         group = self.get_group_name(obj=parent_obj)
         self._group_particles[group].pop(name)
-        self._particles_local_mat.pop(name)
+        # Its row is only removed from the store during the next compaction, so that removing many particles is cheap
+        self._removed_particle_rows.append(self._particle_rows.pop(name))
         particle_info = self._particles_info.pop(name)
         if self._is_cloth_obj(obj=parent_obj):
             # Also remove from cloth face ids
@@ -531,37 +585,39 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             ), "cloth object should exist as direct child of /World prim!"
 
         n_particles = len(positions)
+        if n_particles == 0:
+            return
+        positions = th.stack([th.as_tensor(position, dtype=th.float32) for position in positions])
         if orientations is None:
             orientations = th.zeros((n_particles, 4))
             orientations[:, -1] = 1.0
+        else:
+            orientations = th.stack([th.as_tensor(orientation, dtype=th.float32) for orientation in orientations])
         link_prim_paths = [None] * n_particles if is_cloth else link_prim_paths
 
         scales = self.sample_scales_by_group(group=group, n=n_particles) if scales is None else scales
-
-        bbox_extents_local = [(self.particle_object.aabb_extent * scale).tolist() for scale in scales]
+        scales = th.stack([th.as_tensor(scale, dtype=th.float32) for scale in scales])
 
         # If we're using flatcache, we need to update the object's pose on the USD manually
         if gm.ENABLE_FLATCACHE:
             FlatcacheAPI.sync_raw_object_transforms_in_usd(prim=obj)
 
+        # Possibly shift the particles slightly away from the object if we're not clipping into objects
+        # Note: For particles tied to rigid objects, the given position is on the surface of the object,
+        # so clipping would move the particle INTO the object surface, whereas for particles tied to cloth objects,
+        # the given position is at the particle location (i.e.: already clipped), so NO clipping would move the
+        # particle AWAY from the object surface
+        if (is_cloth and not self._CLIP_INTO_OBJECTS) or (not is_cloth and self._CLIP_INTO_OBJECTS):
+            # Shift the particles halfway down along their local z-axes
+            base_to_center = self.particle_object.aabb_extent[2] * scales[:, 2] / 2.0
+            normals = T.quat2mat(orientations)[:, :, 2]
+            offsets = normals * base_to_center.reshape(-1, 1)
+            positions = positions + offsets if is_cloth else positions - offsets
+
         # Generate particles
-        z_up = th.zeros((3, 1))
-        z_up[-1] = 1.0
-        for position, orientation, scale, bbox_extent_local, link_prim_path in zip(
-            positions, orientations, scales, bbox_extents_local, link_prim_paths
-        ):
+        names, parents = [], []
+        for scale, link_prim_path in zip(scales, link_prim_paths):
             link = None if is_cloth else obj.links[link_prim_path.split("/")[-1]]
-            # Possibly shift the particle slightly away from the object if we're not clipping into objects
-            # Note: For particles tied to rigid objects, the given position is on the surface of the object,
-            # so clipping would move the particle INTO the object surface, whereas for particles tied to cloth objects,
-            # the given position is at the particle location (i.e.: already clipped), so NO clipping would move the
-            # particle AWAY from the object surface
-            if (is_cloth and not self._CLIP_INTO_OBJECTS) or (not is_cloth and self._CLIP_INTO_OBJECTS):
-                # Shift the particle halfway down
-                base_to_center = bbox_extent_local[2] / 2.0
-                normal = (T.quat2mat(orientation) @ z_up).flatten()
-                offset = normal * base_to_center if is_cloth else -normal * base_to_center
-                position += offset
 
             # Create particle
             particle_prim_path = obj.prim_path if is_cloth else link_prim_path
@@ -573,9 +629,14 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             # Add to group
             self._group_particles[group][particle.name] = particle
             self._particles_info[particle.name] = dict(obj=self._group_objects[group], link=link)
+            names.append(particle.name)
+            parents.append(obj if is_cloth else link)
 
-            # Set the pose
-            self.set_particle_position_orientation(idx=-1, position=position, orientation=orientation)
+        # Set all the poses at once
+        rows = self._add_particles_to_store(names=names, group=group, parents=parents, scales=scales)
+        self._modify_batch_particles_position_orientation(
+            rows=rows, positions=positions, orientations=orientations, local=False
+        )
 
     def generate_group_particles_on_object(self, group, max_samples=None, min_samples_for_success=1):
         # This function does not support max_samples=None. Must be explicitly specified
@@ -662,12 +723,161 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         return success
 
-    def _compute_batch_particles_position_orientation(self, particles, local=False):
+    def _get_parent_frame_idx(self, frame, is_cloth):
+        """
+        Grabs the index of parent frame @frame in the particle store, registering it if it hasn't been seen before
+
+        Args:
+            frame (RigidPrim or BaseObject): Link (if attached to a rigid body) or object (if attached to a cloth) that
+                particles are attached to
+            is_cloth (bool): Whether @frame is a cloth object or not
+
+        Returns:
+            int: Index of the parent frame
+        """
+        if frame not in self._parent_frame_idxs:
+            self._parent_frame_idxs[frame] = len(self._parent_frames)
+            self._parent_frames.append((frame, is_cloth))
+        return self._parent_frame_idxs[frame]
+
+    def _add_particles_to_store(self, names, group, parents, scales):
+        """
+        Appends newly added particles @names to the particle store. Their poses are initialized to the identity, and
+        should be set afterwards
+
+        Args:
+            names (list of str): Names of the added particles, in the order they were added to self.particles
+            group (str): Name of the attachment group all the particles belong to
+            parents (list of RigidPrim or BaseObject): Per-particle parent frame the particle is attached to
+            scales (th.tensor): (n, 3) per-particle scales
+
+        Returns:
+            th.tensor: (n,) rows of the added particles in the store
+        """
+        # Compact first so that the new rows are also the particles' indices in self.particles
+        self._compact_particle_store()
+        n_rows, n_particles = len(self._particle_dirty), len(names)
+        is_cloth = self._is_cloth_obj(obj=self._group_objects[group])
+        self._particle_rows.update({name: n_rows + i for i, name in enumerate(names)})
+        identity_orientations = th.zeros((n_particles, 4))
+        identity_orientations[:, -1] = 1.0
+
+        self._particle_group_idxs = th.cat(
+            [self._particle_group_idxs, th.full((n_particles,), self._group_idxs[group], dtype=th.int64)]
+        )
+        self._particle_parent_idxs = th.cat(
+            [
+                self._particle_parent_idxs,
+                th.tensor([self._get_parent_frame_idx(frame=parent, is_cloth=is_cloth) for parent in parents]),
+            ]
+        )
+        self._particle_local_positions = th.cat([self._particle_local_positions, th.zeros((n_particles, 3))])
+        self._particle_local_orientations = th.cat([self._particle_local_orientations, identity_orientations])
+        self._particle_scales = th.cat([self._particle_scales, scales.reshape(n_particles, 3).float()])
+        self._particle_dirty = th.cat([self._particle_dirty, th.zeros(n_particles, dtype=th.bool)])
+
+        return th.arange(n_rows, n_rows + n_particles)
+
+    def _compact_particle_store(self):
+        """
+        Removes the rows of all particles removed since the last compaction from the particle store, so that rows
+        match the particles' indices in self.particles again
+        """
+        if len(self._removed_particle_rows) == 0:
+            return
+
+        keep = th.ones(len(self._particle_dirty), dtype=th.bool)
+        keep[self._removed_particle_rows] = False
+        self._particle_group_idxs = self._particle_group_idxs[keep]
+        self._particle_parent_idxs = self._particle_parent_idxs[keep]
+        self._particle_local_positions = self._particle_local_positions[keep]
+        self._particle_local_orientations = self._particle_local_orientations[keep]
+        self._particle_scales = self._particle_scales[keep]
+        self._particle_dirty = self._particle_dirty[keep]
+
+        # Rows are kept in insertion order, so the remaining particles are simply renumbered
+        self._particle_rows = {name: row for row, name in enumerate(self._particle_rows.keys())}
+        self._removed_particle_rows = []
+
+    def _get_group_rows(self, group):
+        """
+        Grabs the rows of all particles belonging to group @group in the particle store
+
+        Args:
+            group (str): Name of the attachment group
+
+        Returns:
+            th.tensor: (n,) rows of the group's particles, in the same order as the group's particles
+        """
+        self._compact_particle_store()
+        return th.nonzero(self._particle_group_idxs == self._group_idxs[group]).flatten()
+
+    def _get_particle_row(self, idx):
+        """
+        Grabs the row of the particle with index @idx in self.particles in the particle store
+
+        Args:
+            idx (int): Index of the particle. Can be negative
+
+        Returns:
+            th.tensor: (1,) row of the particle
+        """
+        self._compact_particle_store()
+        return th.tensor([range(self.n_particles)[idx]])
+
+    def _compute_parent_frame_poses(self, parent_idxs):
+        """
+        Computes the global poses of the parent frames @parent_idxs. Each unique parent frame is only queried once
+
+        Args:
+            parent_idxs (th.tensor): (n,) parent frame indices
+
+        Returns:
+            2-tuple:
+                - th.tensor: (n, 3) per-entry (x,y,z) global position of the parent frame
+                - th.tensor: (n, 4) per-entry (x,y,z,w) global quaternion orientation of the parent frame
+        """
+        unique_idxs, inverse_idxs = th.unique(parent_idxs, return_inverse=True)
+        positions, orientations = [], []
+        for idx in unique_idxs.tolist():
+            frame, is_cloth = self._parent_frames[idx]
+            # For cloths we want the World --> obj transform, NOT the World --> root_link transform, since these
+            # particles do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly
+            # get the transform, and not obj.get_position_orientation(frame="parent") which will give us the local pose
+            # of the root link!
+            pos, quat = (
+                XFormPrim.get_position_orientation(frame, frame="parent")
+                if is_cloth
+                else frame.get_position_orientation()
+            )
+            positions.append(pos)
+            orientations.append(quat)
+        return th.stack(positions)[inverse_idxs], th.stack(orientations)[inverse_idxs]
+
+    def _compute_parent_frame_scales(self, parent_idxs):
         """
-        Computes all @particles' positions and orientations
+        Computes the scales of the parent frames @parent_idxs. Each unique parent frame is only queried once
 
         Args:
-            particles (Iterable of str): Names of particles to compute batched position orientation for
+            parent_idxs (th.tensor): (n,) parent frame indices
+
+        Returns:
+            th.tensor: (n, 3) per-entry scale of the parent frame. Cloths are treated as unscaled
+        """
+        unique_idxs, inverse_idxs = th.unique(parent_idxs, return_inverse=True)
+        scales = [
+            th.ones(3) if is_cloth else frame.scale
+            for frame, is_cloth in (self._parent_frames[idx] for idx in unique_idxs.tolist())
+        ]
+        return th.stack(scales).float()[inverse_idxs]
+
+    def _compute_batch_particles_position_orientation(self, rows=None, local=False):
+        """
+        Computes the positions and orientations of the particles at rows @rows in the particle store
+
+        Args:
+            rows (None or th.tensor): (n,) rows of the particles to compute poses for. If None, computes the poses of
+                all particles
             local (bool): Whether to compute particles' poses in local frame or not
 
         Returns:
@@ -675,195 +885,172 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
                 - (n, 3)-array: per-particle (x,y,z) position
                 - (n, 4)-array: per-particle (x,y,z,w) quaternion orientation
         """
-        n_particles = len(particles) if particles else 0
-        if n_particles == 0:
+        self._compact_particle_store()
+        rows = slice(None) if rows is None else rows
+        positions = self._particle_local_positions[rows]
+        orientations = self._particle_local_orientations[rows]
+        if len(positions) == 0:
             return (th.empty(0).reshape(0, 3), th.empty(0).reshape(0, 4))
 
+        parent_idxs = self._particle_parent_idxs[rows]
         if local:
-            poses = th.zeros((n_particles, 4, 4))
-            for i, name in enumerate(particles):
-                poses[i] = T.pose2mat(self.particles[name].get_position_orientation(frame="parent"))
-        else:
-            # Iterate over all particles and compute link tfs programmatically, then batch the matrix transform
-            link_tfs = dict()
-            link_tfs_batch = th.zeros((n_particles, 4, 4))
-            particle_local_poses_batch = th.zeros_like(link_tfs_batch)
-            for i, name in enumerate(particles):
-                obj = self._particles_info[name]["obj"]
-                is_cloth = self._is_cloth_obj(obj=obj)
-                if is_cloth:
-                    if obj not in link_tfs:
-                        # We want World --> obj transform, NOT the World --> root_link transform, since these particles
-                        # do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly
-                        # get the transform, and not obj.get_position_orientation(frame="parent") which will give us the local pose of the
-                        # root link!
-                        link_tfs[obj] = T.pose2mat(XFormPrim.get_position_orientation(obj, frame="parent"))
-                    link = obj
-                else:
-                    link = self._particles_info[name]["link"]
-                    if link not in link_tfs:
-                        link_tfs[link] = T.pose2mat(link.get_position_orientation())
-                link_tfs_batch[i] = link_tfs[link]
-                particle_local_poses_batch[i] = self._particles_local_mat[name]
+            # Local poses are relative to the scaled parent link, whereas the store is in world units
+            return positions / self._compute_parent_frame_scales(parent_idxs=parent_idxs), orientations.clone()
 
-            # Compute once
-            poses = link_tfs_batch @ particle_local_poses_batch
-
-        # Decompose back into positions and orientations
-        return poses[:, :3, 3], T.mat2quat(poses[:, :3, :3])
+        parent_positions, parent_orientations = self._compute_parent_frame_poses(parent_idxs=parent_idxs)
+        return T.pose_transform_batch(parent_positions, parent_orientations, positions, orientations)
 
     def get_particles_position_orientation(self):
-        return self._compute_batch_particles_position_orientation(particles=self.particles, local=False)
+        return self._compute_batch_particles_position_orientation(local=False)
 
     def get_particles_local_pose(self):
-        return self._compute_batch_particles_position_orientation(particles=self.particles, local=True)
+        return self._compute_batch_particles_position_orientation(local=True)
 
     def get_group_particles_position_orientation(self, group):
-        return self._compute_batch_particles_position_orientation(particles=self._group_particles[group], local=False)
+        return self._compute_batch_particles_position_orientation(rows=self._get_group_rows(group=group), local=False)
 
     def get_group_particles_local_pose(self, group):
-        return self._compute_batch_particles_position_orientation(particles=self._group_particles[group], local=True)
+        return self._compute_batch_particles_position_orientation(rows=self._get_group_rows(group=group), local=True)
 
     def get_particle_position_orientation(self, idx):
-        name = list(self.particles.keys())[idx]
-        # First, get local pose, scale it by the parent link's scale, and then convert into a matrix
-        # Note that particles_local_mat already takes the parent scale into account when computing the transform!
-        parent_obj = self._particles_info[name]["obj"]
-        is_cloth = self._is_cloth_obj(obj=parent_obj)
-        local_mat = self._particles_local_mat[name]
-        link_tf = (
-            T.pose2mat(XFormPrim.get_position_orientation(parent_obj, frame="parent"))
-            if is_cloth
-            else T.pose2mat(self._particles_info[name]["link"].get_position_orientation())
+        positions, orientations = self._compute_batch_particles_position_orientation(
+            rows=self._get_particle_row(idx=idx), local=False
         )
-
-        # Multiply the local pose by the link's global transform, then return as pos, quat tuple
-        return T.mat2pose(link_tf @ local_mat)
+        return positions[0], orientations[0]
 
     def get_particle_local_pose(self, idx):
-        name = list(self.particles.keys())[idx]
-        return self.particles[name].get_position_orientation(frame="parent")
+        positions, orientations = self._compute_batch_particles_position_orientation(
+            rows=self._get_particle_row(idx=idx), local=True
+        )
+        return positions[0], orientations[0]
 
-    def _modify_batch_particles_position_orientation(self, particles, positions=None, orientations=None, local=False):
+    def _modify_batch_particles_position_orientation(self, rows=None, positions=None, orientations=None, local=False):
         """
-        Modifies all @particles' positions and orientations with @positions and @orientations
+        Modifies the positions and orientations of the particles at rows @rows in the particle store with @positions
+        and @orientations. Note that this only updates the store -- the new poses are written to USD in bulk during
+        the next call to sync_particle_poses_in_usd()
 
         Args:
-            particles (Iterable of str): Names of particles to modify
+            rows (None or th.tensor): (n,) rows of the particles to modify. If None, modifies all particles
             positions (None or (n, 3)-array): New positions to set for the particles
             orientations (None or (n, 4)-array): New orientations to set for the particles
             local (bool): Whether to modify particles' poses in local frame or not
-
-        Returns:
-            2-tuple:
-                - (n, 3)-array: per-particle (x,y,z) position
-                - (n, 4)-array: per-particle (x,y,z,w) quaternion orientation
         """
-        n_particles = len(particles) if particles is not None else 0
+        self._compact_particle_store()
+        rows = slice(None) if rows is None else rows
+        n_particles = len(self._particle_dirty[rows])
         if n_particles == 0:
             return
 
         if positions is None or orientations is None:
-            pos, ori = self._compute_batch_particles_position_orientation(particles=particles, local=local)
+            pos, ori = self._compute_batch_particles_position_orientation(rows=rows, local=local)
             positions = pos if positions is None else positions
             orientations = ori if orientations is None else orientations
-        lens = th.tensor([len(particles), len(positions), len(orientations)])
+        positions = th.as_tensor(positions, dtype=th.float32)
+        orientations = th.as_tensor(orientations, dtype=th.float32)
+        lens = th.tensor([n_particles, len(positions), len(orientations)])
         assert lens.min() == lens.max(), "Got mismatched particles, positions, and orientations!"
 
-        particle_local_poses_batch = th.zeros((n_particles, 4, 4))
-        particle_local_poses_batch[:, -1, -1] = 1.0
-        particle_local_poses_batch[:, :3, 3] = positions
-        particle_local_poses_batch[:, :3, :3] = T.quat2mat(orientations)
-
-        if not local:
-            # Iterate over all particles and compute link tfs programmatically, then batch the matrix transform
-            link_tfs = dict()
-            link_tfs_batch = th.zeros((n_particles, 4, 4))
-            for i, name in enumerate(particles):
-                obj = self._particles_info[name]["obj"]
-                is_cloth = self._is_cloth_obj(obj=obj)
-                if is_cloth:
-                    if obj not in link_tfs:
-                        # We want World --> obj transform, NOT the World --> root_link transform, since these particles
-                        # do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly
-                        # get the transform, and not obj.get_position_orientation(frame="parent") which will give us the local pose of the
-                        # root link!
-                        link_tfs[obj] = T.pose2mat(XFormPrim.get_position_orientation(obj, frame="parent"))
-                    link_tf = link_tfs[obj]
-                else:
-                    link = self._particles_info[name]["link"]
-                    if link not in link_tfs:
-                        link_tfs[link] = T.pose2mat(link.get_position_orientation())
-                    link_tf = link_tfs[link]
-                link_tfs_batch[i] = link_tf
+        parent_idxs = self._particle_parent_idxs[rows]
+        if local:
+            # Local poses are relative to the scaled parent link, whereas the store is in world units
+            positions = positions * self._compute_parent_frame_scales(parent_idxs=parent_idxs)
+        else:
+            parent_positions, parent_orientations = self._compute_parent_frame_poses(parent_idxs=parent_idxs)
+            positions, orientations = T.relative_pose_transform_batch(
+                positions, orientations, parent_positions, parent_orientations
+            )
 
-            # particle_local_poses_batch = th.linalg.inv_ex(link_tfs_batch).inverse @ particle_local_poses_batch
-            particle_local_poses_batch = th.linalg.solve(link_tfs_batch, particle_local_poses_batch)
+        self._particle_local_positions[rows] = positions
+        self._particle_local_orientations[rows] = orientations
+        self._particle_dirty[rows] = True
+        self.invalidate_spatial_hash()
 
-        for i, name in enumerate(particles):
-            self._modify_particle_local_mat(name=name, mat=particle_local_poses_batch[i], ignore_scale=local)
+    def sync_particle_poses_in_usd(self):
+        """
+        Writes the local poses of all particles whose poses were modified since the last call to USD, all at once.
+        The poses are authored directly on the stage's edit target layer within a single Sdf.ChangeBlock, so that USD
+        (and any fabric / renderer listeners) processes a single batch of change notifications rather than one per
+        particle. This is called automatically by the simulator before stepping and rendering, so it only needs to be
+        called manually if the particle prims' USD poses are read directly
+        """
+        self._compact_particle_store()
+        rows = th.nonzero(self._particle_dirty).flatten()
+        if len(rows) == 0:
+            return
+
+        positions, orientations = self._compute_batch_particles_position_orientation(rows=rows, local=True)
+        all_particles = list(self.particles.values())
+        particles = [all_particles[row] for row in rows.tolist()]
+        layer = og.sim.stage.GetEditTarget().GetLayer()
+        fallback_idxs = []
+        with lazy.pxr.Sdf.ChangeBlock():
+            # Positions are (x,y,z), and USD quaternions are (w,x,y,z)
+            for i, (particle, position, orientation) in enumerate(
+                zip(particles, positions.tolist(), orientations[:, [3, 0, 1, 2]].tolist())
+            ):
+                translate_spec = layer.GetAttributeAtPath(f"{particle.prim_path}.xformOp:translate")
+                orient_spec = layer.GetAttributeAtPath(f"{particle.prim_path}.xformOp:orient")
+                if translate_spec is None or orient_spec is None:
+                    # The pose is not authored on this layer, so it has to go through the composed USD API below
+                    fallback_idxs.append(i)
+                    continue
+                translate_spec.default = (
+                    lazy.pxr.Gf.Vec3f(*position)
+                    if translate_spec.typeName == lazy.pxr.Sdf.ValueTypeNames.Float3
+                    else lazy.pxr.Gf.Vec3d(*position)
+                )
+                orient_spec.default = (
+                    lazy.pxr.Gf.Quatf(*orientation)
+                    if orient_spec.typeName == lazy.pxr.Sdf.ValueTypeNames.Quatf
+                    else lazy.pxr.Gf.Quatd(*orientation)
+                )
+        for i in fallback_idxs:
+            particles[i].set_position_orientation(position=positions[i], orientation=orientations[i], frame="parent")
+        PoseAPI.invalidate()
+        if gm.ENABLE_FLATCACHE:
+            # Sync the updated USD local poses to fabric, as XFormPrim.set_position_orientation() does
+            for particle in particles:
+                lazy.usdrt.Rt.Xformable(
+                    lazy.omni.isaac.core.utils.prims.get_prim_at_path(particle.prim_path, fabric=True)
+                ).SetLocalXformFromUsd()
+        self._particle_dirty[rows] = False
 
     def set_particles_position_orientation(self, positions=None, orientations=None):
         return self._modify_batch_particles_position_orientation(
-            particles=self.particles, positions=positions, orientations=orientations, local=False
+            positions=positions, orientations=orientations, local=False
         )
 
     def set_particles_local_pose(self, positions=None, orientations=None):
         return self._modify_batch_particles_position_orientation(
-            particles=self.particles, positions=positions, orientations=orientations, local=True
+            positions=positions, orientations=orientations, local=True
         )
 
     def set_group_particles_position_orientation(self, group, positions=None, orientations=None):
         return self._modify_batch_particles_position_orientation(
-            particles=self._group_particles[group], positions=positions, orientations=orientations, local=False
+            rows=self._get_group_rows(group=group), positions=positions, orientations=orientations, local=False
         )
 
     def set_group_particles_local_pose(self, group, positions=None, orientations=None):
         return self._modify_batch_particles_position_orientation(
-            particles=self._group_particles[group], positions=positions, orientations=orientations, local=True
+            rows=self._get_group_rows(group=group), positions=positions, orientations=orientations, local=True
         )
 
     def set_particle_position_orientation(self, idx, position=None, orientation=None):
-        if position is None or orientation is None:
-            pos, ori = self.get_particle_position_orientation(idx=idx)
-            position = pos if position is None else position
-            orientation = ori if orientation is None else orientation
-
-        position = position if isinstance(position, th.Tensor) else th.tensor(position, dtype=th.float32)
-        orientation = orientation if isinstance(orientation, th.Tensor) else th.tensor(orientation, dtype=th.float32)
-
-        name = list(self.particles.keys())[idx]
-        global_mat = th.zeros((4, 4))
-        global_mat[-1, -1] = 1.0
-        global_mat[:3, 3] = position
-        global_mat[:3, :3] = T.quat2mat(orientation)
-        # First, get global pose, scale it by the parent link's scale, and then convert into a matrix
-        parent_obj = self._particles_info[name]["obj"]
-        is_cloth = self._is_cloth_obj(obj=parent_obj)
-        link_tf = (
-            T.pose2mat(XFormPrim.get_position_orientation(parent_obj, frame="parent"))
-            if is_cloth
-            else T.pose2mat(self._particles_info[name]["link"].get_position_orientation())
+        self._modify_batch_particles_position_orientation(
+            rows=self._get_particle_row(idx=idx),
+            positions=None if position is None else th.as_tensor(position, dtype=th.float32).reshape(1, 3),
+            orientations=None if orientation is None else th.as_tensor(orientation, dtype=th.float32).reshape(1, 4),
+            local=False,
         )
-        local_mat = th.linalg.inv_ex(link_tf).inverse @ global_mat
-
-        self._modify_particle_local_mat(name=name, mat=local_mat, ignore_scale=False)
 
     def set_particle_local_pose(self, idx, position=None, orientation=None):
-        if position is None or orientation is None:
-            pos, ori = self.get_particle_local_pose(idx=idx)
-            position = pos if position is None else position
-            orientation = ori if orientation is None else orientation
-
-        position = position if isinstance(position, th.Tensor) else th.tensor(position, dtype=th.float32)
-        orientation = orientation if isinstance(orientation, th.Tensor) else th.tensor(orientation, dtype=th.float32)
-
-        name = list(self.particles.keys())[idx]
-        local_mat = th.zeros((4, 4))
-        local_mat[-1, -1] = 1.0
-        local_mat[:3, 3] = position
-        local_mat[:3, :3] = T.quat2mat(orientation)
-        self._modify_particle_local_mat(name=name, mat=local_mat, ignore_scale=True)
+        self._modify_batch_particles_position_orientation(
+            rows=self._get_particle_row(idx=idx),
+            positions=None if position is None else th.as_tensor(position, dtype=th.float32).reshape(1, 3),
+            orientations=None if orientation is None else th.as_tensor(orientation, dtype=th.float32).reshape(1, 4),
+            local=True,
+        )
 
     def _is_cloth_obj(self, obj):
         """
@@ -877,45 +1064,6 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         """
         return obj.prim_type == PrimType.CLOTH
 
-    def _compute_particle_local_mat(self, name, ignore_scale=False):
-        """
-        Computes particle @name's local transform as a homogeneous 4x4 matrix
-
-        Args:
-            name (str): Name of the particle to compute local transform matrix for
-            ignore_scale (bool): Whether to ignore the parent_link scale when computing the local transform
-
-        Returns:
-            th.tensor: (4, 4) homogeneous transform matrix
-        """
-        particle = self.particles[name]
-        parent_obj = self._particles_info[name]["obj"]
-        is_cloth = self._is_cloth_obj(obj=parent_obj)
-        scale = th.ones(3) if is_cloth else self._particles_info[name]["link"].scale
-        local_pos, local_quat = particle.get_position_orientation(frame="parent")
-        local_pos = local_pos if ignore_scale else local_pos * scale
-        return T.pose2mat((local_pos, local_quat))
-
-    def _modify_particle_local_mat(self, name, mat, ignore_scale=False):
-        """
-        Sets particle @name's local transform as a homogeneous 4x4 matrix
-
-        Args:
-            name (str): Name of the particle to compute local transform matrix for
-            mat (n-array): (4, 4) homogeneous transform matrix
-            ignore_scale (bool): Whether to ignore the parent_link scale when setting the local transform
-        """
-        particle = self.particles[name]
-        parent_obj = self._particles_info[name]["obj"]
-        is_cloth = self._is_cloth_obj(obj=parent_obj)
-        scale = th.ones(3) if is_cloth else self._particles_info[name]["link"].scale
-        local_pos, local_quat = T.mat2pose(mat)
-        local_pos = local_pos if ignore_scale else local_pos / scale
-        particle.set_position_orientation(position=local_pos, orientation=local_quat, frame="parent")
-
-        # Store updated value
-        self._particles_local_mat[name] = mat
-
     def _sync_particle_groups(
         self,
         group_objects,
@@ -974,6 +1122,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             info = name_to_info_mapping[name]
             self.create_attachment_group(obj=obj)
             is_cloth = self._is_cloth_obj(obj=obj)
+            names, parents = [], []
             for particle_idn, reference in zip(info["particle_idns"], info["references"]):
                 # Reference is either the face ID (int) if cloth group or link name (str) if rigid body group
                 # Create the necessary particles
@@ -991,6 +1140,11 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
                     self._particles_info[particle.name]["face_id"] = int(reference)
                 else:
                     self._particles_info[particle.name]["link"] = obj.links[reference]
+                names.append(particle.name)
+                parents.append(obj if is_cloth else obj.links[reference])
+
+            # Poses and scales get overridden anyways when loading state
+            self._add_particles_to_store(names=names, group=name, parents=parents, scales=th.ones((len(names), 3)))
 
             # Also store the cloth face IDs as a vector
             if is_cloth:
@@ -1072,6 +1226,11 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         # Run super
         super()._load_state(state=state)
 
+        # Keep the particle store's scales in sync with the particles' scales
+        if self.n_particles > 0:
+            self._compact_particle_store()
+            self._particle_scales = th.as_tensor(state["scales"], dtype=th.float32).reshape(-1, 3).clone()
+
     def serialize(self, state):
         # Run super first
         state_flat = super().serialize(state=state)
@@ -1321,6 +1480,7 @@ class MacroPhysicalParticleSystem(MacroParticleSystem, PhysicalParticleSystem):
             orientations = ori if orientations is None else orientations
             positions = pos if positions is None else (positions - T.quat2mat(orientations) @ self._particle_offset)
         self.particles_view.set_transforms(th.cat([positions, orientations], dim=1), indices=th.arange(len(positions)))
+        self.invalidate_spatial_hash()
 
     def set_particles_local_pose(self, positions=None, orientations=None):
         self.set_particles_position_orientation(positions=positions, orientations=orientations)
@@ -1334,6 +1494,7 @@ class MacroPhysicalParticleSystem(MacroParticleSystem, PhysicalParticleSystem):
             orientation = ori if orientation is None else orientation
             position = pos if position is None else (position - T.quat2mat(orientation) @ self._particle_offset)
         self.particles_view.set_transforms(th.cat([position, orientation]).reshape(1, -1), indices=th.tensor([idx]))
+        self.invalidate_spatial_hash()
 
     def set_particle_local_pose(self, idx, position=None, orientation=None):
         self.set_particle_position_orientation(idx=idx, position=position, orientation=orientation)
@@ -1398,6 +1559,13 @@ class MacroPhysicalParticleSystem(MacroParticleSystem, PhysicalParticleSystem):
         # This is simply the normal radius
         return self.particle_radius
 
+    def get_particle_collision_aabbs(self):
+        if self.n_particles == 0:
+            return None
+        # Particle positions are the centers of the particles' bounding spheres
+        positions = self.get_particles_position_orientation()[0]
+        return positions - self.particle_radius, positions + self.particle_radius
+
     @property
     def particle_density(self):
         """
@@ -890,6 +890,9 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
 
         inst.remove_particles(idxs=idxs)
 
+        # Particle indices have changed
+        self.invalidate_spatial_hash()
+
     def generate_particles(
         self,
         positions,
@@ -973,6 +976,9 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
             type_label="class",
         )
 
+        # Particle indices have changed
+        self.invalidate_spatial_hash()
+
         return inst
 
     def generate_particle_instancer(
@@ -1210,6 +1216,7 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
             self.default_particle_instancer.particle_positions = positions
         if orientations is not None:
             self.default_particle_instancer.particle_orientations = orientations
+        self.invalidate_spatial_hash()
 
     def set_particles_local_pose(self, positions=None, orientations=None):
         self.set_particles_position_orientation(positions=positions, orientations=orientations)
@@ -1223,6 +1230,7 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
             orientations = self.default_particle_instancer.particle_orientations
             orientations[idx] = orientation
             self.default_particle_instancer.particle_orientations = orientations
+        self.invalidate_spatial_hash()
 
     def set_particle_local_pose(self, idx, position=None, orientation=None):
         self.set_particle_position_orientation(idx=idx, position=position, orientation=orientation)
@@ -1274,6 +1282,9 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
             info = idn_to_info_mapping[idn]
             self.generate_particle_instancer(idn=idn, particle_group=info["group"], n_particles=info["count"])
 
+        # Particle indices may have changed
+        self.invalidate_spatial_hash()
+
     def _dump_state(self):
         return dict(
             n_instancers=self.n_instancers,
@@ -1301,6 +1312,9 @@ class MicroPhysicalParticleSystem(MicroParticleSystem, PhysicalParticleSystem):
         for name, inst_state in state["particle_states"].items():
             self.particle_instancers[name].load_state(inst_state, serialized=False)
 
+        # Particles may have been moved, so the spatial hash is out of date
+        self.invalidate_spatial_hash()
+
     def serialize(self, state):
         # Array is number of particle instancers, then the corresponding states for each particle instancer
         return th.cat(
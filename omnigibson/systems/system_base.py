@@ -8,6 +8,7 @@ import omnigibson as og
 import omnigibson.lazy as lazy
 from omnigibson.macros import create_module_macros, gm
 from omnigibson.utils.asset_utils import get_all_system_categories
+from omnigibson.utils.broadphase_utils import PointSpatialHash, spheres_overlap_aabbs
 from omnigibson.utils.geometry_utils import generate_points_in_volume_checker_function
 from omnigibson.utils.python_utils import Serializable, get_uuid
 from omnigibson.utils.registry_utils import SerializableRegistry
@@ -29,6 +30,13 @@ m.BBOX_UPPER_LIMIT_FRACTION_OF_AABB = 0.1
 m.BBOX_UPPER_LIMIT_MIN = 0.01
 m.BBOX_UPPER_LIMIT_MAX = 0.1
 
+# Margin added to particles' contact radius when culling particles that cannot be in contact with any rigid body,
+# before precisely checking the remaining ones
+m.CONTACT_CULLING_MARGIN = 0.01
+
+# Cell size of each system's particle spatial hash, in meters
+m.SPATIAL_HASH_CELL_SIZE = 0.1
+
 
 _CALLBACKS_ON_SYSTEM_INIT = dict()
 _CALLBACKS_ON_SYSTEM_CLEAR = dict()
@@ -58,6 +66,11 @@ class BaseSystem(Serializable):
 
         self._scene = None
 
+        # Spatial hash over particle positions, lazily rebuilt when queried, and the (sim step, number of particles)
+        # it was built at
+        self._spatial_hash = PointSpatialHash(cell_size=m.SPATIAL_HASH_CELL_SIZE)
+        self._spatial_hash_key = None
+
     @property
     def name(self):
         # Class name is the unique name assigned
@@ -211,6 +224,7 @@ class BaseSystem(Serializable):
 
         self.initialized = False
         self._scene = None
+        self.invalidate_spatial_hash()
 
     def reset(self):
         """
@@ -230,6 +244,34 @@ class BaseSystem(Serializable):
         """
         return th.rand(n, 3) * (self.max_scale - self.min_scale) + self.min_scale
 
+    @property
+    def spatial_hash(self):
+        """
+        Returns:
+            PointSpatialHash: Spatial hash over the positions of all particles, as returned by
+                get_particles_position_orientation(). It is lazily rebuilt at most once per simulator step, or after it
+                has been invalidated by particles being added, removed, or moved through this system's pose setters or
+                state loading
+        """
+        if self._spatial_hash_key != (og.sim.current_time_step_index, self.n_particles):
+            self.update_spatial_hash()
+        return self._spatial_hash
+
+    def update_spatial_hash(self):
+        """
+        Rebuilds this system's particle spatial hash from the current particle positions
+        """
+        self._spatial_hash.update(self.get_particles_position_orientation()[0])
+        self._spatial_hash_key = (og.sim.current_time_step_index, self.n_particles)
+
+    def invalidate_spatial_hash(self):
+        """
+        Marks this system's particle spatial hash as out of date, so that it is rebuilt the next time it is queried.
+        This should be called whenever particles are added, removed, or moved in between simulator steps, since any of
+        these can change the positions that the hash's particle indices refer to
+        """
+        self._spatial_hash_key = None
+
     def get_particles_position_orientation(self):
         """
         Computes all particles' positions and orientations that belong to this system in the world frame
@@ -363,6 +405,7 @@ class BaseSystem(Serializable):
         # Load the poses
         setter = self.set_particles_local_pose if self._store_local_poses else self.set_particles_position_orientation
         setter(positions=state["positions"], orientations=state["orientations"])
+        self.invalidate_spatial_hash()
 
     def serialize(self, state):
         # Array is n_particles, then min_scale and max_scale, then poses for all particles
@@ -816,11 +859,63 @@ class PhysicalParticleSystem(BaseSystem):
             n-array: (n_particles,) boolean array, True if in contact, otherwise False
         """
         in_contact = th.zeros(len(positions), dtype=bool)
-        for idx, pos in enumerate(positions):
+        # Only precisely check the particles that may be in contact with any rigid body
+        for idx in th.nonzero(self.get_contact_candidates(positions)).flatten().tolist():
             # TODO: Maybe multiply particle contact radius * 2?
-            in_contact[idx] = og.sim.psqi.overlap_sphere_any(self.particle_contact_radius, pos.tolist())
+            in_contact[idx] = og.sim.psqi.overlap_sphere_any(self.particle_contact_radius, positions[idx].tolist())
         return in_contact
 
+    def get_contact_candidates(self, positions):
+        """
+        Conservatively culls the particles specified by @positions that cannot be in contact with any rigid body, by
+        checking their contact spheres against the AABBs of all objects (through each scene's broadphase index), any
+        scene collision geometry not belonging to an object (e.g. a static scene's mesh), the floor plane, and all
+        rigid particles
+
+        Args:
+            positions (th.tensor): (n_particles, 3) shaped array specifying per-particle (x,y,z) positions
+
+        Returns:
+            n-array: (n_particles,) boolean array, True if the particle may be in contact, otherwise False
+        """
+        # Object AABBs are only tracked with object states
+        if not gm.ENABLE_OBJECT_STATES:
+            return th.ones(len(positions), dtype=bool)
+
+        positions = th.as_tensor(positions, dtype=th.float32).reshape(-1, 3)
+        radius = self.particle_contact_radius + m.CONTACT_CULLING_MARGIN
+        lowers, uppers = [], []
+        if og.sim.floor_plane is not None:
+            floor_z = og.sim.floor_plane.get_position_orientation()[0][2].item()
+            lowers.append(th.tensor([[-th.inf, -th.inf, -th.inf]]))
+            uppers.append(th.tensor([[th.inf, th.inf, floor_z]]))
+        may_be_in_contact = th.zeros(len(positions), dtype=bool)
+        for scene in og.sim.scenes:
+            may_be_in_contact |= scene.broadphase.query_spheres(centers=positions, radius=radius)
+            aabbs = scene.get_non_object_collision_aabbs()
+            if aabbs is not None:
+                lowers.append(aabbs[0])
+                uppers.append(aabbs[1])
+            for system in scene.active_systems.values():
+                if isinstance(system, PhysicalParticleSystem):
+                    aabbs = system.get_particle_collision_aabbs()
+                    if aabbs is not None:
+                        lowers.append(aabbs[0])
+                        uppers.append(aabbs[1])
+        if len(lowers) > 0:
+            may_be_in_contact |= spheres_overlap_aabbs(
+                centers=positions, radius=radius, lowers=th.cat(lowers), uppers=th.cat(uppers)
+            )
+        return may_be_in_contact
+
+    def get_particle_collision_aabbs(self):
+        """
+        Returns:
+            None or 2-tuple: If this system's particles are rigid bodies that other particles may be in contact with,
+                the (n_particles, 3) lower and upper corners of conservative AABBs of each particle. Otherwise, None
+        """
+        return None
+
     def generate_particles_from_link(
         self,
         obj,
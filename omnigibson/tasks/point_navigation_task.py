@@ -246,8 +246,9 @@ class PointNavigationTask(BaseTask):
                 _, goal_pos = env.scene.get_random_point(
                     floor=self._floor, reference_point=initial_pos, robot=env.robots[self._robot_idn]
                 )
-                _, dist = env.scene.get_shortest_path(
-                    self._floor, initial_pos[:2], goal_pos[:2], entire_path=False, robot=env.robots[self._robot_idn]
+                # All trials share the same initial position, so they all look up the same cached distance field
+                dist = env.scene.get_geodesic_distance(
+                    self._floor, goal_pos[:2], initial_pos[:2], robot=env.robots[self._robot_idn]
                 )
                 # If a path range is specified, make sure distance is valid
                 if dist is not None and (self._path_range is None or self._path_range[0] < dist < self._path_range[1]):
@@ -272,10 +273,16 @@ class PointNavigationTask(BaseTask):
             env: environment instance
 
         Returns:
-            float: geodesic distance to the target position
+            None or float: geodesic distance to the target position, or None if no path exists
         """
-        _, geodesic_dist = self.get_shortest_path_to_goal(env=env)
-        return geodesic_dist
+        # The distance field to the goal is computed once per episode and cached by the scene's traversable map,
+        # so this is a single lookup
+        return env.scene.get_geodesic_distance(
+            self._floor,
+            env.robots[self._robot_idn].states[Pose].get_value()[0][:2],
+            self._goal_pos[:2],
+            robot=env.robots[self._robot_idn],
+        )
 
     def _get_l2_potential(self, env):
         """
@@ -443,7 +450,12 @@ class PointNavigationTask(BaseTask):
             env.robots[self._robot_idn].states[Pose].get_value()[0][:2] if start_xy_pos is None else start_xy_pos
         )
         return env.scene.get_shortest_path(
-            self._floor, start_xy_pos, self._goal_pos[:2], entire_path=entire_path, robot=env.robots[self._robot_idn]
+            self._floor,
+            start_xy_pos,
+            self._goal_pos[:2],
+            entire_path=entire_path,
+            robot=env.robots[self._robot_idn],
+            use_distance_field=True,
         )
 
     def _step_visualization(self, env):
@@ -39,6 +39,14 @@ m.MELTING_TEMPERATURE = 100.0
 # Default "trash" system if an invalid mixing rule transition occurs
 m.DEFAULT_GARBAGE_SYSTEM = "sludge"
 
+# Whether to skip evaluating active transition rules whose conditions were not met at their last evaluation, as long
+# as none of their input objects has been awake or had a state update since then. This assumes that condition inputs
+# only change through physics or through object state updates, so objects that are teleported while asleep (or that
+# are kinematic only) are not accounted for until the rules are refreshed. Particle counts are not tracked: conditions
+# that read particle state do not declare input objects and are thus evaluated every step, and otherwise particle counts
+# only matter inside transitions, which only run once their conditions are met
+m.EVENT_DRIVEN_RULE_EVALUATION = False
+
 # Tuple of attributes of objects created in transitions.
 # `states` field is dict mapping object state class to arguments to pass to setter for that class
 _attrs_fields = ["category", "model", "name", "scale", "obj", "pos", "orn", "bb_pos", "bb_orn", "states", "callback"]
@@ -80,6 +88,23 @@ class TransitionRuleAPI:
 
         self.all_rules = set([rule(scene) for rule in RULES_REGISTRY.objects])
 
+        # Maps each rule to its unpruned object candidates, i.e.: mapping from filter key to list of object instances
+        # that satisfy that filter. These are maintained incrementally as objects are added and removed
+        self._rule_candidates = {rule: None for rule in self.all_rules}
+
+        # Event-driven evaluation bookkeeping. Maps each active rule to the objects whose updates may change its
+        # conditions' outputs (or None if they must be evaluated every step), and tracks which rules need to be
+        # evaluated regardless, as well as which objects had their states updated since the last step
+        self._rule_inputs = dict()
+        self._rules_to_evaluate = set()
+        self.updated_objects = set()
+
+        # Whether to skip evaluating rules whose inputs did not change. See m.EVENT_DRIVEN_RULE_EVALUATION
+        self.event_driven = m.EVENT_DRIVEN_RULE_EVALUATION
+
+        # Number of rule evaluations that were skipped during the last step
+        self.n_skipped_evaluations = 0
+
     def get_rule_candidates(self, rule, objects):
         """
         Computes valid input object candidates for transition rule @rule, if any exist
@@ -93,9 +118,12 @@ class TransitionRuleAPI:
                 instances that satisfy that filter
         """
         obj_candidates = rule.get_object_candidates(objects=objects)
+        return obj_candidates if self._all_filters_satisfied(rule, obj_candidates) else None
+
+    @staticmethod
+    def _all_filters_satisfied(rule, obj_candidates):
         n_filters_satisfied = sum(len(candidates) > 0 for candidates in obj_candidates.values())
-        # Return object candidates if all filters are met, otherwise return None
-        return obj_candidates if n_filters_satisfied == len(rule.candidate_filters) else None
+        return n_filters_satisfied == len(rule.candidate_filters)
 
     def prune_active_rules(self):
         """
@@ -125,19 +153,93 @@ class TransitionRuleAPI:
             rules (list of BaseTransitionRule): List of transition rules whose candidate lists should be refreshed
         """
         for rule in rules:
-            # Check if rule is still valid, if so, update its entry
-            object_candidates = self.get_rule_candidates(rule=rule, objects=self.scene.objects)
-
-            # Update candidates if valid, otherwise pop the entry if it exists in self.active_rules
-            if object_candidates is not None:
-                # We have a valid rule which should be active, so grab and initialize all of its conditions
-                # NOTE: The rule may ALREADY exist in ACTIVE_RULES, but we still need to refresh its candidates because
-                # the relevant candidate set / information for the rule + its conditions may have changed given the
-                # new set of objects
-                rule.refresh(object_candidates=object_candidates)
-                self.active_rules.add(rule)
-            elif rule in self.active_rules:
-                self.active_rules.remove(rule)
+            self._rule_candidates[rule] = rule.get_object_candidates()
+            self._update_rule(rule)
+
+    def add_objects(self, objs):
+        """
+        Incrementally adds @objs to the object candidates of all registered rules, and refreshes the active rules
+        accordingly. This is equivalent to, but cheaper than, refresh_all_rules() when @objs were just added to the
+        scene
+
+        Args:
+            objs (list of BaseObject): Objects that were added to the scene
+        """
+        for rule in self.all_rules:
+            if self._rule_candidates[rule] is None:
+                self._rule_candidates[rule] = rule.get_object_candidates()
+            else:
+                # Keep candidates sorted by name, matching the order of a full refresh
+                for filter_name, candidates in rule.get_object_candidates(objects=objs).items():
+                    self._rule_candidates[rule][filter_name] = sorted(
+                        self._rule_candidates[rule][filter_name] + candidates, key=lambda obj: obj.name
+                    )
+            self._update_rule(rule)
+
+    def remove_objects(self, objs):
+        """
+        Incrementally removes @objs from the object candidates of all registered rules, and refreshes the active
+        rules accordingly. This is equivalent to, but cheaper than, refresh_all_rules() when @objs were just removed
+        from the scene
+
+        Args:
+            objs (list of BaseObject): Objects that were removed from the scene
+        """
+        objs = set(objs)
+        for rule in self.all_rules:
+            if self._rule_candidates[rule] is None:
+                self._rule_candidates[rule] = rule.get_object_candidates()
+            else:
+                for filter_name, candidates in self._rule_candidates[rule].items():
+                    self._rule_candidates[rule][filter_name] = [obj for obj in candidates if obj not in objs]
+            self._update_rule(rule)
+        self.updated_objects -= objs
+
+    def _update_rule(self, rule):
+        """
+        Activates and refreshes @rule if its current object candidates satisfy all of its filters, otherwise
+        deactivates it
+
+        Args:
+            rule (BaseTransitionRule): Transition rule to update
+        """
+        object_candidates = self._rule_candidates[rule]
+        # Update candidates if valid, otherwise pop the entry if it exists in self.active_rules
+        if self._all_filters_satisfied(rule, object_candidates):
+            # We have a valid rule which should be active, so grab and initialize all of its conditions
+            # NOTE: The rule may ALREADY exist in ACTIVE_RULES, but we still need to refresh its candidates because
+            # the relevant candidate set / information for the rule + its conditions may have changed given the
+            # new set of objects
+            object_candidates = {filter_name: list(candidates) for filter_name, candidates in object_candidates.items()}
+            rule.refresh(object_candidates=object_candidates)
+            self.active_rules.add(rule)
+            self._rule_inputs[rule] = rule.get_input_objects(object_candidates=object_candidates)
+            self._rules_to_evaluate.add(rule)
+        elif rule in self.active_rules:
+            self.active_rules.remove(rule)
+            self._rule_inputs.pop(rule, None)
+            self._rules_to_evaluate.discard(rule)
+
+    def invalidate(self):
+        """
+        Forces all active rules to be evaluated during the next step, e.g. after the scene's state was loaded. Only
+        relevant if self.event_driven is set
+        """
+        self._rules_to_evaluate = set(self.active_rules)
+
+    def _can_skip_evaluation(self, rule):
+        """
+        Args:
+            rule (BaseTransitionRule): Active transition rule
+
+        Returns:
+            bool: Whether evaluating @rule is guaranteed to not meet its conditions, because they were not met at its
+                last evaluation and none of their inputs changed since then
+        """
+        if not self.event_driven or rule in self._rules_to_evaluate:
+            return False
+        inputs = self._rule_inputs[rule]
+        return inputs is not None and not any(obj in self.updated_objects or obj.is_active for obj in inputs)
 
     def step(self):
         """
@@ -156,12 +258,23 @@ class TransitionRuleAPI:
         # Cast to list before iterating since ACTIVE_RULES may get updated mid-iteration
         added_obj_attrs = []
         removed_objs = []
+        self.n_skipped_evaluations = 0
         for rule in tuple(self.active_rules):
+            if self._can_skip_evaluation(rule):
+                self.n_skipped_evaluations += 1
+                continue
             output = rule.step()
+            # Rules whose conditions were met need to be evaluated again, since their inputs may change through
+            # their transition
+            if rule.conditions_met:
+                self._rules_to_evaluate.add(rule)
+            else:
+                self._rules_to_evaluate.discard(rule)
             # Store objects to be added / removed if we have a valid output
             if output is not None:
                 added_obj_attrs += output.add
                 removed_objs += output.remove
+        self.updated_objects = set()
 
         self.execute_transition(added_obj_attrs=added_obj_attrs, removed_objs=removed_objs)
 
@@ -211,6 +324,11 @@ class TransitionRuleAPI:
         # Clear internal dictionaries
         self.active_rules = set()
         self.obj_init_info = dict()
+        self._rule_candidates = {rule: None for rule in self.all_rules}
+        self._rule_inputs = dict()
+        self._rules_to_evaluate = set()
+        self.updated_objects = set()
+        self.n_skipped_evaluations = 0
 
 
 class ObjectCandidateFilter(metaclass=ABCMeta):
@@ -222,31 +340,58 @@ class ObjectCandidateFilter(metaclass=ABCMeta):
     at runtime, once imported
     """
 
+    # Whether get_candidates() looks its candidates up in the scene's object registry instead of testing every object
+    # in the scene. Indexed filters are used to narrow down candidates before testing non-indexed ones
+    indexed = False
+
     @abstractmethod
     def __call__(self, obj):
         """Returns true if the given object passes the filter."""
         return False
 
+    def get_candidates(self, scene):
+        """
+        Computes all objects in @scene that pass this filter
+
+        Args:
+            scene (Scene): Scene whose objects should be filtered
+
+        Returns:
+            set of BaseObject: Objects in @scene that pass this filter
+        """
+        # Test every object by default
+        return set(obj for obj in scene.objects if self(obj))
+
 
 class CategoryFilter(ObjectCandidateFilter):
     """Filter for object categories."""
 
+    indexed = True
+
     def __init__(self, category):
         self.category = category
 
     def __call__(self, obj):
         return obj.category == self.category
 
+    def get_candidates(self, scene):
+        return set(scene.object_registry("category", self.category, default_val=set()))
+
 
 class AbilityFilter(ObjectCandidateFilter):
     """Filter for object abilities."""
 
+    indexed = True
+
     def __init__(self, ability):
         self.ability = ability
 
     def __call__(self, obj):
         return self.ability in obj._abilities
 
+    def get_candidates(self, scene):
+        return set(scene.object_registry("abilities", self.ability, default_val=set()))
+
 
 class NameFilter(ObjectCandidateFilter):
     """Filter for object names."""
@@ -267,6 +412,9 @@ class NotFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return not self.f(obj)
 
+    def get_candidates(self, scene):
+        return set(scene.objects) - self.f.get_candidates(scene)
+
 
 class OrFilter(ObjectCandidateFilter):
     """Logical-or of a set of filters."""
@@ -277,6 +425,13 @@ class OrFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return any(f(obj) for f in self.filters)
 
+    @property
+    def indexed(self):
+        return all(f.indexed for f in self.filters)
+
+    def get_candidates(self, scene):
+        return set().union(*(f.get_candidates(scene) for f in self.filters))
+
 
 class AndFilter(ObjectCandidateFilter):
     """Logical-and of a set of filters."""
@@ -287,6 +442,20 @@ class AndFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return all(f(obj) for f in self.filters)
 
+    @property
+    def indexed(self):
+        return any(f.indexed for f in self.filters)
+
+    def get_candidates(self, scene):
+        indexed_filters = [f for f in self.filters if f.indexed]
+        if len(indexed_filters) == 0:
+            return super().get_candidates(scene)
+
+        # Intersect the indexed candidates, and only test the other filters on the objects that are left
+        candidates = set.intersection(*(f.get_candidates(scene) for f in indexed_filters))
+        other_filters = [f for f in self.filters if not f.indexed]
+        return set(obj for obj in candidates if all(f(obj) for f in other_filters))
+
 
 class RuleCondition:
     """
@@ -321,6 +490,22 @@ class RuleCondition:
         # Default is False
         return False
 
+    def get_input_objects(self, object_candidates):
+        """
+        Computes the objects whose changes may affect this condition's output given @object_candidates. Changes are
+        assumed to be limited to objects being awake or having their states updated, so conditions depending on
+        anything else should return None
+
+        Args:
+            object_candidates (dict): Maps filter name to valid object(s) that satisfy that filter
+
+        Returns:
+            None or set of BaseObject: Objects whose changes may affect this condition's output, or None if its output
+                may change at any time, in which case it should be evaluated every step
+        """
+        # Default is None, since there is no guarantee about which inputs arbitrary conditions depend on
+        return None
+
     @property
     def modifies_filter_names(self):
         """
@@ -426,6 +611,14 @@ class TouchingAnyCondition(RuleCondition):
         # If objs is empty, return False, otherwise, True
         return len(objs) > 0
 
+    def get_input_objects(self, object_candidates):
+        objs = set(object_candidates[self._filter_1_name]) | set(object_candidates[self._filter_2_name])
+        # Contacts only change while one of the objects in contact is awake, which cannot be tracked for kinematic-only
+        # or cloth objects
+        if any(obj.kinematic_only or obj.prim_type == PrimType.CLOTH for obj in objs):
+            return None
+        return objs
+
     @property
     def modifies_filter_names(self):
         # Only modifies values from filter 1
@@ -437,6 +630,9 @@ class StateCondition(RuleCondition):
     Rule condition that checks all objects from @filter_name whether a state condition is equal to @val for
     """
 
+    # Object states whose values only change when their object is awake or has its states updated
+    EVENT_TRACKED_STATES = {ToggledOn, Open, SlicerActive, Temperature, MaxTemperature, Heated, HeatSourceOrSink}
+
     def __init__(
         self,
         filter_name,
@@ -471,6 +667,9 @@ class StateCondition(RuleCondition):
         # Condition met if any object meets the condition
         return len(object_candidates[self._filter_name]) > 0
 
+    def get_input_objects(self, object_candidates):
+        return set(object_candidates[self._filter_name]) if self._state in self.EVENT_TRACKED_STATES else None
+
     @property
     def modifies_filter_names(self):
         return {self._filter_name}
@@ -517,6 +716,10 @@ class ChangeConditionWrapper(RuleCondition):
         # Valid if any object conditions have changed and we still have valid objects
         return valid
 
+    def get_input_objects(self, object_candidates):
+        # Changes of the wrapped condition's output can only occur if its inputs change
+        return self._condition.get_input_objects(object_candidates=object_candidates)
+
     @property
     def modifies_filter_names(self):
         # Return wrapped names
@@ -560,6 +763,9 @@ class OrConditionWrapper(RuleCondition):
 
         return True
 
+    def get_input_objects(self, object_candidates):
+        return _get_conditions_input_objects(conditions=self._conditions, object_candidates=object_candidates)
+
     @property
     def modifies_filter_names(self):
         # Return all wrapped names
@@ -603,12 +809,35 @@ class AndConditionWrapper(RuleCondition):
 
         return True
 
+    def get_input_objects(self, object_candidates):
+        return _get_conditions_input_objects(conditions=self._conditions, object_candidates=object_candidates)
+
     @property
     def modifies_filter_names(self):
         # Return all wrapped names
         return set.union(*(condition.modifies_filter_names for condition in self._conditions))
 
 
+def _get_conditions_input_objects(conditions, object_candidates):
+    """
+    Computes the union of the input objects of @conditions
+
+    Args:
+        conditions (list of RuleCondition): Conditions whose input objects should be aggregated
+        object_candidates (dict): Maps filter name to valid object(s) that satisfy that filter
+
+    Returns:
+        None or set of BaseObject: Union of the input objects of @conditions, or None if any of them returns None
+    """
+    input_objects = set()
+    for condition in conditions:
+        objs = condition.get_input_objects(object_candidates=object_candidates)
+        if objs is None:
+            return None
+        input_objects |= objs
+    return input_objects
+
+
 class BaseTransitionRule(Registerable):
     """
     Defines a set of categories of objects and how to transition their states.
@@ -633,6 +862,8 @@ class BaseTransitionRule(Registerable):
         self.candidates = None
         # Delay condition generation until the first time it's accessed
         self.conditions = None
+        # Whether all conditions were met during the last step
+        self.conditions_met = False
 
     @classproperty
     def candidate_filters(cls):
@@ -667,19 +898,27 @@ class BaseTransitionRule(Registerable):
         """
         raise NotImplementedError
 
-    def get_object_candidates(self, objects):
+    def get_object_candidates(self, objects=None):
         """
         Given the set of objects @objects, compute the valid object candidate combinations that may be valid for
         this TransitionRule
 
         Args:
-            objects (list of BaseObject): Objects to filter for valid transition rule candidates
+            objects (None or list of BaseObject): Objects to filter for valid transition rule candidates. If None, all
+                objects in the scene are filtered, using the scene's object registry to only look up the objects that
+                may satisfy each filter. In that case, candidates are sorted by name
 
         Returns:
             dict: Maps filter name to valid object(s) that satisfy that filter
         """
-        # Iterate over all objects and add to dictionary if valid
         filters = self.candidate_filters
+        if objects is None:
+            return {
+                filter_name: sorted(f.get_candidates(self.scene), key=lambda obj: obj.name)
+                for filter_name, f in filters.items()
+            }
+
+        # Iterate over all objects and add to dictionary if valid
         obj_dict = {filter_name: [] for filter_name in filters.keys()}
 
         for obj in objects:
@@ -705,6 +944,22 @@ class BaseTransitionRule(Registerable):
         for condition in self.conditions:
             condition.refresh(object_candidates=object_candidates)
 
+    def get_input_objects(self, object_candidates):
+        """
+        Computes the objects whose changes may affect whether this rule's conditions are met given
+        @object_candidates. See RuleCondition.get_input_objects() for details
+
+        Args:
+            object_candidates (dict): Maps filter name to valid object(s) that satisfy that filter
+
+        Returns:
+            None or set of BaseObject: Objects whose changes may affect whether this rule's conditions are met, or None
+                if this rule should be evaluated every step
+        """
+        if self.conditions is None:
+            self.conditions = self._generate_conditions()
+        return _get_conditions_input_objects(conditions=self.conditions, object_candidates=object_candidates)
+
     def transition(self, object_candidates):
         """
         Rule to apply for each set of objects satisfying the condition.
@@ -730,12 +985,14 @@ class BaseTransitionRule(Registerable):
         object_candidates = {filter_name: candidates.copy() for filter_name, candidates in self.candidates.items()}
         if self.conditions is None:
             self.conditions = self._generate_conditions()
+        self.conditions_met = False
         for condition in self.conditions:
             if not condition(object_candidates=object_candidates):
                 # Condition was not met, so immediately terminate
                 return
 
         # All conditions are met, take the transition
+        self.conditions_met = True
         return self.transition(object_candidates=object_candidates)
 
     @classproperty
@@ -0,0 +1,396 @@
+"""
+A set of utility functions and classes for broadphase culling of axis-aligned bounding boxes (AABBs) and points, i.e.
+for quickly finding which pairs of boxes, or which points, are close enough to each other to be worth checking with
+more expensive tests
+"""
+
+import torch as th
+
+import omnigibson.utils.transform_utils as T
+
+
+def aabb_distance(lower_a, upper_a, lower_b, upper_b):
+    """
+    Computes the Euclidean distance between pairs of AABBs. Overlapping AABBs have a distance of 0
+
+    Args:
+        lower_a (th.Tensor): (..., 3) lower corners of the first AABBs
+        upper_a (th.Tensor): (..., 3) upper corners of the first AABBs
+        lower_b (th.Tensor): (..., 3) lower corners of the second AABBs
+        upper_b (th.Tensor): (..., 3) upper corners of the second AABBs
+
+    Returns:
+        th.Tensor: (...) distances between the AABBs
+    """
+    gap = th.clamp(th.maximum(lower_a, lower_b) - th.minimum(upper_a, upper_b), min=0.0)
+    return th.norm(gap, dim=-1)
+
+
+def spheres_overlap_aabbs(centers, radius, lowers, uppers, max_chunk_elements=2**22):
+    """
+    Checks which spheres overlap any of a set of AABBs
+
+    Args:
+        centers (th.Tensor): (N, 3) centers of the spheres
+        radius (float or th.Tensor): Radius of all spheres, or (N,) radius of each sphere
+        lowers (th.Tensor): (M, 3) lower corners of the AABBs
+        uppers (th.Tensor): (M, 3) upper corners of the AABBs
+        max_chunk_elements (int): Maximum number of (sphere, AABB) pairs to check at once, bounding memory usage
+
+    Returns:
+        th.Tensor: (N,) boolean array, True where the sphere overlaps at least one of the AABBs
+    """
+    centers = th.as_tensor(centers, dtype=th.float32).reshape(-1, 3)
+    radius = th.as_tensor(radius, dtype=th.float32).expand(len(centers))
+    lowers = th.as_tensor(lowers, dtype=th.float32).reshape(-1, 3)
+    uppers = th.as_tensor(uppers, dtype=th.float32).reshape(-1, 3)
+    overlaps = th.zeros(len(centers), dtype=th.bool)
+    if len(centers) == 0 or len(lowers) == 0:
+        return overlaps
+
+    # Only keep the AABBs that overlap the AABB of all the spheres
+    r_max = radius.max()
+    is_near = ((lowers <= centers.amax(dim=0) + r_max) & (uppers >= centers.amin(dim=0) - r_max)).all(dim=-1)
+    lowers, uppers = lowers[is_near], uppers[is_near]
+    if len(lowers) == 0:
+        return overlaps
+
+    # A sphere overlaps an AABB if the closest point of the AABB to its center is within its radius
+    chunk_size = max(max_chunk_elements // len(lowers), 1)
+    for start in range(0, len(centers), chunk_size):
+        chunk = centers[start : start + chunk_size].unsqueeze(1)
+        closest_points = th.maximum(th.minimum(chunk, uppers.unsqueeze(0)), lowers.unsqueeze(0))
+        sq_distances = ((closest_points - chunk) ** 2).sum(dim=-1)
+        sq_radius = radius[start : start + chunk_size].unsqueeze(1) ** 2
+        overlaps[start : start + chunk_size] = (sq_distances <= sq_radius).any(dim=-1)
+    return overlaps
+
+
+class AABBBroadphase:
+    """
+    Uniform grid broadphase over a set of keyed AABBs. Boxes are hashed into the grid cells they span, so that only
+    boxes sharing a cell are compared against each other. Boxes spanning more than @max_cells_per_box cells (e.g. floors
+    and walls) are not hashed, and are instead compared against all other boxes directly.
+
+    Args:
+        cell_size (float): Side length of each grid cell, in meters
+        max_cells_per_box (int): Maximum number of cells a box can span before being compared against all other boxes
+            instead of being hashed into the grid
+    """
+
+    def __init__(self, cell_size=1.0, max_cells_per_box=64):
+        self.cell_size = cell_size
+        self.max_cells_per_box = max_cells_per_box
+        self._keys = []
+        self._key_to_idx = dict()
+        self._lowers = th.zeros((0, 3))
+        self._uppers = th.zeros((0, 3))
+        self._pairs_cache = dict()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._key_to_idx
+
+    @property
+    def keys(self):
+        """
+        Returns:
+            list: Keys of the indexed AABBs, in the order they were passed to update()
+        """
+        return list(self._keys)
+
+    def update(self, keys, lowers, uppers):
+        """
+        Replaces the indexed AABBs
+
+        Args:
+            keys (list): N unique hashable keys, one per AABB
+            lowers (th.Tensor): (N, 3) lower corners of the AABBs
+            uppers (th.Tensor): (N, 3) upper corners of the AABBs
+        """
+        assert len(keys) == len(lowers) == len(uppers), "Got a different number of keys and AABBs!"
+        self._keys = list(keys)
+        self._key_to_idx = {key: idx for idx, key in enumerate(self._keys)}
+        assert len(self._key_to_idx) == len(self._keys), "AABB keys must be unique!"
+        self._lowers = th.as_tensor(lowers, dtype=th.float32).reshape(-1, 3)
+        self._uppers = th.as_tensor(uppers, dtype=th.float32).reshape(-1, 3)
+        self._pairs_cache = dict()
+
+    def get_aabb(self, key):
+        """
+        Args:
+            key: Key of an indexed AABB
+
+        Returns:
+            2-tuple:
+                - th.Tensor: (3,) lower corner of the AABB
+                - th.Tensor: (3,) upper corner of the AABB
+        """
+        idx = self._key_to_idx[key]
+        return self._lowers[idx], self._uppers[idx]
+
+    def are_near(self, key_a, key_b, margin=0.0):
+        """
+        Checks whether two indexed AABBs are within @margin of each other
+
+        Args:
+            key_a: Key of the first AABB
+            key_b: Key of the second AABB
+            margin (float): Maximum distance between the two AABBs, in meters
+
+        Returns:
+            bool: Whether the two AABBs are within @margin of each other
+        """
+        idx_a, idx_b = self._key_to_idx[key_a], self._key_to_idx[key_b]
+        distance = aabb_distance(self._lowers[idx_a], self._uppers[idx_a], self._lowers[idx_b], self._uppers[idx_b])
+        return distance.item() <= margin
+
+    def query(self, lower, upper, margin=0.0):
+        """
+        Finds all indexed AABBs within @margin of the AABB defined by @lower and @upper
+
+        Args:
+            lower (th.Tensor): (3,) lower corner of the query AABB
+            upper (th.Tensor): (3,) upper corner of the query AABB
+            margin (float): Maximum distance to the query AABB, in meters
+
+        Returns:
+            list: Keys of the AABBs within @margin of the query AABB
+        """
+        lower = th.as_tensor(lower, dtype=th.float32)
+        upper = th.as_tensor(upper, dtype=th.float32)
+        distances = aabb_distance(self._lowers, self._uppers, lower.unsqueeze(0), upper.unsqueeze(0))
+        return [self._keys[idx] for idx in th.nonzero(distances <= margin).flatten().tolist()]
+
+    def query_spheres(self, centers, radius):
+        """
+        Checks which spheres overlap any of the indexed AABBs
+
+        Args:
+            centers (th.Tensor): (N, 3) centers of the spheres
+            radius (float or th.Tensor): Radius of all spheres, or (N,) radius of each sphere
+
+        Returns:
+            th.Tensor: (N,) boolean array, True where the sphere overlaps at least one of the indexed AABBs
+        """
+        return spheres_overlap_aabbs(centers=centers, radius=radius, lowers=self._lowers, uppers=self._uppers)
+
+    def query_pair_indices(self, margin=0.0):
+        """
+        Finds all pairs of indexed AABBs within @margin of each other
+
+        Args:
+            margin (float): Maximum distance between the AABBs of a pair, in meters
+
+        Returns:
+            th.Tensor: (P, 2) int64 indices (i, j), with i < j, of the pairs of AABBs within @margin of each other,
+                sorted lexicographically
+        """
+        if margin not in self._pairs_cache:
+            self._pairs_cache[margin] = self._compute_pair_indices(margin)
+        return self._pairs_cache[margin]
+
+    def query_pairs(self, margin=0.0):
+        """
+        Finds all pairs of indexed AABBs within @margin of each other
+
+        Args:
+            margin (float): Maximum distance between the AABBs of a pair, in meters
+
+        Returns:
+            list of 2-tuple: Pairs of keys of the AABBs within @margin of each other
+        """
+        return [(self._keys[i], self._keys[j]) for i, j in self.query_pair_indices(margin=margin).tolist()]
+
+    def _compute_pair_indices(self, margin):
+        n_boxes = len(self._keys)
+        if n_boxes < 2:
+            return th.zeros((0, 2), dtype=th.int64)
+
+        # Inflate every box by half the margin, so that boxes within the margin of each other share at least one cell
+        lo = th.floor((self._lowers - margin / 2.0) / self.cell_size).long()
+        hi = th.floor((self._uppers + margin / 2.0) / self.cell_size).long()
+        extents = hi - lo + 1
+        n_cells = extents.prod(dim=-1)
+        is_large = n_cells > self.max_cells_per_box
+        candidates = []
+
+        # Expand every small box into the cells it spans, as (cell, box) entries
+        small_idxs = th.nonzero(~is_large).flatten()
+        if len(small_idxs) > 1:
+            counts = n_cells[small_idxs]
+            box_idxs = th.repeat_interleave(small_idxs, counts)
+            offsets = th.arange(len(box_idxs)) - th.repeat_interleave(th.cumsum(counts, dim=0) - counts, counts)
+            box_extents = extents[box_idxs]
+            cells = lo[box_idxs] + th.stack(
+                [
+                    offsets % box_extents[:, 0],
+                    (offsets // box_extents[:, 0]) % box_extents[:, 1],
+                    offsets // (box_extents[:, 0] * box_extents[:, 1]),
+                ],
+                dim=-1,
+            )
+            _, cell_ids = th.unique(cells, dim=0, return_inverse=True)
+
+            # Sort the entries by cell, then pair up every two entries of the same cell
+            cell_ids, order = th.sort(cell_ids, stable=True)
+            box_idxs = box_idxs[order]
+            max_per_cell = th.bincount(cell_ids).max().item()
+            for shift in range(1, max_per_cell):
+                same_cell = cell_ids[:-shift] == cell_ids[shift:]
+                candidates.append(th.stack([box_idxs[:-shift][same_cell], box_idxs[shift:][same_cell]], dim=-1))
+
+        # Compare every large box against all other boxes
+        for large_idx in th.nonzero(is_large).flatten().tolist():
+            other_idxs = th.arange(n_boxes)
+            other_idxs = other_idxs[other_idxs != large_idx]
+            candidates.append(th.stack([th.full_like(other_idxs, large_idx), other_idxs], dim=-1))
+
+        if len(candidates) == 0:
+            return th.zeros((0, 2), dtype=th.int64)
+
+        # Deduplicate the candidates, and only keep the pairs that are actually within the margin
+        pairs = th.cat(candidates, dim=0)
+        pairs = th.unique(th.sort(pairs, dim=-1).values, dim=0)
+        distances = aabb_distance(
+            self._lowers[pairs[:, 0]], self._uppers[pairs[:, 0]], self._lowers[pairs[:, 1]], self._uppers[pairs[:, 1]]
+        )
+        return pairs[distances <= margin]
+
+
+class PointSpatialHash:
+    """
+    Uniform grid spatial hash over a set of points, e.g. particle positions, supporting box, sphere, and oriented box
+    range queries that only touch the points within the grid cells overlapping the queried range.
+
+    Args:
+        cell_size (float): Side length of each grid cell, in meters
+    """
+
+    def __init__(self, cell_size=0.1):
+        self.cell_size = cell_size
+        self._points = th.zeros((0, 3))
+        # Grid cells are identified by linear keys within the grid bounds (in cells) of all points. Occupied cell keys
+        # are sorted, and each maps to the range of sorted point indices belonging to it
+        self._grid_lower = th.zeros(3, dtype=th.int64)
+        self._grid_shape = th.zeros(3, dtype=th.int64)
+        self._cell_keys = th.zeros(0, dtype=th.int64)
+        self._cell_starts = th.zeros(0, dtype=th.int64)
+        self._cell_counts = th.zeros(0, dtype=th.int64)
+        self._sorted_idxs = th.zeros(0, dtype=th.int64)
+
+    def __len__(self):
+        return len(self._points)
+
+    @property
+    def points(self):
+        """
+        Returns:
+            th.Tensor: (N, 3) indexed points
+        """
+        return self._points
+
+    def _get_cell_keys(self, cells):
+        return (cells[..., 0] * self._grid_shape[1] + cells[..., 1]) * self._grid_shape[2] + cells[..., 2]
+
+    def update(self, points):
+        """
+        Replaces the indexed points
+
+        Args:
+            points (th.Tensor): (N, 3) points to index
+        """
+        self._points = th.as_tensor(points, dtype=th.float32).reshape(-1, 3)
+        cells = th.floor(self._points / self.cell_size).long()
+        if len(cells) > 0:
+            self._grid_lower = cells.amin(dim=0)
+            self._grid_shape = cells.amax(dim=0) - self._grid_lower + 1
+        keys = self._get_cell_keys(cells - self._grid_lower)
+        self._cell_keys, cell_ids, self._cell_counts = th.unique(keys, return_inverse=True, return_counts=True)
+        self._cell_starts = th.cumsum(self._cell_counts, dim=0) - self._cell_counts
+        self._sorted_idxs = th.sort(cell_ids, stable=True).indices
+
+    def _query_cells(self, lower, upper):
+        # Indices of all points within the cells overlapping the box spanned by @lower and @upper
+        lower = th.floor(th.as_tensor(lower, dtype=th.float32) / self.cell_size).long() - self._grid_lower
+        upper = th.floor(th.as_tensor(upper, dtype=th.float32) / self.cell_size).long() - self._grid_lower
+        lower, upper = th.clamp(lower, min=0), th.minimum(upper, self._grid_shape - 1)
+        n_cells = th.clamp(upper - lower + 1, min=0).prod().item()
+        if n_cells == 0 or len(self._cell_keys) == 0:
+            return th.zeros(0, dtype=th.int64)
+
+        if n_cells <= len(self._cell_keys):
+            # Few cells are queried, so look each of them up among the occupied cells
+            ranges = [th.arange(lo, hi + 1) for lo, hi in zip(lower.tolist(), upper.tolist())]
+            keys = self._get_cell_keys(th.stack(th.meshgrid(*ranges, indexing="ij"), dim=-1).reshape(-1, 3))
+            cell_idxs = th.clamp(th.searchsorted(self._cell_keys, keys), max=len(self._cell_keys) - 1)
+            cell_idxs = cell_idxs[self._cell_keys[cell_idxs] == keys]
+        else:
+            # Many cells are queried, so check which occupied cells are within the queried range
+            key = self._cell_keys
+            cells = th.stack(
+                [
+                    key // (self._grid_shape[1] * self._grid_shape[2]),
+                    (key // self._grid_shape[2]) % self._grid_shape[1],
+                    key % self._grid_shape[2],
+                ],
+                dim=-1,
+            )
+            cell_idxs = th.nonzero(((cells >= lower) & (cells <= upper)).all(dim=-1)).flatten()
+
+        starts, counts = self._cell_starts[cell_idxs], self._cell_counts[cell_idxs]
+        offsets = th.arange(counts.sum().item()) - th.repeat_interleave(th.cumsum(counts, dim=0) - counts, counts)
+        return self._sorted_idxs[th.repeat_interleave(starts, counts) + offsets]
+
+    def query_box(self, lower, upper):
+        """
+        Finds all indexed points within an axis-aligned box
+
+        Args:
+            lower (th.Tensor): (3,) lower corner of the box
+            upper (th.Tensor): (3,) upper corner of the box
+
+        Returns:
+            th.Tensor: (M,) sorted indices of the points within the box, boundaries included
+        """
+        lower, upper = th.as_tensor(lower, dtype=th.float32), th.as_tensor(upper, dtype=th.float32)
+        idxs = self._query_cells(lower, upper)
+        points = self._points[idxs]
+        return th.sort(idxs[((lower <= points) & (points <= upper)).all(dim=-1)]).values
+
+    def query_sphere(self, center, radius):
+        """
+        Finds all indexed points within a sphere
+
+        Args:
+            center (th.Tensor): (3,) center of the sphere
+            radius (float): Radius of the sphere
+
+        Returns:
+            th.Tensor: (M,) sorted indices of the points within the sphere, boundary included
+        """
+        center = th.as_tensor(center, dtype=th.float32)
+        idxs = self._query_cells(center - radius, center + radius)
+        return th.sort(idxs[th.norm(self._points[idxs] - center, dim=-1) <= radius]).values
+
+    def query_oriented_box(self, pos, quat, half_extent):
+        """
+        Finds all indexed points within an oriented box
+
+        Args:
+            pos (th.Tensor): (3,) center of the box
+            quat (th.Tensor): (4,) (x,y,z,w) orientation of the box
+            half_extent (th.Tensor): (3,) half extent of the box along each of its local axes
+
+        Returns:
+            th.Tensor: (M,) sorted indices of the points within the box, boundaries included
+        """
+        pos, half_extent = th.as_tensor(pos, dtype=th.float32), th.as_tensor(half_extent, dtype=th.float32)
+        rot = T.quat2mat(th.as_tensor(quat, dtype=th.float32))
+        # The AABB of the box is spanned by its rotated half extents
+        aabb_half_extent = (rot.abs() @ half_extent.reshape(3, 1)).flatten()
+        idxs = self._query_cells(pos - aabb_half_extent, pos + aabb_half_extent)
+        local_points = (self._points[idxs] - pos) @ rot
+        return th.sort(idxs[(local_points.abs() <= half_extent).all(dim=-1)]).values
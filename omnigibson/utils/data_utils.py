@@ -0,0 +1,704 @@
+"""
+A set of utility functions and classes for reading and writing OmniGibson (robomimic-format) HDF5 datasets
+"""
+
+import json
+import math
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+
+import h5py
+import torch as th
+
+from omnigibson.macros import create_module_macros
+from omnigibson.utils.numpy_utils import open_np_memmap
+from omnigibson.utils.ui_utils import create_module_logger
+
+# Create module logger
+log = create_module_logger(module_name=__name__)
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Target size (in bytes) of a single HDF5 chunk when streaming trajectory data to disk
+m.TARGET_CHUNK_BYTES = 2**20
+
+# Maximum number of steps in a single HDF5 chunk when streaming trajectory data to disk
+m.MAX_CHUNK_STEPS = 256
+
+# Default maximum number of pending jobs in an AsyncWriter queue before submitting new jobs blocks
+m.DEFAULT_WRITE_QUEUE_SIZE = 64
+
+# Valid per-dataset compression filters that can be used when streaming trajectory data to disk
+VALID_COMPRESSIONS = {"gzip", "lzf", "lz4"}
+
+
+def _to_tensor(data):
+    """
+    Converts @data into a CPU tensor
+
+    Args:
+        data (th.Tensor or float or int or bool): Data to convert
+
+    Returns:
+        th.Tensor: Converted data
+    """
+    return th.as_tensor(data).detach().cpu()
+
+
+def get_compression_kwargs(compression):
+    """
+    Grabs the h5py dataset creation kwargs corresponding to compression filter @compression
+
+    Args:
+        compression (None or str): Compression filter to use. Valid options are None (no compression), or one of
+            VALID_COMPRESSIONS. Note that "lz4" requires the optional hdf5plugin package
+
+    Returns:
+        dict: Keyword arguments to pass to h5py's create_dataset()
+    """
+    if compression is None:
+        return dict()
+    assert compression in VALID_COMPRESSIONS, f"Invalid compression {compression}, valid options: {VALID_COMPRESSIONS}"
+    if compression == "lz4":
+        try:
+            import hdf5plugin
+        except ImportError as e:
+            raise ValueError(
+                "lz4 compression requires hdf5plugin. Install it by running 'pip install hdf5plugin'"
+            ) from e
+        return dict(hdf5plugin.LZ4())
+    return dict(compression=compression)
+
+
+class HDF5TrajectoryWriter:
+    """
+    Streams a single trajectory into an HDF5 group step-by-step, without holding the whole trajectory in memory.
+
+    The trajectory group itself is only created once data is first written, so that the writer can be constructed
+    without touching the HDF5 file (e.g.: when all file I/O is deferred to a background thread). Datasets are lazily
+    created as resizable, chunked datasets the first time a key is seen, and are appended to every @buffer_size steps.
+    The resulting group has the same layout as the one generated by DataWrapper.process_traj_to_hdf5(): one dataset
+    per (non-nested) key, and one subgroup per nested key containing one dataset per modality.
+    """
+
+    def __init__(self, parent_group, name, nested_keys=("obs",), compression=None, pad_keys=(), buffer_size=1):
+        """
+        Args:
+            parent_group (h5py.Group): HDF5 group under which the trajectory group should be created
+            name (str): Name of the trajectory group to create
+            nested_keys (list of str): Name of key(s) corresponding to nested data in each step. This specific data
+                is assumed to be its own keyword-mapped dictionary of array values
+            compression (None or str or dict): Compression filter to use for the written datasets. If a string,
+                the same filter is used for all datasets. If a dict, maps dataset names to filters -- a dataset is
+                first looked up by its full path relative to the trajectory group (e.g.: "obs/rgb"), then by its
+                modality name (e.g.: "rgb"), then by its top-level key (e.g.: "obs"). Datasets without a match are
+                uncompressed. See get_compression_kwargs() for valid filters
+            pad_keys (list of str): Name of (non-nested) key(s) whose per-step data is a 1D array of varying size.
+                The corresponding dataset grows to the largest size seen so far, and shorter entries are zero-padded
+            buffer_size (int): Number of steps to buffer in memory before appending them to disk
+        """
+        self.parent_group = parent_group
+        self.name = name
+        self.group = None
+        self.nested_keys = set(nested_keys)
+        self.compression = compression
+        self.pad_keys = set(pad_keys)
+        self.buffer_size = buffer_size
+        self.num_samples = 0
+
+        # Maps dataset path to list of buffered per-step CPU tensors that have not been written yet
+        self._buffer = defaultdict(list)
+
+    def append(self, step_data):
+        """
+        Appends a single step of data to the trajectory
+
+        Args:
+            step_data (dict): Keyword-mapped data for a single sim step. Not every key needs to be present at every
+                step; each dataset only stores the steps in which its key was present
+        """
+        for key, value in step_data.items():
+            if key in self.nested_keys:
+                for mod, mod_value in value.items():
+                    self._buffer[f"{key}/{mod}"].append(_to_tensor(mod_value))
+            else:
+                self._buffer[key].append(_to_tensor(value))
+        self.num_samples += 1
+
+        if self.num_samples % self.buffer_size == 0:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered steps to disk
+        """
+        for path, rows in self._buffer.items():
+            if rows:
+                self._write_rows(path, rows)
+        self._buffer.clear()
+
+    def close(self):
+        """
+        Writes any remaining buffered steps and finalizes the trajectory group
+
+        Returns:
+            h5py.Group: HDF5 group storing the recorded trajectory data
+        """
+        self.flush()
+        group = self._get_group()
+        group.attrs["num_samples"] = self.num_samples
+        return group
+
+    def discard(self):
+        """
+        Deletes the trajectory group and all of its data from the HDF5 file
+        """
+        self._buffer.clear()
+        if self.group is not None:
+            del self.parent_group[self.name]
+            self.group = None
+
+    def _get_group(self):
+        """
+        Returns:
+            h5py.Group: HDF5 group storing the trajectory data, created if it does not exist yet
+        """
+        if self.group is None:
+            self.group = self.parent_group.create_group(self.name)
+        return self.group
+
+    def _get_compression(self, path):
+        """
+        Args:
+            path (str): Path of the dataset relative to self.group
+
+        Returns:
+            None or str: Compression filter to use for dataset @path
+        """
+        if not isinstance(self.compression, dict):
+            return self.compression
+        parts = path.split("/")
+        for name in (path, parts[-1], parts[0]):
+            if name in self.compression:
+                return self.compression[name]
+        return None
+
+    def _create_dataset(self, path, row):
+        """
+        Creates an empty, resizable dataset at @path whose entries have the same shape and dtype as @row
+
+        Args:
+            path (str): Path of the dataset relative to self.group
+            row (th.Tensor): Example single-step entry
+
+        Returns:
+            h5py.Dataset: Created dataset
+        """
+        pad = path in self.pad_keys
+        if pad:
+            assert row.ndim == 1, f"Padded key {path} must have 1D per-step data, got shape {row.shape}!"
+        row_shape = (max(row.shape[0], 1),) if pad else row.shape
+        row_bytes = max(1, math.prod(row_shape) * row.element_size())
+        chunk_steps = min(m.MAX_CHUNK_STEPS, max(1, m.TARGET_CHUNK_BYTES // row_bytes))
+        return self.group.create_dataset(
+            path,
+            shape=(0, *row.shape),
+            maxshape=(None, None) if pad else (None, *row.shape),
+            chunks=(chunk_steps, *row_shape),
+            dtype=row.numpy().dtype,
+            fillvalue=0 if pad else None,
+            **get_compression_kwargs(self._get_compression(path)),
+        )
+
+    def _write_rows(self, path, rows):
+        """
+        Appends per-step entries @rows to the dataset at @path, creating it if it does not exist yet
+
+        Args:
+            path (str): Path of the dataset relative to self.group
+            rows (list of th.Tensor): Per-step entries to append
+        """
+        group = self._get_group()
+        dataset = group[path] if path in group else self._create_dataset(path, rows[0])
+        if path in self.pad_keys:
+            width = max(dataset.shape[1], max(len(row) for row in rows))
+            if width > dataset.shape[1]:
+                dataset.resize(width, axis=1)
+            data = th.zeros((len(rows), width), dtype=rows[0].dtype)
+            for i, row in enumerate(rows):
+                data[i, : len(row)] = row
+        else:
+            data = th.stack(rows, dim=0)
+        n_written = dataset.shape[0]
+        dataset.resize(n_written + len(rows), axis=0)
+        dataset[n_written:] = data.numpy()
+
+
+class AsyncWriter:
+    """
+    Executes write jobs (e.g.: HDF5 serialization and compression) sequentially on a background thread, so that the
+    submitting thread does not block on disk I/O.
+
+    Jobs are handed over through a bounded queue: if the background thread falls behind and the queue is full,
+    submit() blocks until space frees up, bounding the amount of pending data held in memory. If a job raises an
+    exception, all subsequent jobs are skipped and the exception is re-raised on the submitting thread at the next
+    submit(), drain(), or close() call.
+    """
+
+    def __init__(self, max_queue_size=m.DEFAULT_WRITE_QUEUE_SIZE):
+        """
+        Args:
+            max_queue_size (int): Maximum number of pending jobs before submit() blocks
+        """
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error = None
+        self._closed = False
+
+        # Counters
+        self.n_jobs_completed = 0
+        self.n_items_written = 0
+        self.write_time = 0.0
+        self.blocked_time = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="AsyncWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self):
+        """
+        Returns:
+            int: Number of jobs currently pending in the queue
+        """
+        return self._queue.qsize()
+
+    @property
+    def throughput(self):
+        """
+        Returns:
+            float: Number of items (e.g.: sim steps) written per second of time spent executing write jobs
+        """
+        return self.n_items_written / self.write_time if self.write_time > 0 else 0.0
+
+    def submit(self, job, n_items=1):
+        """
+        Queues @job to be executed on the background thread, blocking while the queue is full
+
+        Args:
+            job (function): Function taking no arguments to execute
+            n_items (int): Number of items written by @job, used for throughput bookkeeping
+        """
+        assert not self._closed, "Cannot submit jobs to a closed AsyncWriter!"
+        self._raise_if_failed()
+        start = time.perf_counter()
+        self._queue.put((job, n_items))
+        self.blocked_time += time.perf_counter() - start
+
+    def drain(self):
+        """
+        Blocks until all submitted jobs have been executed
+        """
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self):
+        """
+        Executes all pending jobs and stops the background thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise RuntimeError("AsyncWriter background job failed!") from self._error
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is None:
+                    return
+                job, n_items = entry
+                # Skip all jobs after a failure, since they likely depend on the failed one
+                if self._error is None:
+                    start = time.perf_counter()
+                    job()
+                    self.write_time += time.perf_counter() - start
+                    self.n_jobs_completed += 1
+                    self.n_items_written += n_items
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+
+class HDF5DatasetReader:
+    """
+    Random-access reader for OmniGibson (robomimic-format) HDF5 datasets, e.g.: those generated by DataWrapper.
+
+    Data is lazily read per-key and per-slice, so only the requested steps are ever loaded into memory. Uncompressed,
+    contiguous datasets are read through a memory map, bypassing HDF5 entirely. This only requires h5py, and thus can
+    be used without launching the simulator.
+    """
+
+    def __init__(self, path, use_mmap=True):
+        """
+        Args:
+            path (str): Path to the HDF5 dataset to read
+            use_mmap (bool): Whether to read uncompressed, contiguous datasets through a memory map
+        """
+        self.path = path
+        self.use_mmap = use_mmap
+        self.hdf5_file = h5py.File(path, "r")
+        self.data_grp = self.hdf5_file["data"]
+
+        # Build the index of episode lengths from the stored metadata only
+        self.episode_ids = sorted(int(name.split("_")[-1]) for name in self.data_grp if name.startswith("demo_"))
+        self.episode_lengths = {
+            episode_id: int(self.data_grp[f"demo_{episode_id}"].attrs["num_samples"]) for episode_id in self.episode_ids
+        }
+
+        # Maps (episode_id, key) to memory map (or None if the dataset cannot be memory mapped)
+        self._memmaps = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.episode_ids)
+
+    @property
+    def n_samples(self):
+        """
+        Returns:
+            int: Total number of samples across all episodes
+        """
+        return sum(self.episode_lengths.values())
+
+    @property
+    def config(self):
+        """
+        Returns:
+            None or dict: Environment config used to collect this dataset, if stored
+        """
+        config = self.data_grp.attrs.get("config", None)
+        return None if config is None else json.loads(config)
+
+    def get_episode_group(self, episode_id):
+        """
+        Args:
+            episode_id (int): Episode ID
+
+        Returns:
+            h5py.Group: HDF5 group storing episode @episode_id
+        """
+        assert episode_id in self.episode_lengths, f"No valid episode with ID {episode_id} found!"
+        return self.data_grp[f"demo_{episode_id}"]
+
+    def get_keys(self, episode_id):
+        """
+        Args:
+            episode_id (int): Episode ID
+
+        Returns:
+            list of str: Paths of all datasets stored for episode @episode_id, e.g.: ["action", "obs/rgb", ...]
+        """
+        keys = []
+        self.get_episode_group(episode_id).visititems(
+            lambda name, obj: keys.append(name) if isinstance(obj, h5py.Dataset) else None
+        )
+        return keys
+
+    def get_key_length(self, episode_id, key):
+        """
+        Args:
+            episode_id (int): Episode ID
+            key (str): Path of the dataset, e.g.: "obs/rgb"
+
+        Returns:
+            int: Number of entries stored in dataset @key of episode @episode_id, or 0 if it does not exist. Note that
+                this may differ from the episode length, e.g.: there is one fewer action than there are states in
+                collected data
+        """
+        traj_grp = self.get_episode_group(episode_id)
+        return traj_grp[key].shape[0] if key in traj_grp else 0
+
+    def get(self, episode_id, key, start=None, end=None):
+        """
+        Reads entries [@start, @end) of dataset @key of episode @episode_id
+
+        Args:
+            episode_id (int): Episode ID
+            key (str): Path of the dataset, e.g.: "obs/rgb"
+            start (None or int): If specified, first entry to read. Default is 0
+            end (None or int): If specified, entry after the last entry to read. Default is the dataset length
+
+        Returns:
+            th.Tensor: Read data
+        """
+        memmap = self._get_memmap(episode_id, key)
+        if memmap is None:
+            return th.from_numpy(self.get_episode_group(episode_id)[key][start:end])
+        # Copy out of the read-only memory map so that the returned tensor owns (and may write to) its data
+        return th.from_numpy(memmap[start:end].copy())
+
+    def get_step(self, episode_id, t, keys=None):
+        """
+        Reads the entries of dataset(s) @keys at step @t of episode @episode_id
+
+        Args:
+            episode_id (int): Episode ID
+            t (int): Step to read
+            keys (None or list of str): Paths of the datasets to read. None reads all datasets
+
+        Returns:
+            dict: Keyword-mapped data for step @t
+        """
+        keys = self.get_keys(episode_id) if keys is None else keys
+        return {key: self.get(episode_id, key, t, t + 1)[0] for key in keys}
+
+    def get_window_index(self, window_size, keys=None, stride=1):
+        """
+        Computes all valid (episode_id, t) pairs such that the window of @window_size entries starting at t is
+        fully contained in every dataset @keys of the episode. Episodes missing any of @keys are skipped. Only
+        dataset shapes are read to compute this
+
+        Args:
+            window_size (int): Number of steps in each window
+            keys (None or list of str): Paths of the datasets to consider. None considers all datasets
+            stride (int): Number of steps between the starts of consecutive windows
+
+        Returns:
+            th.Tensor: (N, 2)-shaped tensor of (episode_id, t) window starts
+        """
+        index = []
+        for episode_id in self.episode_ids:
+            episode_keys = self.get_keys(episode_id) if keys is None else keys
+            length = min(
+                [self.episode_lengths[episode_id]] + [self.get_key_length(episode_id, key) for key in episode_keys]
+            )
+            starts = th.arange(0, max(length - window_size + 1, 0), stride, dtype=th.int64)
+            index.append(th.stack([th.full_like(starts, episode_id), starts], dim=-1))
+        return th.cat(index, dim=0) if index else th.zeros((0, 2), dtype=th.int64)
+
+    def get_window(self, episode_id, t, window_size, keys=None):
+        """
+        Reads the window of @window_size entries starting at step @t of dataset(s) @keys of episode @episode_id
+
+        Args:
+            episode_id (int): Episode ID
+            t (int): First step of the window
+            window_size (int): Number of steps in the window
+            keys (None or list of str): Paths of the datasets to read. None reads all datasets
+
+        Returns:
+            dict: Keyword-mapped (window_size, ...)-shaped data
+        """
+        keys = self.get_keys(episode_id) if keys is None else keys
+        return {key: self.get(episode_id, key, t, t + window_size) for key in keys}
+
+    def iterate_windows(self, window_size, keys=None, stride=1, shuffle=False, generator=None):
+        """
+        Iterates over all windows of @window_size steps in the dataset. See get_window_index() for which windows
+        are valid
+
+        Args:
+            window_size (int): Number of steps in each window
+            keys (None or list of str): Paths of the datasets to read. None reads all datasets
+            stride (int): Number of steps between the starts of consecutive windows
+            shuffle (bool): Whether to iterate over the windows in random order
+            generator (None or th.Generator): If specified, random number generator to use when shuffling
+
+        Returns:
+            generator: Generator yielding 3-tuples of (episode_id, t, window data), where the window data is
+                the output of get_window()
+        """
+        index = self.get_window_index(window_size=window_size, keys=keys, stride=stride)
+        if shuffle:
+            index = index[th.randperm(len(index), generator=generator)]
+        for episode_id, t in index.tolist():
+            yield episode_id, t, self.get_window(episode_id, t, window_size, keys=keys)
+
+    def close(self):
+        """
+        Closes the underlying HDF5 file
+        """
+        self._memmaps.clear()
+        self.hdf5_file.close()
+
+    def _get_memmap(self, episode_id, key):
+        """
+        Args:
+            episode_id (int): Episode ID
+            key (str): Path of the dataset
+
+        Returns:
+            None or np.memmap: Memory map of dataset @key of episode @episode_id, or None if memory mapping is
+                disabled or the dataset is compressed, chunked, or not yet allocated
+        """
+        if not self.use_mmap:
+            return None
+        if (episode_id, key) not in self._memmaps:
+            dataset = self.get_episode_group(episode_id)[key]
+            offset = dataset.id.get_offset()
+            memmap = None
+            if dataset.chunks is None and offset is not None and dataset.dtype.kind in "biuf":
+                memmap = open_np_memmap(self.path, dtype=dataset.dtype, offset=offset, shape=dataset.shape)
+            self._memmaps[(episode_id, key)] = memmap
+        return self._memmaps[(episode_id, key)]
+
+
+def get_playback_shards(episode_ids, episodes_per_shard):
+    """
+    Splits @episode_ids into contiguous shards of at most @episodes_per_shard episodes each, so that concatenating
+    the shards in order preserves the original episode order
+
+    Args:
+        episode_ids (list of int): Episode IDs to split
+        episodes_per_shard (int): Maximum number of episodes per shard
+
+    Returns:
+        list of list of int: Episode IDs of each shard
+    """
+    episode_ids = sorted(episode_ids)
+    return [episode_ids[i : i + episodes_per_shard] for i in range(0, len(episode_ids), episodes_per_shard)]
+
+
+def get_shard_path(output_path, shard_id):
+    """
+    Args:
+        output_path (str): Path to the final, merged output HDF5 file
+        shard_id (int): Shard ID
+
+    Returns:
+        str: Path to the output HDF5 file for shard @shard_id, e.g.: "/data/out_shard_0003.hdf5"
+    """
+    root, ext = os.path.splitext(output_path)
+    return f"{root}_shard_{shard_id:04d}{ext}"
+
+
+def is_shard_complete(shard_path, episode_ids):
+    """
+    Checks whether the output HDF5 file @shard_path of a shard was fully written. A shard file is only considered
+    complete if it was finalized (i.e.: its "n_episodes" attribute was written, which DataWrapper.save_data() does
+    last) and it was generated from the same episodes @episode_ids
+
+    Args:
+        shard_path (str): Path to the shard's output HDF5 file
+        episode_ids (list of int): Episode IDs that the shard should contain
+
+    Returns:
+        bool: Whether the shard is complete
+    """
+    if not os.path.exists(shard_path):
+        return False
+    try:
+        with h5py.File(shard_path, "r") as f:
+            attrs = f["data"].attrs
+            return "n_episodes" in attrs and "episode_ids" in attrs and list(attrs["episode_ids"]) == list(episode_ids)
+    except (OSError, KeyError):
+        # Partially-written files, e.g.: from a crashed worker, may not be readable at all
+        return False
+
+
+def merge_hdf5_datasets(input_paths, output_path):
+    """
+    Merges HDF5 datasets @input_paths into a single dataset at @output_path. Episodes are renumbered to
+    demo_0, ..., demo_<N-1> in order of @input_paths (and of their episode IDs within each input), and the
+    "n_episodes" and "n_steps" attributes are recomputed. All other attributes of the "data" group (e.g.: "config",
+    "scene_file") are copied from the first input
+
+    Args:
+        input_paths (list of str): Paths to the HDF5 datasets to merge
+        output_path (str): Path to the merged HDF5 dataset to write
+    """
+    n_episodes, n_steps = 0, 0
+    with h5py.File(output_path, "w") as out_f:
+        out_data_grp = out_f.create_group("data")
+        for i, input_path in enumerate(input_paths):
+            with h5py.File(input_path, "r") as in_f:
+                in_data_grp = in_f["data"]
+                if i == 0:
+                    for name, value in in_data_grp.attrs.items():
+                        if name not in {"n_episodes", "n_steps", "episode_ids"}:
+                            out_data_grp.attrs[name] = value
+                demo_names = sorted(
+                    (name for name in in_data_grp if name.startswith("demo_")),
+                    key=lambda name: int(name.split("_")[-1]),
+                )
+                for demo_name in demo_names:
+                    in_f.copy(in_data_grp[demo_name], out_data_grp, name=f"demo_{n_episodes}")
+                    n_episodes += 1
+                n_steps += int(in_data_grp.attrs.get("n_steps", 0))
+        out_data_grp.attrs["n_episodes"] = n_episodes
+        out_data_grp.attrs["n_steps"] = n_steps
+
+
+def run_sharded_playback(input_path, output_path, worker_fn, n_workers=1, episodes_per_shard=10, worker_kwargs=None):
+    """
+    Plays back all episodes of the HDF5 dataset @input_path in parallel, and merges the results into @output_path.
+
+    Episodes are split into contiguous shards (see get_playback_shards()), each of which is written to its own output
+    file (see get_shard_path()). Shards are distributed round-robin across @n_workers worker processes, each running
+    @worker_fn. Shards that are already complete from a previous run are skipped (see is_shard_complete()), so an
+    interrupted run can be resumed by calling this function again with the same arguments. Once all shards are
+    complete, they are merged with merge_hdf5_datasets()
+
+    Args:
+        input_path (str): Path to the input HDF5 dataset to play back
+        output_path (str): Path to the final, merged output HDF5 dataset
+        worker_fn (function): Picklable function with signature worker_fn(input_path, shards, **worker_kwargs), where
+            shards is a list of (episode_ids, shard_path) 2-tuples. For each shard, this should play back episodes
+            episode_ids and write them to a finalized HDF5 dataset at shard_path, whose "data" group has an
+            "episode_ids" attribute set to episode_ids
+        n_workers (int): Number of worker processes to use. If 1, @worker_fn is run in the current process
+        episodes_per_shard (int): Maximum number of episodes per shard
+        worker_kwargs (None or dict): If specified, additional keyword arguments to pass to @worker_fn
+
+    Returns:
+        list of str: Paths to the output HDF5 files of all shards
+    """
+    worker_kwargs = dict() if worker_kwargs is None else worker_kwargs
+    with h5py.File(input_path, "r") as f:
+        episode_ids = [int(name.split("_")[-1]) for name in f["data"] if name.startswith("demo_")]
+    shards = [
+        (shard_episode_ids, get_shard_path(output_path, shard_id))
+        for shard_id, shard_episode_ids in enumerate(get_playback_shards(episode_ids, episodes_per_shard))
+    ]
+    pending_shards = [shard for shard in shards if not is_shard_complete(shard[1], shard[0])]
+    log.info(f"Playing back {len(episode_ids)} episodes: {len(pending_shards)} / {len(shards)} shards remaining")
+
+    if n_workers == 1:
+        worker_fn(input_path, pending_shards, **worker_kwargs)
+    elif pending_shards:
+        ctx = mp.get_context("spawn")
+        processes = [
+            ctx.Process(target=worker_fn, args=(input_path, pending_shards[i::n_workers]), kwargs=worker_kwargs)
+            for i in range(min(n_workers, len(pending_shards)))
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+    incomplete_shards = [shard[1] for shard in shards if not is_shard_complete(shard[1], shard[0])]
+    if incomplete_shards:
+        raise RuntimeError(
+            f"{len(incomplete_shards)} shard(s) failed to complete: {incomplete_shards}. "
+            "Run again with the same arguments to resume."
+        )
+
+    shard_paths = [shard[1] for shard in shards]
+    merge_hdf5_datasets(shard_paths, output_path)
+    return shard_paths
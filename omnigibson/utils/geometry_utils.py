@@ -2,14 +2,34 @@
 A set of helper utility functions for dealing with 3D geometry
 """
 
+import hashlib
+import itertools
 import math
+import os
+import tempfile
 
 import torch as th
 
 import omnigibson.utils.transform_utils as T
+from omnigibson.macros import create_module_macros, gm
 from omnigibson.utils.numpy_utils import vtarray_to_torch
+from omnigibson.utils.ui_utils import create_module_logger
 from omnigibson.utils.usd_utils import mesh_prim_mesh_to_trimesh_mesh
 
+# Create module logger
+log = create_module_logger(module_name=__name__)
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Whether to cache container volume data (convex hulls and volumes) on disk, keyed by the content of the container
+# meshes, so that loading the same assets again skips recomputing them
+m.ENABLE_VOLUME_CACHE = True
+
+# Directory of the container volume cache. If None, a cache directory within gm.DATASET_PATH is used if the dataset is
+# writable, otherwise one within the system's temporary directory is used
+m.VOLUME_CACHE_DIR = None
+
 
 def get_particle_positions_in_frame(pos, quat, scale, particle_positions):
     """
@@ -213,37 +233,367 @@ def check_points_in_convex_hull_mesh(mesh_face_centroids, mesh_face_normals, pos
     return in_range
 
 
-def _generate_convex_hull_volume_checker_functions(convex_hull_mesh):
+def _get_frame_transform(pos, quat, scale):
     """
-    An internal helper function used to programmatically generate lambda funtions to check for particle
-    points within a convex hull mesh defined by face centroids @mesh_face_centroids and @mesh_face_normals.
-
-    Note that this is needed as an EXTERNAL helper function to @generate_points_in_volume_checker_function
-    because we "bake" certain arguments as part of the lambda internal scope, and
-    directly generating functions in a for loop results in these local variables being overwritten each time
-    (meaning that all the generated lambda functions reference the SAME variables!!)
+    Computes the affine transform mapping points expressed in a parent frame into the frame specified by @pos and
+    @quat with scale @scale, i.e.: the same transform as @get_particle_positions_in_frame, such that
+    local_points = points @ A.T + b
 
     Args:
-        convex_hull_mesh (Usd.Prim): Raw USD convex hull mesh to generate the volume checker functions
+        pos (3-array): (x,y,z) pos of the frame
+        quat (4-array): (x,y,z,w) quaternion orientation of the frame
+        scale (3-array): (x,y,z) local scale of the frame
 
     Returns:
         2-tuple:
-            - function: Generated lambda function with signature:
+            - th.Tensor: (3, 3) linear part A of the transform
+            - th.Tensor: (3,) translation part b of the transform
+    """
+    pos, quat, scale = (th.as_tensor(x, dtype=th.float32) for x in (pos, quat, scale))
+    A = T.quat2mat(quat).T / scale.reshape(3, 1)
+    return A, -A @ pos
+
+
+class VolumeChecker:
+    """
+    Checks which points are within a union of primitive volumes (cubes, spheres, cylinders, cones, and convex hull
+    meshes), each placed at a static local pose within a common frame, e.g.: the container volumes of a link.
+
+    This computes the same results as the @check_points_in_[...] functions, but compiles all primitives into stacked
+    tensors once, and folds the transform between the points' frame and each primitive's frame into them at every
+    check. Cubes and convex hulls are represented as half-spaces, so that all points are tested against all of their
+    faces with a single (N, 3) x (3, D) matrix product, and spheres, cylinders, and cones are tested together from a
+    single (N, 3) x (3, 3 * K) matrix product. Optionally, points outside the AABB of all primitives are rejected
+    before being tested.
+    """
+
+    def __init__(self):
+        # Half-space primitives: list of (D, 3) face normals and (D,) offsets, such that points within the primitive
+        # satisfy points @ normals.T < offsets, with points expressed in the common frame
+        self._half_spaces = []
+        # Quadric primitives: list of ((3, 3) A, (3,) b, radius, half height, taper, is_sphere), such that points
+        # are mapped into the primitive's local frame with points @ A.T + b
+        self._quadrics = []
+        # List of (M, 3) points, expressed in the common frame, whose AABB bounds all primitives
+        self._bounding_points = []
+        # Compiled tensors, lazily computed from the primitives above
+        self._compiled = None
+
+    @property
+    def n_primitives(self):
+        """
+        Returns:
+            int: Number of primitive volumes composing this checker
+        """
+        return len(self._half_spaces) + len(self._quadrics)
+
+    def _add_half_spaces(self, normals, offsets, vertices, pos, quat, scale):
+        # Planes n . p_local < d, with p_local = A p + b, become (A.T n) . p < d - n . b
+        pos, quat, scale = (th.as_tensor(x, dtype=th.float32) for x in (pos, quat, scale))
+        A, b = _get_frame_transform(pos=pos, quat=quat, scale=scale)
+        normals, offsets = th.as_tensor(normals, dtype=th.float32), th.as_tensor(offsets, dtype=th.float32)
+        self._half_spaces.append((normals @ A, offsets - normals @ b))
+        self._bounding_points.append(get_particle_positions_from_frame(pos, quat, scale, vertices))
+        self._compiled = None
+
+    def _add_quadric(self, radius, half_height, taper, is_sphere, pos, quat, scale):
+        pos, quat, scale = (th.as_tensor(x, dtype=th.float32) for x in (pos, quat, scale))
+        A, b = _get_frame_transform(pos=pos, quat=quat, scale=scale)
+        self._quadrics.append((A, b, radius, half_height, taper, is_sphere))
+        extent = th.tensor([radius, radius, half_height])
+        corners = th.tensor(list(itertools.product([-1.0, 1.0], repeat=3))) * extent
+        self._bounding_points.append(get_particle_positions_from_frame(pos, quat, scale, corners))
+        self._compiled = None
+
+    def add_cube(self, size, pos, quat, scale):
+        """
+        Adds a cube to the checked volumes. See @check_points_in_cube for the arguments
+        """
+        normals = th.cat([th.eye(3), -th.eye(3)])
+        vertices = th.tensor(list(itertools.product([-1.0, 1.0], repeat=3))) * size / 2.0
+        self._add_half_spaces(normals, th.full((6,), size / 2.0), vertices, pos=pos, quat=quat, scale=scale)
+
+    def add_sphere(self, size, pos, quat, scale):
+        """
+        Adds a sphere to the checked volumes. See @check_points_in_sphere for the arguments
+        """
+        # Points within the sphere are always within its half height
+        self._add_quadric(size, size, 0.0, True, pos=pos, quat=quat, scale=scale)
+
+    def add_cylinder(self, size, pos, quat, scale):
+        """
+        Adds a cylinder to the checked volumes. See @check_points_in_cylinder for the arguments
+        """
+        radius, height = size
+        self._add_quadric(radius, height / 2.0, 0.0, False, pos=pos, quat=quat, scale=scale)
+
+    def add_cone(self, size, pos, quat, scale):
+        """
+        Adds a cone to the checked volumes. See @check_points_in_cone for the arguments
+        """
+        radius, height = size
+        self._add_quadric(radius, height / 2.0, radius / height, False, pos=pos, quat=quat, scale=scale)
+
+    def add_convex_hull_mesh(self, mesh_face_centroids, mesh_face_normals, mesh_vertices, pos, quat, scale):
+        """
+        Adds a convex hull mesh to the checked volumes. See @check_points_in_convex_hull_mesh for the arguments
+
+        Args:
+            mesh_vertices (M, 3): (x,y,z) location of the vertices of the mesh, expressed in its local frame. Only used
+                to bound the mesh
+        """
+        mesh_face_centroids = th.as_tensor(mesh_face_centroids, dtype=th.float32)
+        mesh_face_normals = th.as_tensor(mesh_face_normals, dtype=th.float32)
+        offsets = (mesh_face_centroids * mesh_face_normals).sum(dim=-1)
+        vertices = th.as_tensor(mesh_vertices, dtype=th.float32)
+        self._add_half_spaces(mesh_face_normals, offsets, vertices, pos=pos, quat=quat, scale=scale)
+
+    def _compile(self):
+        # Pad every half-space primitive to the same number of faces with planes that are always satisfied, so that
+        # all faces can be packed into a single (3, K * D) matrix
+        n_faces = max([len(normals) for normals, _ in self._half_spaces], default=0)
+        normals = th.zeros((len(self._half_spaces), n_faces, 3))
+        offsets = th.ones((len(self._half_spaces), n_faces))
+        for i, (prim_normals, prim_offsets) in enumerate(self._half_spaces):
+            normals[i, : len(prim_normals)] = prim_normals
+            offsets[i, : len(prim_offsets)] = prim_offsets
+
+        quadrics = list(zip(*self._quadrics)) if len(self._quadrics) > 0 else [[]] * 6
+        A, b, radius, half_height, taper, is_sphere = quadrics
+        bounding_points = th.cat(self._bounding_points) if len(self._bounding_points) > 0 else th.zeros((0, 3))
+        self._compiled = {
+            "n_faces": n_faces,
+            "normals": normals.reshape(-1, 3).T,
+            "offsets": offsets.flatten(),
+            "quadric_A": th.cat(A) if len(A) > 0 else th.zeros((0, 3)),
+            "quadric_b": th.cat(b) if len(b) > 0 else th.zeros(0),
+            "radius": th.tensor(radius, dtype=th.float32),
+            "half_height": th.tensor(half_height, dtype=th.float32),
+            "taper": th.tensor(taper, dtype=th.float32),
+            "is_sphere": th.tensor(is_sphere, dtype=th.bool),
+            "aabb_low": bounding_points.amin(dim=0) if len(bounding_points) > 0 else None,
+            "aabb_high": bounding_points.amax(dim=0) if len(bounding_points) > 0 else None,
+        }
+
+    def check(self, particle_positions, pos=None, quat=None, scale=None, use_aabb=True):
+        """
+        Checks which points are within any of the primitive volumes
+
+        Args:
+            particle_positions ((N, 3) array): positions to check for whether they are in the volumes
+            pos (None or 3-array): If specified, (x,y,z) pos of the primitives' common frame, expressed in the same
+                frame as @particle_positions. If None, @particle_positions are assumed to be expressed in the
+                primitives' common frame
+            quat (None or 4-array): (x,y,z,w) orientation of the primitives' common frame. Only used if @pos is
+                specified
+            scale (None or 3-array): (x,y,z) scale of the primitives' common frame. Only used if @pos is specified
+            use_aabb (bool): Whether to reject points outside the AABB of all primitives before testing them
+
+        Returns:
+            (N,) array: boolean array specifying whether each point lies in any of the volumes
+        """
+        if self._compiled is None:
+            self._compile()
+        c = self._compiled
+        particle_positions = th.as_tensor(particle_positions, dtype=th.float32)
+        in_volumes = th.zeros(len(particle_positions), dtype=th.bool)
+        if len(particle_positions) == 0 or self.n_primitives == 0:
+            return in_volumes
+
+        normals, offsets, quadric_A, quadric_b = c["normals"], c["offsets"], c["quadric_A"], c["quadric_b"]
+        if pos is None:
+            frame_positions = particle_positions
+        else:
+            # Fold the transform into the common frame into the compiled primitives, so that the points themselves
+            # only need to be transformed to be checked against the AABB
+            frame_A, frame_b = _get_frame_transform(pos=pos, quat=quat, scale=scale)
+            offsets = offsets - frame_b @ normals
+            normals = frame_A.T @ normals
+            quadric_b = quadric_b + quadric_A @ frame_b
+            quadric_A = quadric_A @ frame_A
+            frame_positions = particle_positions @ frame_A.T + frame_b if use_aabb else None
+
+        idxs = None
+        if use_aabb:
+            in_aabb = ((c["aabb_low"] <= frame_positions) & (frame_positions <= c["aabb_high"])).all(dim=-1)
+            idxs = th.nonzero(in_aabb).flatten()
+            particle_positions = particle_positions[idxs]
+
+        in_any = th.zeros(len(particle_positions), dtype=th.bool)
+        if c["n_faces"] > 0:
+            # (N, K * D) signed distances to every face, which must all be negative for a point to be in a primitive
+            distances = th.addmm(-offsets, particle_positions, normals)
+            in_any |= (distances.reshape(len(particle_positions), -1, c["n_faces"]).amax(dim=-1) < 0).any(dim=-1)
+        if len(quadric_A) > 0:
+            local_positions = th.addmm(quadric_b, particle_positions, quadric_A.T).reshape(
+                len(particle_positions), -1, 3
+            )
+            z = local_positions[..., 2]
+            radial = th.where(
+                c["is_sphere"], th.norm(local_positions, dim=-1), th.norm(local_positions[..., :2], dim=-1)
+            )
+            in_height = (-c["half_height"] < z) & (z < c["half_height"])
+            in_radius = radial < c["radius"] - c["taper"] * (z + c["half_height"])
+            in_any |= (in_height & in_radius).any(dim=-1)
+
+        if idxs is None:
+            return in_any
+        in_volumes[idxs] = in_any
+        return in_volumes
+
+    def __call__(self, particle_positions, pos=None, quat=None, scale=None, use_aabb=True):
+        return self.check(particle_positions, pos=pos, quat=quat, scale=scale, use_aabb=use_aabb)
+
+    def get_bounding_box(self, pos=None, quat=None, scale=None):
+        """
+        Computes a box bounding all primitive volumes, i.e. their AABB in their common frame
+
+        Args:
+            pos (None or 3-array): If specified, (x,y,z) pos of the primitives' common frame, such that the box is
+                expressed in its parent frame. If None, the box is expressed in the primitives' common frame
+            quat (None or 4-array): (x,y,z,w) orientation of the primitives' common frame. Only used if @pos is
+                specified
+            scale (None or 3-array): (x,y,z) scale of the primitives' common frame. Only used if @pos is specified
+
+        Returns:
+            3-tuple:
+                - th.Tensor: (3,) center of the box
+                - th.Tensor: (4,) (x,y,z,w) orientation of the box
+                - th.Tensor: (3,) half extent of the box along each of its local axes
+        """
+        if self._compiled is None:
+            self._compile()
+        center = (self._compiled["aabb_low"] + self._compiled["aabb_high"]) / 2.0
+        half_extent = (self._compiled["aabb_high"] - self._compiled["aabb_low"]) / 2.0
+        if pos is None:
+            return center, th.tensor([0, 0, 0, 1.0]), half_extent
+        pos, quat, scale = (th.as_tensor(x, dtype=th.float32) for x in (pos, quat, scale))
+        center = get_particle_positions_from_frame(pos, quat, scale, center.reshape(1, 3))[0]
+        return center, quat, half_extent * scale.abs()
+
+    @property
+    def content_hash(self):
+        """
+        Returns:
+            str: Hash of the primitive volumes composing this checker, e.g. to cache quantities derived from them
+        """
+        if self._compiled is None:
+            self._compile()
+        return get_content_hash(*(self._compiled[key] for key in sorted(self._compiled.keys())))
+
+    def calculate_volume(self, precision=1e-5):
+        """
+        Approximates the total volume of the union of the primitive volumes, expressed in their common frame, by
+        checking a regular grid of points spanning their AABB
+
+        Args:
+            precision (float): Relative precision of the volume computation, i.e.: the relative error with respect to
+                the volume of the primitives' AABB
+
+        Returns:
+            th.Tensor: Approximate volume
+        """
+        if self._compiled is None:
+            self._compile()
+        if self.n_primitives == 0:
+            return th.tensor(0.0)
+
+        # Convert precision to minimum number of points to sample, and determine the equally-spaced sampling distance
+        # to achieve this minimum point count
+        low, high = self._compiled["aabb_low"], self._compiled["aabb_high"]
+        sampling_distance = th.pow(th.prod(high - low) / int(math.ceil(1.0 / precision)), 1 / 3.0)
+        # Sample the centers of the grid cells, such that each point accounts for the volume of its cell
+        arrs = [th.arange(l + sampling_distance / 2.0, h, sampling_distance) for l, h in zip(low, high)]
+        points = th.stack([arr.flatten() for arr in th.meshgrid(*arrs, indexing="ij")]).T
+
+        return self.check(points, use_aabb=False).sum() * sampling_distance**3
+
+
+def get_content_hash(*contents):
+    """
+    Computes a hash of @contents, e.g. to use as a key for cached data derived from them
+
+    Args:
+        *contents (any): Tensors, or values with a deterministic repr (e.g.: strings, numbers, tuples of them)
+
+    Returns:
+        str: Hex digest of the contents
+    """
+    h = hashlib.sha1()
+    for content in contents:
+        if isinstance(content, th.Tensor):
+            h.update(repr((content.dtype, tuple(content.shape))).encode())
+            h.update(content.detach().cpu().contiguous().numpy().tobytes())
+        else:
+            h.update(repr(content).encode())
+        # Separate contents so that e.g. ("ab", "c") and ("a", "bc") do not collide
+        h.update(b"|")
+    return h.hexdigest()
+
+
+def get_volume_cache_dir():
+    """
+    Returns:
+        str: Directory of the container volume cache. See m.VOLUME_CACHE_DIR
+    """
+    if m.VOLUME_CACHE_DIR is not None:
+        return m.VOLUME_CACHE_DIR
+    if os.access(gm.DATASET_PATH, os.W_OK):
+        return os.path.join(gm.DATASET_PATH, "cache", "volumes")
+    return os.path.join(tempfile.gettempdir(), "omnigibson", "cache", "volumes")
 
-                    in_range = check_in_volume(mesh, particle_positions)
 
-                where @in_range is a N-array boolean numpy array, (True where the particle is in the convex hull mesh
-                    volume), @mesh is the raw USD mesh, and @particle_positions is a (N, 3) array specifying the particle
-                    positions in the SAME coordinate frame as @mesh
+def load_or_compute_cached(key, compute_fcn, cache_dir=None):
+    """
+    Loads the data cached on disk under @key, or computes it with @compute_fcn and caches it if it is not cached yet.
+    Nothing is cached if m.ENABLE_VOLUME_CACHE is False
 
-            - function: Function for grabbing real-time LOCAL scale volume of the container. Signature:
+    Args:
+        key (str): Unique key of the data, e.g. from get_content_hash()
+        compute_fcn (function): Function with no arguments computing the data. The data should be loadable with
+            th.load(weights_only=True), e.g. tensors or tuples of tensors
+        cache_dir (None or str): Directory of the cache. If None, get_volume_cache_dir() is used
+
+    Returns:
+        any: Loaded or computed data
+    """
+    if not m.ENABLE_VOLUME_CACHE:
+        return compute_fcn()
+
+    cache_dir = get_volume_cache_dir() if cache_dir is None else cache_dir
+    cache_path = os.path.join(cache_dir, f"{key}.pt")
+    if os.path.exists(cache_path):
+        try:
+            return th.load(cache_path, weights_only=True)
+        except Exception as e:
+            log.warning(f"Failed to load cached volume data from {cache_path}, recomputing it: {e}")
+
+    data = compute_fcn()
+    try:
+        # Write to a temporary file first, so that concurrent processes never load partially written files
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".pt", dir=cache_dir)
+        os.close(fd)
+        th.save(data, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning(f"Failed to cache volume data to {cache_path}: {e}")
+    return data
+
+
+def _get_convex_hull_mesh_data(convex_hull_mesh):
+    """
+    Computes the convex hull of a mesh, as used by @generate_points_in_volume_checker_function
 
-                vol = calc_volume(mesh)
+    Args:
+        convex_hull_mesh (Usd.Prim): Raw USD convex hull mesh
 
-            where @vol is the total volume being checked (expressed in the mesh's LOCAL scale), and @mesh is the raw
-                USD mesh
+    Returns:
+        3-tuple:
+            - th.Tensor: (D, 3) centroid of each face of the convex hull, expressed in the mesh's local frame
+            - th.Tensor: (D, 3) normal of each face of the convex hull, expressed in the mesh's local frame
+            - th.Tensor: (M, 3) vertices of the convex hull, expressed in the mesh's local frame
     """
-    # For efficiency, we pre-compute the mesh using trimesh and find its corresponding faces and normals
     trimesh_mesh = mesh_prim_mesh_to_trimesh_mesh(
         convex_hull_mesh, include_normals=False, include_texcoord=False
     ).convex_hull
@@ -252,22 +602,8 @@ def _generate_convex_hull_volume_checker_functions(convex_hull_mesh):
     ), f"Trying to generate a volume checker function for a non-convex mesh {convex_hull_mesh.GetPath().pathString}"
     face_centroids = th.tensor(trimesh_mesh.vertices[trimesh_mesh.faces].mean(axis=1), dtype=th.float32)
     face_normals = th.tensor(trimesh_mesh.face_normals, dtype=th.float32)
-
-    # This function assumes that:
-    # 1. @particle_positions are in the local container_link frame
-    # 2. the @check_points_in_[...] function will convert them into the local @mesh frame
-    in_volume = lambda mesh, particle_positions: check_points_in_convex_hull_mesh(
-        mesh_face_centroids=face_centroids,
-        mesh_face_normals=face_normals,
-        pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
-        quat=vtarray_to_torch(
-            [*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]
-        ),
-        scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
-        particle_positions=particle_positions,
-    )
-    calc_volume = lambda mesh: trimesh_mesh.volume if trimesh_mesh.is_volume else trimesh_mesh.convex_hull.volume
-    return in_volume, calc_volume
+    vertices = th.tensor(trimesh_mesh.vertices, dtype=th.float32)
+    return face_centroids, face_normals, vertices
 
 
 def generate_points_in_volume_checker_function(obj, volume_link, use_visual_meshes=True, mesh_name_prefixes=None):
@@ -294,10 +630,12 @@ def generate_points_in_volume_checker_function(obj, volume_link, use_visual_mesh
         2-tuple:
             - function: Function with signature:
 
-                in_range = check_in_volumes(particle_positions)
+                in_range = check_in_volumes(particle_positions, spatial_hash=None, margin=0.0)
 
-            where @in_range is a N-array boolean numpy array, (True where the particle is in the volume), and
-            @particle_positions is a (N, 3) array specifying the particle positions in global coordinates
+            where @in_range is a N-array boolean numpy array, (True where the particle is in the volume),
+            @particle_positions is a (N, 3) array specifying the particle positions in global coordinates, and
+            @spatial_hash is an optional PointSpatialHash indexing @particle_positions (up to @margin), such that
+            only the points it finds near the volumes are checked
 
             - function: Function for grabbing real-time global scale volume of the container. Signature:
 
@@ -313,123 +651,80 @@ def generate_points_in_volume_checker_function(obj, volume_link, use_visual_mesh
         if mesh_name_prefixes is None or mesh_name_prefixes in container_mesh_name:
             container_meshes.append(container_mesh)
 
-    # Programmatically define the volume checker functions based on each container found
-    volume_checker_fcns = []
+    # Compile the volume checker based on each container found, snapshotting their static local poses and sizes.
+    # Data derived from the container meshes is cached on disk, keyed by the model and link they belong to as well as
+    # their content
+    volume_checker = VolumeChecker()
+    model_id = (getattr(obj, "category", None), getattr(obj, "model", None), volume_link.name)
     for sub_container_mesh in container_meshes:
-        mesh_type = sub_container_mesh.prim.GetTypeName()
+        mesh = sub_container_mesh.prim
+        mesh_type = mesh.GetTypeName()
+        orient = mesh.GetAttribute("xformOp:orient").Get()
+        pose_kwargs = dict(
+            pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
+            quat=vtarray_to_torch([*orient.imaginary, orient.real]),
+            scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
+        )
         if mesh_type == "Mesh":
-            fcn, vol_fcn = _generate_convex_hull_volume_checker_functions(convex_hull_mesh=sub_container_mesh.prim)
-        elif mesh_type == "Sphere":
-            fcn = lambda mesh, particle_positions: check_points_in_sphere(
-                size=mesh.GetAttribute("radius").Get(),
-                pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=vtarray_to_torch(
-                    [
-                        *(mesh.GetAttribute("xformOp:orient").Get().imaginary),
-                        mesh.GetAttribute("xformOp:orient").Get().real,
-                    ]
-                ),
-                scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
+            hull_key = get_content_hash(
+                "convex_hull",
+                *model_id,
+                mesh.GetPath().name,
+                vtarray_to_torch(mesh.GetAttribute("points").Get()),
+                vtarray_to_torch(mesh.GetAttribute("faceVertexCounts").Get(), dtype=th.int),
+                vtarray_to_torch(mesh.GetAttribute("faceVertexIndices").Get(), dtype=th.int),
             )
-        elif mesh_type == "Cylinder":
-            fcn = lambda mesh, particle_positions: check_points_in_cylinder(
-                size=[mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()],
-                pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=vtarray_to_torch(
-                    [
-                        *(mesh.GetAttribute("xformOp:orient").Get().imaginary),
-                        mesh.GetAttribute("xformOp:orient").Get().real,
-                    ]
-                ),
-                scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
+            face_centroids, face_normals, vertices = load_or_compute_cached(
+                key=hull_key, compute_fcn=lambda: _get_convex_hull_mesh_data(convex_hull_mesh=mesh)
             )
-        elif mesh_type == "Cone":
-            fcn = lambda mesh, particle_positions: check_points_in_cone(
-                size=[mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()],
-                pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=vtarray_to_torch(
-                    [
-                        *(mesh.GetAttribute("xformOp:orient").Get().imaginary),
-                        mesh.GetAttribute("xformOp:orient").Get().real,
-                    ]
-                ),
-                scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
+            volume_checker.add_convex_hull_mesh(
+                mesh_face_centroids=face_centroids,
+                mesh_face_normals=face_normals,
+                mesh_vertices=vertices,
+                **pose_kwargs,
             )
+        elif mesh_type == "Sphere":
+            volume_checker.add_sphere(size=mesh.GetAttribute("radius").Get(), **pose_kwargs)
+        elif mesh_type == "Cylinder":
+            size = [mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()]
+            volume_checker.add_cylinder(size=size, **pose_kwargs)
+        elif mesh_type == "Cone":
+            size = [mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()]
+            volume_checker.add_cone(size=size, **pose_kwargs)
         elif mesh_type == "Cube":
-            fcn = lambda mesh, particle_positions: check_points_in_cube(
-                size=mesh.GetAttribute("size").Get(),
-                pos=vtarray_to_torch(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=vtarray_to_torch(
-                    [
-                        *(mesh.GetAttribute("xformOp:orient").Get().imaginary),
-                        mesh.GetAttribute("xformOp:orient").Get().real,
-                    ]
-                ),
-                scale=vtarray_to_torch(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
-            )
+            volume_checker.add_cube(size=mesh.GetAttribute("size").Get(), **pose_kwargs)
         else:
             raise ValueError(f"Cannot create volume checker function for mesh of type: {mesh_type}")
 
-        volume_checker_fcns.append(fcn)
-
     # Define the actual volume checker function
-    def check_points_in_volumes(particle_positions):
-        # Algo
-        # 1. Particles in global frame --> particles in volume link frame (including scaling)
-        # 2. For each volume checker function, apply volume checking
-        # 3. Aggregate across all functions with OR condition (any volume satisfied for that point)
-        ######
-
-        n_particles = len(particle_positions)
-        # Get pose of origin (global frame) in frame of volume link
+    def check_points_in_volumes(particle_positions, spatial_hash=None, margin=0.0):
+        # Particles are checked in the volume link frame (including scaling), against any of the sub-volumes
         # NOTE: This assumes there is no relative scaling between obj and volume link
         volume_link_pos, volume_link_quat = volume_link.get_position_orientation()
-        particle_positions = get_particle_positions_in_frame(
-            pos=volume_link_pos,
-            quat=volume_link_quat,
-            scale=obj.scale,
-            particle_positions=particle_positions,
-        )
-
-        in_volumes = th.zeros(n_particles).bool()
-        for checker_fcn, mesh in zip(volume_checker_fcns, container_meshes):
-            in_volumes |= checker_fcn(mesh.prim, particle_positions)
+        if spatial_hash is None or volume_checker.n_primitives == 0:
+            return volume_checker.check(particle_positions, pos=volume_link_pos, quat=volume_link_quat, scale=obj.scale)
 
+        # Only check the particles that the spatial hash finds within the box bounding all sub-volumes
+        assert len(spatial_hash) == len(particle_positions), "Spatial hash does not index the given positions!"
+        box_pos, box_quat, half_extent = volume_checker.get_bounding_box(
+            pos=volume_link_pos, quat=volume_link_quat, scale=obj.scale
+        )
+        idxs = spatial_hash.query_oriented_box(pos=box_pos, quat=box_quat, half_extent=half_extent + margin)
+        in_volumes = th.zeros(len(particle_positions), dtype=th.bool)
+        in_volumes[idxs] = volume_checker.check(
+            particle_positions[idxs], pos=volume_link_pos, quat=volume_link_quat, scale=obj.scale, use_aabb=False
+        )
         return in_volumes
 
     # Define the actual volume calculator function
     def calculate_volume(precision=1e-5):
-        # We use monte-carlo sampling to approximate the voluem up to @precision
+        # The volume is computed in the volume link frame, and then scaled into the global frame
         # NOTE: precision defines the RELATIVE precision of the volume computation -- i.e.: the relative error with
-        # respect to the volume link's global AABB
-
-        # Convert precision to minimum number of particles to sample
-        min_n_particles = int(math.ceil(1.0 / precision))
-
-        # Make sure container meshes are visible so AABB computation is correct
-        for mesh in container_meshes:
-            mesh.visible = True
-
-        # Determine equally-spaced sampling distance to achieve this minimum particle count
-        aabb_volume = th.prod(volume_link.visual_aabb_extent)
-        sampling_distance = th.pow(aabb_volume / min_n_particles, 1 / 3.0)
-        low, high = volume_link.visual_aabb
-        n_particles_per_axis = ((high - low) / sampling_distance).int() + 1
-        assert th.all(n_particles_per_axis), "Must increase precision for calculate_volume -- too coarse for sampling!"
-        # 1e-10 is added because the extent might be an exact multiple of particle radius
-        arrs = [th.arange(l, h, sampling_distance) for l, h, n in zip(low, high, n_particles_per_axis)]
-        # Generate 3D-rectangular grid of points, and only keep the ones inside the mesh
-        points = th.stack([arr.flatten() for arr in th.meshgrid(*arrs)]).T
-
-        # Re-hide container meshes
-        for mesh in container_meshes:
-            mesh.visible = False
-
-        # Return the fraction of the link AABB's volume based on fraction of points enclosed within it
-        return aabb_volume * th.mean(check_points_in_volumes(points).float())
+        # respect to the AABB of the container volumes
+        volume_key = get_content_hash("volume", *model_id, precision, volume_checker.content_hash)
+        local_volume = load_or_compute_cached(
+            key=volume_key, compute_fcn=lambda: volume_checker.calculate_volume(precision=precision)
+        )
+        return local_volume * th.prod(obj.scale)
 
     return check_points_in_volumes, calculate_volume
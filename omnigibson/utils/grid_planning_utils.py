@@ -0,0 +1,630 @@
+"""
+A set of utility functions and classes for planning on 2D occupancy / traversability grids
+"""
+
+import math
+from array import array
+from heapq import heappop, heappush
+
+import numpy as np
+import torch as th
+from scipy.ndimage import binary_dilation, label
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# Neighbor offsets (row, col) and per-step costs for the supported grid connectivities
+_SQRT2 = math.sqrt(2.0)
+_NEIGHBOR_OFFSETS_4 = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]], dtype=np.int64)
+_NEIGHBOR_OFFSETS_8 = np.array(
+    [[1, 0], [-1, 0], [0, 1], [0, -1], [1, 1], [-1, -1], [1, -1], [-1, 1]],
+    dtype=np.int64,
+)
+
+
+def _to_numpy_map(search_map):
+    """
+    Converts @search_map into a 2D numpy array
+
+    Args:
+        search_map (th.Tensor or np.ndarray): 2D grid map, where nonzero values denote traversable cells
+
+    Returns:
+        np.ndarray: 2D numpy view / copy of @search_map
+    """
+    if isinstance(search_map, th.Tensor):
+        search_map = search_map.cpu().numpy()
+    search_map = np.asarray(search_map)
+    assert search_map.ndim == 2, f"Expected a 2D search map, got shape {search_map.shape}!"
+    return search_map
+
+
+class GridPlanner:
+    """
+    A* planner over a 2D grid map operating on flat, preallocated buffers.
+
+    The map is padded with a one-cell border of untraversable cells and flattened, so that every neighbor of an
+    interior cell can be addressed as @flat_idx + offset without any bounds checks. Cost-to-come and parent buffers
+    are allocated once and reset lazily (only the cells touched by a query are cleared afterwards), so the planner can
+    be reused across many queries on the same map.
+    """
+
+    def __init__(self, search_map, eight_connected=True):
+        """
+        Args:
+            search_map (th.Tensor or np.ndarray): 2D grid map to search on, where nonzero values denote
+                traversable cells
+            eight_connected (bool): Whether we consider the sides and diagonals of a cell as neighbors or just the sides
+        """
+        search_map = _to_numpy_map(search_map)
+        self.shape = tuple(search_map.shape)
+        self.eight_connected = eight_connected
+
+        # Pad the map with an untraversable border and flatten it
+        rows, cols = self.shape
+        self._width = cols + 2
+        padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = search_map != 0
+        self._free = bytearray(padded.tobytes())
+        n_cells = padded.size
+
+        # Preallocate search buffers
+        self._g = array("d", [math.inf]) * n_cells
+        self._parent = array("q", [-1]) * n_cells
+        self._closed = bytearray(n_cells)
+
+        # Compute flat neighbor offsets and their associated step costs
+        offsets = _NEIGHBOR_OFFSETS_8 if eight_connected else _NEIGHBOR_OFFSETS_4
+        flat_offsets = offsets[:, 0] * self._width + offsets[:, 1]
+        step_costs = np.where(np.all(offsets != 0, axis=1), _SQRT2, 1.0)
+        self._neighbors = tuple(zip(flat_offsets.tolist(), step_costs.tolist()))
+
+        # Sparse adjacency graph used for single-source distance fields, built lazily
+        self._graph = None
+
+        # Number of nodes expanded during the most recent query
+        self.n_expanded = 0
+
+    @property
+    def free(self):
+        """
+        Returns:
+            np.ndarray: (H, W) boolean array of traversable cells in this planner's map
+        """
+        padded = np.frombuffer(self._free, dtype=np.uint8).reshape(self.shape[0] + 2, self._width)
+        return padded[1:-1, 1:-1].astype(bool)
+
+    def in_bounds(self, cell):
+        """
+        Args:
+            cell (2-tuple): (row, col) cell in map coordinates
+
+        Returns:
+            bool: Whether @cell lies inside this planner's map
+        """
+        return 0 <= cell[0] < self.shape[0] and 0 <= cell[1] < self.shape[1]
+
+    def is_free(self, cell):
+        """
+        Args:
+            cell (2-tuple): (row, col) cell in map coordinates
+
+        Returns:
+            bool: Whether @cell lies inside this planner's map and is traversable
+        """
+        return self.in_bounds(cell) and self._free[self._to_flat(cell)] != 0
+
+    def _to_flat(self, cell):
+        return (int(cell[0]) + 1) * self._width + int(cell[1]) + 1
+
+    def _to_cell(self, flat_idx):
+        row, col = divmod(flat_idx, self._width)
+        return row - 1, col - 1
+
+    def plan(self, start, goal, free=None):
+        """
+        Finds the shortest path from @start to @goal
+
+        Args:
+            start (2-array): (row, col) start position on the map
+            goal (2-array): (row, col) goal position on the map
+            free (None or np.ndarray): if specified, (H, W) boolean array of traversable cells overriding this
+                planner's map for this query only, e.g.: to restrict the search to a subset of the map
+
+        Returns:
+            None or th.Tensor: Array of shape (N, 2) where N is the number of steps in the path.
+                Each row represents the (row, col) coordinates of a step on the path.
+                If no path is found, returns None.
+        """
+        self.n_expanded = 0
+        if not (self.in_bounds(start) and self.in_bounds(goal)):
+            return None
+
+        source, target = self._to_flat(start), self._to_flat(goal)
+        if source == target:
+            return th.tensor([[int(start[0]), int(start[1])]])
+
+        width = self._width
+        g, parent, closed = self._g, self._parent, self._closed
+        if free is None:
+            free = self._free
+        else:
+            padded_free = np.zeros((self.shape[0] + 2, width), dtype=np.uint8)
+            padded_free[1:-1, 1:-1] = free
+            free = bytearray(padded_free.tobytes())
+        neighbors = self._neighbors
+        eight_connected = self.eight_connected
+        goal_row, goal_col = divmod(target, width)
+
+        # Octile distance is admissible and consistent for the 8-connected grid, manhattan for the 4-connected one
+        def heuristic(idx):
+            row, col = divmod(idx, width)
+            d_row, d_col = abs(row - goal_row), abs(col - goal_col)
+            if eight_connected:
+                return max(d_row, d_col) + (_SQRT2 - 1.0) * min(d_row, d_col)
+            return d_row + d_col
+
+        touched = [source]
+        g[source] = 0.0
+        open_set = [(heuristic(source), source)]
+        found = False
+        n_expanded = 0
+        while open_set:
+            _, current = heappop(open_set)
+            if closed[current]:
+                continue
+            if current == target:
+                found = True
+                break
+            closed[current] = 1
+            n_expanded += 1
+            g_current = g[current]
+            for offset, step_cost in neighbors:
+                neighbor = current + offset
+                if not free[neighbor] or closed[neighbor]:
+                    continue
+                tentative_g = g_current + step_cost
+                if tentative_g < g[neighbor]:
+                    if parent[neighbor] == -1:
+                        touched.append(neighbor)
+                    g[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    heappush(open_set, (tentative_g + heuristic(neighbor), neighbor))
+
+        path = None
+        if found:
+            flat_path = [target]
+            while flat_path[-1] != source:
+                flat_path.append(parent[flat_path[-1]])
+            flat_path.reverse()
+            path = th.tensor([self._to_cell(idx) for idx in flat_path])
+
+        # Lazily reset only the buffer entries this query wrote to
+        for idx in touched:
+            g[idx] = math.inf
+            parent[idx] = -1
+            closed[idx] = 0
+        self.n_expanded = n_expanded
+
+        return path
+
+    def _get_graph(self):
+        """
+        Returns:
+            csr_matrix: Sparse (N, N) graph over the padded, flattened map, where N is the number of padded cells.
+                There is an edge v -> u, weighted by the step cost, for every traversable cell v and every in-map
+                neighbor u of v, i.e.: reversing the edge gives a valid move from u into v. Searching this graph from a
+                goal therefore yields the cost-to-go from every cell to that goal
+        """
+        if self._graph is None:
+            rows, cols = self.shape
+            n_cells = len(self._free)
+            in_map = np.zeros((rows + 2, self._width), dtype=bool)
+            in_map[1:-1, 1:-1] = True
+            in_map = in_map.ravel()
+            free_idxs = np.flatnonzero(np.frombuffer(self._free, dtype=np.uint8))
+            srcs, dsts, costs = [], [], []
+            for offset, step_cost in self._neighbors:
+                # Free cells are never on the padded border, so their neighbors are always valid flat indices
+                nbr_idxs = free_idxs + offset
+                valid = in_map[nbr_idxs]
+                srcs.append(free_idxs[valid])
+                dsts.append(nbr_idxs[valid])
+                costs.append(np.full(int(valid.sum()), step_cost))
+            self._graph = csr_matrix(
+                (np.concatenate(costs), (np.concatenate(srcs), np.concatenate(dsts))), shape=(n_cells, n_cells)
+            )
+
+        return self._graph
+
+    def compute_distances(self, goals):
+        """
+        Computes the geodesic distance from every cell in the map to each goal in @goals, using one Dijkstra pass
+        per goal over the map
+
+        Args:
+            goals ((K, 2)-array): (row, col) goal positions on the map. Every goal must lie inside the map
+
+        Returns:
+            np.ndarray: (K, N) cost-to-go, in cells, from every cell of the padded and flattened map to each goal.
+                Unreachable cells have infinite distance
+        """
+        flat_goals = [self._to_flat(goal) for goal in goals]
+        return dijkstra(self._get_graph(), directed=True, indices=flat_goals).reshape(len(flat_goals), -1)
+
+    def compute_distance_field(self, goal):
+        """
+        Computes the single-source geodesic distance field from every cell in the map to @goal, using a single
+        Dijkstra pass over the map
+
+        Args:
+            goal (2-array): (row, col) goal position on the map
+
+        Returns:
+            GridDistanceField: Distance field to @goal
+        """
+        distances = np.full(len(self._free), np.inf)
+        if self.in_bounds(goal):
+            distances = self.compute_distances([goal])[0]
+        return GridDistanceField(planner=self, goal=goal, distances=distances)
+
+
+class GridDistanceField:
+    """
+    Single-source geodesic distance field over a @GridPlanner's map. Distance queries are a single array lookup, and
+    shortest paths are recovered by descending the field from the query cell to the goal.
+    """
+
+    def __init__(self, planner, goal, distances):
+        """
+        Args:
+            planner (GridPlanner): Planner whose map this distance field was computed on
+            goal (2-array): (row, col) goal position on the map
+            distances (np.ndarray): (N,) cost-to-go to @goal, in cells, for every cell of the planner's padded and
+                flattened map. Unreachable cells should have infinite distance
+        """
+        self.planner = planner
+        self.goal = (int(goal[0]), int(goal[1]))
+        self._distances = distances
+
+    @property
+    def distances(self):
+        """
+        Returns:
+            th.Tensor: (H, W) cost-to-go to the goal, in cells, for every cell in the map. Unreachable cells have
+                infinite distance
+        """
+        rows, cols = self.planner.shape
+        return th.from_numpy(self._distances.reshape(rows + 2, cols + 2)[1:-1, 1:-1].copy())
+
+    def get_distance(self, cell):
+        """
+        Args:
+            cell (2-array): (row, col) query position on the map
+
+        Returns:
+            None or float: Geodesic distance, in cells, from @cell to the goal, or None if no path exists
+        """
+        if not self.planner.in_bounds(cell):
+            return None
+        distance = self._distances[self.planner._to_flat(cell)]
+        return None if distance == np.inf else float(distance)
+
+    def get_path(self, cell):
+        """
+        Recovers the shortest path from @cell to the goal by greedily descending the distance field
+
+        Args:
+            cell (2-array): (row, col) start position on the map
+
+        Returns:
+            None or th.Tensor: Array of shape (N, 2) where N is the number of steps in the path.
+                Each row represents the (row, col) coordinates of a step on the path.
+                If no path is found, returns None.
+        """
+        if self.get_distance(cell) is None:
+            return None
+
+        planner = self.planner
+        free, neighbors, distances = planner._free, planner._neighbors, self._distances
+        current = planner._to_flat(cell)
+        flat_path = [current]
+        while distances[current] > 0.0:
+            best_distance, best_neighbor = math.inf, None
+            for offset, step_cost in neighbors:
+                neighbor = current + offset
+                if free[neighbor] and step_cost + distances[neighbor] < best_distance:
+                    best_distance, best_neighbor = step_cost + distances[neighbor], neighbor
+            current = best_neighbor
+            flat_path.append(current)
+
+        return th.tensor([planner._to_cell(idx) for idx in flat_path])
+
+
+class HierarchicalGridPlanner:
+    """
+    Multi-resolution A* planner over a 2D grid map.
+
+    Builds a pyramid of progressively coarser maps, where a coarse cell is traversable only if all of the finer cells
+    it covers are traversable, so that thin walls are preserved. Queries are first solved on the coarsest level, and
+    each finer level only searches inside a corridor around the path found on the level above. If a level has no path
+    (e.g.: a doorway narrower than its cells), or a corridor does not contain one, that level falls back to an
+    unrestricted search. The returned paths are therefore always valid, but not necessarily optimal.
+    """
+
+    def __init__(self, search_map, eight_connected=True, n_levels=3, coarsening_factor=4, corridor_radius=2):
+        """
+        Args:
+            search_map (th.Tensor or np.ndarray): 2D grid map to search on, where nonzero values denote
+                traversable cells
+            eight_connected (bool): Whether we consider the sides and diagonals of a cell as neighbors or just the sides
+            n_levels (int): Number of levels in the pyramid, including the full-resolution map
+            coarsening_factor (int): Side length, in cells, of the block of cells on each level that is merged into
+                a single cell on the next coarser level
+            corridor_radius (int): Number of cells, on the coarser level, by which a coarse path is dilated to
+                generate the search corridor on the next finer level
+        """
+        self.coarsening_factor = coarsening_factor
+        self.corridor_radius = corridor_radius
+
+        free = _to_numpy_map(search_map) != 0
+        self.planners = [GridPlanner(free, eight_connected=eight_connected)]
+        for _ in range(n_levels - 1):
+            rows, cols = free.shape
+            padded = np.zeros(
+                (-(-rows // coarsening_factor) * coarsening_factor, -(-cols // coarsening_factor) * coarsening_factor),
+                dtype=bool,
+            )
+            padded[:rows, :cols] = free
+            free = padded.reshape(
+                padded.shape[0] // coarsening_factor, coarsening_factor, padded.shape[1] // coarsening_factor, -1
+            ).all(axis=(1, 3))
+            self.planners.append(GridPlanner(free, eight_connected=eight_connected))
+
+        # Number of nodes expanded, summed over all levels, during the most recent query
+        self.n_expanded = 0
+
+    def plan(self, start, goal):
+        """
+        Finds a path from @start to @goal, refining the path found on each level of the pyramid in turn
+
+        Args:
+            start (2-array): (row, col) start position on the map
+            goal (2-array): (row, col) goal position on the map
+
+        Returns:
+            None or th.Tensor: Array of shape (N, 2) where N is the number of steps in the path.
+                Each row represents the (row, col) coordinates of a step on the path.
+                If no path is found, returns None.
+        """
+        self.n_expanded = 0
+        if not (self.planners[0].in_bounds(start) and self.planners[0].in_bounds(goal)):
+            return None
+
+        structure = np.ones((2 * self.corridor_radius + 1,) * 2, dtype=bool)
+        path = None
+        for level in reversed(range(len(self.planners))):
+            planner = self.planners[level]
+            scale = self.coarsening_factor**level
+            level_start = (int(start[0]) // scale, int(start[1]) // scale)
+            level_goal = (int(goal[0]) // scale, int(goal[1]) // scale)
+
+            # Coarse cells containing the start or goal are always traversable, so that a query near a wall can still
+            # be solved on the coarse levels
+            free = planner.free
+            if level > 0:
+                free[level_start] = True
+                free[level_goal] = True
+
+            if path is not None:
+                # Dilate the coarser path and upsample it to obtain the corridor on this level
+                corridor = np.zeros(self.planners[level + 1].shape, dtype=bool)
+                corridor[path[:, 0].numpy(), path[:, 1].numpy()] = True
+                corridor = binary_dilation(corridor, structure=structure)
+                corridor = corridor.repeat(self.coarsening_factor, axis=0).repeat(self.coarsening_factor, axis=1)
+                path = planner.plan(level_start, level_goal, free=free & corridor[: free.shape[0], : free.shape[1]])
+                self.n_expanded += planner.n_expanded
+
+            if path is None:
+                path = planner.plan(level_start, level_goal, free=free if level > 0 else None)
+                self.n_expanded += planner.n_expanded
+
+        return path
+
+
+class GridLandmarkIndex:
+    """
+    Landmark-based (ALT) geodesic distance index over a 2D grid map.
+
+    Stores the exact distance field from a small set of landmark cells to every cell in the map. By the triangle
+    inequality, the true geodesic distance d(s, t) between any two cells is bounded by
+    max_k |d(l_k, s) - d(l_k, t)| <= d(s, t) <= min_k d(l_k, s) + d(l_k, t), so batched distance queries reduce to a
+    handful of array gathers.
+    """
+
+    def __init__(self, free, landmarks, distances):
+        """
+        Args:
+            free ((H, W)-array): boolean array of traversable cells in the map
+            landmarks ((K, 2)-array): (row, col) landmark cells on the map
+            distances ((K, H, W)-array): distance, in cells, from each landmark to every cell in the map. Unreachable
+                cells should have infinite distance
+        """
+        self.free = th.as_tensor(free, dtype=th.bool)
+        self.landmarks = th.as_tensor(landmarks, dtype=th.int64)
+        self.distances = th.as_tensor(distances, dtype=th.float32)
+        self.shape = tuple(self.free.shape)
+        self._flat_distances = self.distances.reshape(len(self.landmarks), -1)
+
+    @classmethod
+    def build(cls, planner, n_landmarks=16, min_component_size=100):
+        """
+        Builds a landmark index over @planner's map. One landmark is placed on the periphery of every connected
+        component with at least @min_component_size cells (largest components first), and the remaining landmarks
+        are placed with farthest-point sampling, which keeps the distance bounds tight across the map
+
+        Args:
+            planner (GridPlanner): Planner whose map should be indexed
+            n_landmarks (int): Maximum number of landmarks to place
+            min_component_size (int): Minimum number of cells a connected component needs to be guaranteed a landmark
+
+        Returns:
+            GridLandmarkIndex: Generated landmark index
+        """
+        rows, cols = planner.shape
+        structure = np.ones((3, 3)) if planner.eight_connected else None
+        component_labels, _ = label(planner.free, structure=structure)
+        component_sizes = np.bincount(component_labels.ravel())
+        component_sizes[0] = 0
+
+        def compute_unpadded_distances(goals):
+            return planner.compute_distances(goals).reshape(-1, rows + 2, cols + 2)[:, 1:-1, 1:-1]
+
+        landmarks, distances = [], []
+        for component in np.argsort(-component_sizes, kind="stable"):
+            if len(landmarks) == n_landmarks or component_sizes[component] < max(min_component_size, 1):
+                break
+            # Start from any cell in the component and move the landmark to the farthest cell from it
+            seed = np.argwhere(component_labels == component)[0]
+            seed_distances = np.where(component_labels == component, compute_unpadded_distances([seed])[0], -1.0)
+            landmarks.append(np.unravel_index(np.argmax(seed_distances), planner.shape))
+            distances.append(compute_unpadded_distances([landmarks[-1]])[0])
+
+        if len(landmarks) > 0:
+            min_distances = np.min(distances, axis=0)
+            covered = np.isfinite(min_distances) & planner.free
+            while len(landmarks) < n_landmarks:
+                farthest = np.argmax(np.where(covered, min_distances, -1.0))
+                if min_distances.flat[farthest] <= 0.0:
+                    break
+                landmarks.append(np.unravel_index(farthest, planner.shape))
+                distances.append(compute_unpadded_distances([landmarks[-1]])[0])
+                min_distances = np.minimum(min_distances, distances[-1])
+
+        landmarks = np.array(landmarks, dtype=np.int64).reshape(-1, 2)
+        distances = np.array(distances, dtype=np.float32).reshape(-1, rows, cols)
+        return cls(free=planner.free, landmarks=landmarks, distances=distances)
+
+    def get_distance_bounds(self, sources, targets):
+        """
+        Computes lower and upper bounds on the geodesic distance between each pair of cells in @sources and @targets
+
+        Args:
+            sources ((N, 2)-array): (row, col) source cells on the map
+            targets ((N, 2)-array): (row, col) target cells on the map
+
+        Returns:
+            2-tuple:
+                - (N,)-array: lower bound on the distance, in cells. This is infinite if no path exists (e.g.: the
+                    target is not traversable), and NaN if no landmark reaches either cell, in which case the index
+                    cannot bound the distance
+                - (N,)-array: upper bound on the distance, in cells. This is infinite if no path exists or if the
+                    index cannot bound the distance
+        """
+        sources = th.as_tensor(sources, dtype=th.int64).reshape(-1, 2)
+        targets = th.as_tensor(targets, dtype=th.int64).reshape(-1, 2)
+        rows, cols = self.shape
+        in_bounds = (
+            (sources[:, 0] >= 0)
+            & (sources[:, 0] < rows)
+            & (sources[:, 1] >= 0)
+            & (sources[:, 1] < cols)
+            & (targets[:, 0] >= 0)
+            & (targets[:, 0] < rows)
+            & (targets[:, 1] >= 0)
+            & (targets[:, 1] < cols)
+        )
+        flat_sources = th.where(in_bounds, sources[:, 0] * cols + sources[:, 1], 0)
+        flat_targets = th.where(in_bounds, targets[:, 0] * cols + targets[:, 1], 0)
+        source_distances = self._flat_distances[:, flat_sources]
+        target_distances = self._flat_distances[:, flat_targets]
+
+        # Landmarks that reach neither cell carry no information, and if one reaches only one of the two cells then
+        # the cells are in different connected components. Paths can leave an untraversable source but never enter
+        # it, so distances are only symmetric between traversable cells and for untraversable sources only the
+        # d(s, l) - d(t, l) <= d(s, t) side of the triangle inequality holds
+        informative = th.isfinite(source_distances) | th.isfinite(target_distances)
+        differences = th.where(
+            self.free.flatten()[flat_sources],
+            th.abs(source_distances - target_distances),
+            source_distances - target_distances,
+        )
+        lower = th.where(informative, differences, -math.inf).max(dim=0).values
+        upper = (source_distances + target_distances).min(dim=0).values
+        unknown = th.isinf(lower) & (lower < 0)
+        lower[unknown] = math.nan
+        lower.clamp_(min=0.0)
+        unreachable = ~in_bounds | ~self.free.flatten()[flat_targets]
+        lower[unreachable] = math.inf
+        upper[unreachable] = math.inf
+        same_cell = in_bounds & (flat_sources == flat_targets)
+        lower[same_cell] = 0.0
+        upper[same_cell] = 0.0
+
+        return lower, upper
+
+    def save(self, fpath):
+        """
+        Serializes this index to disk
+
+        Args:
+            fpath (str): Path to the .npz file to write
+        """
+        np.savez_compressed(
+            fpath, free=self.free.numpy(), landmarks=self.landmarks.numpy(), distances=self.distances.numpy()
+        )
+
+    @classmethod
+    def load(cls, fpath):
+        """
+        Loads a serialized index from disk
+
+        Args:
+            fpath (str): Path to the .npz file written by GridLandmarkIndex.save()
+
+        Returns:
+            GridLandmarkIndex: Loaded index
+        """
+        with np.load(fpath) as data:
+            return cls(free=data["free"], landmarks=data["landmarks"], distances=data["distances"])
+
+
+def astar(search_map, start, goal, eight_connected=True):
+    """
+    A* search algorithm for finding a path from start to goal on a grid map, using the flat-buffer @GridPlanner.
+    Returns paths in the same format as omnigibson.utils.motion_planning_utils.astar.
+
+    NOTE: If many queries are issued on the same map, prefer constructing a single @GridPlanner and calling
+    GridPlanner.plan() repeatedly, which avoids re-allocating the search buffers.
+
+    Args:
+        search_map (th.Tensor or np.ndarray): 2D Grid map to search on
+        start (2-array): Start position on the map
+        goal (2-array): Goal position on the map
+        eight_connected (bool): Whether we consider the sides and diagonals of a cell as neighbors or just the sides
+
+    Returns:
+        None or th.Tensor: Array of shape (N, 2) where N is the number of steps in the path.
+            Each row represents the (x, y) coordinates of a step on the path.
+            If no path is found, returns None.
+    """
+    return GridPlanner(search_map, eight_connected=eight_connected).plan(start, goal)
+
+
+def plan_paths(search_map, starts, goals, eight_connected=True, hierarchical=False):
+    """
+    Finds the shortest paths for multiple start / goal pairs on the same grid map, reusing a single planner. This is a
+    standalone function so that it can be submitted to thread or process pools
+
+    Args:
+        search_map (th.Tensor or np.ndarray): 2D Grid map to search on
+        starts (list of 2-array): Start positions on the map
+        goals (list of 2-array): Goal positions on the map
+        eight_connected (bool): Whether we consider the sides and diagonals of a cell as neighbors or just the sides
+        hierarchical (bool): Whether to use a @HierarchicalGridPlanner instead of a @GridPlanner
+
+    Returns:
+        list of (None or th.Tensor): Path for each start / goal pair, in the same format as GridPlanner.plan()
+    """
+    planner_cls = HierarchicalGridPlanner if hierarchical else GridPlanner
+    planner = planner_cls(search_map, eight_connected=eight_connected)
+    return [planner.plan(start, goal) for start, goal in zip(starts, goals)]
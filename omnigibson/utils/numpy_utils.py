@@ -23,3 +23,7 @@ def pil_to_tensor(pil_image):
 
 def list_to_np_array(list):
     return np.array(list)
+
+
+def open_np_memmap(path, dtype, offset, shape):
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
@@ -0,0 +1,147 @@
+"""
+A set of utility functions and classes for rasterizing 2D range scans into local occupancy grids
+"""
+
+import math
+
+import cv2
+import torch as th
+
+from omnigibson.utils.constants import OccupancyGridState
+
+# Values written into the uint8 occupancy grid before it gets normalized back into OccupancyGridState values
+_OBSTACLES = int(OccupancyGridState.OBSTACLES * 2.0)
+_UNKNOWN = int(OccupancyGridState.UNKNOWN * 2.0)
+_FREESPACE = int(OccupancyGridState.FREESPACE * 2.0)
+
+
+def get_scan_ray_directions(horizontal_fov, horizontal_resolution):
+    """
+    Computes the unit direction of every ray of a 1D range scan, in the scan sensor's frame
+
+    Args:
+        horizontal_fov (float): Horizontal field of view of the sensor, in degrees
+        horizontal_resolution (float): Degrees in between each horizontal scan hit
+
+    Returns:
+        th.Tensor: (N, 3) unit vectors for each of the N rays, sweeping the FOV counterclockwise
+    """
+    num_points = math.ceil(horizontal_fov / horizontal_resolution)
+    half_fov = th.deg2rad(th.tensor([horizontal_fov / 2])).item()
+    angles = th.linspace(-half_fov, half_fov, num_points)
+    return th.stack([th.cos(angles), th.sin(angles), th.zeros_like(angles)], dim=1)
+
+
+def _get_disk_kernel(radius):
+    """
+    Computes the (2 * radius + 1, 2 * radius + 1) mask of a filled disk of radius @radius, exactly as rasterized by
+    cv2.circle
+
+    Args:
+        radius (int): Radius of the disk, in pixels
+
+    Returns:
+        th.Tensor: (2 * radius + 1, 2 * radius + 1) uint8 disk mask
+    """
+    kernel = th.zeros((2 * radius + 1, 2 * radius + 1), dtype=th.uint8)
+    cv2.circle(img=kernel.numpy(), center=(radius, radius), radius=radius, color=1, thickness=-1)
+    return kernel
+
+
+class OccupancyGridRasterizer:
+    """
+    Rasterizes 2D range scan hits, expressed in a local frame, into (resolution, resolution) occupancy grids centered
+    at that frame's origin. Cells around each hit are marked as obstacles, the polygon swept by the scan is marked as
+    free space, and so is a disk of radius @inner_radius around the origin. All other cells are unknown.
+
+    The per-grid constants (obstacle disk kernel and inner free-space disk) are precomputed once, so that rasterizing a
+    scan only involves a single scatter of all of its hits, a dilation, and a single polygon fill.
+    """
+
+    def __init__(self, resolution, grid_range, inner_radius, obstacle_radius=2):
+        """
+        Args:
+            resolution (int): Number of cells along each side of the occupancy grid
+            grid_range (float): Side length of the occupancy grid, in meters
+            inner_radius (int): Radius of the disk around the origin that is assumed to be empty, in cells
+            obstacle_radius (int): Radius of the disk marked as an obstacle around each scan hit, in cells
+        """
+        self.resolution = resolution
+        self.grid_range = grid_range
+        self.inner_radius = inner_radius
+        self.obstacle_radius = obstacle_radius
+
+        self._obstacle_kernel = _get_disk_kernel(obstacle_radius)
+        inner_disk = th.zeros((resolution, resolution), dtype=th.uint8)
+        cv2.circle(
+            img=inner_disk.numpy(),
+            center=(resolution // 2, resolution // 2),
+            radius=inner_radius,
+            color=1,
+            thickness=-1,
+        )
+        self._inner_disk = inner_disk.bool()
+
+    def to_grid_coordinates(self, points):
+        """
+        Converts local (x, y) points in meters into integer (col, row) occupancy grid coordinates. Note that the y-axis
+        is flipped, and that points outside of the grid map to coordinates outside of [0, resolution)
+
+        Args:
+            points (th.Tensor): (..., 2) local (x, y) points, in meters
+
+        Returns:
+            th.Tensor: (..., 2) int32 (col, row) grid coordinates
+        """
+        points = points.clone()
+        points[..., 1] *= -1
+        return (points / self.grid_range * self.resolution + (self.resolution / 2)).int()
+
+    def rasterize(self, points):
+        """
+        Rasterizes a single scan into an occupancy grid
+
+        Args:
+            points (th.Tensor): (N, 2) local (x, y) positions of the scan hits, in meters, ordered by ray angle
+
+        Returns:
+            th.Tensor: (resolution, resolution, 1) occupancy grid, with values from OccupancyGridState
+        """
+        return self.rasterize_batch(points.unsqueeze(0))[0]
+
+    def rasterize_batch(self, points):
+        """
+        Rasterizes a batch of scans into occupancy grids
+
+        Args:
+            points (th.Tensor): (B, N, 2) local (x, y) positions of the scan hits of each of the B scans, in meters,
+                ordered by ray angle
+
+        Returns:
+            th.Tensor: (B, resolution, resolution, 1) occupancy grids, with values from OccupancyGridState
+        """
+        n_scans = points.shape[0]
+        # Close each scan polygon through the local origin
+        origins = th.zeros((n_scans, 1, 2), dtype=points.dtype, device=points.device)
+        points = th.cat([origins, points, origins], dim=1)
+        cells = self.to_grid_coordinates(points).cpu()
+
+        grids = th.full((n_scans, self.resolution, self.resolution), fill_value=_UNKNOWN, dtype=th.uint8)
+
+        # Mark every hit in a grid padded by the obstacle radius, so that hits right outside of the grid are kept, and
+        # then dilate them into disks
+        pad = self.obstacle_radius
+        padded_cells = cells.long() + pad
+        in_bounds = ((padded_cells >= 0) & (padded_cells < self.resolution + 2 * pad)).all(dim=-1)
+        scan_idxs = th.arange(n_scans)[:, None].expand_as(in_bounds)
+        hits = th.zeros((n_scans, self.resolution + 2 * pad, self.resolution + 2 * pad), dtype=th.uint8)
+        hits[scan_idxs[in_bounds], padded_cells[in_bounds][:, 1], padded_cells[in_bounds][:, 0]] = 1
+        for grid, scan_hits, scan_cells in zip(grids, hits, cells):
+            obstacles = th.from_numpy(cv2.dilate(scan_hits.numpy(), self._obstacle_kernel.numpy()))
+            grid[obstacles[pad : pad + self.resolution, pad : pad + self.resolution].bool()] = _OBSTACLES
+            # Fill the polygon swept by the scan as free space
+            cv2.fillPoly(img=grid.numpy(), pts=scan_cells.numpy().reshape((1, -1, 1, 2)), color=_FREESPACE, lineType=1)
+
+        grids[:, self._inner_disk] = _FREESPACE
+
+        return grids[..., None] / 2.0
@@ -459,6 +459,25 @@ def mat2pose(hmat):
     return pos, orn
 
 
+@th.jit.script
+def mat2pose_batch(hmat: th.Tensor) -> Tuple[th.Tensor, th.Tensor]:
+    """
+    Batched version of mat2pose(). Converts homogeneous 4x4 matrices into poses.
+
+    NOTE: Unlike mat2pose(), this does not check that the rotation matrices are unscaled, since doing so requires
+    synchronizing with the device
+
+    Args:
+        hmat (th.tensor): (..., 4, 4) homogeneous matrices
+
+    Returns:
+        2-tuple:
+            - (th.tensor) (..., 3) (x,y,z) position arrays in cartesian coordinates
+            - (th.tensor) (..., 4) (x,y,z,w) orientation arrays in quaternion form
+    """
+    return hmat[..., :3, 3], mat2quat(hmat[..., :3, :3])
+
+
 @th.jit.script
 def vec2quat(vec: th.Tensor, up: th.Tensor = th.tensor([0.0, 0.0, 1.0])) -> th.Tensor:
     """
@@ -620,6 +639,32 @@ def pose2mat(pose: Tuple[th.Tensor, th.Tensor]) -> th.Tensor:
     return homo_pose_mat
 
 
+@th.jit.script
+def pose2mat_batch(pose: Tuple[th.Tensor, th.Tensor]) -> th.Tensor:
+    """
+    Batched version of pose2mat(). Converts poses into homogeneous 4x4 matrices. Leading dimensions of the position
+    and orientation arrays are broadcast against each other.
+
+    Args:
+        pose (2-tuple): a (pos, orn) tuple where pos is a (..., 3) array of (x,y,z) positions and orn is a (..., 4)
+            array of (x,y,z,w) quaternions
+
+    Returns:
+        th.tensor: (..., 4, 4) homogeneous matrices
+    """
+    pos, orn = pose
+    pos = pos.to(dtype=th.float32)
+    orn = orn.to(dtype=th.float32)
+    batch_shape = th.broadcast_shapes(pos.shape[:-1], orn.shape[:-1])
+
+    homo_pose_mat = th.zeros(batch_shape + (4, 4), dtype=th.float32, device=pos.device)
+    homo_pose_mat[..., :3, :3] = quat2mat(orn)
+    homo_pose_mat[..., :3, 3] = pos
+    homo_pose_mat[..., 3, 3] = 1.0
+
+    return homo_pose_mat
+
+
 @th.jit.script
 def quat2axisangle(quat):
     """
@@ -634,15 +679,16 @@ def quat2axisangle(quat):
     quat_shape = quat.shape[:-1]  # ignore last dim
     quat = quat.reshape(-1, 4)
     # clip quaternion
-    quat[:, 3] = th.clip(quat[:, 3], -1.0, 1.0)
+    qw = th.clip(quat[:, 3], -1.0, 1.0)
     # Calculate denominator
-    den = th.sqrt(1.0 - quat[:, 3] * quat[:, 3])
-    # Map this into a mask
+    den = th.sqrt(1.0 - qw * qw)
+    # Map this into a mask, and avoid dividing by zero for (near-)identity rotations, which map to zero
+    valid = den != 0.0
+    den = th.where(valid, den, th.ones_like(den))
 
     # Create return array
-    ret = th.zeros_like(quat)[:, :3]
-    idx = th.nonzero(den).reshape(-1)
-    ret[idx, :] = (quat[idx, :3] * 2.0 * th.acos(quat[idx, 3]).unsqueeze(-1)) / den[idx].unsqueeze(-1)
+    ret = (quat[:, :3] * 2.0 * th.acos(qw).unsqueeze(-1)) / den.unsqueeze(-1)
+    ret = th.where(valid.unsqueeze(-1), ret, th.zeros_like(ret))
 
     # Reshape and return output
     ret = ret.reshape(
@@ -745,6 +791,26 @@ def pose_inv(pose_mat):
     return pose_inv
 
 
+@th.jit.script
+def pose_inv_batch(pose_mat: th.Tensor) -> th.Tensor:
+    """
+    Batched version of pose_inv(). Computes the inverse of homogeneous matrices corresponding to the poses of some
+    frames B in frames A.
+
+    Args:
+        pose_mat (th.tensor): (..., 4, 4) matrices for the poses to inverse
+
+    Returns:
+        th.tensor: (..., 4, 4) matrices for the inverse poses
+    """
+    rot_inv = pose_mat[..., :3, :3].transpose(-1, -2)
+    pose_inv = th.zeros_like(pose_mat)
+    pose_inv[..., :3, :3] = rot_inv
+    pose_inv[..., :3, 3] = -(rot_inv @ pose_mat[..., :3, 3].unsqueeze(-1)).squeeze(-1)
+    pose_inv[..., 3, 3] = 1.0
+    return pose_inv
+
+
 @th.jit.script
 def pose_transform(pos1, quat1, pos0, quat0):
     """
@@ -771,6 +837,33 @@ def pose_transform(pos1, quat1, pos0, quat0):
     return mat2pose(mat1 @ mat0)
 
 
+@th.jit.script
+def pose_transform_batch(pos1, quat1, pos0, quat0):
+    """
+    Batched version of pose_transform(). Conducts forward transforms from poses (pos0, quat0) to poses (pos1, quat1).
+    Leading dimensions of all inputs are broadcast against each other.
+
+    pose1 @ pose0, NOT pose0 @ pose1
+
+    Args:
+        pos1: (..., 3) (x,y,z) positions to transform
+        quat1: (..., 4) (x,y,z,w) orientations to transform
+        pos0: (..., 3) (x,y,z) initial positions
+        quat0: (..., 4) (x,y,z,w) initial orientations
+
+    Returns:
+        2-tuple:
+            - (th.tensor) (..., 3) (x,y,z) position arrays in cartesian coordinates
+            - (th.tensor) (..., 4) (x,y,z,w) orientation arrays in quaternion form
+    """
+    # Get poses
+    mat0 = pose2mat_batch((pos0, quat0))
+    mat1 = pose2mat_batch((pos1, quat1))
+
+    # Multiply and convert back to pos, quat
+    return mat2pose_batch(mat1 @ mat0)
+
+
 @th.jit.script
 def invert_pose_transform(pos, quat):
     """
@@ -792,6 +885,27 @@ def invert_pose_transform(pos, quat):
     return mat2pose(pose_inv(mat))
 
 
+@th.jit.script
+def invert_pose_transform_batch(pos, quat):
+    """
+    Batched version of invert_pose_transform(). Inverts pose transforms
+
+    Args:
+        pos: (..., 3) (x,y,z) positions to transform
+        quat: (..., 4) (x,y,z,w) orientations to transform
+
+    Returns:
+        2-tuple:
+            - (th.tensor) (..., 3) (x,y,z) position arrays in cartesian coordinates
+            - (th.tensor) (..., 4) (x,y,z,w) orientation arrays in quaternion form
+    """
+    # Get poses
+    mat = pose2mat_batch((pos, quat))
+
+    # Invert poses and convert back to pos, quat
+    return mat2pose_batch(pose_inv_batch(mat))
+
+
 @th.jit.script
 def relative_pose_transform(pos1, quat1, pos0, quat0):
     """
@@ -818,6 +932,32 @@ def relative_pose_transform(pos1, quat1, pos0, quat0):
     return mat2pose(pose_inv(mat0) @ mat1)
 
 
+@th.jit.script
+def relative_pose_transform_batch(pos1, quat1, pos0, quat0):
+    """
+    Batched version of relative_pose_transform(). Computes relative forward transforms from poses (pos0, quat0) to
+    poses (pos1, quat1), i.e.: solves pose1 = pose0 @ transform. Leading dimensions of all inputs are broadcast
+    against each other.
+
+    Args:
+        pos1: (..., 3) (x,y,z) positions to transform
+        quat1: (..., 4) (x,y,z,w) orientations to transform
+        pos0: (..., 3) (x,y,z) initial positions
+        quat0: (..., 4) (x,y,z,w) initial orientations
+
+    Returns:
+        2-tuple:
+            - (th.tensor) (..., 3) (x,y,z) position arrays in cartesian coordinates
+            - (th.tensor) (..., 4) (x,y,z,w) orientation arrays in quaternion form
+    """
+    # Get poses
+    mat0 = pose2mat_batch((pos0, quat0))
+    mat1 = pose2mat_batch((pos1, quat1))
+
+    # Invert pose0 and calculate transform
+    return mat2pose_batch(pose_inv_batch(mat0) @ mat1)
+
+
 @th.jit.script
 def _skew_symmetric_translation(pos_A_in_B):
     """
@@ -1113,6 +1253,29 @@ def get_pose_error(target_pose, current_pose):
     return error
 
 
+@th.jit.script
+def get_pose_error_batch(target_pose, current_pose):
+    """
+    Batched version of get_pose_error(). Computes the errors corresponding to target poses - current poses as 6-dim
+    vectors. The first 3 components correspond to translational error while the last 3 components correspond to the
+    rotational error.
+
+    Args:
+        target_pose (th.tensor): (..., 4, 4) homogenous matrices for the target poses
+        current_pose (th.tensor): (..., 4, 4) homogenous matrices for the current poses
+
+    Returns:
+        th.tensor: (..., 6) pose errors
+    """
+    # compute translational error
+    pos_err = target_pose[..., :3, 3] - current_pose[..., :3, 3]
+
+    # compute rotational error, summing the cross products of corresponding rotation matrix columns
+    rot_err = 0.5 * th.linalg.cross(current_pose[..., :3, :3], target_pose[..., :3, :3], dim=-2).sum(dim=-1)
+
+    return th.cat([pos_err, rot_err], dim=-1)
+
+
 @th.jit.script
 def matrix_inverse(matrix):
     """
@@ -69,14 +69,40 @@ class Remapper:
     """
 
     def __init__(self):
-        self.key_array = th.empty(0, dtype=th.int32, device="cuda")  # Initialize the key_array as empty
+        # The key_array is allocated lazily on the device of the first image that gets remapped
+        self.key_array = th.empty(0, dtype=th.int32)
         self.known_ids = set()
         self.warning_printed = set()
+        # Reverse (label -> new key) index of new_mapping, which is rebuilt whenever a lookup misses or is stale
+        self._label_to_key = dict()
 
     def clear(self):
         """Resets the key_array to empty."""
-        self.key_array = th.empty(0, dtype=th.int32, device="cuda")
+        self.key_array = th.empty(0, dtype=th.int32, device=self.key_array.device)
         self.known_ids = set()
+        self._label_to_key = dict()
+
+    def _get_new_key(self, new_mapping, label):
+        """
+        Finds the key that maps to @label in @new_mapping through the cached reverse label -> key index. The index is
+        rebuilt from @new_mapping whenever @label is missing from it, or its cached key no longer maps to @label, so
+        it never goes stale when @new_mapping is modified.
+
+        Args:
+            new_mapping (dict): The new mapping dictionary that maps a set of image values to labels
+            label (str): The label to look up
+
+        Returns:
+            None or int: The key in @new_mapping that maps to @label, or None if there is no such key. If multiple keys
+                share the same label, the first one is returned
+        """
+        key = self._label_to_key.get(label, None)
+        if key is None or new_mapping.get(key, None) != label:
+            self._label_to_key = dict()
+            for new_key, new_label in new_mapping.items():
+                self._label_to_key.setdefault(new_label, new_key)
+            key = self._label_to_key.get(label, None)
+        return key
 
     def remap(self, old_mapping, new_mapping, image, image_keys=None):
         """
@@ -90,51 +116,66 @@ class Remapper:
             new_mapping (dict): The new mapping dictionary that maps another set of image values to labels,
                 e.g. {5: 'desk', 7: 'chair', 100: 'unlabelled'}.
             image (th.tensor): The 2D image to remap, e.g. [[1, 3], [1, 2]].
-            image_keys (th.tensor): The unique keys in the image, e.g. [1, 2, 3].
+            image_keys (th.tensor): The sorted unique keys in the image, e.g. [1, 2, 3]. If not specified, this will be
+                computed with th.unique. Callers that already computed it should pass it in to avoid recomputing it
 
         Returns:
             th.tensor: The remapped image, e.g. [[5,100],[5,7]].
             dict: The remapped labels dictionary, e.g. {5: 'desk', 7: 'chair', 100: 'unlabelled'}.
         """
+        device = image.device
+        if image_keys is None:
+            image_keys = th.unique(image)
         # Make sure that max int32 doesn't match any value in the new mapping
-        assert th.all(
-            th.tensor(list(new_mapping.keys())) != th.iinfo(th.int32).max
-        ), "New mapping contains default unmapped value!"
-        image_max_key = th.max(image).item()
+        assert th.iinfo(th.int32).max not in new_mapping, "New mapping contains default unmapped value!"
+
+        if self.key_array.device != device:
+            self.key_array = self.key_array.to(device)
+
+        new_keys = list(old_mapping.keys() - self.known_ids)
+
+        # th.unique returns sorted keys, so the last one is the largest
+        max_key = max(image_keys[-1].item() if len(image_keys) > 0 else -1, max(new_keys, default=-1))
         key_array_max_key = len(self.key_array) - 1
-        if image_max_key > key_array_max_key:
-            prev_key_array = self.key_array.clone()
+        if max_key > key_array_max_key:
+            prev_key_array = self.key_array
             # We build a new key array and use max int32 as the default value.
-            self.key_array = th.full((image_max_key + 1,), th.iinfo(th.int32).max, dtype=th.int32, device="cuda")
+            self.key_array = th.full((max_key + 1,), th.iinfo(th.int32).max, dtype=th.int32, device=device)
             # Copy the previous key array into the new key array
             self.key_array[: len(prev_key_array)] = prev_key_array
 
-        new_keys = old_mapping.keys() - self.known_ids
         if new_keys:
             self.known_ids.update(new_keys)
             # Populate key_array with new keys
+            new_values = []
             for key in new_keys:
                 label = old_mapping[key]
-                new_key = next((k for k, v in new_mapping.items() if v == label), None)
+                new_key = self._get_new_key(new_mapping, label)
                 assert new_key is not None, f"Could not find a new key for label {label} in new_mapping!"
-                self.key_array[key] = new_key
+                new_values.append(new_key)
+            self.key_array[th.tensor(new_keys, dtype=th.long, device=device)] = th.tensor(
+                new_values, dtype=th.int32, device=device
+            )
 
         # For all the values that exist in the image but not in old_mapping.keys(), we map them to whichever key in
         # new_mapping that equals to 'unlabelled'. This is needed because some values in the image don't necessarily
         # show up in the old_mapping, i.e. particle systems.
-        for key in th.unique(image) if image_keys is None else image_keys:
-            if key.item() not in old_mapping.keys():
-                new_key = next((k for k, v in new_mapping.items() if v == "unlabelled"), None)
-                assert new_key is not None, f"Could not find a new key for label 'unlabelled' in new_mapping!"
-                self.key_array[key] = new_key
+        old_keys = th.tensor(list(old_mapping.keys()), dtype=image_keys.dtype, device=device)
+        unknown_keys = image_keys[~th.isin(image_keys, old_keys)]
+        if len(unknown_keys) > 0:
+            new_key = self._get_new_key(new_mapping, "unlabelled")
+            assert new_key is not None, f"Could not find a new key for label 'unlabelled' in new_mapping!"
+            self.key_array[unknown_keys.long()] = new_key
+            # These keys must be looked up again if they show up in old_mapping in a later frame
+            self.known_ids.difference_update(unknown_keys.tolist())
 
         # Apply remapping
         remapped_img = self.key_array[image]
+        # The remapped keys are exactly the remapped image keys, so we don't need to run th.unique on the whole image
+        remapped_keys = self.key_array[image_keys.long()]
         # Make sure all values are correctly remapped and not equal to the default value
-        assert th.all(remapped_img != th.iinfo(th.int32).max), "Not all keys in the image are in the key array!"
-        remapped_labels = {}
-        for key in th.unique(remapped_img):
-            remapped_labels[key.item()] = new_mapping[key.item()]
+        assert th.all(remapped_keys != th.iinfo(th.int32).max), "Not all keys in the image are in the key array!"
+        remapped_labels = {key: new_mapping[key] for key in th.unique(remapped_keys).tolist()}
 
         return remapped_img, remapped_labels
 
@@ -0,0 +1,157 @@
+"""
+Script to benchmark the flat-buffer grid planner against the legacy A* implementation, and the hierarchical grid planner
+against the flat one, on synthetic traversability maps.
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+import torch as th
+
+from omnigibson.utils.grid_planning_utils import GridPlanner, HierarchicalGridPlanner
+from omnigibson.utils.motion_planning_utils import astar as legacy_astar
+
+MAP_SIZES = [100, 500, 2000]
+
+
+def generate_synthetic_map(size, obstacle_ratio=0.2, seed=0):
+    """
+    Generates a square traversability map with random rectangular obstacles, leaving the corners free
+
+    Args:
+        size (int): Side length of the map in cells
+        obstacle_ratio (float): Approximate fraction of the map covered by obstacles
+        seed (int): Random seed
+
+    Returns:
+        th.Tensor: (size, size) uint8 map where 255 denotes traversable cells
+    """
+    rng = np.random.default_rng(seed)
+    trav_map = np.full((size, size), 255, dtype=np.uint8)
+    max_extent = max(2, size // 20)
+    n_obstacles = int(obstacle_ratio * size * size / (max_extent**2 / 2))
+    for row, col, height, width in zip(
+        rng.integers(0, size, n_obstacles),
+        rng.integers(0, size, n_obstacles),
+        rng.integers(1, max_extent, n_obstacles),
+        rng.integers(1, max_extent, n_obstacles),
+    ):
+        trav_map[row : row + height, col : col + width] = 0
+    corner = max(1, size // 20)
+    trav_map[:corner, :corner] = 255
+    trav_map[-corner:, -corner:] = 255
+    return th.tensor(trav_map)
+
+
+def generate_synthetic_rooms_map(size, room_size=50, door_width=8, seed=0):
+    """
+    Generates a square, house-like traversability map made of a grid of rooms, where each wall between two adjacent
+    rooms has a single randomly-placed door
+
+    Args:
+        size (int): Side length of the map in cells
+        room_size (int): Side length of each room in cells
+        door_width (int): Width of each door in cells
+        seed (int): Random seed
+
+    Returns:
+        th.Tensor: (size, size) uint8 map where 255 denotes traversable cells
+    """
+    rng = np.random.default_rng(seed)
+    trav_map = np.full((size, size), 255, dtype=np.uint8)
+    room_size = min(room_size, size // 2)
+    door_width = min(door_width, room_size - 2)
+    for wall in range(room_size, size, room_size):
+        trav_map[wall, :] = 0
+        trav_map[:, wall] = 0
+    for wall in range(room_size, size, room_size):
+        for room_start in range(0, size, room_size):
+            room_end = min(room_start + room_size, size)
+            if room_end - room_start <= door_width + 2:
+                continue
+            for door_start in rng.integers(room_start + 1, room_end - door_width, 2):
+                trav_map[wall, door_start : door_start + door_width] = 255
+                trav_map[door_start : door_start + door_width, wall] = 255
+    return th.tensor(trav_map)
+
+
+def path_cost(path):
+    if path is None:
+        return None
+    steps = th.abs(path[1:] - path[:-1]).sum(dim=1)
+    return float(th.where(steps == 2, math.sqrt(2), 1.0).sum())
+
+
+def benchmark_size(size, n_queries, eight_connected, run_legacy, rooms=False):
+    trav_map = generate_synthetic_rooms_map(size) if rooms else generate_synthetic_map(size)
+    start, goal = (0, 0), (size - 1, size - 1)
+
+    t_start = time.time()
+    planner = GridPlanner(trav_map, eight_connected=eight_connected)
+    t_build = time.time() - t_start
+
+    t_start = time.time()
+    for _ in range(n_queries):
+        path = planner.plan(start, goal)
+    t_plan = (time.time() - t_start) / n_queries
+
+    print(f"\n{size}x{size} {'rooms' if rooms else 'obstacles'} map, {'8' if eight_connected else '4'}-connected")
+    print(f"  GridPlanner: build {t_build * 1e3:.1f} ms, query {t_plan * 1e3:.1f} ms, expanded {planner.n_expanded}")
+
+    if run_legacy:
+        t_start = time.time()
+        legacy_path = legacy_astar(trav_map, start, goal, eight_connected=eight_connected)
+        t_legacy = time.time() - t_start
+        print(f"  legacy astar: query {t_legacy * 1e3:.1f} ms, speedup {t_legacy / (t_build + t_plan):.1f}x")
+        assert (path is None) == (legacy_path is None), "Planners disagree on path existence!"
+        if path is not None:
+            assert math.isclose(path_cost(path), path_cost(legacy_path), rel_tol=1e-6), "Path costs differ!"
+    else:
+        print("  legacy astar: skipped")
+
+    t_start = time.time()
+    hierarchical_planner = HierarchicalGridPlanner(trav_map, eight_connected=eight_connected)
+    t_build = time.time() - t_start
+
+    t_start = time.time()
+    for _ in range(n_queries):
+        hierarchical_path = hierarchical_planner.plan(start, goal)
+    t_plan = (time.time() - t_start) / n_queries
+
+    print(
+        f"  HierarchicalGridPlanner: build {t_build * 1e3:.1f} ms, query {t_plan * 1e3:.1f} ms, "
+        f"expanded {hierarchical_planner.n_expanded} ({hierarchical_planner.n_expanded / planner.n_expanded:.2f}x)"
+    )
+    assert (path is None) == (hierarchical_path is None), "Planners disagree on path existence!"
+    if path is not None:
+        print(f"  hierarchical / optimal path cost: {path_cost(hierarchical_path) / path_cost(path):.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark grid planners on synthetic traversability maps")
+    parser.add_argument("--sizes", type=int, nargs="+", default=MAP_SIZES, help="Map side lengths to benchmark")
+    parser.add_argument("--n-queries", type=int, default=5, help="Number of repeated queries for the grid planner")
+    parser.add_argument(
+        "--max-legacy-size",
+        type=int,
+        default=max(MAP_SIZES),
+        help="Largest map size on which to also run the (slow) legacy astar",
+    )
+    parser.add_argument("--four-connected", action="store_true", help="Use 4-connectivity instead of 8-connectivity")
+    args = parser.parse_args()
+
+    for rooms in (False, True):
+        for size in args.sizes:
+            benchmark_size(
+                size=size,
+                n_queries=args.n_queries,
+                eight_connected=not args.four_connected,
+                run_legacy=size <= args.max_legacy_size,
+                rooms=rooms,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Script to benchmark the segmentation Remapper on synthetic 1024x1024 segmentation frames, on CPU and (if available) GPU.
+"""
+
+import argparse
+import time
+
+import torch as th
+
+from omnigibson.utils.vision_utils import Remapper
+
+N_LABELS = [10, 100, 1000, 10000]
+
+
+def generate_synthetic_frames(n_labels, n_frames, resolution=1024, n_unknown=4, seed=0):
+    """
+    Generates synthetic segmentation frames made of random rectangular blobs, along with the replicator-style mapping
+    from image values to labels and the mapping from our own ids to labels
+
+    Args:
+        n_labels (int): Number of distinct labels
+        n_frames (int): Number of frames to generate
+        resolution (int): Side length of each frame in pixels
+        n_unknown (int): Number of image values per frame that are not in the old mapping
+        seed (int): Random seed
+
+    Returns:
+        3-tuple:
+            - list of th.Tensor: (resolution, resolution) int32 frames
+            - dict: Mapping from image values to labels
+            - dict: Mapping from new ids to labels, including 'unlabelled'
+    """
+    generator = th.Generator().manual_seed(seed)
+    # Sparse, replicator-like image values
+    image_values = th.randperm(n_labels * 10, generator=generator)[:n_labels] + 2
+    old_mapping = {value: f"label_{i}" for i, value in enumerate(image_values.tolist())}
+    new_mapping = {i: f"label_{i}" for i in range(n_labels)}
+    new_mapping[n_labels] = "unlabelled"
+    unknown_values = th.arange(n_unknown) + n_labels * 10 + 2
+
+    frames = []
+    blob_size = max(8, resolution // int(n_labels**0.5 + 1))
+    n_blobs = (resolution // blob_size) ** 2
+    for _ in range(n_frames):
+        values = th.cat([image_values, unknown_values])
+        blobs = values[th.randint(len(values), (n_blobs,), generator=generator)]
+        side = resolution // blob_size
+        frame = blobs.reshape(side, side).repeat_interleave(blob_size, 0).repeat_interleave(blob_size, 1)
+        frame = th.nn.functional.pad(frame, (0, resolution - frame.shape[1], 0, resolution - frame.shape[0]))
+        frames.append(frame.to(th.int32))
+    return frames, old_mapping, new_mapping
+
+
+def benchmark_n_labels(n_labels, n_frames, device):
+    frames, old_mapping, new_mapping = generate_synthetic_frames(n_labels, n_frames)
+    frames = [frame.to(device) for frame in frames]
+    remapper = Remapper()
+
+    def sync():
+        if device.startswith("cuda"):
+            th.cuda.synchronize()
+
+    sync()
+    t_start = time.time()
+    image_keys = th.unique(frames[0])
+    remapper.remap(old_mapping, new_mapping, frames[0], image_keys)
+    sync()
+    t_cold = time.time() - t_start
+
+    t_unique, t_remap = 0.0, 0.0
+    for frame in frames[1:]:
+        t_start = time.time()
+        image_keys = th.unique(frame)
+        sync()
+        t_unique += time.time() - t_start
+        t_start = time.time()
+        remapper.remap(old_mapping, new_mapping, frame, image_keys)
+        sync()
+        t_remap += time.time() - t_start
+
+    n_warm = max(n_frames - 1, 1)
+    print(
+        f"  {n_labels} labels: first frame {t_cold * 1e3:.1f} ms, then th.unique {t_unique / n_warm * 1e3:.1f} ms + "
+        f"remap {t_remap / n_warm * 1e3:.1f} ms per frame"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the segmentation Remapper on synthetic 1024x1024 frames")
+    parser.add_argument("--n-labels", type=int, nargs="+", default=N_LABELS, help="Number of labels to benchmark")
+    parser.add_argument("--n-frames", type=int, default=20, help="Number of frames to remap per run")
+    args = parser.parse_args()
+
+    devices = ["cpu"] + (["cuda"] if th.cuda.is_available() else [])
+    for device in devices:
+        print(f"\nDevice: {device}")
+        for n_labels in args.n_labels:
+            benchmark_n_labels(n_labels=n_labels, n_frames=args.n_frames, device=device)
+
+
+if __name__ == "__main__":
+    main()
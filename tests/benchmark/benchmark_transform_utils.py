@@ -0,0 +1,128 @@
+"""
+Microbenchmark suite for omnigibson.utils.transform_utils on CPU. Requires pytest-benchmark, and is meant to be run
+explicitly, e.g.:
+
+    pytest tests/benchmark/benchmark_transform_utils.py --benchmark-group-by=func
+
+Functions that support leading batch dimensions (including the *_batch pose kernels) are benchmarked with N = 1, 100,
+and 10k inputs, while functions that only operate on a single input are benchmarked with a single call.
+"""
+
+import math
+
+import pytest
+import torch as th
+
+import omnigibson.utils.transform_utils as T
+
+BATCH_SIZES = [1, 100, 10000]
+
+
+def _vecs(n):
+    return th.rand(n, 3) * 2.0 - 1.0
+
+
+def _quats(n):
+    return T.random_quaternion(n)
+
+
+def _mats(n):
+    return T.quat2mat(_quats(n))
+
+
+def _hmats(n):
+    return T.pose2mat_batch((_vecs(n), _quats(n)))
+
+
+# Maps function name to (function, function taking batch size N and returning the function's positional arguments)
+BATCHED_CASES = {
+    "copysign": (T.copysign, lambda n: (1.0, th.randn(n))),
+    "anorm": (lambda x: T.anorm(x, dim=-1), lambda n: (_vecs(n),)),
+    "normalize": (lambda v: T.normalize(v, dim=-1), lambda n: (_vecs(n),)),
+    "dot": (lambda v1, v2: T.dot(v1, v2, dim=-1), lambda n: (_vecs(n), _vecs(n))),
+    "unit_vector": (lambda data: T.unit_vector(data, dim=-1), lambda n: (_vecs(n),)),
+    "quat_apply": (T.quat_apply, lambda n: (_quats(n).unsqueeze(1), _vecs(n).unsqueeze(1))),
+    "quat_slerp": (T.quat_slerp, lambda n: (_quats(n), _quats(n), th.rand(n, 1))),
+    "quat2mat": (T.quat2mat, lambda n: (_quats(n),)),
+    "mat2quat": (T.mat2quat, lambda n: (_mats(n),)),
+    "euler2quat": (T.euler2quat, lambda n: (_vecs(n) * math.pi,)),
+    "quat2euler": (T.quat2euler, lambda n: (_quats(n),)),
+    "euler2mat": (T.euler2mat, lambda n: (_vecs(n) * math.pi,)),
+    "mat2euler": (T.mat2euler, lambda n: (_mats(n),)),
+    "quat2axisangle": (T.quat2axisangle, lambda n: (_quats(n),)),
+    "axisangle2quat": (T.axisangle2quat, lambda n: (_vecs(n),)),
+    "pose_in_A_to_pose_in_B": (T.pose_in_A_to_pose_in_B, lambda n: (_hmats(n), _hmats(n))),
+    "matrix_inverse": (T.matrix_inverse, lambda n: (_mats(n),)),
+    "vecs2axisangle": (T.vecs2axisangle, lambda n: (_vecs(n), _vecs(n))),
+    "vecs2quat": (T.vecs2quat, lambda n: (_vecs(n), _vecs(n))),
+    "align_vector_sets": (T.align_vector_sets, lambda n: (_vecs(n), _vecs(n))),
+    "l2_distance": (T.l2_distance, lambda n: (_vecs(n), _vecs(n))),
+    "cartesian_to_polar": (T.cartesian_to_polar, lambda n: (th.randn(n), th.randn(n))),
+    "z_angle_from_quat": (T.z_angle_from_quat, lambda n: (_quats(n),)),
+    "random_quaternion": (T.random_quaternion, lambda n: (n,)),
+    "transform_points": (T.transform_points, lambda n: (_vecs(n), _hmats(1)[0])),
+    "pose2mat_batch": (T.pose2mat_batch, lambda n: ((_vecs(n), _quats(n)),)),
+    "mat2pose_batch": (T.mat2pose_batch, lambda n: (_hmats(n),)),
+    "pose_inv_batch": (T.pose_inv_batch, lambda n: (_hmats(n),)),
+    "pose_transform_batch": (T.pose_transform_batch, lambda n: (_vecs(n), _quats(n), _vecs(n), _quats(n))),
+    "invert_pose_transform_batch": (T.invert_pose_transform_batch, lambda n: (_vecs(n), _quats(n))),
+    "relative_pose_transform_batch": (
+        T.relative_pose_transform_batch,
+        lambda n: (_vecs(n), _quats(n), _vecs(n), _quats(n)),
+    ),
+    "get_pose_error_batch": (T.get_pose_error_batch, lambda n: (_hmats(n), _hmats(n))),
+}
+
+# Maps function name to (function, function returning the function's positional arguments for a single input)
+# NOTE: vel_in_A_to_vel_in_B, force_in_A_to_force_in_B, and get_orientation_error are not covered since they currently
+# fail under TorchScript for valid single inputs
+SINGLE_CASES = {
+    "convert_quat": (T.convert_quat, lambda: (_quats(1)[0],)),
+    "quat_multiply": (T.quat_multiply, lambda: (_quats(1)[0], _quats(1)[0])),
+    "quat_conjugate": (T.quat_conjugate, lambda: (_quats(1)[0],)),
+    "quat_inverse": (T.quat_inverse, lambda: (_quats(1)[0],)),
+    "quat_distance": (T.quat_distance, lambda: (_quats(1)[0], _quats(1)[0])),
+    "random_axis_angle": (T.random_axis_angle, lambda: ()),
+    "mat2pose": (T.mat2pose, lambda: (_hmats(1)[0],)),
+    "vec2quat": (T.vec2quat, lambda: (_vecs(1)[0],)),
+    "pose2mat": (T.pose2mat, lambda: ((_vecs(1)[0], _quats(1)[0]),)),
+    "pose_inv": (T.pose_inv, lambda: (_hmats(1)[0],)),
+    "pose_transform": (T.pose_transform, lambda: (_vecs(1)[0], _quats(1)[0], _vecs(1)[0], _quats(1)[0])),
+    "invert_pose_transform": (T.invert_pose_transform, lambda: (_vecs(1)[0], _quats(1)[0])),
+    "relative_pose_transform": (
+        T.relative_pose_transform,
+        lambda: (_vecs(1)[0], _quats(1)[0], _vecs(1)[0], _quats(1)[0]),
+    ),
+    "rotation_matrix": (T.rotation_matrix, lambda: (0.5, _vecs(1)[0])),
+    "transformation_matrix": (T.transformation_matrix, lambda: (0.5, _vecs(1)[0], _vecs(1)[0])),
+    "clip_translation": (T.clip_translation, lambda: (_vecs(1)[0], th.tensor(0.5))),
+    "clip_rotation": (T.clip_rotation, lambda: (_quats(1)[0], th.tensor(0.5))),
+    "make_pose": (T.make_pose, lambda: (_vecs(1)[0], _mats(1)[0])),
+    "get_orientation_diff_in_radian": (T.get_orientation_diff_in_radian, lambda: (_quats(1)[0], _quats(1)[0])),
+    "get_pose_error": (T.get_pose_error, lambda: (_hmats(1)[0], _hmats(1)[0])),
+    "check_quat_right_angle": (T.check_quat_right_angle, lambda: (_quats(1)[0],)),
+    "integer_spiral_coordinates": (T.integer_spiral_coordinates, lambda: (1000,)),
+    "quaternions_close": (T.quaternions_close, lambda: (_quats(1)[0], _quats(1)[0])),
+    "deg2rad": (T.deg2rad, lambda: (th.rand(1),)),
+    "rad2deg": (T.rad2deg, lambda: (th.rand(1),)),
+}
+
+
+@pytest.fixture(autouse=True)
+def _fixed_seed():
+    th.manual_seed(0)
+
+
+@pytest.mark.parametrize("n", BATCH_SIZES)
+@pytest.mark.parametrize("name", list(BATCHED_CASES.keys()))
+def test_batched(benchmark, name, n):
+    benchmark.group = name
+    fn, make_args = BATCHED_CASES[name]
+    benchmark(fn, *make_args(n))
+
+
+@pytest.mark.parametrize("name", list(SINGLE_CASES.keys()))
+def test_single(benchmark, name):
+    benchmark.group = name
+    fn, make_args = SINGLE_CASES[name]
+    benchmark(fn, *make_args())
@@ -0,0 +1,129 @@
+import torch as th
+
+from omnigibson.object_states import AABB
+from omnigibson.object_states.adjacency import (
+    RayBackend,
+    compute_adjacencies,
+    compute_adjacencies_batch,
+    flatten_planes,
+    get_equidistant_coordinate_planes,
+)
+from omnigibson.utils.constants import PrimType
+
+
+class FakeAABBState:
+    def __init__(self, lower, upper):
+        self.value = (th.tensor(lower, dtype=th.float32), th.tensor(upper, dtype=th.float32))
+
+    def get_value(self):
+        return self.value
+
+
+class FakeScene:
+    def __init__(self):
+        self.objs_by_link_path = dict()
+
+    def object_registry(self, key, value, default_val=None):
+        assert key in {"link_prim_paths", "prim_path"}
+        return self.objs_by_link_path.get(value, default_val) if key == "link_prim_paths" else default_val
+
+
+class FakeObject:
+    def __init__(self, name, scene, lower, upper):
+        self.name = name
+        self.scene = scene
+        self.prim_type = PrimType.RIGID
+        self.link_prim_paths = [f"/World/scene_0/{name}/base_link"]
+        self.states = {AABB: FakeAABBState(lower, upper)}
+        scene.objs_by_link_path[self.link_prim_paths[0]] = self
+
+    def __repr__(self):
+        return self.name
+
+
+class FakeRayBackend(RayBackend):
+    """
+    Casts rays against the AABBs of a set of objects, and counts how many times it was called
+    """
+
+    def __init__(self, objs):
+        self.objs = objs
+        self.n_calls = 0
+
+    def raycast_all(self, start_points, end_points):
+        self.n_calls += 1
+        results = []
+        for start, end in zip(start_points, end_points):
+            hits = []
+            for obj in self.objs:
+                lower, upper = obj.states[AABB].get_value()
+                # Slab test of the segment against the AABB
+                delta = end - start
+                t0 = th.where(delta != 0, (lower - start) / delta, th.full_like(delta, -float("inf")))
+                t1 = th.where(delta != 0, (upper - start) / delta, th.full_like(delta, float("inf")))
+                outside = (delta == 0) & ((start < lower) | (start > upper))
+                t_enter = th.minimum(t0, t1).max().clamp(min=0.0)
+                t_exit = th.maximum(t0, t1).min().clamp(max=1.0)
+                if outside.any() or t_enter > t_exit:
+                    continue
+                hits.append(
+                    {
+                        "hit": True,
+                        "position": start + t_enter * delta,
+                        "distance": (t_enter * th.norm(delta)).item(),
+                        "rigidBody": obj.link_prim_paths[0],
+                    }
+                )
+            results.append(hits)
+        return results
+
+
+def _make_scene():
+    scene = FakeScene()
+    table = FakeObject("table", scene, [-1.0, -1.0, 0.0], [1.0, 1.0, 1.0])
+    cup = FakeObject("cup", scene, [-0.1, -0.1, 1.0], [0.1, 0.1, 1.2])
+    lamp = FakeObject("lamp", scene, [-0.2, -0.2, 2.0], [0.2, 0.2, 2.5])
+    chair = FakeObject("chair", scene, [1.5, -0.5, 0.0], [2.5, 0.5, 1.0])
+    return scene, [table, cup, lamp, chair]
+
+
+def test_vertical_adjacency_with_fake_backend():
+    _, (table, cup, lamp, chair) = _make_scene()
+    backend = FakeRayBackend([table, cup, lamp, chair])
+
+    adjacency = compute_adjacencies(cup, th.tensor([[0, 0, 1]]), 5.0, use_aabb_center=False, ray_backend=backend)[0]
+    assert adjacency.positive_neighbors == {lamp}
+    assert adjacency.negative_neighbors == {table}
+
+    # Rays are cast once to find the start points on the object's surface, and once to find its neighbors
+    assert backend.n_calls == 2
+
+
+def test_horizontal_adjacency_with_fake_backend():
+    _, (table, cup, lamp, chair) = _make_scene()
+    backend = FakeRayBackend([table, cup, lamp, chair])
+
+    axes = get_equidistant_coordinate_planes(5).reshape(-1, 3)
+    adjacencies = compute_adjacencies(table, axes, 5.0, use_aabb_center=True, ray_backend=backend)
+    neighbors = set().union(*(adj.positive_neighbors | adj.negative_neighbors for adj in adjacencies))
+    assert neighbors == {chair}
+    assert chair in adjacencies[0].positive_neighbors and chair not in adjacencies[0].negative_neighbors
+    assert backend.n_calls == 1
+
+    bodies_by_plane = list(zip(adjacencies[::2], adjacencies[1::2]))
+    assert len(list(flatten_planes(bodies_by_plane))) == len(axes)
+
+
+def test_batched_adjacencies_match_individual_ones():
+    _, objs = _make_scene()
+    vertical_axes = th.tensor([[0, 0, 1]])
+    horizontal_axes = get_equidistant_coordinate_planes(5).reshape(-1, 3)
+    requests = [(obj, vertical_axes, 5.0, False) for obj in objs] + [(obj, horizontal_axes, 5.0, True) for obj in objs]
+
+    backend = FakeRayBackend(objs)
+    batched = compute_adjacencies_batch(requests, ray_backend=backend)
+    assert backend.n_calls == 2
+
+    individual = [compute_adjacencies(*request, ray_backend=FakeRayBackend(objs)) for request in requests]
+    assert batched == individual
+    assert compute_adjacencies_batch([], ray_backend=backend) == []
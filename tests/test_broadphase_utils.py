@@ -0,0 +1,124 @@
+import pytest
+import torch as th
+
+import omnigibson.utils.transform_utils as T
+from omnigibson.utils.broadphase_utils import AABBBroadphase, PointSpatialHash, aabb_distance, spheres_overlap_aabbs
+
+
+def _random_aabbs(n, scene_size=10.0, max_size=0.5):
+    lowers = th.rand(n, 3) * scene_size
+    uppers = lowers + th.rand(n, 3) * max_size
+    return lowers, uppers
+
+
+def _brute_force_pairs(lowers, uppers, margin):
+    n = len(lowers)
+    return {
+        (i, j)
+        for i in range(n)
+        for j in range(i + 1, n)
+        if aabb_distance(lowers[i], uppers[i], lowers[j], uppers[j]).item() <= margin
+    }
+
+
+def test_aabb_distance():
+    lower = th.zeros(3)
+    upper = th.ones(3)
+    assert aabb_distance(lower, upper, lower + 0.5, upper + 0.5).item() == 0.0
+    assert aabb_distance(lower, upper, lower + th.tensor([2.0, 0, 0]), upper + th.tensor([2.0, 0, 0])).item() == 1.0
+    assert aabb_distance(lower, upper, lower + 4.0, upper + 4.0).item() == pytest.approx(3.0**1.5)
+
+
+@pytest.mark.parametrize("margin", [0.0, 0.1, 1.5])
+def test_query_pairs_matches_brute_force(margin):
+    th.manual_seed(0)
+    lowers, uppers = _random_aabbs(200)
+    # Add a few large boxes, e.g. floors and walls, that are compared against all other boxes
+    lowers = th.cat([lowers, th.tensor([[-1.0, -1.0, -0.1], [0.0, 5.0, 0.0]])])
+    uppers = th.cat([uppers, th.tensor([[11.0, 11.0, 0.0], [10.0, 5.1, 3.0]])])
+    keys = [f"obj{i}" for i in range(len(lowers))]
+
+    broadphase = AABBBroadphase(cell_size=1.0, max_cells_per_box=16)
+    broadphase.update(keys=keys, lowers=lowers, uppers=uppers)
+
+    expected = _brute_force_pairs(lowers, uppers, margin)
+    assert set(map(tuple, broadphase.query_pair_indices(margin=margin).tolist())) == expected
+    assert set(broadphase.query_pairs(margin=margin)) == {(keys[i], keys[j]) for i, j in expected}
+    for i, j in list(expected)[:10]:
+        assert broadphase.are_near(keys[i], keys[j], margin=margin)
+
+
+def test_query():
+    broadphase = AABBBroadphase(cell_size=0.5)
+    broadphase.update(
+        keys=["a", "b", "c"],
+        lowers=th.tensor([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [10.0, 10.0, 10.0]]),
+        uppers=th.tensor([[1.0, 1.0, 1.0], [3.0, 1.0, 1.0], [11.0, 11.0, 11.0]]),
+    )
+    assert len(broadphase) == 3 and "a" in broadphase and "d" not in broadphase
+    assert set(broadphase.query(th.tensor([1.1, 0.0, 0.0]), th.tensor([1.9, 1.0, 1.0]))) == set()
+    assert set(broadphase.query(th.tensor([1.1, 0.0, 0.0]), th.tensor([1.9, 1.0, 1.0]), margin=0.2)) == {"a", "b"}
+    assert broadphase.query_pairs(margin=0.5) == []
+    assert broadphase.query_pairs(margin=1.0) == [("a", "b")]
+    assert not broadphase.are_near("a", "c", margin=1.0)
+
+    # Updating the index replaces all of its boxes
+    broadphase.update(keys=["c"], lowers=th.zeros((1, 3)), uppers=th.ones((1, 3)))
+    assert broadphase.keys == ["c"]
+    assert broadphase.query_pairs(margin=1.0) == []
+
+
+def test_spheres_overlap_aabbs_matches_brute_force():
+    th.manual_seed(0)
+    lowers, uppers = _random_aabbs(200)
+    centers = th.rand(1000, 3) * 10.0
+    radius = 0.2
+    expected = th.tensor(
+        [
+            any(aabb_distance(lower, upper, center, center).item() <= radius for lower, upper in zip(lowers, uppers))
+            for center in centers
+        ]
+    )
+    # Small chunks should not change the results
+    for max_chunk_elements in (2**22, 7):
+        overlaps = spheres_overlap_aabbs(centers, radius, lowers, uppers, max_chunk_elements=max_chunk_elements)
+        assert th.equal(overlaps, expected)
+
+    broadphase = AABBBroadphase()
+    broadphase.update(keys=list(range(len(lowers))), lowers=lowers, uppers=uppers)
+    assert th.equal(broadphase.query_spheres(centers, radius), expected)
+
+
+def test_spheres_overlap_unbounded_aabbs():
+    # e.g.: a floor plane, as an AABB that is unbounded below its top
+    lowers = th.tensor([[-th.inf, -th.inf, -th.inf]])
+    uppers = th.tensor([[th.inf, th.inf, 0.0]])
+    centers = th.tensor([[100.0, -5.0, 0.05], [0.0, 0.0, 0.15], [0.0, 0.0, -1.0]])
+    assert spheres_overlap_aabbs(centers, 0.1, lowers, uppers).tolist() == [True, False, True]
+    assert not spheres_overlap_aabbs(th.zeros((0, 3)), 0.1, lowers, uppers).any()
+
+
+def test_point_spatial_hash_queries_match_brute_force():
+    th.manual_seed(0)
+    points = th.rand(5000, 3) * 2.0 - 1.0
+    spatial_hash = PointSpatialHash(cell_size=0.1)
+    spatial_hash.update(points)
+    assert len(spatial_hash) == len(points)
+
+    lower, upper = th.tensor([-0.3, -0.2, 0.1]), th.tensor([0.25, 0.4, 0.3])
+    expected = th.nonzero(((lower <= points) & (points <= upper)).all(dim=-1)).flatten()
+    assert th.equal(spatial_hash.query_box(lower, upper), expected)
+
+    center, radius = th.tensor([0.1, -0.2, 0.3]), 0.35
+    expected = th.nonzero(th.norm(points - center, dim=-1) <= radius).flatten()
+    assert th.equal(spatial_hash.query_sphere(center, radius), expected)
+
+    pos, quat, half_extent = th.tensor([0.2, 0.1, -0.1]), T.random_quaternion(1)[0], th.tensor([0.4, 0.1, 0.2])
+    local_points = (points - pos) @ T.quat2mat(quat)
+    expected = th.nonzero((local_points.abs() <= half_extent).all(dim=-1)).flatten()
+    assert th.equal(spatial_hash.query_oriented_box(pos, quat, half_extent), expected)
+
+    # Queries outside of all occupied cells, and queries on an empty hash, return no points
+    assert len(spatial_hash.query_box(th.tensor([5.0, 5.0, 5.0]), th.tensor([6.0, 6.0, 6.0]))) == 0
+    spatial_hash.update(th.zeros((0, 3)))
+    assert len(spatial_hash.query_sphere(th.zeros(3), 1.0)) == 0
@@ -0,0 +1,238 @@
+import threading
+
+import h5py
+import pytest
+import torch as th
+
+from omnigibson.utils.data_utils import (
+    AsyncWriter,
+    HDF5DatasetReader,
+    HDF5TrajectoryWriter,
+    get_playback_shards,
+    get_shard_path,
+    is_shard_complete,
+    run_sharded_playback,
+)
+
+
+def _step_data(i):
+    return {
+        "action": th.full((3,), float(i)),
+        "reward": 0.5 * i,
+        "terminated": False,
+        "obs": {"rgb": th.full((4, 4, 3), i, dtype=th.uint8), "proprio": th.full((5,), float(i))},
+    }
+
+
+@pytest.mark.parametrize("buffer_size", [1, 4])
+def test_trajectory_writer(tmp_path, buffer_size):
+    with h5py.File(tmp_path / "data.hdf5", "w") as f:
+        writer = HDF5TrajectoryWriter(
+            parent_group=f.require_group("data"), name="demo_0", compression={"rgb": "gzip"}, buffer_size=buffer_size
+        )
+        # First step is missing the action, as is the case for the initial state during data collection
+        writer.append({"obs": _step_data(0)["obs"]})
+        for i in range(1, 10):
+            writer.append(_step_data(i))
+        traj_grp = writer.close()
+
+        assert traj_grp.attrs["num_samples"] == 10
+        assert traj_grp["obs/rgb"].shape == (10, 4, 4, 3)
+        assert traj_grp["obs/rgb"].compression == "gzip"
+        assert traj_grp["obs/proprio"].compression is None
+        assert traj_grp["action"].shape == (9, 3)
+        assert traj_grp["terminated"].dtype == bool
+        assert th.equal(th.from_numpy(traj_grp["obs/rgb"][:, 0, 0, 0]), th.arange(10, dtype=th.uint8))
+        assert th.allclose(th.from_numpy(traj_grp["reward"][()]), 0.5 * th.arange(1, 10))
+
+
+def test_trajectory_writer_padding_and_discard(tmp_path):
+    with h5py.File(tmp_path / "data.hdf5", "w") as f:
+        writer = HDF5TrajectoryWriter(f.require_group("data"), "demo_0", pad_keys=("state",), buffer_size=2)
+        for size in (3, 5, 2, 7, 1):
+            writer.append({"state": th.ones(size), "state_size": size})
+        state = th.from_numpy(writer.close()["state"][()])
+        assert state.shape == (5, 7)
+        assert state.sum(dim=1).tolist() == [3, 5, 2, 7, 1]
+
+        writer = HDF5TrajectoryWriter(f["data"], "demo_1")
+        writer.append({"state": th.ones(3)})
+        writer.discard()
+        assert "demo_1" not in f["data"]
+        assert "demo_0" in f["data"]
+
+
+def test_async_writer():
+    writer = AsyncWriter(max_queue_size=2)
+    gate = threading.Event()
+    results = []
+    writer.submit(gate.wait, n_items=0)
+    for i in range(2):
+        writer.submit(lambda i=i: results.append(i))
+    # Queue is full while the first job is blocked, so further submissions exert back-pressure
+    assert writer.queue_depth == 2
+    gate.set()
+    for i in range(2, 10):
+        writer.submit(lambda i=i: results.append(i))
+    writer.drain()
+    assert results == list(range(10))
+    assert writer.queue_depth == 0
+    assert writer.n_jobs_completed == 11
+    assert writer.n_items_written == 10
+    writer.close()
+
+
+def test_async_writer_error():
+    writer = AsyncWriter()
+
+    def fail():
+        raise ValueError("write failed")
+
+    writer.submit(fail)
+    with pytest.raises(RuntimeError):
+        writer.drain()
+
+
+def _write_dataset(path, episode_lengths):
+    with h5py.File(path, "w") as f:
+        data_grp = f.create_group("data")
+        data_grp.attrs["config"] = '{"env": {}}'
+        for episode_id, length in enumerate(episode_lengths):
+            # Uncompressed contiguous datasets, as written by DataWrapper.process_traj_to_hdf5()
+            traj_grp = data_grp.create_group(f"demo_{episode_id}")
+            traj_grp.attrs["num_samples"] = length
+            traj_grp.create_dataset("state", data=th.arange(length * 2, dtype=th.float32).reshape(length, 2))
+            traj_grp.create_dataset("action", data=th.full((length - 1, 3), episode_id, dtype=th.float32))
+        # Compressed chunked datasets, as written by HDF5TrajectoryWriter
+        writer = HDF5TrajectoryWriter(data_grp, f"demo_{len(episode_lengths)}", compression="gzip")
+        for i in range(4):
+            writer.append({"state": th.full((2,), i, dtype=th.float32), "obs": {"rgb": th.full((2, 2), i)}})
+        writer.close()
+
+
+def test_dataset_reader(tmp_path):
+    path = str(tmp_path / "data.hdf5")
+    _write_dataset(path, episode_lengths=[5, 8])
+
+    with HDF5DatasetReader(path) as reader:
+        assert reader.episode_ids == [0, 1, 2]
+        assert reader.episode_lengths == {0: 5, 1: 8, 2: 4}
+        assert reader.n_samples == 17
+        assert reader.config == {"env": {}}
+        assert sorted(reader.get_keys(2)) == ["obs/rgb", "state"]
+
+        # Uncompressed datasets are memory mapped, compressed ones are not
+        assert reader._get_memmap(1, "state") is not None
+        assert reader._get_memmap(2, "state") is None
+        assert th.equal(reader.get(1, "state", 2, 4), th.tensor([[4.0, 5.0], [6.0, 7.0]]))
+        assert th.equal(reader.get(2, "obs/rgb", 1, 3)[:, 0, 0], th.tensor([1, 2]))
+        assert th.equal(reader.get_step(1, 3, keys=["action"])["action"], th.ones(3))
+
+        # Windows must fit within every requested dataset, e.g.: there is one fewer action than states
+        index = reader.get_window_index(window_size=3, keys=["state", "action"])
+        assert index.tolist() == [[0, 0], [0, 1], [1, 0], [1, 1], [1, 2], [1, 3], [1, 4]]
+        assert len(reader.get_window_index(window_size=3, keys=["state"], stride=2)) == 2 + 3 + 1
+
+        windows = list(reader.iterate_windows(window_size=2, keys=["state"], shuffle=True))
+        assert len(windows) == 4 + 7 + 3
+        for episode_id, t, window in windows:
+            assert th.equal(window["state"], reader.get(episode_id, "state")[t : t + 2])
+
+
+def _stub_playback_worker(input_path, shards, played_episodes, fail_at_episode=None):
+    # Mimics DataPlaybackWrapper: records each episode's state as an observation, and finalizes each shard file
+    with h5py.File(input_path, "r") as in_f:
+        for episode_ids, shard_path in shards:
+            with h5py.File(shard_path, "w") as f:
+                data_grp = f.create_group("data")
+                data_grp.attrs["config"] = in_f["data"].attrs["config"]
+                data_grp.attrs["episode_ids"] = episode_ids
+                for i, episode_id in enumerate(episode_ids):
+                    if episode_id == fail_at_episode:
+                        raise RuntimeError("Worker crashed!")
+                    played_episodes.append(episode_id)
+                    state = in_f[f"data/demo_{episode_id}/state"][()]
+                    traj_grp = data_grp.create_group(f"demo_{i}")
+                    traj_grp.attrs["num_samples"] = len(state)
+                    traj_grp.create_dataset("obs/state", data=state)
+                data_grp.attrs["n_steps"] = sum(data_grp[name].attrs["num_samples"] for name in data_grp)
+                data_grp.attrs["n_episodes"] = len(episode_ids)
+
+
+def test_playback_shards():
+    assert get_playback_shards([4, 0, 3, 1, 2], episodes_per_shard=2) == [[0, 1], [2, 3], [4]]
+    assert get_shard_path("/data/out.hdf5", 3) == "/data/out_shard_0003.hdf5"
+
+
+def test_sharded_playback(tmp_path):
+    input_path = str(tmp_path / "input.hdf5")
+    output_path = str(tmp_path / "output.hdf5")
+    episode_lengths = [3, 4, 5, 6, 7]
+    _write_dataset(input_path, episode_lengths=episode_lengths)
+
+    # Crash in the middle of the third shard: the first two shards are kept when resuming
+    played_episodes = []
+    with pytest.raises(RuntimeError):
+        run_sharded_playback(
+            input_path,
+            output_path,
+            worker_fn=_stub_playback_worker,
+            episodes_per_shard=2,
+            worker_kwargs=dict(played_episodes=played_episodes, fail_at_episode=5),
+        )
+    assert played_episodes == [0, 1, 2, 3, 4]
+
+    played_episodes.clear()
+    shard_paths = run_sharded_playback(
+        input_path,
+        output_path,
+        worker_fn=_stub_playback_worker,
+        episodes_per_shard=2,
+        worker_kwargs=dict(played_episodes=played_episodes),
+    )
+    assert played_episodes == [4, 5]
+    assert len(shard_paths) == 3
+
+    with HDF5DatasetReader(output_path) as reader:
+        assert reader.episode_ids == list(range(6))
+        assert reader.episode_lengths == dict(enumerate(episode_lengths + [4]))
+        assert reader.hdf5_file["data"].attrs["n_episodes"] == 6
+        assert reader.hdf5_file["data"].attrs["n_steps"] == sum(episode_lengths) + 4
+        assert reader.config == {"env": {}}
+        with HDF5DatasetReader(input_path) as input_reader:
+            for episode_id in reader.episode_ids:
+                assert th.equal(reader.get(episode_id, "obs/state"), input_reader.get(episode_id, "state"))
+
+
+def test_sharded_playback_multiprocess(tmp_path):
+    input_path = str(tmp_path / "input.hdf5")
+    output_path = str(tmp_path / "output.hdf5")
+    episode_lengths = [3, 4, 5, 6, 7]
+    _write_dataset(input_path, episode_lengths=episode_lengths)
+    shards = [([0, 1], get_shard_path(output_path, 0)), ([2, 3], get_shard_path(output_path, 1))]
+    shards.append(([4, 5], get_shard_path(output_path, 2)))
+
+    # The first worker crashes on its second shard, which does not affect the shards of the other worker
+    with pytest.raises(RuntimeError):
+        run_sharded_playback(
+            input_path,
+            output_path,
+            worker_fn=_stub_playback_worker,
+            n_workers=2,
+            episodes_per_shard=2,
+            worker_kwargs=dict(played_episodes=[], fail_at_episode=5),
+        )
+    assert [is_shard_complete(shard_path, episode_ids) for episode_ids, shard_path in shards] == [True, True, False]
+
+    shard_paths = run_sharded_playback(
+        input_path,
+        output_path,
+        worker_fn=_stub_playback_worker,
+        n_workers=2,
+        episodes_per_shard=2,
+        worker_kwargs=dict(played_episodes=[]),
+    )
+    assert shard_paths == [shard_path for _, shard_path in shards]
+    with HDF5DatasetReader(output_path) as reader:
+        assert reader.episode_ids == list(range(6))
+        assert reader.episode_lengths == dict(enumerate(episode_lengths + [4]))
@@ -0,0 +1,157 @@
+import math
+import os
+
+import pytest
+import torch as th
+
+import omnigibson.utils.transform_utils as T
+from omnigibson.utils.geometry_utils import (
+    VolumeChecker,
+    check_points_in_cone,
+    check_points_in_convex_hull_mesh,
+    check_points_in_cube,
+    check_points_in_cylinder,
+    check_points_in_sphere,
+    get_content_hash,
+    get_particle_positions_in_frame,
+    load_or_compute_cached,
+)
+
+
+def _random_pose():
+    pos = th.rand(3) * 0.2 - 0.1
+    quat = T.random_quaternion(1)[0]
+    scale = th.rand(3) * 0.5 + 0.75
+    return pos, quat, scale
+
+
+def _octahedron():
+    # Convex hull of the unit octahedron, with one face per octant
+    vertices = th.tensor([[1.0, 0, 0], [-1.0, 0, 0], [0, 1.0, 0], [0, -1.0, 0], [0, 0, 1.0], [0, 0, -1.0]]) * 0.2
+    signs = th.tensor([[x, y, z] for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)])
+    normals = signs / th.norm(signs, dim=-1, keepdim=True)
+    centroids = signs * 0.2 / 3.0
+    return centroids, normals, vertices
+
+
+def _add_primitives(checker):
+    # Returns the reference functions checking each of the primitives added to @checker
+    fcns = []
+    for add_fcn, check_fcn, size in (
+        (checker.add_cube, check_points_in_cube, 0.3),
+        (checker.add_sphere, check_points_in_sphere, 0.15),
+        (checker.add_cylinder, check_points_in_cylinder, [0.1, 0.3]),
+        (checker.add_cone, check_points_in_cone, [0.15, 0.25]),
+    ):
+        pos, quat, scale = _random_pose()
+        add_fcn(size=size, pos=pos, quat=quat, scale=scale)
+        fcns.append(
+            lambda points, f=check_fcn, kw=dict(size=size, pos=pos, quat=quat, scale=scale): f(
+                **kw, particle_positions=points
+            )
+        )
+
+    centroids, normals, vertices = _octahedron()
+    pos, quat, scale = _random_pose()
+    checker.add_convex_hull_mesh(centroids, normals, vertices, pos=pos, quat=quat, scale=scale)
+    fcns.append(
+        lambda points, kw=dict(pos=pos, quat=quat, scale=scale): check_points_in_convex_hull_mesh(
+            mesh_face_centroids=centroids, mesh_face_normals=normals, **kw, particle_positions=points
+        )
+    )
+    return fcns
+
+
+def _n_mismatches(a, b):
+    return (a != b).sum().item()
+
+
+@pytest.mark.parametrize("use_aabb", [True, False])
+def test_volume_checker_matches_primitive_checks(use_aabb):
+    th.manual_seed(0)
+    checker = VolumeChecker()
+    fcns = _add_primitives(checker)
+    assert checker.n_primitives == len(fcns)
+
+    points = th.rand(20000, 3) * 0.8 - 0.4
+    expected = th.zeros(len(points), dtype=th.bool)
+    for fcn in fcns:
+        expected |= fcn(points)
+    in_volumes = checker.check(points, use_aabb=use_aabb)
+    assert in_volumes.any() and not in_volumes.all()
+    # Only points lying right on a primitive's boundary may differ due to floating point error
+    assert _n_mismatches(in_volumes, expected) <= 2
+
+
+def test_volume_checker_in_frame():
+    th.manual_seed(1)
+    checker = VolumeChecker()
+    fcns = _add_primitives(checker)
+    frame_pos, frame_quat, frame_scale = th.tensor([1.0, -2.0, 0.5]), T.random_quaternion(1)[0], th.tensor([1.5] * 3)
+
+    points = th.rand(20000, 3) * 1.2 - 0.6 + frame_pos
+    local_points = get_particle_positions_in_frame(frame_pos, frame_quat, frame_scale, points)
+    expected = th.zeros(len(points), dtype=th.bool)
+    for fcn in fcns:
+        expected |= fcn(local_points)
+    in_volumes = checker(points, pos=frame_pos, quat=frame_quat, scale=frame_scale)
+    assert in_volumes.any()
+    assert _n_mismatches(in_volumes, expected) <= 2
+
+
+def test_volume_checker_bounding_box():
+    th.manual_seed(2)
+    checker = VolumeChecker()
+    _add_primitives(checker)
+    frame_pos, frame_quat, frame_scale = th.tensor([1.0, -2.0, 0.5]), T.random_quaternion(1)[0], th.tensor([1.5, 1, 2])
+
+    points = th.rand(20000, 3) * 2.0 - 1.0 + frame_pos
+    in_volumes = checker(points, pos=frame_pos, quat=frame_quat, scale=frame_scale)
+    box_pos, box_quat, half_extent = checker.get_bounding_box(pos=frame_pos, quat=frame_quat, scale=frame_scale)
+    local_points = (points - box_pos) @ T.quat2mat(box_quat)
+    in_box = (local_points.abs() <= half_extent).all(dim=-1)
+    assert in_volumes.any()
+    assert not (in_volumes & ~in_box).any()
+
+
+def test_volume_checker_empty():
+    checker = VolumeChecker()
+    assert not checker.check(th.rand(10, 3)).any()
+    checker.add_sphere(size=0.1, pos=th.zeros(3), quat=th.tensor([0, 0, 0, 1.0]), scale=th.ones(3))
+    assert checker.check(th.zeros((0, 3))).shape == (0,)
+    assert checker.check(th.tensor([[0.0, 0.0, 0.05], [0.0, 0.0, 0.15]])).tolist() == [True, False]
+
+
+def test_volume_checker_calculate_volume():
+    checker = VolumeChecker()
+    checker.add_cube(size=0.2, pos=th.zeros(3), quat=T.random_quaternion(1)[0], scale=th.tensor([1.0, 2.0, 0.5]))
+    assert th.isclose(checker.calculate_volume(precision=1e-5), th.tensor(0.2**3), rtol=0.02)
+
+    checker = VolumeChecker()
+    checker.add_sphere(size=0.1, pos=th.tensor([0.5, 0.0, 0.0]), quat=th.tensor([0, 0, 0, 1.0]), scale=th.ones(3))
+    assert th.isclose(checker.calculate_volume(precision=1e-5), th.tensor(4.0 / 3.0 * math.pi * 0.1**3), rtol=0.02)
+
+
+def test_volume_cache(tmp_path):
+    n_calls = []
+
+    def compute():
+        n_calls.append(1)
+        return th.arange(3.0), th.tensor(1.5)
+
+    key = get_content_hash("test", "model", th.ones(3))
+    assert key == get_content_hash("test", "model", th.ones(3))
+    assert key != get_content_hash("test", "model", th.ones(4))
+    assert key != get_content_hash("tes", "tmodel", th.ones(3))
+
+    for _ in range(2):
+        data, volume = load_or_compute_cached(key=key, compute_fcn=compute, cache_dir=str(tmp_path))
+        assert th.equal(data, th.arange(3.0)) and volume.item() == 1.5
+    assert len(n_calls) == 1
+    assert os.listdir(tmp_path) == [f"{key}.pt"]
+
+    # Corrupted cache entries are recomputed
+    (tmp_path / f"{key}.pt").write_bytes(b"corrupted")
+    data, _ = load_or_compute_cached(key=key, compute_fcn=compute, cache_dir=str(tmp_path))
+    assert th.equal(data, th.arange(3.0))
+    assert len(n_calls) == 2
@@ -0,0 +1,107 @@
+from collections import namedtuple
+
+import networkx as nx
+import pytest
+import torch as th
+
+from omnigibson.scene_graphs.graph_export import SceneGraphDiffStream, SceneGraphExporter
+
+_Obj = namedtuple("_Obj", ["name"])
+
+
+def _add_node(G, name, x, states):
+    pose = th.eye(4)
+    pose[0, 3] = x
+    G.add_node(_Obj(name), pose=pose, bbox_pose=pose.clone(), bbox_extent=th.ones(3) * (x + 1), states=states)
+
+
+def _make_graph(merge_parallel_edges, step):
+    G = nx.DiGraph() if merge_parallel_edges else nx.MultiDiGraph()
+    _add_node(G, "robot", 0.0, {})
+    _add_node(G, "table", 1.0, {"Open": False})
+    _add_node(G, "bowl", 2.0 + step, {"Cooked": step > 0})
+    if step < 2:
+        _add_node(G, "apple", 3.0, {})
+    edges = [("bowl", "table", "OnTop")]
+    if step < 2:
+        edges += [("apple", "bowl", "Inside"), ("apple", "bowl", "Touching")]
+    if step > 0:
+        edges += [("table", "bowl", "Under")]
+    if merge_parallel_edges:
+        merged = dict()
+        for obj1, obj2, state in edges:
+            merged.setdefault((obj1, obj2), []).append((state, True))
+        G.add_edges_from((_Obj(obj1), _Obj(obj2), {"states": states}) for (obj1, obj2), states in merged.items())
+    else:
+        G.add_edges_from((_Obj(obj1), _Obj(obj2), state, {"value": True}) for obj1, obj2, state in edges)
+    return G
+
+
+def _assert_exports_equal(export1, export2):
+    assert th.equal(export1["node_ids"], export2["node_ids"])
+    for key in ("poses", "bbox_poses", "bbox_extents"):
+        assert th.allclose(export1[key], export2[key])
+    assert th.equal(export1["unary_states"], export2["unary_states"])
+
+    def _edges(export):
+        return set(
+            zip(
+                export["node_ids"][export["edge_index"][0]].tolist(),
+                export["node_ids"][export["edge_index"][1]].tolist(),
+                export["edge_predicates"].tolist(),
+                export["edge_values"].tolist(),
+            )
+        )
+
+    assert _edges(export1) == _edges(export2)
+
+
+@pytest.mark.parametrize("merge_parallel_edges", [True, False])
+def test_export(merge_parallel_edges):
+    exporter = SceneGraphExporter()
+    export = exporter.export(_make_graph(merge_parallel_edges, step=1))
+    assert export["node_ids"].tolist() == [0, 1, 2, 3]
+    assert export["poses"].shape == (4, 4, 4) and export["bbox_extents"].shape == (4, 3)
+    names = exporter.node_names
+    bowl_row = names.index("bowl")
+    assert export["poses"][bowl_row, 0, 3].item() == 3.0
+    assert export["unary_states"][bowl_row].item() == 1 << exporter.unary_state_names.index("Cooked")
+    assert export["unary_states"][names.index("table")].item() == 0
+    assert export["edge_index"].shape == (2, 4)
+    edges = {
+        (names[src], names[dst], exporter.predicate_names[predicate])
+        for src, dst, predicate in zip(*export["edge_index"].tolist(), export["edge_predicates"].tolist())
+    }
+    assert edges == {
+        ("bowl", "table", "OnTop"),
+        ("apple", "bowl", "Inside"),
+        ("apple", "bowl", "Touching"),
+        ("table", "bowl", "Under"),
+    }
+
+
+@pytest.mark.parametrize("merge_parallel_edges", [True, False])
+def test_diff_stream(merge_parallel_edges):
+    diffs = []
+    stream = SceneGraphDiffStream(sink=diffs.append)
+    reconstructed = None
+    for step in range(4):
+        diff = stream.step(_make_graph(merge_parallel_edges, step))
+        reconstructed = stream.exporter.apply_diff(
+            stream.exporter.export(nx.DiGraph()) if reconstructed is None else reconstructed, diff
+        )
+        _assert_exports_equal(reconstructed, stream.last_export)
+    assert len(diffs) == 4
+
+    exporter = stream.exporter
+    # The first diff contains the whole graph
+    assert len(diffs[0]["node_ids"]) == 4 and diffs[0]["added_edges"].shape == (3, 3)
+    # Step 1: the bowl moves and gets cooked, and one edge gets added
+    assert [exporter.node_names[i] for i in diffs[1]["node_ids"].tolist()] == ["bowl"]
+    assert diffs[1]["added_edges"].shape == (3, 1) and diffs[1]["removed_edges"].shape == (3, 0)
+    # Step 2: the apple and its edges get removed
+    assert [exporter.node_names[i] for i in diffs[2]["removed_node_ids"].tolist()] == ["apple"]
+    assert diffs[2]["removed_edges"].shape == (3, 2)
+    # Step 3: only the bowl moves
+    assert [exporter.node_names[i] for i in diffs[3]["node_ids"].tolist()] == ["bowl"]
+    assert diffs[3]["added_edges"].shape[1] == 0 and diffs[3]["removed_edges"].shape[1] == 0
@@ -0,0 +1,163 @@
+import math
+
+import pytest
+import torch as th
+
+from omnigibson.utils.grid_planning_utils import (
+    GridLandmarkIndex,
+    GridPlanner,
+    HierarchicalGridPlanner,
+    astar,
+    plan_paths,
+)
+
+
+def _path_cost(path):
+    steps = th.abs(path[1:] - path[:-1]).sum(dim=1)
+    return float(th.where(steps == 2, math.sqrt(2), 1.0).sum())
+
+
+def _wall_map(size=10):
+    # Vertical wall in the middle column with a single gap at the bottom row
+    trav_map = th.full((size, size), 255, dtype=th.uint8)
+    trav_map[:, size // 2] = 0
+    trav_map[size - 1, size // 2] = 255
+    return trav_map
+
+
+@pytest.mark.parametrize("eight_connected", [True, False])
+def test_astar_path_is_valid(eight_connected):
+    trav_map = _wall_map()
+    path = astar(trav_map, (0, 0), (0, 9), eight_connected=eight_connected)
+    assert path.shape[1] == 2
+    assert tuple(path[0].tolist()) == (0, 0)
+    assert tuple(path[-1].tolist()) == (0, 9)
+    assert th.all(trav_map[path[:, 0], path[:, 1]] != 0)
+    steps = th.abs(path[1:] - path[:-1])
+    assert th.all(steps.max(dim=1).values == 1)
+    if not eight_connected:
+        assert th.all(steps.sum(dim=1) == 1)
+
+
+def test_astar_optimal_cost():
+    trav_map = _wall_map()
+    # 4-connected: down 9, across 9, up 9
+    assert _path_cost(astar(trav_map, (0, 0), (0, 9), eight_connected=False)) == pytest.approx(27.0)
+    # 8-connected: diagonal moves allowed, so the path is strictly shorter
+    assert _path_cost(astar(trav_map, (0, 0), (0, 9), eight_connected=True)) < 27.0
+    # Open map: straight diagonal
+    open_map = th.full((10, 10), 255, dtype=th.uint8)
+    assert _path_cost(astar(open_map, (0, 0), (9, 9))) == pytest.approx(9 * math.sqrt(2))
+
+
+def test_astar_no_path():
+    trav_map = _wall_map()
+    trav_map[9, 5] = 0
+    assert astar(trav_map, (0, 0), (0, 9)) is None
+    assert astar(trav_map, (0, 0), (20, 20)) is None
+
+
+def test_grid_planner_reuse():
+    planner = GridPlanner(_wall_map())
+    first = planner.plan((0, 0), (0, 9))
+    assert planner.n_expanded > 0
+    assert planner.plan((3, 3), (3, 3)).tolist() == [[3, 3]]
+    assert th.equal(planner.plan((0, 0), (0, 9)), first)
+
+
+@pytest.mark.parametrize("eight_connected", [True, False])
+def test_distance_field_matches_astar(eight_connected):
+    th.manual_seed(0)
+    trav_map = (th.rand(30, 30) > 0.3).to(th.uint8) * 255
+    goal = (15, 15)
+    trav_map[goal] = 255
+    planner = GridPlanner(trav_map, eight_connected=eight_connected)
+    distance_field = planner.compute_distance_field(goal)
+    assert distance_field.distances.shape == (30, 30)
+    for start in [(0, 0), (29, 29), (3, 20), (15, 15), (22, 4)]:
+        path = planner.plan(start, goal)
+        distance = distance_field.get_distance(start)
+        field_path = distance_field.get_path(start)
+        if path is None:
+            assert distance is None and field_path is None
+        else:
+            assert distance == pytest.approx(_path_cost(path))
+            assert _path_cost(field_path) == pytest.approx(distance)
+            assert tuple(field_path[0].tolist()) == start
+            assert tuple(field_path[-1].tolist()) == goal
+
+
+def test_landmark_index_bounds(tmp_path):
+    th.manual_seed(0)
+    trav_map = (th.rand(40, 40) > 0.2).to(th.uint8) * 255
+    planner = GridPlanner(trav_map)
+    index = GridLandmarkIndex.build(planner, n_landmarks=8, min_component_size=20)
+    assert 0 < len(index.landmarks) <= 8
+
+    sources = th.randint(0, 40, (50, 2))
+    targets = th.randint(0, 40, (50, 2))
+    lower, upper = index.get_distance_bounds(sources, targets)
+    for source, target, lo, up in zip(sources.tolist(), targets.tolist(), lower.tolist(), upper.tolist()):
+        if math.isnan(lo):
+            continue
+        path = planner.plan(source, target)
+        if path is None:
+            assert math.isinf(lo) and math.isinf(up)
+        else:
+            assert lo - 1e-4 <= _path_cost(path) <= up + 1e-4
+
+    fpath = str(tmp_path / "landmarks.npz")
+    index.save(fpath)
+    loaded = GridLandmarkIndex.load(fpath)
+    assert th.equal(loaded.landmarks, index.landmarks)
+    assert th.equal(loaded.distances, index.distances)
+
+
+@pytest.mark.parametrize("eight_connected", [True, False])
+def test_landmark_index_bounds_blocked_sources(eight_connected):
+    # Paths can leave untraversable sources but never enter them, so distances from them are not symmetric
+    th.manual_seed(1)
+    for _ in range(5):
+        trav_map = (th.rand(40, 40) > 0.3).to(th.uint8) * 255
+        planner = GridPlanner(trav_map, eight_connected=eight_connected)
+        index = GridLandmarkIndex.build(planner, n_landmarks=8, min_component_size=20)
+        blocked_cells = th.nonzero(trav_map == 0)
+        sources = blocked_cells[th.randint(len(blocked_cells), (100,))]
+        targets = (sources + th.randint(-3, 4, (100, 2))).clamp(0, 39)
+        lower, upper = index.get_distance_bounds(sources, targets)
+        for source, target, lo, up in zip(sources.tolist(), targets.tolist(), lower.tolist(), upper.tolist()):
+            distance = planner.compute_distance_field(target).get_distance(source)
+            if distance is None:
+                assert math.isnan(lo) or math.isinf(lo)
+            elif not math.isnan(lo):
+                assert lo - 1e-4 <= distance <= up + 1e-4
+
+
+@pytest.mark.parametrize("eight_connected", [True, False])
+def test_hierarchical_planner(eight_connected):
+    th.manual_seed(0)
+    trav_map = (th.rand(64, 64) > 0.3).to(th.uint8) * 255
+    planner = GridPlanner(trav_map, eight_connected=eight_connected)
+    hierarchical_planner = HierarchicalGridPlanner(
+        trav_map, eight_connected=eight_connected, n_levels=3, coarsening_factor=2, corridor_radius=1
+    )
+    for start, goal in [((0, 0), (63, 63)), ((5, 60), (60, 5)), ((32, 32), (33, 30))]:
+        path = planner.plan(start, goal)
+        hierarchical_path = hierarchical_planner.plan(start, goal)
+        if path is None:
+            assert hierarchical_path is None
+            continue
+        assert tuple(hierarchical_path[0].tolist()) == start
+        assert tuple(hierarchical_path[-1].tolist()) == goal
+        assert th.all(trav_map[hierarchical_path[1:, 0], hierarchical_path[1:, 1]] != 0)
+        assert th.all(th.abs(hierarchical_path[1:] - hierarchical_path[:-1]).max(dim=1).values == 1)
+        assert _path_cost(hierarchical_path) >= _path_cost(path) - 1e-6
+
+
+def test_plan_paths():
+    trav_map = _wall_map()
+    starts, goals = [(0, 0), (9, 9), (0, 0)], [(0, 9), (0, 0), (0, 5)]
+    paths = plan_paths(trav_map, starts, goals)
+    assert paths[2] is None
+    for path, start, goal in zip(paths[:2], starts, goals):
+        assert th.equal(path, astar(trav_map, start, goal))
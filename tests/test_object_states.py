@@ -111,12 +111,18 @@ def test_touching(env):
 
         assert obj.states[Touching].get_value(breakfast_table)
         assert breakfast_table.states[Touching].get_value(obj)
+        candidate_pairs = env.scene.get_candidate_object_pairs()
+        assert (obj, breakfast_table) in candidate_pairs or (breakfast_table, obj) in candidate_pairs
 
+        # Teleporting invalidates the broadphase index, even within the same simulator step
         obj.set_position_orientation(position=th.ones(3) * 10 * (i + 1))
+        assert not env.scene.objects_may_be_near(obj, breakfast_table)
         og.sim.step()
 
         assert not obj.states[Touching].get_value(breakfast_table)
         assert not breakfast_table.states[Touching].get_value(obj)
+        assert (obj, breakfast_table) not in env.scene.get_candidate_object_pairs()
+        assert (breakfast_table, obj) not in env.scene.get_candidate_object_pairs()
 
     with pytest.raises(NotImplementedError):
         bowl.states[Touching].set_value(breakfast_table, None)
@@ -0,0 +1,67 @@
+import math
+
+import cv2
+import pytest
+import torch as th
+
+from omnigibson.utils.constants import OccupancyGridState
+from omnigibson.utils.occupancy_grid_utils import OccupancyGridRasterizer, get_scan_ray_directions
+
+
+def _legacy_rasterize(points, resolution, grid_range, inner_radius):
+    # Per-ray reference implementation that ScanSensor.get_local_occupancy_grid used to run
+    scan_local = th.cat([th.tensor([[0, 0]]), points, th.tensor([[0, 0]])], dim=0)
+    scan_local[:, 1] *= -1
+    occupancy_grid = th.full((resolution, resolution), fill_value=int(OccupancyGridState.UNKNOWN * 2.0), dtype=th.uint8)
+    scan_local_in_map = scan_local / grid_range * resolution + (resolution / 2)
+    scan_local_in_map = scan_local_in_map.reshape((1, -1, 1, 2)).int()
+    occupancy_grid = occupancy_grid.cpu().numpy()
+    scan_local_in_map = scan_local_in_map.cpu().numpy()
+    for i in range(scan_local_in_map.shape[1]):
+        cv2.circle(
+            img=occupancy_grid,
+            center=(scan_local_in_map[0, i, 0, 0], scan_local_in_map[0, i, 0, 1]),
+            radius=2,
+            color=int(OccupancyGridState.OBSTACLES * 2.0),
+            thickness=-1,
+        )
+    cv2.fillPoly(img=occupancy_grid, pts=scan_local_in_map, color=int(OccupancyGridState.FREESPACE * 2.0), lineType=1)
+    cv2.circle(
+        img=occupancy_grid,
+        center=(resolution // 2, resolution // 2),
+        radius=inner_radius,
+        color=int(OccupancyGridState.FREESPACE * 2.0),
+        thickness=-1,
+    )
+    return th.tensor(occupancy_grid[:, :, None]) / 2.0
+
+
+def _random_scan_points(n_scans, horizontal_fov, horizontal_resolution, max_range):
+    directions = get_scan_ray_directions(horizontal_fov, horizontal_resolution)[:, :2]
+    ranges = 0.05 + th.rand(n_scans, len(directions), 1) * (max_range - 0.05)
+    # Random offset between the sensor and the occupancy grid's local link
+    return directions * ranges + (th.rand(n_scans, 1, 2) - 0.5)
+
+
+def test_get_scan_ray_directions():
+    directions = get_scan_ray_directions(270.0, 0.5)
+    assert directions.shape == (540, 3)
+    assert th.allclose(th.norm(directions, dim=-1), th.ones(540))
+    assert th.allclose(directions[0], th.tensor([math.cos(-0.75 * math.pi), math.sin(-0.75 * math.pi), 0.0]))
+    assert th.allclose(directions[-1], th.tensor([math.cos(0.75 * math.pi), math.sin(0.75 * math.pi), 0.0]))
+
+
+@pytest.mark.parametrize("horizontal_fov, horizontal_resolution", [(360.0, 1.0), (270.0, 0.25)])
+def test_rasterizer_matches_legacy(horizontal_fov, horizontal_resolution):
+    th.manual_seed(0)
+    resolution, grid_range = 128, 5.0
+    inner_radius = int(0.5 * resolution / grid_range)
+    rasterizer = OccupancyGridRasterizer(resolution=resolution, grid_range=grid_range, inner_radius=inner_radius)
+    points = _random_scan_points(4, horizontal_fov, horizontal_resolution, max_range=10.0)
+
+    grids = rasterizer.rasterize_batch(points)
+    assert grids.shape == (4, resolution, resolution, 1)
+    for scan_points, grid in zip(points, grids):
+        legacy_grid = _legacy_rasterize(scan_points, resolution, grid_range, inner_radius)
+        assert th.equal(grid, legacy_grid)
+        assert th.equal(rasterizer.rasterize(scan_points), legacy_grid)
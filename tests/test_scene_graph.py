@@ -112,3 +112,41 @@ def test_scene_graph():
         ),
         th.Tensor,
     )
+
+    # Test incremental scene graph against a full rebuild
+    def _edge_set(G):
+        return {(u.name, v.name, tuple(sorted(data["states"]))) for u, v, data in G.edges(data=True)}
+
+    scene_graph_builder_full = SceneGraphBuilder(
+        robot_names=robot_names[:1], egocentric=False, full_obs=True, only_true=True, merge_parallel_edges=True
+    )
+    scene_graph_builder_incremental = SceneGraphBuilder(
+        robot_names=robot_names[:1],
+        egocentric=False,
+        full_obs=True,
+        only_true=True,
+        merge_parallel_edges=True,
+        incremental=True,
+    )
+    scene_graph_builder_full.start(scene)
+    scene_graph_builder_incremental.start(scene)
+    # All nodes except for the single robot's
+    n_objs = len(scene_graph_builder_incremental.get_scene_graph().nodes) - 1
+    assert scene_graph_builder_incremental.n_recomputed_nodes == n_objs
+    assert scene_graph_builder_incremental.n_recomputed_edges == n_objs * (n_objs - 1)
+
+    for i in range(4):
+        if i == 2:
+            bowl.set_position_orientation(position=[0.5, -0.8, 0.1], orientation=[0, 0, 0, 1])
+        og.sim.step()
+        scene_graph_builder_full.step(scene)
+        scene_graph_builder_incremental.step(scene)
+        if i == 2:
+            assert scene_graph_builder_incremental.n_recomputed_nodes >= 1
+            assert scene_graph_builder_incremental.n_recomputed_edges < n_objs * (n_objs - 1)
+        full_graph = scene_graph_builder_full.get_scene_graph()
+        incremental_graph = scene_graph_builder_incremental.get_scene_graph()
+        assert set(full_graph.nodes) == set(incremental_graph.nodes)
+        assert _edge_set(full_graph) == _edge_set(incremental_graph)
+        for obj in full_graph.nodes:
+            assert full_graph.nodes[obj]["states"] == incremental_graph.nodes[obj]["states"]
@@ -88,6 +88,15 @@ def test_segmentation_modalities(env):
     }
     assert set(seg_instance_id_info.values()) == set(expected_dict.values())
 
+    # Instance labels are cached after the first frame, and the cached labels give the same results
+    assert VisionSensor.INSTANCE_LABEL_CACHE[None][dishtowel.prim_path] == "dishtowel"
+    cached_observation, cached_info = og.sim.viewer_camera.get_obs()
+    for modality in modalities_required:
+        assert th.equal(cached_observation[modality], all_observation[modality])
+        assert cached_info[modality] == all_info[modality]
+    assert VisionSensor.INSTANCE_REGISTRY_INDEX == {v: k for k, v in VisionSensor.INSTANCE_REGISTRY.items()}
+    assert VisionSensor.INSTANCE_ID_REGISTRY_INDEX == {v: k for k, v in VisionSensor.INSTANCE_ID_REGISTRY.items()}
+
     for system in systems:
         env.scene.clear_system(system.name)
 
@@ -1,4 +1,5 @@
 import pytest
+import torch as th
 from utils import SYSTEM_EXAMPLES, og_test
 
 import omnigibson as og
@@ -20,3 +21,91 @@ def test_system_clear(env):
             assert system.n_particles > 0
             og.sim.step()
             env.scene.clear_system(system_name)
+
+
+@og_test
+def test_macro_visual_particle_poses(env):
+    breakfast_table = env.scene.object_registry("name", "breakfast_table")
+    system = env.scene.get_system("stain")
+    assert breakfast_table.states[Covered].set_value(system, True)
+    group = system.get_group_name(obj=breakfast_table)
+    positions, orientations = system.get_group_particles_position_orientation(group=group)
+    assert len(positions) == system.n_particles
+
+    # Batched poses match per-particle poses
+    for idx in (0, -1):
+        position, orientation = system.get_particle_position_orientation(idx=idx)
+        assert th.allclose(position, positions[idx], atol=1e-5)
+        assert th.allclose(orientation, orientations[idx], atol=1e-5)
+
+    # Local poses are written to USD in bulk once stepping
+    og.sim.step()
+    local_positions, local_orientations = system.get_particles_local_pose()
+    for idx, particle in ((0, next(iter(system.particles.values()))), (-1, list(system.particles.values())[-1])):
+        usd_position, _ = particle.get_position_orientation(frame="parent")
+        assert th.allclose(usd_position, local_positions[idx], atol=1e-4)
+
+    # Particles follow their parent object, and setting local poses back leaves global poses unchanged
+    table_pos, table_quat = breakfast_table.get_position_orientation()
+    offset = th.tensor([0.5, 0.0, 0.0])
+    breakfast_table.set_position_orientation(position=table_pos + offset, orientation=table_quat)
+    moved_positions, _ = system.get_group_particles_position_orientation(group=group)
+    assert th.allclose(moved_positions - positions, offset, atol=1e-3)
+    system.set_particles_local_pose(positions=local_positions, orientations=local_orientations)
+    assert th.allclose(system.get_particles_position_orientation()[0], moved_positions, atol=1e-4)
+    breakfast_table.set_position_orientation(position=table_pos, orientation=table_quat)
+
+    # Removing particles keeps the remaining particles' poses intact
+    system.remove_particles(idxs=[0, 1])
+    remaining_positions, _ = system.get_group_particles_position_orientation(group=group)
+    assert th.allclose(remaining_positions, positions[2:], atol=1e-3)
+
+    env.scene.clear_system("stain")
+
+
+@og_test
+def test_particle_spatial_hash(env):
+    breakfast_table = env.scene.object_registry("name", "breakfast_table")
+    system = env.scene.get_system("stain")
+    assert breakfast_table.states[Covered].set_value(system, True)
+    positions, _ = system.get_particles_position_orientation()
+    lower, upper = positions.min(dim=0).values - 1e-3, positions.max(dim=0).values + 1e-3
+    assert len(system.spatial_hash.query_box(lower, upper)) == system.n_particles
+
+    # Moving particles within the same simulator step invalidates the spatial hash
+    offset = th.tensor([10.0, 0.0, 0.0])
+    system.set_particles_position_orientation(positions=positions + offset)
+    assert len(system.spatial_hash.query_box(lower, upper)) == 0
+    assert len(system.spatial_hash.query_box(lower + offset, upper + offset)) == system.n_particles
+
+    # Removing and adding the same number of particles within the same simulator step also invalidates it
+    n_particles = system.n_particles
+    system.remove_particles(idxs=[0])
+    system.generate_group_particles(
+        group=system.get_group_name(obj=breakfast_table),
+        positions=lower.reshape(1, 3),
+        link_prim_paths=[breakfast_table.root_link.prim_path],
+    )
+    assert system.n_particles == n_particles
+    assert system.spatial_hash.query_box(lower, upper).tolist() == [n_particles - 1]
+
+    env.scene.clear_system("stain")
+
+
+@og_test
+def test_contact_candidates(env):
+    system = env.scene.get_system("water")
+
+    # Particles far away from all objects and above the floor plane cannot be in contact with anything
+    positions = th.tensor([[50.0, 50.0, 5.0], [-50.0, 50.0, 5.0]])
+    assert not system.get_contact_candidates(positions).any()
+
+    # Collision geometry that does not belong to any object, such as a static scene's mesh, is also accounted for
+    lower, upper = th.tensor([[49.0, 49.0, 4.0]]), th.tensor([[51.0, 51.0, 6.0]])
+    env.scene.get_non_object_collision_aabbs = lambda: (lower, upper)
+    try:
+        assert system.get_contact_candidates(positions).tolist() == [True, False]
+    finally:
+        del env.scene.get_non_object_collision_aabbs
+
+    env.scene.clear_system("water")
@@ -453,3 +453,68 @@ class TestMiscellaneousFunctions:
         coords = [integer_spiral_coordinates(i) for i in range(5)]
         expected = [(0, 0), (1, 0), (1, 1), (0, 1), (-1, 1)]
         assert coords == expected
+
+
+class TestBatchedPoseTransformations:
+    @staticmethod
+    def _random_poses(n):
+        return th.rand(n, 3) * 2.0 - 1.0, random_quaternion(n)
+
+    def test_pose2mat_and_mat2pose_batch(self):
+        pos, orn = self._random_poses(10)
+        mats = pose2mat_batch((pos, orn))
+        assert mats.shape == (10, 4, 4)
+        for i in range(10):
+            assert_close(mats[i], pose2mat((pos[i], orn[i])))
+        recovered_pos, recovered_orn = mat2pose_batch(mats)
+        for i in range(10):
+            single_pos, single_orn = mat2pose(mats[i])
+            assert_close(recovered_pos[i], single_pos)
+            assert_close(recovered_orn[i], single_orn)
+
+        # Leading dimensions are broadcast
+        assert pose2mat_batch((pos.reshape(2, 5, 3), orn[0])).shape == (2, 5, 4, 4)
+
+    def test_pose_inv_batch(self):
+        mats = pose2mat_batch(self._random_poses(10))
+        mats_inv = pose_inv_batch(mats)
+        for i in range(10):
+            assert_close(mats_inv[i], pose_inv(mats[i]))
+        assert_close(mats @ mats_inv, th.eye(4).expand(10, 4, 4))
+
+    def test_pose_transforms_batch(self):
+        pos1, quat1 = self._random_poses(10)
+        pos0, quat0 = self._random_poses(10)
+        for batch_fn, fn in (
+            (pose_transform_batch, pose_transform),
+            (relative_pose_transform_batch, relative_pose_transform),
+        ):
+            batch_pos, batch_quat = batch_fn(pos1, quat1, pos0, quat0)
+            for i in range(10):
+                single_pos, single_quat = fn(pos1[i], quat1[i], pos0[i], quat0[i])
+                assert_close(batch_pos[i], single_pos)
+                assert_close(batch_quat[i], single_quat)
+
+        inv_pos, inv_quat = invert_pose_transform_batch(pos0, quat0)
+        for i in range(10):
+            single_pos, single_quat = invert_pose_transform(pos0[i], quat0[i])
+            assert_close(inv_pos[i], single_pos)
+            assert_close(inv_quat[i], single_quat)
+
+    def test_get_pose_error_batch(self):
+        target = pose2mat_batch(self._random_poses(10))
+        current = pose2mat_batch(self._random_poses(10))
+        errors = get_pose_error_batch(target, current)
+        assert errors.shape == (10, 6)
+        for i in range(10):
+            assert_close(errors[i], get_pose_error(target[i], current[i]))
+
+    def test_quat2axisangle_batch(self):
+        quats = th.cat([random_quaternion(10), th.tensor([[0.0, 0.0, 0.0, 1.0]])])
+        original = quats.clone()
+        axisangles = quat2axisangle(quats)
+        assert th.equal(quats, original)
+        assert_close(axisangles[-1], th.zeros(3))
+        for i in range(11):
+            assert_close(axisangles[i], quat2axisangle(quats[i]))
+            assert_close(axisangle2quat(axisangles[i]), quats[i])
@@ -16,7 +16,16 @@ import omnigibson.utils.transform_utils as T
 from omnigibson.macros import macros as m
 from omnigibson.object_states import *
 from omnigibson.objects import DatasetObject
-from omnigibson.transition_rules import REGISTERED_RULES
+from omnigibson.transition_rules import (
+    REGISTERED_RULES,
+    AbilityFilter,
+    AndFilter,
+    CategoryFilter,
+    MeltingRule,
+    NameFilter,
+    NotFilter,
+    OrFilter,
+)
 from omnigibson.utils.constants import PrimType
 from omnigibson.utils.physx_utils import apply_force_at_pos, apply_torque
 
@@ -353,6 +362,72 @@ def test_melting_rule(env):
     og.sim.step()
 
 
+@og_test
+def test_event_driven_melting_rule(env):
+    transition_rule_api = env.scene.transition_rule_api
+    swiss_cheese = env.scene.object_registry("name", "swiss_cheese")
+    melted_swiss_cheese = env.scene.get_system("melted__swiss_cheese")
+    (melting_rule,) = [rule for rule in transition_rule_api.active_rules if isinstance(rule, MeltingRule)]
+
+    deleted_objs = [swiss_cheese]
+    deleted_objs_cfg = [retrieve_obj_cfg(obj) for obj in deleted_objs]
+
+    transition_rule_api.event_driven = True
+    try:
+        place_obj_on_floor_plane(swiss_cheese)
+        og.sim.step()
+
+        # Once every object is asleep and has no state updates, the melting rule does not need to be evaluated
+        for obj in env.scene.objects:
+            obj.sleep()
+        og.sim.step()
+        og.sim.step()
+        assert transition_rule_api.n_skipped_evaluations > 0
+        assert transition_rule_api._can_skip_evaluation(melting_rule)
+        assert melted_swiss_cheese.n_particles == 0
+
+        # Updating the swiss cheese's temperature makes the melting rule get evaluated again
+        assert swiss_cheese.states[Temperature].set_value(m.transition_rules.MELTING_TEMPERATURE + 1)
+        assert not transition_rule_api._can_skip_evaluation(melting_rule)
+        og.sim.step()
+
+        assert melted_swiss_cheese.n_particles > 0
+        for obj in deleted_objs:
+            assert env.scene.object_registry("name", obj.name) is None
+    finally:
+        transition_rule_api.event_driven = False
+
+    # Clean up
+    remove_all_systems(env.scene)
+
+    for obj_cfg in deleted_objs_cfg:
+        obj = DatasetObject(**obj_cfg)
+        env.scene.add_object(obj)
+    og.sim.step()
+
+
+@og_test
+def test_indexed_rule_candidates(env):
+    transition_rule_api = env.scene.transition_rule_api
+    for rule in transition_rule_api.all_rules:
+        # Candidates looked up through the scene's object registry should match testing every object in the scene
+        indexed_candidates = rule.get_object_candidates()
+        candidates = rule.get_object_candidates(objects=env.scene.objects)
+        assert indexed_candidates.keys() == candidates.keys()
+        for filter_name, objs in candidates.items():
+            assert set(indexed_candidates[filter_name]) == set(objs)
+            assert len(indexed_candidates[filter_name]) == len(objs)
+
+    # Compound filters are compiled to set operations over the registry
+    stove = env.scene.object_registry("name", "stove")
+    container_filter = AndFilter(
+        filters=[AbilityFilter(ability="fillable"), NotFilter(CategoryFilter("washer")), NameFilter("pot")]
+    )
+    assert container_filter.indexed
+    assert container_filter.get_candidates(env.scene) == set(obj for obj in env.scene.objects if container_filter(obj))
+    assert stove in OrFilter(filters=[CategoryFilter("stove"), NameFilter("pot")]).get_candidates(env.scene)
+
+
 @og_test
 def test_cooking_physical_particle_rule_failure_recipe_systems(env):
     assert len(REGISTERED_RULES) > 0, "No rules registered!"
@@ -0,0 +1,160 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import cv2
+import pytest
+import torch as th
+
+from omnigibson.maps.traversable_map import TraversableMap
+from omnigibson.utils.grid_planning_utils import GridLandmarkIndex
+
+
+@pytest.fixture
+def maps_path(tmp_path):
+    # 4m x 4m floor with a wall along x = 0, which can only be crossed through a gap at y > 1.4, and a closed-off room
+    # in the x > 1, y < -1.4 corner. Image rows and columns map to the world y and x axes respectively
+    trav_map = th.full((400, 400), 255, dtype=th.uint8)
+    trav_map[:340, 195:205] = 0
+    trav_map[:60, 300:310] = 0
+    trav_map[50:60, 300:] = 0
+    cv2.imwrite(os.path.join(tmp_path, "floor_trav_0.png"), trav_map.numpy())
+    return str(tmp_path)
+
+
+def _load_map(maps_path, **kwargs):
+    trav_map = TraversableMap(map_resolution=0.1, **kwargs)
+    trav_map.load_map(maps_path=maps_path, floor_heights=(0.0,))
+    return trav_map
+
+
+# (x, y) world points on the left and right side of the wall, and inside the closed-off room
+LEFT = th.tensor([[-1.5, -1.5], [-1.0, 0.5], [-0.5, 1.0]])
+RIGHT = th.tensor([[1.5, 1.5], [0.5, -1.5], [0.8, 0.5]])
+ROOM = th.tensor([1.6, -1.8])
+
+
+def test_eroded_map_cache(maps_path):
+    trav_map = _load_map(maps_path)
+    map_info = trav_map.get_eroded_map_info(floor=0)
+    assert trav_map.get_eroded_map_info(floor=0) is map_info
+
+    # Entries are keyed by erosion radius, so robots of similar size share the same entry
+    robot = SimpleNamespace(reset_joint_pos_aabb_extent=th.tensor([0.5, 0.5, 1.0]))
+    similar_robot = SimpleNamespace(reset_joint_pos_aabb_extent=th.tensor([0.5, 0.45, 1.0]))
+    robot_map_info = trav_map.get_eroded_map_info(floor=0, robot=robot)
+    assert robot_map_info is not map_info
+    assert trav_map.get_eroded_map_info(floor=0, robot=similar_robot) is robot_map_info
+    assert (robot_map_info["trav_map"] > 0).sum() < (map_info["trav_map"] > 0).sum()
+    assert set(trav_map._floor_map_cache.keys()) == {(0, 0), (0, 4)}
+
+    trav_map.clear_cache(floor=1)
+    assert len(trav_map._floor_map_cache) == 2
+    trav_map.clear_cache(floor=0)
+    assert len(trav_map._floor_map_cache) == 0
+    assert trav_map.get_eroded_map_info(floor=0) is not map_info
+    trav_map.clear_cache()
+    assert len(trav_map._floor_map_cache) == 0
+
+
+@pytest.mark.parametrize("max_error", [None, 0.5, 0.0])
+def test_geodesic_distances(maps_path, max_error):
+    trav_map = _load_map(maps_path)
+    sources = th.cat([LEFT, LEFT, ROOM.reshape(1, 2)])
+    targets = th.cat([RIGHT, RIGHT.flip(0), RIGHT[:1]])
+    distances = trav_map.get_geodesic_distances(floor=0, sources=sources, targets=targets, max_error=max_error)
+
+    expected = th.tensor(
+        [
+            trav_map.get_geodesic_distance(floor=0, source_world=source, target_world=target) or math.inf
+            for source, target in zip(sources, targets)
+        ]
+    )
+    assert th.isinf(distances[-1]) and th.isinf(expected[-1])
+    if max_error is None:
+        # Distances are the midpoints of the landmark bounds, so they can only be off by the bounds' half-width
+        sources_map, targets_map = trav_map.world_to_map(sources[:-1]), trav_map.world_to_map(targets[:-1])
+        lower, upper = trav_map.get_landmark_index(floor=0).get_distance_bounds(sources_map, targets_map)
+        max_errors = (upper - lower) * trav_map.map_resolution / 2.0
+        assert th.all((distances[:-1] - expected[:-1]).abs() <= max_errors + 1e-4)
+    else:
+        assert th.allclose(distances[:-1], expected[:-1], atol=max_error + 1e-4)
+
+
+def test_landmark_index_is_cached_on_disk(maps_path, monkeypatch):
+    trav_map = _load_map(maps_path)
+    landmark_index = trav_map.get_landmark_index(floor=0)
+    assert trav_map.get_landmark_index(floor=0) is landmark_index
+    fnames = [fname for fname in os.listdir(maps_path) if fname.endswith(".npz")]
+    assert len(fnames) == 1 and fnames[0].startswith("floor_trav_0_landmarks_")
+
+    # A fresh map of the same floor loads the index from disk instead of rebuilding it
+    def build(*args, **kwargs):
+        raise AssertionError("Landmark index should have been loaded from disk")
+
+    monkeypatch.setattr(GridLandmarkIndex, "build", build)
+    reloaded_map = _load_map(maps_path)
+    sources, targets = trav_map.world_to_map(LEFT), trav_map.world_to_map(RIGHT)
+    for bounds, reloaded_bounds in zip(
+        landmark_index.get_distance_bounds(sources, targets),
+        reloaded_map.get_landmark_index(floor=0).get_distance_bounds(sources, targets),
+    ):
+        assert th.equal(bounds, reloaded_bounds)
+
+    # A differently eroded map gets its own index
+    monkeypatch.undo()
+    robot = SimpleNamespace(reset_joint_pos_aabb_extent=th.tensor([0.5, 0.5, 1.0]))
+    reloaded_map.get_landmark_index(floor=0, robot=robot)
+    assert len([fname for fname in os.listdir(maps_path) if fname.endswith(".npz")]) == 2
+
+
+@pytest.mark.parametrize("hierarchical_planning", [True, False])
+def test_hierarchical_planning(maps_path, hierarchical_planning):
+    trav_map = _load_map(maps_path, hierarchical_planning=hierarchical_planning)
+    map_info = trav_map.get_eroded_map_info(floor=0)
+    assert (map_info["hierarchical_planner"] is not None) == hierarchical_planning
+
+    for source, target in zip(LEFT, RIGHT):
+        path, geodesic_distance = trav_map.get_shortest_path(
+            floor=0, source_world=source, target_world=target, entire_path=True
+        )
+        optimal_distance = trav_map.get_geodesic_distance(floor=0, source_world=source, target_world=target)
+        assert th.allclose(path[0], source, atol=trav_map.map_resolution)
+        assert geodesic_distance >= optimal_distance - 1e-4
+        if not hierarchical_planning:
+            assert math.isclose(geodesic_distance, optimal_distance, abs_tol=1e-4)
+
+    path, geodesic_distance = trav_map.get_shortest_path(floor=0, source_world=LEFT[0], target_world=ROOM)
+    assert path is None and geodesic_distance is None
+
+
+@pytest.mark.parametrize("use_executor", [True, False])
+def test_shortest_paths(maps_path, use_executor):
+    trav_map = _load_map(maps_path)
+    map_info = trav_map.get_eroded_map_info(floor=0)
+
+    # Three queries share the first target, the others are independent
+    sources = th.cat([LEFT, RIGHT[1:], LEFT[:1]])
+    targets = th.cat([RIGHT[:1].expand(3, 2), LEFT[1:], ROOM.reshape(1, 2)])
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            paths, lengths, distances = trav_map.get_shortest_paths(
+                floor=0, sources=sources, targets=targets, entire_path=True, executor=executor, chunk_size=1
+            )
+    else:
+        paths, lengths, distances = trav_map.get_shortest_paths(
+            floor=0, sources=sources, targets=targets, entire_path=True
+        )
+
+    # Only the shared target gets a distance field
+    assert list(map_info["distance_fields"].keys()) == [tuple(trav_map.world_to_map(RIGHT[0]).tolist())]
+    assert paths.shape == (len(sources), int(lengths.max()), 2)
+    assert lengths[-1] == 0 and th.isinf(distances[-1])
+    for idx, (source, target) in enumerate(zip(sources[:-1], targets[:-1])):
+        path, geodesic_distance = trav_map.get_shortest_path(
+            floor=0, source_world=source, target_world=target, entire_path=True
+        )
+        assert math.isclose(distances[idx], geodesic_distance, abs_tol=1e-4)
+        assert lengths[idx] == len(path)
+        assert th.all(paths[idx, lengths[idx] :] == 0)
@@ -0,0 +1,84 @@
+import pytest
+import torch as th
+
+from omnigibson.utils.vision_utils import Remapper
+
+
+def _naive_remap(old_mapping, new_mapping, image):
+    label_to_key = dict()
+    for key, label in new_mapping.items():
+        label_to_key.setdefault(label, key)
+    remapped_img = image.clone()
+    for key in th.unique(image).tolist():
+        remapped_img[image == key] = label_to_key[old_mapping.get(key, "unlabelled")]
+    return remapped_img, {key: new_mapping[key] for key in th.unique(remapped_img).tolist()}
+
+
+def test_remapper_cpu():
+    old_mapping = {1: "desk", 2: "chair", 10: "desk"}
+    new_mapping = {5: "desk", 7: "chair", 100: "unlabelled"}
+    image = th.tensor([[1, 3], [10, 2]], dtype=th.int32)
+    remapper = Remapper()
+    remapped_img, remapped_labels = remapper.remap(old_mapping, new_mapping, image)
+    assert remapped_img.device == image.device
+    assert remapped_img.tolist() == [[5, 100], [5, 7]]
+    assert remapped_labels == {5: "desk", 7: "chair", 100: "unlabelled"}
+
+    # Passing in precomputed image keys gives the same result
+    remapped_img_2, remapped_labels_2 = remapper.remap(old_mapping, new_mapping, image, th.unique(image))
+    assert th.equal(remapped_img, remapped_img_2)
+    assert remapped_labels == remapped_labels_2
+
+    remapper.clear()
+    assert len(remapper.key_array) == 0 and len(remapper.known_ids) == 0
+
+
+def test_remapper_matches_naive_remap():
+    th.manual_seed(0)
+    remapper = Remapper()
+    # New mapping that grows over time, as the instance registries do
+    new_mapping = {0: "background", 1: "unlabelled"}
+    # Image values keep the same label across frames, as they do for the replicator
+    key_to_label = dict()
+    for frame in range(5):
+        new_mapping.update({len(new_mapping) + i: f"obj_{frame}_{i}" for i in range(20)})
+        labels = [label for label in new_mapping.values() if label.startswith("obj_")]
+        old_keys = th.randperm(500)[:30].tolist()
+        for key in old_keys:
+            key_to_label.setdefault(key, labels[th.randint(len(labels), (1,)).item()])
+        old_mapping = {key: key_to_label[key] for key in old_keys}
+        # Some pixels have values that are not in old_mapping
+        image = th.tensor(old_keys + [600, 601], dtype=th.int32)[th.randint(32, (64, 64))]
+        remapped_img, remapped_labels = remapper.remap(old_mapping, new_mapping, image)
+        naive_img, naive_labels = _naive_remap(old_mapping, new_mapping, image)
+        assert th.equal(remapped_img, naive_img)
+        assert remapped_labels == naive_labels
+
+
+def test_remapper_unknown_key_becomes_known():
+    new_mapping = {0: "unlabelled", 1: "desk"}
+    image = th.tensor([[0, 3]], dtype=th.int32)
+    remapper = Remapper()
+    assert remapper.remap({3: "desk"}, new_mapping, image)[0].tolist() == [[0, 1]]
+    # Key 3 is missing from the old mapping in this frame, so it's unlabelled
+    assert remapper.remap({}, new_mapping, image)[0].tolist() == [[0, 0]]
+    # ...and is correctly remapped again once it shows back up
+    assert remapper.remap({3: "desk"}, new_mapping, image)[0].tolist() == [[0, 1]]
+
+
+def test_remapper_new_mapping_modified_in_place():
+    new_mapping = {5: "desk", 100: "unlabelled"}
+    remapper = Remapper()
+    assert remapper.remap({1: "desk"}, new_mapping, th.tensor([[1, 3]], dtype=th.int32))[0].tolist() == [[5, 100]]
+    # The mapping is the same object with the same size, but its label moved to a different key
+    del new_mapping[5]
+    new_mapping[6] = "desk"
+    assert remapper.remap({2: "desk"}, new_mapping, th.tensor([[2, 3]], dtype=th.int32))[0].tolist() == [[6, 100]]
+
+
+def test_remapper_missing_label():
+    remapper = Remapper()
+    with pytest.raises(AssertionError):
+        remapper.remap({1: "desk"}, {5: "chair", 100: "unlabelled"}, th.tensor([[1]], dtype=th.int32))
+    with pytest.raises(AssertionError):
+        remapper.remap({}, {5: "chair"}, th.tensor([[1]], dtype=th.int32))